@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied
@@ -422,15 +423,8 @@ class ItemLookupSession(abc_assessment_sessions.ItemLookupSession, osid_sessions
                 query.match_bank_id(catalog_id, match=True)
         return self._query_session.get_items_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('lookup', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -442,9 +436,8 @@ class ItemLookupSession(abc_assessment_sessions.ItemLookupSession, osid_sessions
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_items_by_query(query)
 
     def get_bank_id(self):
@@ -593,6 +586,7 @@ class ItemQuerySession(abc_assessment_sessions.ItemQuerySession, osid_sessions.O
         self._qualifier_id = self._provider_session.get_bank_id()
         self._id_namespace = 'assessment.Item'
         self.use_federated_bank_view()
+        self._auth_bank_ids = None
         self._unauth_bank_ids = None
         # self._overriding_bank_ids = None
 
@@ -607,15 +601,8 @@ class ItemQuerySession(abc_assessment_sessions.ItemQuerySession, osid_sessions.O
                 query._provider_query.match_bank_id(bank_id, match=True)
         return self._query_session.get_items_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('search', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('search', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -625,9 +612,8 @@ class ItemQuerySession(abc_assessment_sessions.ItemQuerySession, osid_sessions.O
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query._provider_query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_items_by_query(query)
 
     class ItemQueryWrapper(QueryWrapper):
@@ -810,6 +796,11 @@ class ItemAdminSession(abc_assessment_sessions.ItemAdminSession, osid_sessions.O
             raise PermissionDenied()
         return self._provider_session.create_item(item_form)
 
+    def create_items(self, item_forms):
+        if not self._can('create'):
+            raise PermissionDenied()
+        return self._provider_session.create_items(item_forms)
+
     def can_update_items(self):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.can_update_resources
@@ -837,6 +828,11 @@ class ItemAdminSession(abc_assessment_sessions.ItemAdminSession, osid_sessions.O
             raise PermissionDenied()
         return self._provider_session.update_item(item_form)
 
+    def update_items(self, item_forms):
+        if not self._can('update'):
+            raise PermissionDenied()
+        return self._provider_session.update_items(item_forms)
+
     def can_delete_items(self):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.can_delete_resources
@@ -1307,15 +1303,8 @@ class AssessmentLookupSession(abc_assessment_sessions.AssessmentLookupSession, o
                 query.match_bank_id(catalog_id, match=True)
         return self._query_session.get_assessments_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('lookup', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -1327,9 +1316,8 @@ class AssessmentLookupSession(abc_assessment_sessions.AssessmentLookupSession, o
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessments_by_query(query)
 
     def get_bank_id(self):
@@ -1462,6 +1450,7 @@ class AssessmentQuerySession(abc_assessment_sessions.AssessmentQuerySession, osi
         self._qualifier_id = self._provider_session.get_bank_id()
         self._id_namespace = 'assessment.Assessment'
         self.use_federated_bank_view()
+        self._auth_bank_ids = None
         self._unauth_bank_ids = None
         # self._overriding_bank_ids = None
 
@@ -1476,15 +1465,8 @@ class AssessmentQuerySession(abc_assessment_sessions.AssessmentQuerySession, osi
                 query._provider_query.match_bank_id(bank_id, match=True)
         return self._query_session.get_assessments_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('search', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('search', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -1494,9 +1476,8 @@ class AssessmentQuerySession(abc_assessment_sessions.AssessmentQuerySession, osi
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query._provider_query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessments_by_query(query)
 
     class AssessmentQueryWrapper(QueryWrapper):
@@ -2112,15 +2093,8 @@ class AssessmentOfferedLookupSession(abc_assessment_sessions.AssessmentOfferedLo
                 query.match_bank_id(catalog_id, match=True)
         return self._query_session.get_assessments_offered_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('lookup', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -2132,9 +2106,8 @@ class AssessmentOfferedLookupSession(abc_assessment_sessions.AssessmentOfferedLo
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessments_offered_by_query(query)
 
     def get_bank_id(self):
@@ -2282,6 +2255,7 @@ class AssessmentOfferedQuerySession(abc_assessment_sessions.AssessmentOfferedQue
         self._qualifier_id = self._provider_session.get_bank_id()
         self._id_namespace = 'assessment.AssessmentOffered'
         self.use_federated_bank_view()
+        self._auth_bank_ids = None
         self._unauth_bank_ids = None
         # self._overriding_bank_ids = None
 
@@ -2296,15 +2270,8 @@ class AssessmentOfferedQuerySession(abc_assessment_sessions.AssessmentOfferedQue
                 query._provider_query.match_bank_id(bank_id, match=True)
         return self._query_session.get_assessments_offered_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('search', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('search', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -2314,9 +2281,8 @@ class AssessmentOfferedQuerySession(abc_assessment_sessions.AssessmentOfferedQue
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query._provider_query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessments_offered_by_query(query)
 
     class AssessmentOfferedQueryWrapper(QueryWrapper):
@@ -2888,15 +2854,8 @@ class AssessmentTakenLookupSession(abc_assessment_sessions.AssessmentTakenLookup
                 query.match_bank_id(catalog_id, match=True)
         return self._query_session.get_assessments_taken_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('lookup', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -2908,9 +2867,8 @@ class AssessmentTakenLookupSession(abc_assessment_sessions.AssessmentTakenLookup
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessments_taken_by_query(query)
 
     def get_bank_id(self):
@@ -3108,6 +3066,7 @@ class AssessmentTakenQuerySession(abc_assessment_sessions.AssessmentTakenQuerySe
         self._qualifier_id = self._provider_session.get_bank_id()
         self._id_namespace = 'assessment.AssessmentTaken'
         self.use_federated_bank_view()
+        self._auth_bank_ids = None
         self._unauth_bank_ids = None
         # self._overriding_bank_ids = None
 
@@ -3122,15 +3081,8 @@ class AssessmentTakenQuerySession(abc_assessment_sessions.AssessmentTakenQuerySe
                 query._provider_query.match_bank_id(bank_id, match=True)
         return self._query_session.get_assessments_taken_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('search', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('search', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -3140,9 +3092,8 @@ class AssessmentTakenQuerySession(abc_assessment_sessions.AssessmentTakenQuerySe
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query._provider_query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessments_taken_by_query(query)
 
     class AssessmentTakenQueryWrapper(QueryWrapper):
@@ -4221,6 +4172,7 @@ class BankHierarchyDesignSession(abc_assessment_sessions.BankHierarchyDesignSess
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_bank(self, bank_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -4229,24 +4181,28 @@ class BankHierarchyDesignSession(abc_assessment_sessions.BankHierarchyDesignSess
         return self._provider_session.add_root_bank(bank_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_bank(self, bank_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_bank(bank_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_bank(self, bank_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_bank(bank_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_bank(self, bank_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_bank(bank_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_banks(self, bank_id):
         if not self._can('modify'):
             raise PermissionDenied()
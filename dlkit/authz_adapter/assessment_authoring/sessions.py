@@ -40,15 +40,8 @@ class AssessmentPartLookupSession(abc_assessment_authoring_sessions.AssessmentPa
                 query.match_bank_id(catalog_id, match=True)
         return self._query_session.get_assessment_parts_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('lookup', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -60,9 +53,8 @@ class AssessmentPartLookupSession(abc_assessment_authoring_sessions.AssessmentPa
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessment_parts_by_query(query)
 
     def get_bank_id(self):
@@ -236,6 +228,7 @@ class AssessmentPartQuerySession(abc_assessment_authoring_sessions.AssessmentPar
         self._qualifier_id = self._provider_session.get_bank_id()
         self._id_namespace = 'assessment_authoring.AssessmentPart'
         self.use_federated_bank_view()
+        self._auth_bank_ids = None
         self._unauth_bank_ids = None
         # self._overriding_bank_ids = None
 
@@ -250,15 +243,8 @@ class AssessmentPartQuerySession(abc_assessment_authoring_sessions.AssessmentPar
                 query._provider_query.match_bank_id(bank_id, match=True)
         return self._query_session.get_assessment_parts_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('search', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('search', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -268,9 +254,8 @@ class AssessmentPartQuerySession(abc_assessment_authoring_sessions.AssessmentPar
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query._provider_query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_assessment_parts_by_query(query)
 
     class AssessmentPartQueryWrapper(QueryWrapper):
@@ -979,15 +964,8 @@ class SequenceRuleLookupSession(abc_assessment_authoring_sessions.SequenceRuleLo
                 query.match_bank_id(catalog_id, match=True)
         return self._query_session.get_sequence_rules_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('lookup', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -999,9 +977,8 @@ class SequenceRuleLookupSession(abc_assessment_authoring_sessions.SequenceRuleLo
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_sequence_rules_by_query(query)
 
     def get_bank_id(self):
@@ -1181,6 +1158,7 @@ class SequenceRuleQuerySession(abc_assessment_authoring_sessions.SequenceRuleQue
         self._qualifier_id = self._provider_session.get_bank_id()
         self._id_namespace = 'assessment_authoring.SequenceRule'
         self.use_federated_bank_view()
+        self._auth_bank_ids = None
         self._unauth_bank_ids = None
         # self._overriding_bank_ids = None
 
@@ -1195,15 +1173,8 @@ class SequenceRuleQuerySession(abc_assessment_authoring_sessions.SequenceRuleQue
                 query._provider_query.match_bank_id(bank_id, match=True)
         return self._query_session.get_sequence_rules_by_query(query), query
 
-    def _get_unauth_bank_ids(self, bank_id):
-        if self._can('search', bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bank_id)]
-        if self._hierarchy_session.has_child_banks(bank_id):
-            for child_bank_id in self._hierarchy_session.get_child_bank_ids(bank_id):
-                unauth_list = unauth_list + self._get_unauth_bank_ids(child_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_bank_ids(self, bank_id):
+        return self._get_catalog_idstrs_by_authz('search', bank_id, self._hierarchy_session.get_child_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_banks(query)
@@ -1213,9 +1184,8 @@ class SequenceRuleQuerySession(abc_assessment_authoring_sessions.SequenceRuleQue
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bank_ids is None:
-            self._unauth_bank_ids = self._get_unauth_bank_ids(self._qualifier_id)
-        for bank_id in self._unauth_bank_ids:
-            query._provider_query.match_bank_id(bank_id, match=False)
+            self._auth_bank_ids, self._unauth_bank_ids = self._get_auth_and_unauth_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bank_id, self._auth_bank_ids, self._unauth_bank_ids)
         return self._query_session.get_sequence_rules_by_query(query)
 
     class SequenceRuleQueryWrapper(QueryWrapper):
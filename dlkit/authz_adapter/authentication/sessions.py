@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class AgentLookupSession(abc_authentication_sessions.AgentLookupSession, osid_se
                 query.match_agency_id(catalog_id, match=True)
         return self._query_session.get_agents_by_query(query), query
 
-    def _get_unauth_agency_ids(self, agency_id):
-        if self._can('lookup', agency_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(agency_id)]
-        if self._hierarchy_session.has_child_agencies(agency_id):
-            for child_agency_id in self._hierarchy_session.get_child_agency_ids(agency_id):
-                unauth_list = unauth_list + self._get_unauth_agency_ids(child_agency_id)
-        return unauth_list
+    def _get_auth_and_unauth_agency_ids(self, agency_id):
+        return self._get_catalog_idstrs_by_authz('lookup', agency_id, self._hierarchy_session.get_child_agency_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_agencies(query)
@@ -60,9 +54,8 @@ class AgentLookupSession(abc_authentication_sessions.AgentLookupSession, osid_se
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_agency_ids is None:
-            self._unauth_agency_ids = self._get_unauth_agency_ids(self._qualifier_id)
-        for agency_id in self._unauth_agency_ids:
-            query.match_agency_id(agency_id, match=False)
+            self._auth_agency_ids, self._unauth_agency_ids = self._get_auth_and_unauth_agency_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_agency_id, self._auth_agency_ids, self._unauth_agency_ids)
         return self._query_session.get_agents_by_query(query)
 
     def get_agency_id(self):
@@ -195,6 +188,7 @@ class AgentQuerySession(abc_authentication_sessions.AgentQuerySession, osid_sess
         self._qualifier_id = self._provider_session.get_agency_id()
         self._id_namespace = 'authentication.Agent'
         self.use_federated_agency_view()
+        self._auth_agency_ids = None
         self._unauth_agency_ids = None
         # self._overriding_agency_ids = None
 
@@ -209,15 +203,8 @@ class AgentQuerySession(abc_authentication_sessions.AgentQuerySession, osid_sess
                 query._provider_query.match_agency_id(agency_id, match=True)
         return self._query_session.get_agents_by_query(query), query
 
-    def _get_unauth_agency_ids(self, agency_id):
-        if self._can('search', agency_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(agency_id)]
-        if self._hierarchy_session.has_child_agencies(agency_id):
-            for child_agency_id in self._hierarchy_session.get_child_agency_ids(agency_id):
-                unauth_list = unauth_list + self._get_unauth_agency_ids(child_agency_id)
-        return unauth_list
+    def _get_auth_and_unauth_agency_ids(self, agency_id):
+        return self._get_catalog_idstrs_by_authz('search', agency_id, self._hierarchy_session.get_child_agency_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_agencies(query)
@@ -227,9 +214,8 @@ class AgentQuerySession(abc_authentication_sessions.AgentQuerySession, osid_sess
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_agency_ids is None:
-            self._unauth_agency_ids = self._get_unauth_agency_ids(self._qualifier_id)
-        for agency_id in self._unauth_agency_ids:
-            query._provider_query.match_agency_id(agency_id, match=False)
+            self._auth_agency_ids, self._unauth_agency_ids = self._get_auth_and_unauth_agency_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_agency_id, self._auth_agency_ids, self._unauth_agency_ids)
         return self._query_session.get_agents_by_query(query)
 
     class AgentQueryWrapper(QueryWrapper):
@@ -1247,6 +1233,7 @@ class AgencyHierarchyDesignSession(abc_authentication_sessions.AgencyHierarchyDe
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_agency(self, agency_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -1255,24 +1242,28 @@ class AgencyHierarchyDesignSession(abc_authentication_sessions.AgencyHierarchyDe
         return self._provider_session.add_root_agency(agency_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_agency(self, agency_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_agency(agency_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_agency(self, agency_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_agency(agency_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_agency(self, agency_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_agency(agency_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_agencies(self, agency_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -64,15 +64,8 @@ class TrustLookupSession(abc_authentication_process_sessions.TrustLookupSession,
                 query.match_agency_id(catalog_id, match=True)
         return self._query_session.get_trusts_by_query(query), query
 
-    def _get_unauth_agency_ids(self, agency_id):
-        if self._can('lookup', agency_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(agency_id)]
-        if self._hierarchy_session.has_child_agencies(agency_id):
-            for child_agency_id in self._hierarchy_session.get_child_agency_ids(agency_id):
-                unauth_list = unauth_list + self._get_unauth_agency_ids(child_agency_id)
-        return unauth_list
+    def _get_auth_and_unauth_agency_ids(self, agency_id):
+        return self._get_catalog_idstrs_by_authz('lookup', agency_id, self._hierarchy_session.get_child_agency_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_agencies(query)
@@ -84,9 +77,8 @@ class TrustLookupSession(abc_authentication_process_sessions.TrustLookupSession,
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_agency_ids is None:
-            self._unauth_agency_ids = self._get_unauth_agency_ids(self._qualifier_id)
-        for agency_id in self._unauth_agency_ids:
-            query.match_agency_id(agency_id, match=False)
+            self._auth_agency_ids, self._unauth_agency_ids = self._get_auth_and_unauth_agency_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_agency_id, self._auth_agency_ids, self._unauth_agency_ids)
         return self._query_session.get_trusts_by_query(query)
 
     def get_agency_id(self):
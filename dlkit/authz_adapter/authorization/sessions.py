@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -80,15 +81,8 @@ class AuthorizationLookupSession(abc_authorization_sessions.AuthorizationLookupS
                 query.match_vault_id(catalog_id, match=True)
         return self._query_session.get_authorizations_by_query(query), query
 
-    def _get_unauth_vault_ids(self, vault_id):
-        if self._can('lookup', vault_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(vault_id)]
-        if self._hierarchy_session.has_child_vaults(vault_id):
-            for child_vault_id in self._hierarchy_session.get_child_vault_ids(vault_id):
-                unauth_list = unauth_list + self._get_unauth_vault_ids(child_vault_id)
-        return unauth_list
+    def _get_auth_and_unauth_vault_ids(self, vault_id):
+        return self._get_catalog_idstrs_by_authz('lookup', vault_id, self._hierarchy_session.get_child_vault_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_vaults(query)
@@ -100,9 +94,8 @@ class AuthorizationLookupSession(abc_authorization_sessions.AuthorizationLookupS
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_vault_ids is None:
-            self._unauth_vault_ids = self._get_unauth_vault_ids(self._qualifier_id)
-        for vault_id in self._unauth_vault_ids:
-            query.match_vault_id(vault_id, match=False)
+            self._auth_vault_ids, self._unauth_vault_ids = self._get_auth_and_unauth_vault_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_vault_id, self._auth_vault_ids, self._unauth_vault_ids)
         return self._query_session.get_authorizations_by_query(query)
 
     def get_vault_id(self):
@@ -306,6 +299,7 @@ class AuthorizationQuerySession(abc_authorization_sessions.AuthorizationQuerySes
         self._qualifier_id = self._provider_session.get_vault_id()
         self._id_namespace = 'authorization.Authorization'
         self.use_federated_vault_view()
+        self._auth_vault_ids = None
         self._unauth_vault_ids = None
         # self._overriding_vault_ids = None
 
@@ -320,15 +314,8 @@ class AuthorizationQuerySession(abc_authorization_sessions.AuthorizationQuerySes
                 query._provider_query.match_vault_id(vault_id, match=True)
         return self._query_session.get_authorizations_by_query(query), query
 
-    def _get_unauth_vault_ids(self, vault_id):
-        if self._can('search', vault_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(vault_id)]
-        if self._hierarchy_session.has_child_vaults(vault_id):
-            for child_vault_id in self._hierarchy_session.get_child_vault_ids(vault_id):
-                unauth_list = unauth_list + self._get_unauth_vault_ids(child_vault_id)
-        return unauth_list
+    def _get_auth_and_unauth_vault_ids(self, vault_id):
+        return self._get_catalog_idstrs_by_authz('search', vault_id, self._hierarchy_session.get_child_vault_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_vaults(query)
@@ -338,9 +325,8 @@ class AuthorizationQuerySession(abc_authorization_sessions.AuthorizationQuerySes
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_vault_ids is None:
-            self._unauth_vault_ids = self._get_unauth_vault_ids(self._qualifier_id)
-        for vault_id in self._unauth_vault_ids:
-            query._provider_query.match_vault_id(vault_id, match=False)
+            self._auth_vault_ids, self._unauth_vault_ids = self._get_auth_and_unauth_vault_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_vault_id, self._auth_vault_ids, self._unauth_vault_ids)
         return self._query_session.get_authorizations_by_query(query)
 
     class AuthorizationQueryWrapper(QueryWrapper):
@@ -538,6 +524,7 @@ class AuthorizationAdminSession(abc_authorization_sessions.AuthorizationAdminSes
         raise Unimplemented()
 
     @raise_null_argument
+    @invalidates_decisions
     def create_authorization(self, authorization_form):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.create_resource
@@ -565,6 +552,7 @@ class AuthorizationAdminSession(abc_authorization_sessions.AuthorizationAdminSes
         return self._provider_session.duplicate_authorization(authorization_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def update_authorization(self, authorization_form):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.update_resource
@@ -579,6 +567,7 @@ class AuthorizationAdminSession(abc_authorization_sessions.AuthorizationAdminSes
                 bool(self._get_overriding_catalog_ids('delete')))
 
     @raise_null_argument
+    @invalidates_decisions
     def delete_authorization(self, authorization_id):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.delete_resource
@@ -593,6 +582,7 @@ class AuthorizationAdminSession(abc_authorization_sessions.AuthorizationAdminSes
                 bool(self._get_overriding_catalog_ids('manage')))
 
     @raise_null_argument
+    @invalidates_decisions
     def alias_authorization(self, authorization_id, alias_id):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.alias_resources
@@ -864,6 +854,7 @@ class AuthorizationVaultAssignmentSession(abc_authorization_sessions.Authorizati
         return self._provider_session.get_assignable_vault_ids_for_authorization(vault_id, authorization_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def assign_authorization_to_vault(self, authorization_id, vault_id):
         # Implemented from azosid template for -
         # osid.resource.ResourceBinAssignmentSession.assign_resource_to_bin
@@ -872,6 +863,7 @@ class AuthorizationVaultAssignmentSession(abc_authorization_sessions.Authorizati
         return self._provider_session.assign_authorization_to_vault(authorization_id, vault_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def unassign_authorization_from_vault(self, authorization_id, vault_id):
         # Implemented from azosid template for -
         # osid.resource.ResourceBinAssignmentSession.assign_resource_to_bin
@@ -880,6 +872,7 @@ class AuthorizationVaultAssignmentSession(abc_authorization_sessions.Authorizati
         return self._provider_session.unassign_authorization_from_vault(authorization_id, vault_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def reassign_authorization_to_vault(self, authorization_id, from_vault_id, to_vault_id):
         raise Unimplemented()
 
@@ -956,15 +949,8 @@ class FunctionLookupSession(abc_authorization_sessions.FunctionLookupSession, os
                 query.match_vault_id(catalog_id, match=True)
         return self._query_session.get_functions_by_query(query), query
 
-    def _get_unauth_vault_ids(self, vault_id):
-        if self._can('lookup', vault_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(vault_id)]
-        if self._hierarchy_session.has_child_vaults(vault_id):
-            for child_vault_id in self._hierarchy_session.get_child_vault_ids(vault_id):
-                unauth_list = unauth_list + self._get_unauth_vault_ids(child_vault_id)
-        return unauth_list
+    def _get_auth_and_unauth_vault_ids(self, vault_id):
+        return self._get_catalog_idstrs_by_authz('lookup', vault_id, self._hierarchy_session.get_child_vault_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_vaults(query)
@@ -976,9 +962,8 @@ class FunctionLookupSession(abc_authorization_sessions.FunctionLookupSession, os
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_vault_ids is None:
-            self._unauth_vault_ids = self._get_unauth_vault_ids(self._qualifier_id)
-        for vault_id in self._unauth_vault_ids:
-            query.match_vault_id(vault_id, match=False)
+            self._auth_vault_ids, self._unauth_vault_ids = self._get_auth_and_unauth_vault_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_vault_id, self._auth_vault_ids, self._unauth_vault_ids)
         return self._query_session.get_functions_by_query(query)
 
     def get_vault_id(self):
@@ -1121,6 +1106,7 @@ class FunctionQuerySession(abc_authorization_sessions.FunctionQuerySession, osid
         self._qualifier_id = self._provider_session.get_vault_id()
         self._id_namespace = 'authorization.Function'
         self.use_federated_vault_view()
+        self._auth_vault_ids = None
         self._unauth_vault_ids = None
         # self._overriding_vault_ids = None
 
@@ -1135,15 +1121,8 @@ class FunctionQuerySession(abc_authorization_sessions.FunctionQuerySession, osid
                 query._provider_query.match_vault_id(vault_id, match=True)
         return self._query_session.get_functions_by_query(query), query
 
-    def _get_unauth_vault_ids(self, vault_id):
-        if self._can('search', vault_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(vault_id)]
-        if self._hierarchy_session.has_child_vaults(vault_id):
-            for child_vault_id in self._hierarchy_session.get_child_vault_ids(vault_id):
-                unauth_list = unauth_list + self._get_unauth_vault_ids(child_vault_id)
-        return unauth_list
+    def _get_auth_and_unauth_vault_ids(self, vault_id):
+        return self._get_catalog_idstrs_by_authz('search', vault_id, self._hierarchy_session.get_child_vault_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_vaults(query)
@@ -1153,9 +1132,8 @@ class FunctionQuerySession(abc_authorization_sessions.FunctionQuerySession, osid
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_vault_ids is None:
-            self._unauth_vault_ids = self._get_unauth_vault_ids(self._qualifier_id)
-        for vault_id in self._unauth_vault_ids:
-            query._provider_query.match_vault_id(vault_id, match=False)
+            self._auth_vault_ids, self._unauth_vault_ids = self._get_auth_and_unauth_vault_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_vault_id, self._auth_vault_ids, self._unauth_vault_ids)
         return self._query_session.get_functions_by_query(query)
 
     class FunctionQueryWrapper(QueryWrapper):
@@ -1703,15 +1681,8 @@ class QualifierLookupSession(abc_authorization_sessions.QualifierLookupSession,
                 query.match_vault_id(catalog_id, match=True)
         return self._query_session.get_qualifiers_by_query(query), query
 
-    def _get_unauth_vault_ids(self, vault_id):
-        if self._can('lookup', vault_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(vault_id)]
-        if self._hierarchy_session.has_child_vaults(vault_id):
-            for child_vault_id in self._hierarchy_session.get_child_vault_ids(vault_id):
-                unauth_list = unauth_list + self._get_unauth_vault_ids(child_vault_id)
-        return unauth_list
+    def _get_auth_and_unauth_vault_ids(self, vault_id):
+        return self._get_catalog_idstrs_by_authz('lookup', vault_id, self._hierarchy_session.get_child_vault_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_vaults(query)
@@ -1723,9 +1694,8 @@ class QualifierLookupSession(abc_authorization_sessions.QualifierLookupSession,
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_vault_ids is None:
-            self._unauth_vault_ids = self._get_unauth_vault_ids(self._qualifier_id)
-        for vault_id in self._unauth_vault_ids:
-            query.match_vault_id(vault_id, match=False)
+            self._auth_vault_ids, self._unauth_vault_ids = self._get_auth_and_unauth_vault_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_vault_id, self._auth_vault_ids, self._unauth_vault_ids)
         return self._query_session.get_qualifiers_by_query(query)
 
     def get_vault_id(self):
@@ -1858,6 +1828,7 @@ class QualifierQuerySession(abc_authorization_sessions.QualifierQuerySession, os
         self._qualifier_id = self._provider_session.get_vault_id()
         self._id_namespace = 'authorization.Qualifier'
         self.use_federated_vault_view()
+        self._auth_vault_ids = None
         self._unauth_vault_ids = None
         # self._overriding_vault_ids = None
 
@@ -1872,15 +1843,8 @@ class QualifierQuerySession(abc_authorization_sessions.QualifierQuerySession, os
                 query._provider_query.match_vault_id(vault_id, match=True)
         return self._query_session.get_qualifiers_by_query(query), query
 
-    def _get_unauth_vault_ids(self, vault_id):
-        if self._can('search', vault_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(vault_id)]
-        if self._hierarchy_session.has_child_vaults(vault_id):
-            for child_vault_id in self._hierarchy_session.get_child_vault_ids(vault_id):
-                unauth_list = unauth_list + self._get_unauth_vault_ids(child_vault_id)
-        return unauth_list
+    def _get_auth_and_unauth_vault_ids(self, vault_id):
+        return self._get_catalog_idstrs_by_authz('search', vault_id, self._hierarchy_session.get_child_vault_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_vaults(query)
@@ -1890,9 +1854,8 @@ class QualifierQuerySession(abc_authorization_sessions.QualifierQuerySession, os
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_vault_ids is None:
-            self._unauth_vault_ids = self._get_unauth_vault_ids(self._qualifier_id)
-        for vault_id in self._unauth_vault_ids:
-            query._provider_query.match_vault_id(vault_id, match=False)
+            self._auth_vault_ids, self._unauth_vault_ids = self._get_auth_and_unauth_vault_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_vault_id, self._auth_vault_ids, self._unauth_vault_ids)
         return self._query_session.get_qualifiers_by_query(query)
 
     class QualifierQueryWrapper(QueryWrapper):
@@ -2376,6 +2339,7 @@ class QualifierHierarchyDesignSession(abc_authorization_sessions.QualifierHierar
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_qualifier(self, qualifier_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::add_root_subject_template
         if not self._can('modify'):
@@ -2383,6 +2347,7 @@ class QualifierHierarchyDesignSession(abc_authorization_sessions.QualifierHierar
         return self._provider_session.add_root_qualifier(qualifier_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_qualifier(self, qualifier_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::remove_root_subject_template
         if not self._can('modify'):
@@ -2390,6 +2355,7 @@ class QualifierHierarchyDesignSession(abc_authorization_sessions.QualifierHierar
         return self._provider_session.remove_root_qualifier(qualifier_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_qualifier(self, qualifier_id, child_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::add_child_subject_template
         if not self._can('modify'):
@@ -2397,6 +2363,7 @@ class QualifierHierarchyDesignSession(abc_authorization_sessions.QualifierHierar
         return self._provider_session.add_child_qualifier(qualifier_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_qualifier(self, qualifier_id, child_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::remove_child_subject_template
         if not self._can('modify'):
@@ -2404,6 +2371,7 @@ class QualifierHierarchyDesignSession(abc_authorization_sessions.QualifierHierar
         return self._provider_session.remove_child_qualifier(qualifier_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_qualifiers(self, qualifier_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::remove_child_subjects_template
         if not self._can('modify'):
@@ -3066,6 +3034,7 @@ class VaultHierarchyDesignSession(abc_authorization_sessions.VaultHierarchyDesig
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_vault(self, vault_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -3074,24 +3043,28 @@ class VaultHierarchyDesignSession(abc_authorization_sessions.VaultHierarchyDesig
         return self._provider_session.add_root_vault(vault_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_vault(self, vault_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_vault(vault_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_vault(self, vault_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_vault(vault_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_vault(self, vault_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_vault(vault_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_vaults(self, vault_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -687,6 +688,7 @@ class CatalogHierarchyDesignSession(abc_cataloging_sessions.CatalogHierarchyDesi
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_catalog(self, catalog_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -695,24 +697,28 @@ class CatalogHierarchyDesignSession(abc_cataloging_sessions.CatalogHierarchyDesi
         return self._provider_session.add_root_catalog(catalog_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_catalog(self, catalog_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_catalog(catalog_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_catalog(self, catalog_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_catalog(catalog_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_catalog(self, catalog_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_catalog(catalog_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_catalogs(self, catalog_id):
         if not self._can('modify'):
             raise PermissionDenied()
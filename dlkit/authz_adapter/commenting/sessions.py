@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class CommentLookupSession(abc_commenting_sessions.CommentLookupSession, osid_se
                 query.match_book_id(catalog_id, match=True)
         return self._query_session.get_comments_by_query(query), query
 
-    def _get_unauth_book_ids(self, book_id):
-        if self._can('lookup', book_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(book_id)]
-        if self._hierarchy_session.has_child_books(book_id):
-            for child_book_id in self._hierarchy_session.get_child_book_ids(book_id):
-                unauth_list = unauth_list + self._get_unauth_book_ids(child_book_id)
-        return unauth_list
+    def _get_auth_and_unauth_book_ids(self, book_id):
+        return self._get_catalog_idstrs_by_authz('lookup', book_id, self._hierarchy_session.get_child_book_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_books(query)
@@ -60,9 +54,8 @@ class CommentLookupSession(abc_commenting_sessions.CommentLookupSession, osid_se
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_book_ids is None:
-            self._unauth_book_ids = self._get_unauth_book_ids(self._qualifier_id)
-        for book_id in self._unauth_book_ids:
-            query.match_book_id(book_id, match=False)
+            self._auth_book_ids, self._unauth_book_ids = self._get_auth_and_unauth_book_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_book_id, self._auth_book_ids, self._unauth_book_ids)
         return self._query_session.get_comments_by_query(query)
 
     def get_book_id(self):
@@ -349,6 +342,7 @@ class CommentQuerySession(abc_commenting_sessions.CommentQuerySession, osid_sess
         self._qualifier_id = self._provider_session.get_book_id()
         self._id_namespace = 'commenting.Comment'
         self.use_federated_book_view()
+        self._auth_book_ids = None
         self._unauth_book_ids = None
         # self._overriding_book_ids = None
 
@@ -363,15 +357,8 @@ class CommentQuerySession(abc_commenting_sessions.CommentQuerySession, osid_sess
                 query._provider_query.match_book_id(book_id, match=True)
         return self._query_session.get_comments_by_query(query), query
 
-    def _get_unauth_book_ids(self, book_id):
-        if self._can('search', book_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(book_id)]
-        if self._hierarchy_session.has_child_books(book_id):
-            for child_book_id in self._hierarchy_session.get_child_book_ids(book_id):
-                unauth_list = unauth_list + self._get_unauth_book_ids(child_book_id)
-        return unauth_list
+    def _get_auth_and_unauth_book_ids(self, book_id):
+        return self._get_catalog_idstrs_by_authz('search', book_id, self._hierarchy_session.get_child_book_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_books(query)
@@ -381,9 +368,8 @@ class CommentQuerySession(abc_commenting_sessions.CommentQuerySession, osid_sess
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_book_ids is None:
-            self._unauth_book_ids = self._get_unauth_book_ids(self._qualifier_id)
-        for book_id in self._unauth_book_ids:
-            query._provider_query.match_book_id(book_id, match=False)
+            self._auth_book_ids, self._unauth_book_ids = self._get_auth_and_unauth_book_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_book_id, self._auth_book_ids, self._unauth_book_ids)
         return self._query_session.get_comments_by_query(query)
 
     class CommentQueryWrapper(QueryWrapper):
@@ -1434,6 +1420,7 @@ class BookHierarchyDesignSession(abc_commenting_sessions.BookHierarchyDesignSess
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_book(self, book_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -1442,24 +1429,28 @@ class BookHierarchyDesignSession(abc_commenting_sessions.BookHierarchyDesignSess
         return self._provider_session.add_root_book(book_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_book(self, book_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_book(book_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_book(self, book_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_book(book_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_book(self, book_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_book(book_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_books(self, book_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -0,0 +1,151 @@
+"""Process-wide caching of authorization decisions
+
+``OsidSession._can()`` asks the authorization service whether the
+effective agent may perform a function on a qualifier. The answers are
+kept in ``AUTHZ_DECISION_CACHE``, keyed by (authorization vault, agent,
+function, qualifier), and shared by every authz adapter session, so a
+new session does not ask again.
+
+Writes through the adapter sessions that can change a decision, i.e.
+creating, updating, deleting or aliasing authorizations, moving them
+between vaults and changing a catalog hierarchy, drop every cached
+decision. Decisions changed in other ways, e.g. by other processes or
+directly through the authorization provider, are picked up once they
+expire, after ``DECISION_TTL`` seconds. Adapter managers also call
+``listen_to_json_oplog()``: once a JSON provider runtime sets
+``invalidateCacheFromOplog@json``, its ``MongoListener`` then hands every
+change to ``AUTHZ_DECISION_CACHE.process_oplog_entry()``. Otherwise the
+TTL is the only bound on how long such changes go unseen.
+
+"""
+import time
+
+from collections import OrderedDict
+from functools import wraps
+from threading import RLock
+
+
+MAX_CACHED_DECISIONS = 10000
+DECISION_TTL = 60
+
+# The collections whose changes may change a decision
+DECISION_COLLECTIONS = ['Authorization', 'Relationship', 'Vault']
+
+
+def _get_empty_stats():
+    return dict(hits=0, misses=0, evictions=0, expirations=0, invalidations=0)
+
+
+class DecisionCache(object):
+    """A bounded LRU cache of authorization decisions, each kept for ``ttl`` seconds.
+
+    Every invalidation bumps the generation of the cache. A reader gets
+    the generation before asking the authorization service and hands it
+    to ``put()``, which drops the decision if a write came in meanwhile.
+
+    """
+    def __init__(self, max_size=MAX_CACHED_DECISIONS, ttl=DECISION_TTL, timer=time.time):
+        self._lock = RLock()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._timer = timer
+        self._entries = OrderedDict()
+        self._generation = 0
+        self._listening = False
+        self._stats = _get_empty_stats()
+
+    def get_stats(self):
+        """Gets the counters, the size and the hit rate of the cache"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = float(stats['hits']) / lookups if lookups else 0.0
+        return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = _get_empty_stats()
+
+    def get_generation(self):
+        return self._generation
+
+    def get(self, key):
+        """Gets a cached decision, or None"""
+        with self._lock:
+            try:
+                decision, expires = self._entries[key]
+            except KeyError:
+                self._stats['misses'] += 1
+                return None
+            if expires is not None and expires <= self._timer():
+                del self._entries[key]
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+            self._entries[key] = self._entries.pop(key)  # most recently used
+            self._stats['hits'] += 1
+            return decision
+
+    def put(self, key, decision, generation=None):
+        """Caches a decision, or another value derived from authorizations,
+        unless the cache was invalidated since ``generation``"""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            expires = None
+            if self.ttl is not None:
+                expires = self._timer() + self.ttl
+            self._entries.pop(key, None)
+            self._entries[key] = (decision, expires)
+            while len(self._entries) > self.max_size:
+                del self._entries[next(iter(self._entries))]
+                self._stats['evictions'] += 1
+
+    def invalidate(self):
+        """Drops every cached decision"""
+        with self._lock:
+            self._generation += 1
+            self._stats['invalidations'] += len(self._entries)
+            self._entries = OrderedDict()
+
+    def process_oplog_entry(self, entry):
+        """Invalidates the cache if a MongoDB oplog entry may change a decision"""
+        collection = entry.get('ns', '').split('.', 1)[-1]
+        if entry.get('op') == 'c' or collection in DECISION_COLLECTIONS:
+            self.invalidate()
+
+    def listen_to_oplog(self, listener, runtime=None):
+        """Has a ``MongoListener`` invalidate this cache, starting it if needed"""
+        with self._lock:
+            if self._listening:
+                return
+            listener.oplog_callbacks.append(self.process_oplog_entry)
+            self._listening = True
+            if not listener.is_alive():
+                listener.initialize(runtime)
+                listener.start()
+
+
+def invalidates_decisions(func):
+    """decorator, to drop the cached decisions after a write that may change them"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        result = func(*args, **kwargs)
+        AUTHZ_DECISION_CACHE.invalidate()
+        return result
+    return wrapper
+
+
+def listen_to_json_oplog():
+    """Registers ``AUTHZ_DECISION_CACHE`` with the JSON provider, which
+    has its ``MongoListener`` invalidate it under runtimes that set
+    ``invalidateCacheFromOplog@json``"""
+    try:
+        from dlkit.json_.utilities import register_oplog_cache
+    except ImportError:
+        return  # there is no JSON provider
+    register_oplog_cache(AUTHZ_DECISION_CACHE)
+
+
+AUTHZ_DECISION_CACHE = DecisionCache()
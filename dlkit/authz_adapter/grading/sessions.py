@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class GradeSystemLookupSession(abc_grading_sessions.GradeSystemLookupSession, os
                 query.match_gradebook_id(catalog_id, match=True)
         return self._query_session.get_grade_systems_by_query(query), query
 
-    def _get_unauth_gradebook_ids(self, gradebook_id):
-        if self._can('lookup', gradebook_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(gradebook_id)]
-        if self._hierarchy_session.has_child_gradebooks(gradebook_id):
-            for child_gradebook_id in self._hierarchy_session.get_child_gradebook_ids(gradebook_id):
-                unauth_list = unauth_list + self._get_unauth_gradebook_ids(child_gradebook_id)
-        return unauth_list
+    def _get_auth_and_unauth_gradebook_ids(self, gradebook_id):
+        return self._get_catalog_idstrs_by_authz('lookup', gradebook_id, self._hierarchy_session.get_child_gradebook_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_gradebooks(query)
@@ -60,9 +54,8 @@ class GradeSystemLookupSession(abc_grading_sessions.GradeSystemLookupSession, os
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_gradebook_ids is None:
-            self._unauth_gradebook_ids = self._get_unauth_gradebook_ids(self._qualifier_id)
-        for gradebook_id in self._unauth_gradebook_ids:
-            query.match_gradebook_id(gradebook_id, match=False)
+            self._auth_gradebook_ids, self._unauth_gradebook_ids = self._get_auth_and_unauth_gradebook_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_gradebook_id, self._auth_gradebook_ids, self._unauth_gradebook_ids)
         return self._query_session.get_grade_systems_by_query(query)
 
     def get_gradebook_id(self):
@@ -199,6 +192,7 @@ class GradeSystemQuerySession(abc_grading_sessions.GradeSystemQuerySession, osid
         self._qualifier_id = self._provider_session.get_gradebook_id()
         self._id_namespace = 'grading.GradeSystem'
         self.use_federated_gradebook_view()
+        self._auth_gradebook_ids = None
         self._unauth_gradebook_ids = None
         # self._overriding_gradebook_ids = None
 
@@ -213,15 +207,8 @@ class GradeSystemQuerySession(abc_grading_sessions.GradeSystemQuerySession, osid
                 query._provider_query.match_gradebook_id(gradebook_id, match=True)
         return self._query_session.get_grade_systems_by_query(query), query
 
-    def _get_unauth_gradebook_ids(self, gradebook_id):
-        if self._can('search', gradebook_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(gradebook_id)]
-        if self._hierarchy_session.has_child_gradebooks(gradebook_id):
-            for child_gradebook_id in self._hierarchy_session.get_child_gradebook_ids(gradebook_id):
-                unauth_list = unauth_list + self._get_unauth_gradebook_ids(child_gradebook_id)
-        return unauth_list
+    def _get_auth_and_unauth_gradebook_ids(self, gradebook_id):
+        return self._get_catalog_idstrs_by_authz('search', gradebook_id, self._hierarchy_session.get_child_gradebook_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_gradebooks(query)
@@ -231,9 +218,8 @@ class GradeSystemQuerySession(abc_grading_sessions.GradeSystemQuerySession, osid
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_gradebook_ids is None:
-            self._unauth_gradebook_ids = self._get_unauth_gradebook_ids(self._qualifier_id)
-        for gradebook_id in self._unauth_gradebook_ids:
-            query._provider_query.match_gradebook_id(gradebook_id, match=False)
+            self._auth_gradebook_ids, self._unauth_gradebook_ids = self._get_auth_and_unauth_gradebook_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_gradebook_id, self._auth_gradebook_ids, self._unauth_gradebook_ids)
         return self._query_session.get_grade_systems_by_query(query)
 
     class GradeSystemQueryWrapper(QueryWrapper):
@@ -839,15 +825,8 @@ class GradeEntryLookupSession(abc_grading_sessions.GradeEntryLookupSession, osid
                 query.match_gradebook_id(catalog_id, match=True)
         return self._query_session.get_grade_entries_by_query(query), query
 
-    def _get_unauth_gradebook_ids(self, gradebook_id):
-        if self._can('lookup', gradebook_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(gradebook_id)]
-        if self._hierarchy_session.has_child_gradebooks(gradebook_id):
-            for child_gradebook_id in self._hierarchy_session.get_child_gradebook_ids(gradebook_id):
-                unauth_list = unauth_list + self._get_unauth_gradebook_ids(child_gradebook_id)
-        return unauth_list
+    def _get_auth_and_unauth_gradebook_ids(self, gradebook_id):
+        return self._get_catalog_idstrs_by_authz('lookup', gradebook_id, self._hierarchy_session.get_child_gradebook_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_gradebooks(query)
@@ -859,9 +838,8 @@ class GradeEntryLookupSession(abc_grading_sessions.GradeEntryLookupSession, osid
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_gradebook_ids is None:
-            self._unauth_gradebook_ids = self._get_unauth_gradebook_ids(self._qualifier_id)
-        for gradebook_id in self._unauth_gradebook_ids:
-            query.match_gradebook_id(gradebook_id, match=False)
+            self._auth_gradebook_ids, self._unauth_gradebook_ids = self._get_auth_and_unauth_gradebook_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_gradebook_id, self._auth_gradebook_ids, self._unauth_gradebook_ids)
         return self._query_session.get_grade_entries_by_query(query)
 
     def get_gradebook_id(self):
@@ -1047,6 +1025,7 @@ class GradeEntryQuerySession(abc_grading_sessions.GradeEntryQuerySession, osid_s
         self._qualifier_id = self._provider_session.get_gradebook_id()
         self._id_namespace = 'grading.GradeEntry'
         self.use_federated_gradebook_view()
+        self._auth_gradebook_ids = None
         self._unauth_gradebook_ids = None
         # self._overriding_gradebook_ids = None
 
@@ -1061,15 +1040,8 @@ class GradeEntryQuerySession(abc_grading_sessions.GradeEntryQuerySession, osid_s
                 query._provider_query.match_gradebook_id(gradebook_id, match=True)
         return self._query_session.get_grade_entries_by_query(query), query
 
-    def _get_unauth_gradebook_ids(self, gradebook_id):
-        if self._can('search', gradebook_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(gradebook_id)]
-        if self._hierarchy_session.has_child_gradebooks(gradebook_id):
-            for child_gradebook_id in self._hierarchy_session.get_child_gradebook_ids(gradebook_id):
-                unauth_list = unauth_list + self._get_unauth_gradebook_ids(child_gradebook_id)
-        return unauth_list
+    def _get_auth_and_unauth_gradebook_ids(self, gradebook_id):
+        return self._get_catalog_idstrs_by_authz('search', gradebook_id, self._hierarchy_session.get_child_gradebook_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_gradebooks(query)
@@ -1079,9 +1051,8 @@ class GradeEntryQuerySession(abc_grading_sessions.GradeEntryQuerySession, osid_s
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_gradebook_ids is None:
-            self._unauth_gradebook_ids = self._get_unauth_gradebook_ids(self._qualifier_id)
-        for gradebook_id in self._unauth_gradebook_ids:
-            query._provider_query.match_gradebook_id(gradebook_id, match=False)
+            self._auth_gradebook_ids, self._unauth_gradebook_ids = self._get_auth_and_unauth_gradebook_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_gradebook_id, self._auth_gradebook_ids, self._unauth_gradebook_ids)
         return self._query_session.get_grade_entries_by_query(query)
 
     class GradeEntryQueryWrapper(QueryWrapper):
@@ -1519,15 +1490,8 @@ class GradebookColumnLookupSession(abc_grading_sessions.GradebookColumnLookupSes
                 query.match_gradebook_id(catalog_id, match=True)
         return self._query_session.get_gradebook_columns_by_query(query), query
 
-    def _get_unauth_gradebook_ids(self, gradebook_id):
-        if self._can('lookup', gradebook_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(gradebook_id)]
-        if self._hierarchy_session.has_child_gradebooks(gradebook_id):
-            for child_gradebook_id in self._hierarchy_session.get_child_gradebook_ids(gradebook_id):
-                unauth_list = unauth_list + self._get_unauth_gradebook_ids(child_gradebook_id)
-        return unauth_list
+    def _get_auth_and_unauth_gradebook_ids(self, gradebook_id):
+        return self._get_catalog_idstrs_by_authz('lookup', gradebook_id, self._hierarchy_session.get_child_gradebook_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_gradebooks(query)
@@ -1539,9 +1503,8 @@ class GradebookColumnLookupSession(abc_grading_sessions.GradebookColumnLookupSes
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_gradebook_ids is None:
-            self._unauth_gradebook_ids = self._get_unauth_gradebook_ids(self._qualifier_id)
-        for gradebook_id in self._unauth_gradebook_ids:
-            query.match_gradebook_id(gradebook_id, match=False)
+            self._auth_gradebook_ids, self._unauth_gradebook_ids = self._get_auth_and_unauth_gradebook_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_gradebook_id, self._auth_gradebook_ids, self._unauth_gradebook_ids)
         return self._query_session.get_gradebook_columns_by_query(query)
 
     def get_gradebook_id(self):
@@ -1691,6 +1654,7 @@ class GradebookColumnQuerySession(abc_grading_sessions.GradebookColumnQuerySessi
         self._qualifier_id = self._provider_session.get_gradebook_id()
         self._id_namespace = 'grading.GradebookColumn'
         self.use_federated_gradebook_view()
+        self._auth_gradebook_ids = None
         self._unauth_gradebook_ids = None
         # self._overriding_gradebook_ids = None
 
@@ -1705,15 +1669,8 @@ class GradebookColumnQuerySession(abc_grading_sessions.GradebookColumnQuerySessi
                 query._provider_query.match_gradebook_id(gradebook_id, match=True)
         return self._query_session.get_gradebook_columns_by_query(query), query
 
-    def _get_unauth_gradebook_ids(self, gradebook_id):
-        if self._can('search', gradebook_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(gradebook_id)]
-        if self._hierarchy_session.has_child_gradebooks(gradebook_id):
-            for child_gradebook_id in self._hierarchy_session.get_child_gradebook_ids(gradebook_id):
-                unauth_list = unauth_list + self._get_unauth_gradebook_ids(child_gradebook_id)
-        return unauth_list
+    def _get_auth_and_unauth_gradebook_ids(self, gradebook_id):
+        return self._get_catalog_idstrs_by_authz('search', gradebook_id, self._hierarchy_session.get_child_gradebook_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_gradebooks(query)
@@ -1723,9 +1680,8 @@ class GradebookColumnQuerySession(abc_grading_sessions.GradebookColumnQuerySessi
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_gradebook_ids is None:
-            self._unauth_gradebook_ids = self._get_unauth_gradebook_ids(self._qualifier_id)
-        for gradebook_id in self._unauth_gradebook_ids:
-            query._provider_query.match_gradebook_id(gradebook_id, match=False)
+            self._auth_gradebook_ids, self._unauth_gradebook_ids = self._get_auth_and_unauth_gradebook_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_gradebook_id, self._auth_gradebook_ids, self._unauth_gradebook_ids)
         return self._query_session.get_gradebook_columns_by_query(query)
 
     class GradebookColumnQueryWrapper(QueryWrapper):
@@ -2707,6 +2663,7 @@ class GradebookHierarchyDesignSession(abc_grading_sessions.GradebookHierarchyDes
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_gradebook(self, gradebook_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -2715,18 +2672,21 @@ class GradebookHierarchyDesignSession(abc_grading_sessions.GradebookHierarchyDes
         return self._provider_session.add_root_gradebook(gradebook_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_gradebook(self, gradebook_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_gradebook(gradebook_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_gradebook(self, gradebook_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_gradebook(gradebook_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_gradebook(self, gradebook_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -105,22 +106,27 @@ class HierarchyDesignSession(abc_hierarchy_sessions.HierarchyDesignSession, osid
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root(self, id_):
         raise Unimplemented()
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child(self, id_, child_id):
         raise Unimplemented()
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root(self, id_):
         raise Unimplemented()
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child(self, id_, child_id):
         raise Unimplemented()
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_children(self, id_):
         raise Unimplemented()
 
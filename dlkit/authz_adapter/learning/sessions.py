@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class ObjectiveLookupSession(abc_learning_sessions.ObjectiveLookupSession, osid_
                 query.match_objective_bank_id(catalog_id, match=True)
         return self._query_session.get_objectives_by_query(query), query
 
-    def _get_unauth_objective_bank_ids(self, objective_bank_id):
-        if self._can('lookup', objective_bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(objective_bank_id)]
-        if self._hierarchy_session.has_child_objective_banks(objective_bank_id):
-            for child_objective_bank_id in self._hierarchy_session.get_child_objective_bank_ids(objective_bank_id):
-                unauth_list = unauth_list + self._get_unauth_objective_bank_ids(child_objective_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_objective_bank_ids(self, objective_bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', objective_bank_id, self._hierarchy_session.get_child_objective_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_objective_banks(query)
@@ -60,9 +54,8 @@ class ObjectiveLookupSession(abc_learning_sessions.ObjectiveLookupSession, osid_
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_objective_bank_ids is None:
-            self._unauth_objective_bank_ids = self._get_unauth_objective_bank_ids(self._qualifier_id)
-        for objective_bank_id in self._unauth_objective_bank_ids:
-            query.match_objective_bank_id(objective_bank_id, match=False)
+            self._auth_objective_bank_ids, self._unauth_objective_bank_ids = self._get_auth_and_unauth_objective_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_objective_bank_id, self._auth_objective_bank_ids, self._unauth_objective_bank_ids)
         return self._query_session.get_objectives_by_query(query)
 
     def get_objective_bank_id(self):
@@ -195,6 +188,7 @@ class ObjectiveQuerySession(abc_learning_sessions.ObjectiveQuerySession, osid_se
         self._qualifier_id = self._provider_session.get_objective_bank_id()
         self._id_namespace = 'learning.Objective'
         self.use_federated_objective_bank_view()
+        self._auth_objective_bank_ids = None
         self._unauth_objective_bank_ids = None
         # self._overriding_objective_bank_ids = None
 
@@ -209,15 +203,8 @@ class ObjectiveQuerySession(abc_learning_sessions.ObjectiveQuerySession, osid_se
                 query._provider_query.match_objective_bank_id(objective_bank_id, match=True)
         return self._query_session.get_objectives_by_query(query), query
 
-    def _get_unauth_objective_bank_ids(self, objective_bank_id):
-        if self._can('search', objective_bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(objective_bank_id)]
-        if self._hierarchy_session.has_child_objective_banks(objective_bank_id):
-            for child_objective_bank_id in self._hierarchy_session.get_child_objective_bank_ids(objective_bank_id):
-                unauth_list = unauth_list + self._get_unauth_objective_bank_ids(child_objective_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_objective_bank_ids(self, objective_bank_id):
+        return self._get_catalog_idstrs_by_authz('search', objective_bank_id, self._hierarchy_session.get_child_objective_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_objective_banks(query)
@@ -227,9 +214,8 @@ class ObjectiveQuerySession(abc_learning_sessions.ObjectiveQuerySession, osid_se
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_objective_bank_ids is None:
-            self._unauth_objective_bank_ids = self._get_unauth_objective_bank_ids(self._qualifier_id)
-        for objective_bank_id in self._unauth_objective_bank_ids:
-            query._provider_query.match_objective_bank_id(objective_bank_id, match=False)
+            self._auth_objective_bank_ids, self._unauth_objective_bank_ids = self._get_auth_and_unauth_objective_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_objective_bank_id, self._auth_objective_bank_ids, self._unauth_objective_bank_ids)
         return self._query_session.get_objectives_by_query(query)
 
     class ObjectiveQueryWrapper(QueryWrapper):
@@ -726,6 +712,7 @@ class ObjectiveHierarchyDesignSession(abc_learning_sessions.ObjectiveHierarchyDe
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_objective(self, objective_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::add_root_subject_template
         if not self._can('modify'):
@@ -733,6 +720,7 @@ class ObjectiveHierarchyDesignSession(abc_learning_sessions.ObjectiveHierarchyDe
         return self._provider_session.add_root_objective(objective_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_objective(self, objective_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::remove_root_subject_template
         if not self._can('modify'):
@@ -740,6 +728,7 @@ class ObjectiveHierarchyDesignSession(abc_learning_sessions.ObjectiveHierarchyDe
         return self._provider_session.remove_root_objective(objective_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_objective(self, objective_id, child_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::add_child_subject_template
         if not self._can('modify'):
@@ -747,6 +736,7 @@ class ObjectiveHierarchyDesignSession(abc_learning_sessions.ObjectiveHierarchyDe
         return self._provider_session.add_child_objective(objective_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_objective(self, objective_id, child_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::remove_child_subject_template
         if not self._can('modify'):
@@ -754,6 +744,7 @@ class ObjectiveHierarchyDesignSession(abc_learning_sessions.ObjectiveHierarchyDe
         return self._provider_session.remove_child_objective(objective_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_objectives(self, objective_id):
         # From azosid_templates/ontology.py::SubjectHierarchyDesignSession::remove_child_subjects_template
         if not self._can('modify'):
@@ -1126,15 +1117,8 @@ class ActivityLookupSession(abc_learning_sessions.ActivityLookupSession, osid_se
                 query.match_objective_bank_id(catalog_id, match=True)
         return self._query_session.get_activities_by_query(query), query
 
-    def _get_unauth_objective_bank_ids(self, objective_bank_id):
-        if self._can('lookup', objective_bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(objective_bank_id)]
-        if self._hierarchy_session.has_child_objective_banks(objective_bank_id):
-            for child_objective_bank_id in self._hierarchy_session.get_child_objective_bank_ids(objective_bank_id):
-                unauth_list = unauth_list + self._get_unauth_objective_bank_ids(child_objective_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_objective_bank_ids(self, objective_bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', objective_bank_id, self._hierarchy_session.get_child_objective_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_objective_banks(query)
@@ -1146,9 +1130,8 @@ class ActivityLookupSession(abc_learning_sessions.ActivityLookupSession, osid_se
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_objective_bank_ids is None:
-            self._unauth_objective_bank_ids = self._get_unauth_objective_bank_ids(self._qualifier_id)
-        for objective_bank_id in self._unauth_objective_bank_ids:
-            query.match_objective_bank_id(objective_bank_id, match=False)
+            self._auth_objective_bank_ids, self._unauth_objective_bank_ids = self._get_auth_and_unauth_objective_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_objective_bank_id, self._auth_objective_bank_ids, self._unauth_objective_bank_ids)
         return self._query_session.get_activities_by_query(query)
 
     def get_objective_bank_id(self):
@@ -1312,6 +1295,7 @@ class ActivityQuerySession(abc_learning_sessions.ActivityQuerySession, osid_sess
         self._qualifier_id = self._provider_session.get_objective_bank_id()
         self._id_namespace = 'learning.Activity'
         self.use_federated_objective_bank_view()
+        self._auth_objective_bank_ids = None
         self._unauth_objective_bank_ids = None
         # self._overriding_objective_bank_ids = None
 
@@ -1326,15 +1310,8 @@ class ActivityQuerySession(abc_learning_sessions.ActivityQuerySession, osid_sess
                 query._provider_query.match_objective_bank_id(objective_bank_id, match=True)
         return self._query_session.get_activities_by_query(query), query
 
-    def _get_unauth_objective_bank_ids(self, objective_bank_id):
-        if self._can('search', objective_bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(objective_bank_id)]
-        if self._hierarchy_session.has_child_objective_banks(objective_bank_id):
-            for child_objective_bank_id in self._hierarchy_session.get_child_objective_bank_ids(objective_bank_id):
-                unauth_list = unauth_list + self._get_unauth_objective_bank_ids(child_objective_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_objective_bank_ids(self, objective_bank_id):
+        return self._get_catalog_idstrs_by_authz('search', objective_bank_id, self._hierarchy_session.get_child_objective_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_objective_banks(query)
@@ -1344,9 +1321,8 @@ class ActivityQuerySession(abc_learning_sessions.ActivityQuerySession, osid_sess
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_objective_bank_ids is None:
-            self._unauth_objective_bank_ids = self._get_unauth_objective_bank_ids(self._qualifier_id)
-        for objective_bank_id in self._unauth_objective_bank_ids:
-            query._provider_query.match_objective_bank_id(objective_bank_id, match=False)
+            self._auth_objective_bank_ids, self._unauth_objective_bank_ids = self._get_auth_and_unauth_objective_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_objective_bank_id, self._auth_objective_bank_ids, self._unauth_objective_bank_ids)
         return self._query_session.get_activities_by_query(query)
 
     class ActivityQueryWrapper(QueryWrapper):
@@ -1918,15 +1894,8 @@ class ProficiencyLookupSession(abc_learning_sessions.ProficiencyLookupSession, o
                 query.match_objective_bank_id(catalog_id, match=True)
         return self._query_session.get_proficiencies_by_query(query), query
 
-    def _get_unauth_objective_bank_ids(self, objective_bank_id):
-        if self._can('lookup', objective_bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(objective_bank_id)]
-        if self._hierarchy_session.has_child_objective_banks(objective_bank_id):
-            for child_objective_bank_id in self._hierarchy_session.get_child_objective_bank_ids(objective_bank_id):
-                unauth_list = unauth_list + self._get_unauth_objective_bank_ids(child_objective_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_objective_bank_ids(self, objective_bank_id):
+        return self._get_catalog_idstrs_by_authz('lookup', objective_bank_id, self._hierarchy_session.get_child_objective_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_objective_banks(query)
@@ -1938,9 +1907,8 @@ class ProficiencyLookupSession(abc_learning_sessions.ProficiencyLookupSession, o
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_objective_bank_ids is None:
-            self._unauth_objective_bank_ids = self._get_unauth_objective_bank_ids(self._qualifier_id)
-        for objective_bank_id in self._unauth_objective_bank_ids:
-            query.match_objective_bank_id(objective_bank_id, match=False)
+            self._auth_objective_bank_ids, self._unauth_objective_bank_ids = self._get_auth_and_unauth_objective_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_objective_bank_id, self._auth_objective_bank_ids, self._unauth_objective_bank_ids)
         return self._query_session.get_proficiencies_by_query(query)
 
     def get_objective_bank_id(self):
@@ -2166,6 +2134,7 @@ class ProficiencyQuerySession(abc_learning_sessions.ProficiencyQuerySession, osi
         self._qualifier_id = self._provider_session.get_objective_bank_id()
         self._id_namespace = 'learning.Proficiency'
         self.use_federated_objective_bank_view()
+        self._auth_objective_bank_ids = None
         self._unauth_objective_bank_ids = None
         # self._overriding_objective_bank_ids = None
 
@@ -2180,15 +2149,8 @@ class ProficiencyQuerySession(abc_learning_sessions.ProficiencyQuerySession, osi
                 query._provider_query.match_objective_bank_id(objective_bank_id, match=True)
         return self._query_session.get_proficiencies_by_query(query), query
 
-    def _get_unauth_objective_bank_ids(self, objective_bank_id):
-        if self._can('search', objective_bank_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(objective_bank_id)]
-        if self._hierarchy_session.has_child_objective_banks(objective_bank_id):
-            for child_objective_bank_id in self._hierarchy_session.get_child_objective_bank_ids(objective_bank_id):
-                unauth_list = unauth_list + self._get_unauth_objective_bank_ids(child_objective_bank_id)
-        return unauth_list
+    def _get_auth_and_unauth_objective_bank_ids(self, objective_bank_id):
+        return self._get_catalog_idstrs_by_authz('search', objective_bank_id, self._hierarchy_session.get_child_objective_bank_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_objective_banks(query)
@@ -2198,9 +2160,8 @@ class ProficiencyQuerySession(abc_learning_sessions.ProficiencyQuerySession, osi
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_objective_bank_ids is None:
-            self._unauth_objective_bank_ids = self._get_unauth_objective_bank_ids(self._qualifier_id)
-        for objective_bank_id in self._unauth_objective_bank_ids:
-            query._provider_query.match_objective_bank_id(objective_bank_id, match=False)
+            self._auth_objective_bank_ids, self._unauth_objective_bank_ids = self._get_auth_and_unauth_objective_bank_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_objective_bank_id, self._auth_objective_bank_ids, self._unauth_objective_bank_ids)
         return self._query_session.get_proficiencies_by_query(query)
 
     class ProficiencyQueryWrapper(QueryWrapper):
@@ -3406,6 +3367,7 @@ class ObjectiveBankHierarchyDesignSession(abc_learning_sessions.ObjectiveBankHie
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_objective_bank(self, objective_bank_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -3414,24 +3376,28 @@ class ObjectiveBankHierarchyDesignSession(abc_learning_sessions.ObjectiveBankHie
         return self._provider_session.add_root_objective_bank(objective_bank_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_objective_bank(self, objective_bank_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_objective_bank(objective_bank_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_objective_bank(self, objective_bank_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_objective_bank(objective_bank_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_objective_bank(self, objective_bank_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_objective_bank(objective_bank_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_objective_banks(self, objective_bank_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -102,15 +103,8 @@ class LogEntryLookupSession(abc_logging_sessions.LogEntryLookupSession, osid_ses
                 query.match_log_id(catalog_id, match=True)
         return self._query_session.get_log_entries_by_query(query), query
 
-    def _get_unauth_log_ids(self, log_id):
-        if self._can('lookup', log_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(log_id)]
-        if self._hierarchy_session.has_child_logs(log_id):
-            for child_log_id in self._hierarchy_session.get_child_log_ids(log_id):
-                unauth_list = unauth_list + self._get_unauth_log_ids(child_log_id)
-        return unauth_list
+    def _get_auth_and_unauth_log_ids(self, log_id):
+        return self._get_catalog_idstrs_by_authz('lookup', log_id, self._hierarchy_session.get_child_log_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_logs(query)
@@ -122,9 +116,8 @@ class LogEntryLookupSession(abc_logging_sessions.LogEntryLookupSession, osid_ses
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_log_ids is None:
-            self._unauth_log_ids = self._get_unauth_log_ids(self._qualifier_id)
-        for log_id in self._unauth_log_ids:
-            query.match_log_id(log_id, match=False)
+            self._auth_log_ids, self._unauth_log_ids = self._get_auth_and_unauth_log_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_log_id, self._auth_log_ids, self._unauth_log_ids)
         return self._query_session.get_log_entries_by_query(query)
 
     def get_log_id(self):
@@ -283,6 +276,7 @@ class LogEntryQuerySession(abc_logging_sessions.LogEntryQuerySession, osid_sessi
         self._qualifier_id = self._provider_session.get_log_id()
         self._id_namespace = 'logging.LogEntry'
         self.use_federated_log_view()
+        self._auth_log_ids = None
         self._unauth_log_ids = None
         # self._overriding_log_ids = None
 
@@ -297,15 +291,8 @@ class LogEntryQuerySession(abc_logging_sessions.LogEntryQuerySession, osid_sessi
                 query._provider_query.match_log_id(log_id, match=True)
         return self._query_session.get_log_entries_by_query(query), query
 
-    def _get_unauth_log_ids(self, log_id):
-        if self._can('search', log_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(log_id)]
-        if self._hierarchy_session.has_child_logs(log_id):
-            for child_log_id in self._hierarchy_session.get_child_log_ids(log_id):
-                unauth_list = unauth_list + self._get_unauth_log_ids(child_log_id)
-        return unauth_list
+    def _get_auth_and_unauth_log_ids(self, log_id):
+        return self._get_catalog_idstrs_by_authz('search', log_id, self._hierarchy_session.get_child_log_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_logs(query)
@@ -315,9 +302,8 @@ class LogEntryQuerySession(abc_logging_sessions.LogEntryQuerySession, osid_sessi
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_log_ids is None:
-            self._unauth_log_ids = self._get_unauth_log_ids(self._qualifier_id)
-        for log_id in self._unauth_log_ids:
-            query._provider_query.match_log_id(log_id, match=False)
+            self._auth_log_ids, self._unauth_log_ids = self._get_auth_and_unauth_log_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_log_id, self._auth_log_ids, self._unauth_log_ids)
         return self._query_session.get_log_entries_by_query(query)
 
     class LogEntryQueryWrapper(QueryWrapper):
@@ -1366,6 +1352,7 @@ class LogHierarchyDesignSession(abc_logging_sessions.LogHierarchyDesignSession,
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_log(self, log_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -1374,24 +1361,28 @@ class LogHierarchyDesignSession(abc_logging_sessions.LogHierarchyDesignSession,
         return self._provider_session.add_root_log(log_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_log(self, log_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_log(log_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_log(self, log_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_log(log_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_log(self, log_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_log(log_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_logs(self, log_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import listen_to_json_oplog
 from ..osid import markers as osid_markers
 from ..osid.osid_errors import Unimplemented, IllegalState, NullArgument
 from ..primitives import Id
@@ -32,6 +33,7 @@ class OsidProfile(abc_osid_managers.OsidProfile, osid_markers.Sourceable):
         if self._my_runtime is not None:
             raise IllegalState('this manager has already been initialized.')
         self._my_runtime = runtime
+        listen_to_json_oplog()
 
     def _get_authz_manager(self):
         config = self._my_runtime.get_configuration()
@@ -7,6 +7,9 @@
 #     Inheritance defined in specification
 
 
+import logging
+
+from ..decision_cache import AUTHZ_DECISION_CACHE
 from ..osid.osid_errors import IllegalState, Unimplemented
 from ..osid.osid_errors import PermissionDenied
 from ..primitives import Id
@@ -19,6 +22,8 @@ PLENARY = 1
 FEDERATED = 0
 ISOLATED = 1
 
+LOG = logging.getLogger(__name__)
+
 
 class OsidSession(abc_osid_sessions.OsidSession):
     """Adapts underlying OsidSession methodswith authorization checks."""
@@ -38,7 +43,7 @@ class OsidSession(abc_osid_sessions.OsidSession):
         self._object_catalog_session = None
         self._id_namespace = None
         self._qualifier_id = None
-        self._authz_cache = dict()  # Does this want to be a real cache???
+        self._authz_vault_idstr = None
         self._overriding_catalog_ids = None
         self._object_view = COMPARATIVE
         self._catalog_view = FEDERATED
@@ -49,27 +54,112 @@ class OsidSession(abc_osid_sessions.OsidSession):
             namespace=self._id_namespace,
             authority='ODL.MIT.EDU')
 
+    def _get_authz_vault_idstr(self):
+        """Gets the Id string of the vault the authorization session checks"""
+        if self._authz_vault_idstr is None:
+            try:
+                self._authz_vault_idstr = str(self._authz_session.get_vault_id())
+            except (AttributeError, Unimplemented):
+                self._authz_vault_idstr = ''
+        return self._authz_vault_idstr
+
     def _can(self, func_name, qualifier_id=None):
         """Tests if the named function is authorized with agent and qualifier.
 
-        Also, caches authz's in a dict.  It is expected that this will not grow to big, as
-        there are typically only a small number of qualifier + function combinations to
-        store for the agent.  However, if this becomes an issue, we can switch to something
-        like cachetools.
+        The decisions are kept in the process-wide ``AUTHZ_DECISION_CACHE``,
+        which writes through the authz adapter invalidate.
 
         """
-        function_id = self._get_function_id(func_name)
         if qualifier_id is None:
             qualifier_id = self._qualifier_id
+        return self._can_all(func_name, [qualifier_id])[0]
+
+    def _can_all(self, func_name, qualifier_ids):
+        """Tests if the named function is authorized with agent on each of the qualifiers.
+
+        The decisions that are not cached are asked for with one
+        ``are_authorized()`` call, if the authorization session has it.
+
+        """
+        function_id = self._get_function_id(func_name)
         agent_id = self.get_effective_agent_id()
-        try:
-            return self._authz_cache[str(agent_id) + str(function_id) + str(qualifier_id)]
-        except KeyError:
-            authz = self._authz_session.is_authorized(agent_id=agent_id,
-                                                      function_id=function_id,
-                                                      qualifier_id=qualifier_id)
-            self._authz_cache[str(agent_id) + str(function_id) + str(qualifier_id)] = authz
-            return authz
+        keys = [(self._get_authz_vault_idstr(), str(agent_id), str(function_id), str(qualifier_id))
+                for qualifier_id in qualifier_ids]
+        decisions = [AUTHZ_DECISION_CACHE.get(key) for key in keys]
+        uncached_indexes = [index for index, authz in enumerate(decisions) if authz is None]
+        if uncached_indexes:
+            generation = AUTHZ_DECISION_CACHE.get_generation()
+            if hasattr(self._authz_session, 'are_authorized'):
+                uncached_decisions = self._authz_session.are_authorized(
+                    agent_id=agent_id,
+                    function_ids=[function_id],
+                    qualifier_ids=[qualifier_ids[index] for index in uncached_indexes])[0]
+            else:
+                uncached_decisions = [self._authz_session.is_authorized(agent_id=agent_id,
+                                                                        function_id=function_id,
+                                                                        qualifier_id=qualifier_ids[index])
+                                      for index in uncached_indexes]
+            for index, authz in zip(uncached_indexes, uncached_decisions):
+                decisions[index] = authz
+                AUTHZ_DECISION_CACHE.put(keys[index], bool(authz), generation=generation)
+        return decisions
+
+    def _get_catalog_idstrs_by_authz(self, func_name, catalog_id, get_child_catalog_ids):
+        """Splits the Id strings of a catalog and of its descendants into the
+        ones the named function is authorized for and the ones it is not.
+
+        The catalogs are checked a level at a time, with one ``_can_all()``
+        per level, and the descendants of authorized catalogs are not
+        checked, as authorizations are inherited.
+
+        """
+        seen = set()
+
+        def get_unseen(catalog_ids):
+            unseen_catalog_ids = []
+            for catalog_id in catalog_ids:
+                if str(catalog_id) not in seen:
+                    seen.add(str(catalog_id))
+                    unseen_catalog_ids.append(catalog_id)
+            return unseen_catalog_ids
+
+        auth_list = []
+        unauth_list = []
+        inherited_catalog_ids = []
+        catalog_ids = get_unseen([catalog_id])
+        while inherited_catalog_ids or catalog_ids:
+            next_inherited_catalog_ids = []
+            next_catalog_ids = []
+            for catalog_id in inherited_catalog_ids:
+                auth_list.append(str(catalog_id))
+                next_inherited_catalog_ids += list(get_child_catalog_ids(catalog_id))
+            for catalog_id, authz in zip(catalog_ids, self._can_all(func_name, catalog_ids)):
+                if authz:
+                    auth_list.append(str(catalog_id))
+                    next_inherited_catalog_ids += list(get_child_catalog_ids(catalog_id))
+                else:
+                    unauth_list.append(str(catalog_id))
+                    next_catalog_ids += list(get_child_catalog_ids(catalog_id))
+            inherited_catalog_ids = get_unseen(next_inherited_catalog_ids)
+            catalog_ids = get_unseen(next_catalog_ids)
+        return auth_list, unauth_list
+
+    def _match_authz_catalog_ids(self, match_catalog_id, auth_catalog_idstrs, unauth_catalog_idstrs):
+        """Restricts a query to the catalogs the agent is authorized for.
+
+        The authorized catalogs are matched positively, which the providers
+        turn into a single ``$in`` term, and the number of them is returned.
+        If there are none, the unauthorized catalogs are excluded instead.
+
+        """
+        if auth_catalog_idstrs:
+            for catalog_idstr in auth_catalog_idstrs:
+                match_catalog_id(Id(catalog_idstr), match=True)
+        else:
+            for catalog_idstr in unauth_catalog_idstrs:
+                match_catalog_id(Id(catalog_idstr), match=False)
+        LOG.debug('%s matched %d authorized catalogs', self.__class__.__name__, len(auth_catalog_idstrs))
+        return len(auth_catalog_idstrs)
 
     def _can_for_object(self, func_name, object_id, method_name):
         """Checks if agent can perform function for object"""
@@ -79,18 +169,37 @@ class OsidSession(abc_osid_sessions.OsidSession):
                 self._override_lookup_session is None):
             return can_for_session
 
-        override_auths = self._override_lookup_session.get_authorizations_for_agent_and_function(
-            self.get_effective_agent_id(),
-            self._get_function_id(func_name))
-        if not override_auths.available():
+        override_qualifier_idstrs = self._get_override_qualifier_idstrs(func_name)
+        if not override_qualifier_idstrs:
             return False
 
-        if self._object_catalog_session is not None:
-            catalog_ids = list(getattr(self._object_catalog_session, method_name)(object_id))
-            for auth in override_auths:
-                if auth.get_qualifier_id() in catalog_ids:
-                    return True
-        return False
+        catalog_ids = getattr(self._object_catalog_session, method_name)(object_id)
+        return any(str(catalog_id) in override_qualifier_idstrs for catalog_id in catalog_ids)
+
+    def _get_override_qualifier_idstrs(self, func_name):
+        """Gets the Id strings of the qualifiers of the agent's overriding
+        authorizations for the named function.
+
+        They are kept in the ``AUTHZ_DECISION_CACHE``, so they expire and
+        are invalidated like the decisions.
+
+        """
+        agent_id = self.get_effective_agent_id()
+        function_id = self._get_function_id(func_name)
+        try:
+            override_vault_idstr = str(self._override_lookup_session.get_vault_id())
+        except (AttributeError, Unimplemented):
+            override_vault_idstr = ''
+        key = ('override', override_vault_idstr, str(agent_id), str(function_id))
+        override_qualifier_idstrs = AUTHZ_DECISION_CACHE.get(key)
+        if override_qualifier_idstrs is None:
+            generation = AUTHZ_DECISION_CACHE.get_generation()
+            override_auths = self._override_lookup_session.get_authorizations_for_agent_and_function(
+                agent_id,
+                function_id)
+            override_qualifier_idstrs = frozenset(str(auth.get_qualifier_id()) for auth in override_auths)
+            AUTHZ_DECISION_CACHE.put(key, override_qualifier_idstrs, generation=generation)
+        return override_qualifier_idstrs
 
     def _get_overriding_catalog_ids(self, func_name):
         if self._overriding_catalog_ids is None and self._override_lookup_session is not None:
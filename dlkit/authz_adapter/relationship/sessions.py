@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class RelationshipLookupSession(abc_relationship_sessions.RelationshipLookupSess
                 query.match_family_id(catalog_id, match=True)
         return self._query_session.get_relationships_by_query(query), query
 
-    def _get_unauth_family_ids(self, family_id):
-        if self._can('lookup', family_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(family_id)]
-        if self._hierarchy_session.has_child_families(family_id):
-            for child_family_id in self._hierarchy_session.get_child_family_ids(family_id):
-                unauth_list = unauth_list + self._get_unauth_family_ids(child_family_id)
-        return unauth_list
+    def _get_auth_and_unauth_family_ids(self, family_id):
+        return self._get_catalog_idstrs_by_authz('lookup', family_id, self._hierarchy_session.get_child_family_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_families(query)
@@ -60,9 +54,8 @@ class RelationshipLookupSession(abc_relationship_sessions.RelationshipLookupSess
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_family_ids is None:
-            self._unauth_family_ids = self._get_unauth_family_ids(self._qualifier_id)
-        for family_id in self._unauth_family_ids:
-            query.match_family_id(family_id, match=False)
+            self._auth_family_ids, self._unauth_family_ids = self._get_auth_and_unauth_family_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_family_id, self._auth_family_ids, self._unauth_family_ids)
         return self._query_session.get_relationships_by_query(query)
 
     def get_family_id(self):
@@ -269,6 +262,7 @@ class RelationshipQuerySession(abc_relationship_sessions.RelationshipQuerySessio
         self._qualifier_id = self._provider_session.get_family_id()
         self._id_namespace = 'relationship.Relationship'
         self.use_federated_family_view()
+        self._auth_family_ids = None
         self._unauth_family_ids = None
         # self._overriding_family_ids = None
 
@@ -283,15 +277,8 @@ class RelationshipQuerySession(abc_relationship_sessions.RelationshipQuerySessio
                 query._provider_query.match_family_id(family_id, match=True)
         return self._query_session.get_relationships_by_query(query), query
 
-    def _get_unauth_family_ids(self, family_id):
-        if self._can('search', family_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(family_id)]
-        if self._hierarchy_session.has_child_families(family_id):
-            for child_family_id in self._hierarchy_session.get_child_family_ids(family_id):
-                unauth_list = unauth_list + self._get_unauth_family_ids(child_family_id)
-        return unauth_list
+    def _get_auth_and_unauth_family_ids(self, family_id):
+        return self._get_catalog_idstrs_by_authz('search', family_id, self._hierarchy_session.get_child_family_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_families(query)
@@ -301,9 +288,8 @@ class RelationshipQuerySession(abc_relationship_sessions.RelationshipQuerySessio
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_family_ids is None:
-            self._unauth_family_ids = self._get_unauth_family_ids(self._qualifier_id)
-        for family_id in self._unauth_family_ids:
-            query._provider_query.match_family_id(family_id, match=False)
+            self._auth_family_ids, self._unauth_family_ids = self._get_auth_and_unauth_family_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_family_id, self._auth_family_ids, self._unauth_family_ids)
         return self._query_session.get_relationships_by_query(query)
 
     class RelationshipQueryWrapper(QueryWrapper):
@@ -1378,6 +1364,7 @@ class FamilyHierarchyDesignSession(abc_relationship_sessions.FamilyHierarchyDesi
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_family(self, family_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -1386,24 +1373,28 @@ class FamilyHierarchyDesignSession(abc_relationship_sessions.FamilyHierarchyDesi
         return self._provider_session.add_root_family(family_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_family(self, family_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_family(family_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_family(self, family_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_family(family_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_family(self, family_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_family(family_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_families(self, family_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class AssetLookupSession(abc_repository_sessions.AssetLookupSession, osid_sessio
                 query.match_repository_id(catalog_id, match=True)
         return self._query_session.get_assets_by_query(query), query
 
-    def _get_unauth_repository_ids(self, repository_id):
-        if self._can('lookup', repository_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(repository_id)]
-        if self._hierarchy_session.has_child_repositories(repository_id):
-            for child_repository_id in self._hierarchy_session.get_child_repository_ids(repository_id):
-                unauth_list = unauth_list + self._get_unauth_repository_ids(child_repository_id)
-        return unauth_list
+    def _get_auth_and_unauth_repository_ids(self, repository_id):
+        return self._get_catalog_idstrs_by_authz('lookup', repository_id, self._hierarchy_session.get_child_repository_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_repositories(query)
@@ -60,9 +54,8 @@ class AssetLookupSession(abc_repository_sessions.AssetLookupSession, osid_sessio
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_repository_ids is None:
-            self._unauth_repository_ids = self._get_unauth_repository_ids(self._qualifier_id)
-        for repository_id in self._unauth_repository_ids:
-            query.match_repository_id(repository_id, match=False)
+            self._auth_repository_ids, self._unauth_repository_ids = self._get_auth_and_unauth_repository_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_repository_id, self._auth_repository_ids, self._unauth_repository_ids)
         return self._query_session.get_assets_by_query(query)
 
     def get_repository_id(self):
@@ -207,15 +200,8 @@ class AssetContentLookupSession(abc_repository_sessions.AssetContentLookupSessio
         self._auth_repository_ids = None
         self._unauth_repository_ids = None
 
-    def _get_unauth_repository_ids(self, repository_id):
-        if self._can('lookup', repository_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(repository_id)]
-        if self._hierarchy_session.has_child_repositories(repository_id):
-            for child_repository_id in self._hierarchy_session.get_child_repository_ids(repository_id):
-                unauth_list = unauth_list + self._get_unauth_repository_ids(child_repository_id)
-        return unauth_list
+    def _get_auth_and_unauth_repository_ids(self, repository_id):
+        return self._get_catalog_idstrs_by_authz('lookup', repository_id, self._hierarchy_session.get_child_repository_ids)
 
     def _try_harder(self, query):
         if self._hierarchy_session is None or self._query_session is None:
@@ -223,9 +209,8 @@ class AssetContentLookupSession(abc_repository_sessions.AssetContentLookupSessio
             # perhaps through a query.match_any(match = None)?
             raise PermissionDenied()
         if self._unauth_repository_ids is None:
-            self._unauth_repository_ids = self._get_unauth_repository_ids(self._qualifier_id)
-        for repository_id in self._unauth_repository_ids:
-            query.match_repository_id(repository_id, match=False)
+            self._auth_repository_ids, self._unauth_repository_ids = self._get_auth_and_unauth_repository_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_repository_id, self._auth_repository_ids, self._unauth_repository_ids)
         return self._query_session.get_assets_by_query(query)
 
     def get_repository_id(self):
@@ -326,6 +311,7 @@ class AssetQuerySession(abc_repository_sessions.AssetQuerySession, osid_sessions
         self._qualifier_id = self._provider_session.get_repository_id()
         self._id_namespace = 'repository.Asset'
         self.use_federated_repository_view()
+        self._auth_repository_ids = None
         self._unauth_repository_ids = None
         # self._overriding_repository_ids = None
 
@@ -340,15 +326,8 @@ class AssetQuerySession(abc_repository_sessions.AssetQuerySession, osid_sessions
                 query._provider_query.match_repository_id(repository_id, match=True)
         return self._query_session.get_assets_by_query(query), query
 
-    def _get_unauth_repository_ids(self, repository_id):
-        if self._can('search', repository_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(repository_id)]
-        if self._hierarchy_session.has_child_repositories(repository_id):
-            for child_repository_id in self._hierarchy_session.get_child_repository_ids(repository_id):
-                unauth_list = unauth_list + self._get_unauth_repository_ids(child_repository_id)
-        return unauth_list
+    def _get_auth_and_unauth_repository_ids(self, repository_id):
+        return self._get_catalog_idstrs_by_authz('search', repository_id, self._hierarchy_session.get_child_repository_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_repositories(query)
@@ -358,9 +337,8 @@ class AssetQuerySession(abc_repository_sessions.AssetQuerySession, osid_sessions
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_repository_ids is None:
-            self._unauth_repository_ids = self._get_unauth_repository_ids(self._qualifier_id)
-        for repository_id in self._unauth_repository_ids:
-            query._provider_query.match_repository_id(repository_id, match=False)
+            self._auth_repository_ids, self._unauth_repository_ids = self._get_auth_and_unauth_repository_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_repository_id, self._auth_repository_ids, self._unauth_repository_ids)
         return self._query_session.get_assets_by_query(query)
 
     class AssetQueryWrapper(QueryWrapper):
@@ -564,6 +542,11 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
             raise PermissionDenied()
         return self._provider_session.create_asset(asset_form)
 
+    def create_assets(self, asset_forms):
+        if not self._can('create'):
+            raise PermissionDenied()
+        return self._provider_session.create_assets(asset_forms)
+
     def can_update_assets(self):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.can_update_resources
@@ -591,6 +574,11 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
             raise PermissionDenied()
         return self._provider_session.update_asset(asset_form)
 
+    def update_assets(self, asset_forms):
+        if not self._can('update'):
+            raise PermissionDenied()
+        return self._provider_session.update_assets(asset_forms)
+
     def can_delete_assets(self):
         # Implemented from azosid template for -
         # osid.resource.ResourceAdminSession.can_delete_resources
@@ -1350,15 +1338,8 @@ class CompositionLookupSession(abc_repository_sessions.CompositionLookupSession,
                 query.match_repository_id(catalog_id, match=True)
         return self._query_session.get_compositions_by_query(query), query
 
-    def _get_unauth_repository_ids(self, repository_id):
-        if self._can('lookup', repository_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(repository_id)]
-        if self._hierarchy_session.has_child_repositories(repository_id):
-            for child_repository_id in self._hierarchy_session.get_child_repository_ids(repository_id):
-                unauth_list = unauth_list + self._get_unauth_repository_ids(child_repository_id)
-        return unauth_list
+    def _get_auth_and_unauth_repository_ids(self, repository_id):
+        return self._get_catalog_idstrs_by_authz('lookup', repository_id, self._hierarchy_session.get_child_repository_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_repositories(query)
@@ -1370,9 +1351,8 @@ class CompositionLookupSession(abc_repository_sessions.CompositionLookupSession,
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_repository_ids is None:
-            self._unauth_repository_ids = self._get_unauth_repository_ids(self._qualifier_id)
-        for repository_id in self._unauth_repository_ids:
-            query.match_repository_id(repository_id, match=False)
+            self._auth_repository_ids, self._unauth_repository_ids = self._get_auth_and_unauth_repository_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_repository_id, self._auth_repository_ids, self._unauth_repository_ids)
         return self._query_session.get_compositions_by_query(query)
 
     def get_repository_id(self):
@@ -1529,6 +1509,7 @@ class CompositionQuerySession(abc_repository_sessions.CompositionQuerySession, o
         self._qualifier_id = self._provider_session.get_repository_id()
         self._id_namespace = 'repository.Composition'
         self.use_federated_repository_view()
+        self._auth_repository_ids = None
         self._unauth_repository_ids = None
         # self._overriding_repository_ids = None
 
@@ -1543,15 +1524,8 @@ class CompositionQuerySession(abc_repository_sessions.CompositionQuerySession, o
                 query._provider_query.match_repository_id(repository_id, match=True)
         return self._query_session.get_compositions_by_query(query), query
 
-    def _get_unauth_repository_ids(self, repository_id):
-        if self._can('search', repository_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(repository_id)]
-        if self._hierarchy_session.has_child_repositories(repository_id):
-            for child_repository_id in self._hierarchy_session.get_child_repository_ids(repository_id):
-                unauth_list = unauth_list + self._get_unauth_repository_ids(child_repository_id)
-        return unauth_list
+    def _get_auth_and_unauth_repository_ids(self, repository_id):
+        return self._get_catalog_idstrs_by_authz('search', repository_id, self._hierarchy_session.get_child_repository_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_repositories(query)
@@ -1561,9 +1535,8 @@ class CompositionQuerySession(abc_repository_sessions.CompositionQuerySession, o
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_repository_ids is None:
-            self._unauth_repository_ids = self._get_unauth_repository_ids(self._qualifier_id)
-        for repository_id in self._unauth_repository_ids:
-            query._provider_query.match_repository_id(repository_id, match=False)
+            self._auth_repository_ids, self._unauth_repository_ids = self._get_auth_and_unauth_repository_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_repository_id, self._auth_repository_ids, self._unauth_repository_ids)
         return self._query_session.get_compositions_by_query(query)
 
     class CompositionQueryWrapper(QueryWrapper):
@@ -2557,6 +2530,7 @@ class RepositoryHierarchyDesignSession(abc_repository_sessions.RepositoryHierarc
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_repository(self, repository_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -2565,24 +2539,28 @@ class RepositoryHierarchyDesignSession(abc_repository_sessions.RepositoryHierarc
         return self._provider_session.add_root_repository(repository_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_repository(self, repository_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_repository(repository_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_repository(self, repository_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_repository(repository_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_repository(self, repository_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_repository(repository_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_repositories(self, repository_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -7,6 +7,7 @@
 #     Inheritance defined in specification
 
 
+from ..decision_cache import invalidates_decisions
 from ..osid import sessions as osid_sessions
 from ..osid.osid_errors import NotFound
 from ..osid.osid_errors import PermissionDenied, NullArgument, Unimplemented
@@ -40,15 +41,8 @@ class ResourceLookupSession(abc_resource_sessions.ResourceLookupSession, osid_se
                 query.match_bin_id(catalog_id, match=True)
         return self._query_session.get_resources_by_query(query), query
 
-    def _get_unauth_bin_ids(self, bin_id):
-        if self._can('lookup', bin_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bin_id)]
-        if self._hierarchy_session.has_child_bins(bin_id):
-            for child_bin_id in self._hierarchy_session.get_child_bin_ids(bin_id):
-                unauth_list = unauth_list + self._get_unauth_bin_ids(child_bin_id)
-        return unauth_list
+    def _get_auth_and_unauth_bin_ids(self, bin_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bin_id, self._hierarchy_session.get_child_bin_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_bins(query)
@@ -60,9 +54,8 @@ class ResourceLookupSession(abc_resource_sessions.ResourceLookupSession, osid_se
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bin_ids is None:
-            self._unauth_bin_ids = self._get_unauth_bin_ids(self._qualifier_id)
-        for bin_id in self._unauth_bin_ids:
-            query.match_bin_id(bin_id, match=False)
+            self._auth_bin_ids, self._unauth_bin_ids = self._get_auth_and_unauth_bin_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bin_id, self._auth_bin_ids, self._unauth_bin_ids)
         return self._query_session.get_resources_by_query(query)
 
     def get_bin_id(self):
@@ -195,6 +188,7 @@ class ResourceQuerySession(abc_resource_sessions.ResourceQuerySession, osid_sess
         self._qualifier_id = self._provider_session.get_bin_id()
         self._id_namespace = 'resource.Resource'
         self.use_federated_bin_view()
+        self._auth_bin_ids = None
         self._unauth_bin_ids = None
         # self._overriding_bin_ids = None
 
@@ -209,15 +203,8 @@ class ResourceQuerySession(abc_resource_sessions.ResourceQuerySession, osid_sess
                 query._provider_query.match_bin_id(bin_id, match=True)
         return self._query_session.get_resources_by_query(query), query
 
-    def _get_unauth_bin_ids(self, bin_id):
-        if self._can('search', bin_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bin_id)]
-        if self._hierarchy_session.has_child_bins(bin_id):
-            for child_bin_id in self._hierarchy_session.get_child_bin_ids(bin_id):
-                unauth_list = unauth_list + self._get_unauth_bin_ids(child_bin_id)
-        return unauth_list
+    def _get_auth_and_unauth_bin_ids(self, bin_id):
+        return self._get_catalog_idstrs_by_authz('search', bin_id, self._hierarchy_session.get_child_bin_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_bins(query)
@@ -227,9 +214,8 @@ class ResourceQuerySession(abc_resource_sessions.ResourceQuerySession, osid_sess
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bin_ids is None:
-            self._unauth_bin_ids = self._get_unauth_bin_ids(self._qualifier_id)
-        for bin_id in self._unauth_bin_ids:
-            query._provider_query.match_bin_id(bin_id, match=False)
+            self._auth_bin_ids, self._unauth_bin_ids = self._get_auth_and_unauth_bin_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bin_id, self._auth_bin_ids, self._unauth_bin_ids)
         return self._query_session.get_resources_by_query(query)
 
     class ResourceQueryWrapper(QueryWrapper):
@@ -1181,15 +1167,8 @@ class ResourceRelationshipLookupSession(abc_resource_sessions.ResourceRelationsh
                 query.match_bin_id(catalog_id, match=True)
         return self._query_session.get_resource_relationships_by_query(query), query
 
-    def _get_unauth_bin_ids(self, bin_id):
-        if self._can('lookup', bin_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bin_id)]
-        if self._hierarchy_session.has_child_bins(bin_id):
-            for child_bin_id in self._hierarchy_session.get_child_bin_ids(bin_id):
-                unauth_list = unauth_list + self._get_unauth_bin_ids(child_bin_id)
-        return unauth_list
+    def _get_auth_and_unauth_bin_ids(self, bin_id):
+        return self._get_catalog_idstrs_by_authz('lookup', bin_id, self._hierarchy_session.get_child_bin_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_bins(query)
@@ -1201,9 +1180,8 @@ class ResourceRelationshipLookupSession(abc_resource_sessions.ResourceRelationsh
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bin_ids is None:
-            self._unauth_bin_ids = self._get_unauth_bin_ids(self._qualifier_id)
-        for bin_id in self._unauth_bin_ids:
-            query.match_bin_id(bin_id, match=False)
+            self._auth_bin_ids, self._unauth_bin_ids = self._get_auth_and_unauth_bin_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query.match_bin_id, self._auth_bin_ids, self._unauth_bin_ids)
         return self._query_session.get_resource_relationships_by_query(query)
 
     def get_bin_id(self):
@@ -1410,6 +1388,7 @@ class ResourceRelationshipQuerySession(abc_resource_sessions.ResourceRelationshi
         self._qualifier_id = self._provider_session.get_bin_id()
         self._id_namespace = 'resource.ResourceRelationship'
         self.use_federated_bin_view()
+        self._auth_bin_ids = None
         self._unauth_bin_ids = None
         # self._overriding_bin_ids = None
 
@@ -1424,15 +1403,8 @@ class ResourceRelationshipQuerySession(abc_resource_sessions.ResourceRelationshi
                 query._provider_query.match_bin_id(bin_id, match=True)
         return self._query_session.get_resource_relationships_by_query(query), query
 
-    def _get_unauth_bin_ids(self, bin_id):
-        if self._can('search', bin_id):
-            return []  # Don't go further - assumes authorizations inherited
-        else:
-            unauth_list = [str(bin_id)]
-        if self._hierarchy_session.has_child_bins(bin_id):
-            for child_bin_id in self._hierarchy_session.get_child_bin_ids(bin_id):
-                unauth_list = unauth_list + self._get_unauth_bin_ids(child_bin_id)
-        return unauth_list
+    def _get_auth_and_unauth_bin_ids(self, bin_id):
+        return self._get_catalog_idstrs_by_authz('search', bin_id, self._hierarchy_session.get_child_bin_ids)
 
     def _try_harder(self, query):
         results, query = self._try_overriding_bins(query)
@@ -1442,9 +1414,8 @@ class ResourceRelationshipQuerySession(abc_resource_sessions.ResourceRelationshi
         if self._hierarchy_session is None or self._query_session is None:
             return results
         if self._unauth_bin_ids is None:
-            self._unauth_bin_ids = self._get_unauth_bin_ids(self._qualifier_id)
-        for bin_id in self._unauth_bin_ids:
-            query._provider_query.match_bin_id(bin_id, match=False)
+            self._auth_bin_ids, self._unauth_bin_ids = self._get_auth_and_unauth_bin_ids(self._qualifier_id)
+        self._match_authz_catalog_ids(query._provider_query.match_bin_id, self._auth_bin_ids, self._unauth_bin_ids)
         return self._query_session.get_resource_relationships_by_query(query)
 
     class ResourceRelationshipQueryWrapper(QueryWrapper):
@@ -2484,6 +2455,7 @@ class BinHierarchyDesignSession(abc_resource_sessions.BinHierarchyDesignSession,
         return self._can('modify')
 
     @raise_null_argument
+    @invalidates_decisions
     def add_root_bin(self, bin_id):
         # Implemented from azosid template for -
         # osid.resource.BinHierarchyDesignSession.add_root_bin_template
@@ -2492,24 +2464,28 @@ class BinHierarchyDesignSession(abc_resource_sessions.BinHierarchyDesignSession,
         return self._provider_session.add_root_bin(bin_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_root_bin(self, bin_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_root_bin(bin_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def add_child_bin(self, bin_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.add_child_bin(bin_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_bin(self, bin_id, child_id):
         if not self._can('modify'):
             raise PermissionDenied()
         return self._provider_session.remove_child_bin(bin_id, child_id)
 
     @raise_null_argument
+    @invalidates_decisions
     def remove_child_bins(self, bin_id):
         if not self._can('modify'):
             raise PermissionDenied()
@@ -941,6 +941,17 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
         # osid.resource.ResourceAdminSession.create_resource_template
         return self._provider_session.create_asset(asset_form)
 
+    def create_assets(self, asset_forms=None):
+        """Creates several new ``Assets`` with one bulk write.
+
+        arg:    asset_forms (osid.repository.AssetForm[]): the forms for
+                the new ``Assets``
+        return: (osid.repository.AssetList) - the new ``Assets``
+        *compliance: optional -- This method is not in the OSID spec.*
+
+        """
+        return self._provider_session.create_assets(asset_forms)
+
     def can_update_assets(self):
         """Tests if this user can update ``Assets``.
 
@@ -1001,6 +1012,17 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
         """
         return Asset(self._provider_session.update_asset(asset_form), self._config_map)
 
+    def update_assets(self, asset_forms=None):
+        """Updates several existing ``Assets`` with one bulk write.
+
+        arg:    asset_forms (osid.repository.AssetForm[]): the forms
+                containing the elements to be updated
+        return: (osid.repository.AssetList) - the updated ``Assets``
+        *compliance: optional -- This method is not in the OSID spec.*
+
+        """
+        return AssetList(self._provider_session.update_assets(asset_forms), self._config_map)
+
     def can_delete_assets(self):
         """Tests if this user can delete ``Assets``.
 
@@ -1,13 +1,20 @@
 """Supporting objects to be instantiated at runtime"""
 
-from dlkit.abstract_osid.osid.errors import OperationFailed, IllegalState
+from dlkit.abstract_osid.osid.errors import OperationFailed, IllegalState, NotFound
 from dlkit.primordium.id.primitives import Id
-import time
 import datetime
-from threading import Thread
-from pymongo import DESCENDING
+from collections import deque
+from heapq import heappop, heappush
+from itertools import count
+from threading import Condition, Event, Lock, Thread
+from pymongo.errors import PyMongoError
 from bson import ObjectId
-from bson.timestamp import Timestamp
+
+try:
+    from Queue import Queue
+except ImportError:
+    # python 3
+    from queue import Queue
 
 VMAP = {
     'i': 'new',
@@ -42,40 +49,226 @@ class JSONClientContainer:
 JSON_CLIENT = JSONClientContainer()
 
 
+class DeliveryPool(object):
+    """A bounded pool of worker threads that deliver notifications.
+
+    Each receiver has its own mailbox, and only one worker delivers to a
+    given receiver at a time, so a receiver gets its notifications in
+    order and a slow receiver only holds up one worker. Workers take
+    turns between receivers, one delivery at a time. ``submit()`` blocks
+    once ``max_pending`` deliveries are waiting.
+
+    """
+    def __init__(self, max_workers=4, max_pending=10000):
+        self._max_workers = max_workers
+        self._max_pending = max_pending
+        self._lock = Lock()
+        self._not_full = Condition(self._lock)
+        self._mailboxes = dict()
+        self._ready = Queue()
+        self._pending = 0
+        self._workers = []
+
+    def _start_workers(self):
+        while len(self._workers) < self._max_workers:
+            worker = Thread(target=self._work)
+            worker.daemon = True
+            worker.start()
+            self._workers.append(worker)
+
+    def submit(self, receiver, delivery):
+        """Queues a delivery (a callable) for a receiver"""
+        with self._not_full:
+            if not self._workers:
+                self._start_workers()
+            while self._pending >= self._max_pending:
+                self._not_full.wait()
+            self._pending += 1
+            if receiver in self._mailboxes:
+                self._mailboxes[receiver].append(delivery)
+            else:
+                # not being delivered to, so make it ready
+                self._mailboxes[receiver] = deque([delivery])
+                self._ready.put(receiver)
+
+    def _work(self):
+        while True:
+            receiver = self._ready.get()
+            with self._lock:
+                delivery = self._mailboxes[receiver].popleft()
+            try:
+                delivery()
+            except Exception:  # pylint: disable=broad-except
+                # a failing receiver must not take the worker down with it
+                pass
+            with self._not_full:
+                self._pending -= 1
+                self._not_full.notify()
+                if self._mailboxes[receiver]:
+                    self._ready.put(receiver)
+                else:
+                    del self._mailboxes[receiver]
+
+
+class LocalChangeFeed(object):
+    """The writes this process makes through ``JSONClientValidated``.
+
+    Stands in for a change stream when MongoDB is not a replica set, or
+    when the filesystem is used. Only changes to namespaces someone
+    listens to are kept. Writers never block: once ``max_size`` changes
+    are waiting, the oldest are dropped.
+
+    """
+    def __init__(self, max_size=10000):
+        self._changes = deque(maxlen=max_size)
+        self._not_empty = Condition(Lock())
+        self.dropped = 0
+
+    def publish(self, entry):
+        with self._not_empty:
+            if len(self._changes) == self._changes.maxlen:
+                self.dropped += 1
+            self._changes.append(entry)
+            self._not_empty.notify()
+
+    def get(self, timeout):
+        """Gets the next change, or None if none came within ``timeout`` seconds"""
+        with self._not_empty:
+            if not self._changes:
+                self._not_empty.wait(timeout)
+            if self._changes:
+                return self._changes.popleft()
+            return None
+
+
+# change stream operation types, and the oplog op codes the receivers use
+CHANGE_OPS = {
+    'insert': 'i',
+    'update': 'u',
+    'replace': 'u',
+    'delete': 'd',
+}
+
+RESUME_TOKEN_COLLECTION = 'NotificationResumeTokens'
+
+
 class MongoListener(Thread):
-    """A utility thread that listens for MongoDB database changes for notification sessions"""
+    """A utility thread that listens for database changes for notification sessions.
+
+    Changes are read from a MongoDB change stream when the database is a
+    replica set. The stream's resume token is saved in the
+    ``<prefix>notifications`` database, so a restarted listener picks up
+    where it stopped. Otherwise, the writes made through this process'
+    ``JSONClientValidated`` calls are replayed from a ``LocalChangeFeed``.
+
+    Every change is handed, as an oplog-style entry, to the
+    ``oplog_callbacks`` and then, through a ``DeliveryPool``, to the
+    registered receivers. Reliable notifications are kept in a heap
+    ordered by when they are due again, until acknowledged or out of
+    attempts. The due ones are retried, and the resume token saved,
+    whenever the stream is caught up, and at least every
+    ``retry_seconds`` while it is busy.
+
+    """
 
-    def __init__(self, wait_seconds=10, max_attempts=3):
+    def __init__(self, wait_seconds=10, max_attempts=3, max_workers=4, retry_seconds=1):
         """Constructor"""
         Thread.__init__(self)
-        self.setDaemon(True)
+        self.daemon = True
         self._wait_period = datetime.timedelta(seconds=wait_seconds)
+        self._retry_period = datetime.timedelta(seconds=retry_seconds)
         self._max_attempts = max_attempts
         self.receivers = dict()
         self.notifications = dict()
+        self.oplog_callbacks = []  # called with every change, i.e. to invalidate caches
+        self.local_changes = None
+        self._retry_heap = []
+        self._retry_count = count()
+        self._delivery_pool = DeliveryPool(max_workers=max_workers)
+        self._resume_tokens = None
+        self._listener_name = 'dlkit'
+        self._stopped = Event()
 
     def initialize(self, runtime):
-        """Initialize this listener. Finds most recent timestamp"""
+        """Initialize this listener. Opens the change stream, or the local feed"""
         if self.is_alive():
             raise IllegalState('notification thread is already initialized')
         if not JSON_CLIENT.is_json_client_set() and runtime is not None:
-            JSON_CLIENT.set_json_client(runtime)
+            from .utilities import set_json_client
+            set_json_client(runtime)
+        db_prefix = ''
         try:
-            cursor = JSON_CLIENT.json_client['local']['oplog.rs'].find().sort('ts', DESCENDING).limit(-1)
+            db_prefix = runtime.get_configuration().get_value_by_parameter(
+                Id('parameter:mongoDBNamePrefix@json')).get_string_value()
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            self._listener_name = runtime.get_configuration().get_value_by_parameter(
+                Id('parameter:notificationListenerName@json')).get_string_value()
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            self._resume_tokens = JSON_CLIENT.json_client[db_prefix + 'notifications'][RESUME_TOKEN_COLLECTION]
+            self._watch().close()
         except TypeError:
             # filesystem, so .json_client is a bool and not iterable
-            pass
-        else:
-            try:
-                self.last_timestamp = cursor.next()['ts']
-            except StopIteration:
-                self.last_timestamp = Timestamp(0, 0)
+            self._resume_tokens = None
+            self.local_changes = LocalChangeFeed()
+        except (PyMongoError, AttributeError):
+            # not a replica set, or a server without change streams
+            self._resume_tokens = None
+            self.local_changes = LocalChangeFeed()
+
+    def stop(self):
+        """Stops the control loop. Deliveries already queued still go out"""
+        self._stopped.set()
 
-    def _notify_receiver(self, receiver, params, doc):
+    def publish_local(self, ns, op, doc_ids):
+        """Replays writes from this process, when there is no change stream"""
+        if self.local_changes is not None and ns in self.receivers:
+            for doc_id in doc_ids:
+                self.local_changes.publish({'op': op, 'ns': ns, 'o': {'_id': doc_id}})
+
+    def acknowledge(self, notification_id):
+        """Stops the retries of a reliable notification"""
+        self.notifications.pop(notification_id, None)
+
+    def _watch(self):
+        kwargs = dict(max_await_time_ms=250)
+        saved = self._resume_tokens.find_one({'_id': self._listener_name})
+        if saved is not None:
+            kwargs['resume_after'] = saved['token']
+        # do not hear about the resume tokens being saved
+        pipeline = [{'$match': {'ns.coll': {'$ne': RESUME_TOKEN_COLLECTION}}}]
+        return JSON_CLIENT.json_client.watch(pipeline, **kwargs)
+
+    def _save_resume_token(self, token):
+        self._resume_tokens.replace_one({'_id': self._listener_name},
+                                        {'_id': self._listener_name, 'token': token},
+                                        upsert=True)
+
+    @staticmethod
+    def _get_oplog_entry(change):
+        """Converts a change stream event to the oplog entry form receivers use"""
+        ns = change.get('ns', {})
+        op_type = change['operationType']
+        if op_type in CHANGE_OPS:
+            doc_key = change.get('documentKey', {})
+            return {'op': CHANGE_OPS[op_type],
+                    'ns': '{0}.{1}'.format(ns.get('db'), ns.get('coll')),
+                    'o': change.get('fullDocument') or doc_key,
+                    'o2': doc_key,
+                    'ts': change.get('clusterTime')}
+        if op_type == 'drop':
+            return {'op': 'c', 'ns': '{0}.$cmd'.format(ns.get('db')), 'o': {'drop': ns.get('coll')}}
+        if op_type == 'dropDatabase':
+            return {'op': 'c', 'ns': '{0}.$cmd'.format(ns.get('db')), 'o': {'dropDatabase': 1}}
+        return None
+
+    def _notify_receiver(self, receiver, params, doc, notification_id):
         """Send notification to the receiver"""
         verb = VMAP[doc['op']]
         ns = doc['ns']
-        notification_id = Id(ns + 'Notification:' + str(ObjectId()) + '@' + params['authority'])
         object_id = Id(ns + ':' + str(doc['o']['_id']) + '@' + params['authority'])
         try:
             getattr(receiver, '_'.join([verb, params['obj_name_plural']]))(notification_id, [object_id])
@@ -83,57 +276,101 @@ class MongoListener(Thread):
             pass
         return notification_id
 
+    def _deliver(self, receiver, params, doc, notification_id):
+        """Queues a notification for the delivery pool"""
+        self._delivery_pool.submit(
+            receiver,
+            lambda: self._notify_receiver(receiver, params, doc, notification_id))
+
     def _run_namespace(self, doc):
         """Run through all receivers related to the doc's namespace"""
-        for receiver in self.receivers[doc['ns']]:
-            params = self.receivers[doc['ns']][receiver]
+        # receivers come and go from other threads
+        for receiver, params in list(self.receivers.get(doc['ns'], {}).items()):
             if params[doc['op']]:
                 if params[doc['op']] is True or str(doc['o']['_id']) in params[doc['op']]:
-                    notification_id = self._notify_receiver(receiver, params, doc)
+                    notification_id = Id(doc['ns'] + 'Notification:' + str(ObjectId()) + '@' +
+                                         params['authority'])
+                    self._deliver(receiver, params, doc, notification_id)
                     if params['reliable'] and self._max_attempts > 1:
+                        due = datetime.datetime.utcnow() + self._wait_period
                         self.notifications[notification_id] = {
                             'receiver': receiver,
                             'params': dict(params),
                             'doc': dict(doc),
-                            'ts': datetime.datetime.utcnow(),
+                            'ts': due,
                             'attempts': 1}
+                        heappush(self._retry_heap, (due, next(self._retry_count), notification_id))
 
     def _retry(self):
-        """Deal with unacknowledged notifications."""
-        notifications_to_delete = []
-        for notification_id in self.notifications:
-            if datetime.datetime.utcnow() > self.notifications[notification_id]['ts'] + self._wait_period:
-                self._notify_receiver(
-                    self.notifications[notification_id]['receiver'],
-                    self.notifications[notification_id]['params'],
-                    self.notifications[notification_id]['doc'])
-                if self.notifications[notification_id]['attempts'] >= self._max_attempts - 1:
-                    notifications_to_delete.append(notification_id)
-                else:
-                    self.notifications[notification_id]['ts'] = datetime.datetime.utcnow()
-                    self.notifications[notification_id]['attempts'] += 1
-        for notification_id in notifications_to_delete:
-            del self.notifications[notification_id]
+        """Deal with the unacknowledged notifications that are due"""
+        now = datetime.datetime.utcnow()
+        while self._retry_heap and self._retry_heap[0][0] <= now:
+            notification_id = heappop(self._retry_heap)[2]
+            notification = self.notifications.get(notification_id)
+            if notification is None:
+                # acknowledged since
+                continue
+            self._deliver(notification['receiver'],
+                          notification['params'],
+                          notification['doc'],
+                          notification_id)
+            notification['attempts'] += 1
+            if notification['attempts'] >= self._max_attempts:
+                del self.notifications[notification_id]
+            else:
+                notification['ts'] = now + self._wait_period
+                heappush(self._retry_heap, (notification['ts'], next(self._retry_count), notification_id))
+
+    def _get_timeout(self):
+        """Seconds until the next retry is due, at most one"""
+        if not self._retry_heap:
+            return 1.0
+        wait = self._retry_heap[0][0] - datetime.datetime.utcnow()
+        return min(max(wait.total_seconds(), 0.0), 1.0)
+
+    def _process(self, doc):
+        for callback in self.oplog_callbacks:
+            callback(doc)
+        if doc['ns'] in self.receivers and doc['op'] in VMAP:
+            self._run_namespace(doc)
+
+    def _run_change_stream(self):
+        with self._watch() as stream:
+            saved_token = None
+            retry_due = datetime.datetime.utcnow() + self._retry_period
+            while not self._stopped.is_set():
+                change = stream.try_next()
+                if change is not None:
+                    doc = self._get_oplog_entry(change)
+                    if doc is not None:
+                        self._process(doc)
+                    if datetime.datetime.utcnow() < retry_due:
+                        continue
+                # caught up, or busy for a retry period: save the token and retry
+                if stream.resume_token is not None and stream.resume_token != saved_token:
+                    self._save_resume_token(stream.resume_token)
+                    saved_token = stream.resume_token
+                self._retry()
+                retry_due = datetime.datetime.utcnow() + self._retry_period
+
+    def _run_local(self):
+        while not self._stopped.is_set():
+            doc = self.local_changes.get(self._get_timeout())
+            if doc is not None:
+                self._process(doc)
+            self._retry()
 
     def run(self):
         """main control loop for thread"""
-        while True:
+        while not self._stopped.is_set():
+            if self.local_changes is not None:
+                self._run_local()
+                return
             try:
-                cursor = JSON_CLIENT.json_client['local']['oplog.rs'].find(
-                    {'ts': {'$gt': self.last_timestamp}})
-            except TypeError:
-                # filesystem, so .json_client is a bool and not iterable
-                pass
-            else:
-                # http://stackoverflow.com/questions/30401063/pymongo-tailing-oplog
-                cursor.add_option(2)  # tailable
-                cursor.add_option(8)  # oplog_replay
-                cursor.add_option(32)  # await data
-                self._retry()
-                for doc in cursor:
-                    self.last_timestamp = doc['ts']
-                    if doc['ns'] in self.receivers:
-                        self._run_namespace(doc)
-            time.sleep(1)
+                self._run_change_stream()
+            except PyMongoError:
+                # i.e. the connection dropped; resume from the saved token
+                self._stopped.wait(1)
+
 
 MONGO_LISTENER = MongoListener()
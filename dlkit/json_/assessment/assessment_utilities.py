@@ -20,6 +20,9 @@ def check_effective(func):
 
     Side benefit: raised NotFound on AssessmentSections and AssessmentTakens
 
+    Sections are checked, and the method run, in one section identity map
+    of the session, so the section is loaded once.
+
     """
     def wrapper(*args, **kwargs):
         if ('assessment_section_id' in kwargs or
@@ -28,9 +31,11 @@ def check_effective(func):
                 assessment_section_id = kwargs['assessment_section_id']
             except KeyError:
                 assessment_section_id = args[1]
-            if (not args[0].has_assessment_section_begun(assessment_section_id) or
-                    args[0].is_assessment_section_over(assessment_section_id)):
-                raise IllegalState()
+            with args[0]._section_identity_map():
+                if (not args[0].has_assessment_section_begun(assessment_section_id) or
+                        args[0].is_assessment_section_over(assessment_section_id)):
+                    raise IllegalState()
+                return func(*args, **kwargs)
         else:
             if 'assessment_taken_id' in kwargs:
                 assessment_taken_id = kwargs['assessment_taken_id']
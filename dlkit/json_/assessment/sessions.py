@@ -11,6 +11,7 @@
 
 
 from bson.objectid import ObjectId
+from contextlib import contextmanager
 from importlib import import_module
 
 
@@ -110,6 +111,7 @@ class AssessmentSession(abc_assessment_sessions.AssessmentSession, osid_sessions
             cat_class=objects.Bank)
         self._forms = dict()
         self._assessments_taken = dict()
+        self._loaded_sections = None
 
     def get_bank_id(self):
         """Gets the ``Bank``  ``Id`` associated with this session.
@@ -362,7 +364,7 @@ class AssessmentSession(abc_assessment_sessions.AssessmentSession, osid_sessions
         *compliance: mandatory -- This method must be implemented.*
 
         """
-        return get_section_util(assessment_section_id, runtime=self._runtime, proxy=self._proxy)
+        return self._get_loaded_section(assessment_section_id)
 
     @utilities.arguments_not_none
     @check_effective
@@ -451,8 +453,7 @@ class AssessmentSession(abc_assessment_sessions.AssessmentSession, osid_sessions
         *compliance: mandatory -- This method must be implemented.*
 
         """
-        return get_section_util(assessment_section_id,
-                                runtime=self._runtime)._assessment_taken.has_started()
+        return self._get_loaded_section(assessment_section_id)._assessment_taken.has_started()
 
     @utilities.arguments_not_none
     def is_assessment_section_over(self, assessment_section_id):
@@ -474,8 +475,7 @@ class AssessmentSession(abc_assessment_sessions.AssessmentSession, osid_sessions
         *compliance: mandatory -- This method must be implemented.*
 
         """
-        return get_section_util(assessment_section_id,
-                                runtime=self._runtime).is_over()
+        return self._get_loaded_section(assessment_section_id).is_over()
 
     @utilities.arguments_not_none
     @check_effective
@@ -1192,6 +1192,41 @@ class AssessmentSession(abc_assessment_sessions.AssessmentSession, osid_sessions
         else:
             raise errors.IllegalState()
 
+    @contextmanager
+    def _section_identity_map(self):
+        """Loads each AssessmentSection at most once within this context.
+
+        Until the outermost context exits, sections looked up through this
+        session are the same ``LoadedSection``, with its taken and part,
+        instead of being read and rebuilt on every lookup. Methods checked
+        with ``check_effective`` run in one, and callers can open one
+        around several calls.
+
+        """
+        if self._loaded_sections is not None:
+            yield
+            return
+        self._loaded_sections = dict()
+        try:
+            yield
+        finally:
+            self._loaded_sections = None
+
+    def _get_loaded_section(self, assessment_section_id):
+        """Helper method for getting a LoadedSection given an Id, from the
+        identity map if one is open."""
+        if self._loaded_sections is None:
+            return get_section_util(assessment_section_id, runtime=self._runtime, proxy=self._proxy)
+        if str(assessment_section_id) not in self._loaded_sections:
+            self._loaded_sections[str(assessment_section_id)] = get_section_util(
+                assessment_section_id, runtime=self._runtime, proxy=self._proxy)
+        return self._loaded_sections[str(assessment_section_id)]
+
+    def _refresh_section(self, assessment_section_id):
+        """Drops a section from the identity map, to be read again on its next lookup"""
+        if self._loaded_sections is not None:
+            self._loaded_sections.pop(str(assessment_section_id), None)
+
     def _get_assessment_taken(self, assessment_taken_id):
         """Helper method for getting an AssessmentTaken objects given an Id."""
         if assessment_taken_id not in self._assessments_taken:
@@ -1537,24 +1572,14 @@ class ItemLookupSession(abc_assessment_sessions.ItemLookupSession, osid_sessions
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('assessment',
                                          collection='Item',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in item_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'assessment').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.ItemList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(item_ids, 'assessment'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.ItemList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_items_by_genus_type(self, item_genus_type):
@@ -2213,7 +2238,7 @@ class ItemAdminSession(abc_assessment_sessions.ItemAdminSession, osid_sessions.O
             raise errors.Unsupported('item_form did not originate from this session')
         if not item_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(item_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(item_form._my_map))
 
         self._forms[item_form.get_id().get_identifier()] = CREATED
         result = objects.Item(
@@ -2223,6 +2248,56 @@ class ItemAdminSession(abc_assessment_sessions.ItemAdminSession, osid_sessions.O
 
         return result
 
+    @utilities.arguments_not_none
+    def create_items(self, item_forms):
+        """Creates several new ``Items`` with one bulk write.
+
+        All the forms are checked before anything is written.
+
+        arg:    item_forms (osid.assessment.ItemForm[]): the forms for the
+                new ``Items``
+        return: (osid.assessment.ItemList) - the new ``Items``, in the order
+                of ``item_forms``
+        raise:  IllegalState - a ``item_form`` was already used in a
+                create transaction
+        raise:  InvalidArgument - one or more of the form elements is
+                invalid
+        raise:  NullArgument - ``item_forms`` is ``null``
+        raise:  OperationFailed - unable to complete request
+        raise:  PermissionDenied - authorization failure occurred
+        raise:  Unsupported - a ``item_form`` did not originate from
+                ``get_item_form_for_create()``
+        *compliance: optional -- This method is not in the OSID spec.*
+
+        """
+        collection = JSONClientValidated('assessment',
+                                         collection='Item',
+                                         runtime=self._runtime)
+        item_forms = list(item_forms)
+        form_ids = set()
+        for item_form in item_forms:
+            if not isinstance(item_form, ABCItemForm):
+                raise errors.InvalidArgument('argument type is not an ItemForm')
+            if item_form.is_for_update():
+                raise errors.InvalidArgument('the ItemForm is for update only, not create')
+            form_id = item_form.get_id().get_identifier()
+            try:
+                if self._forms[form_id] == CREATED or form_id in form_ids:
+                    raise errors.IllegalState('item_form already used in a create transaction')
+            except KeyError:
+                raise errors.Unsupported('item_form did not originate from this session')
+            if not item_form.is_valid():
+                raise errors.InvalidArgument('one or more of the form elements is invalid')
+            form_ids.add(form_id)
+        insert_result = collection.insert_many([self._set_ancestor_catalog_ids(item_form._my_map) for item_form in item_forms])
+
+        for form_id in form_ids:
+            self._forms[form_id] = CREATED
+        return objects.ItemList(
+            self._get_object_maps_in_order(collection, insert_result.inserted_ids),
+            runtime=self._runtime,
+            proxy=self._proxy)
+
     def can_update_items(self):
         """Tests if this user can update ``Items``.
 
@@ -2318,6 +2393,57 @@ class ItemAdminSession(abc_assessment_sessions.ItemAdminSession, osid_sessions.O
             runtime=self._runtime,
             proxy=self._proxy)
 
+    @utilities.arguments_not_none
+    def update_items(self, item_forms):
+        """Updates several existing ``Items`` with one bulk write.
+
+        All the forms are checked before anything is written.
+
+        arg:    item_forms (osid.assessment.ItemForm[]): the forms
+                containing the elements to be updated
+        return: (osid.assessment.ItemList) - the updated ``Items``, in the
+                order of ``item_forms``
+        raise:  IllegalState - a ``item_form`` was already used in an
+                update transaction
+        raise:  InvalidArgument - one or more of the form elements is
+                invalid
+        raise:  NullArgument - ``item_forms`` is ``null``
+        raise:  OperationFailed - unable to complete request
+        raise:  PermissionDenied - authorization failure occurred
+        raise:  Unsupported - a ``item_form`` did not originate from
+                ``get_item_form_for_update()``
+        *compliance: optional -- This method is not in the OSID spec.*
+
+        """
+        collection = JSONClientValidated('assessment',
+                                         collection='Item',
+                                         runtime=self._runtime)
+        item_forms = list(item_forms)
+        form_ids = set()
+        for item_form in item_forms:
+            if not isinstance(item_form, ABCItemForm):
+                raise errors.InvalidArgument('argument type is not an ItemForm')
+            if not item_form.is_for_update():
+                raise errors.InvalidArgument('the ItemForm is for update only, not create')
+            form_id = item_form.get_id().get_identifier()
+            try:
+                if self._forms[form_id] == UPDATED or form_id in form_ids:
+                    raise errors.IllegalState('item_form already used in an update transaction')
+            except KeyError:
+                raise errors.Unsupported('item_form did not originate from this session')
+            if not item_form.is_valid():
+                raise errors.InvalidArgument('one or more of the form elements is invalid')
+            form_ids.add(form_id)
+        collection.bulk_save([item_form._my_map for item_form in item_forms])
+
+        for form_id in form_ids:
+            self._forms[form_id] = UPDATED
+        # Note: like update_item(), returns the objects even though the OSIDs don't require it
+        return objects.ItemList(
+            [item_form._my_map for item_form in item_forms],
+            runtime=self._runtime,
+            proxy=self._proxy)
+
     def can_delete_items(self):
         """Tests if this user can delete ``Items``.
 
@@ -3032,7 +3158,7 @@ class ItemAdminSession(abc_assessment_sessions.ItemAdminSession, osid_sessions.O
             item_map['bankId'] = str(self._catalog_id)
         if 'assignedBankIds' in item_map:
             item_map['assignedBankIds'] = [str(self._catalog_id)]
-        insert_result = collection.insert_one(item_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(item_map))
         result = objects.Item(
             osid_object_map=collection.find_one({'_id': insert_result.inserted_id}),
             runtime=self._runtime,
@@ -3422,10 +3548,10 @@ class ItemBankSession(abc_assessment_sessions.ItemBankSession, osid_sessions.Osi
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for item in self.get_items_by_bank(bank_id):
-            id_list.append(item.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('ASSESSMENT', local=True)
+        lookup_session = mgr.get_item_lookup_session_for_bank(bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_bank_view()
+        return lookup_session._get_object_ids_in_view('assessment', 'Item', 'assessment.Item')
 
     @utilities.arguments_not_none
     def get_items_by_bank(self, bank_id):
@@ -3872,24 +3998,14 @@ class AssessmentLookupSession(abc_assessment_sessions.AssessmentLookupSession, o
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('assessment',
                                          collection='Assessment',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in assessment_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'assessment').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AssessmentList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(assessment_ids, 'assessment'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AssessmentList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_assessments_by_genus_type(self, assessment_genus_type):
@@ -4418,7 +4534,7 @@ class AssessmentAdminSession(abc_assessment_sessions.AssessmentAdminSession, osi
             raise errors.Unsupported('assessment_form did not originate from this session')
         if not assessment_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(assessment_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(assessment_form._my_map))
 
         self._forms[assessment_form.get_id().get_identifier()] = CREATED
         result = objects.Assessment(
@@ -4660,7 +4776,7 @@ class AssessmentAdminSession(abc_assessment_sessions.AssessmentAdminSession, osi
             assessment_map['bankId'] = str(self._catalog_id)
         if 'assignedBankIds' in assessment_map:
             assessment_map['assignedBankIds'] = [str(self._catalog_id)]
-        insert_result = collection.insert_one(assessment_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(assessment_map))
         result = objects.Assessment(
             osid_object_map=collection.find_one({'_id': insert_result.inserted_id}),
             runtime=self._runtime,
@@ -4755,10 +4871,10 @@ class AssessmentBankSession(abc_assessment_sessions.AssessmentBankSession, osid_
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for assessment in self.get_assessments_by_bank(bank_id):
-            id_list.append(assessment.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('ASSESSMENT', local=True)
+        lookup_session = mgr.get_assessment_lookup_session_for_bank(bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_bank_view()
+        return lookup_session._get_object_ids_in_view('assessment', 'Assessment', 'assessment.Assessment')
 
     @utilities.arguments_not_none
     def get_assessments_by_bank(self, bank_id):
@@ -5400,24 +5516,14 @@ class AssessmentOfferedLookupSession(abc_assessment_sessions.AssessmentOfferedLo
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('assessment',
                                          collection='AssessmentOffered',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in assessment_offered_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'assessment').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AssessmentOfferedList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(assessment_offered_ids, 'assessment'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AssessmentOfferedList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_assessments_offered_by_genus_type(self, assessment_offered_genus_type):
@@ -5960,7 +6066,7 @@ class AssessmentOfferedAdminSession(abc_assessment_sessions.AssessmentOfferedAdm
             raise errors.Unsupported('assessment_offered_form did not originate from this session')
         if not assessment_offered_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(assessment_offered_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(assessment_offered_form._my_map))
 
         self._forms[assessment_offered_form.get_id().get_identifier()] = CREATED
         result = objects.AssessmentOffered(
@@ -6251,10 +6357,10 @@ class AssessmentOfferedBankSession(abc_assessment_sessions.AssessmentOfferedBank
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for assessment_offered in self.get_assessments_offered_by_bank(bank_id):
-            id_list.append(assessment_offered.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('ASSESSMENT', local=True)
+        lookup_session = mgr.get_assessment_offered_lookup_session_for_bank(bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_bank_view()
+        return lookup_session._get_object_ids_in_view('assessment', 'AssessmentOffered', 'assessment.AssessmentOffered')
 
     @utilities.arguments_not_none
     def get_assessments_offered_by_bank(self, bank_id):
@@ -6716,24 +6822,14 @@ class AssessmentTakenLookupSession(abc_assessment_sessions.AssessmentTakenLookup
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('assessment',
                                          collection='AssessmentTaken',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in assessment_taken_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'assessment').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AssessmentTakenList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(assessment_taken_ids, 'assessment'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AssessmentTakenList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_assessments_taken_by_genus_type(self, assessment_taken_genus_type):
@@ -7563,7 +7659,7 @@ class AssessmentTakenAdminSession(abc_assessment_sessions.AssessmentTakenAdminSe
             pass
         assessment_taken_form._my_map['takingAgentId'] = str(self.get_effective_agent_id())
 
-        insert_result = collection.insert_one(assessment_taken_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(assessment_taken_form._my_map))
         self._forms[assessment_taken_form.get_id().get_identifier()] = CREATED
         return objects.AssessmentTaken(
             osid_object_map=collection.find_one({'_id': insert_result.inserted_id}),
@@ -7850,10 +7946,10 @@ class AssessmentTakenBankSession(abc_assessment_sessions.AssessmentTakenBankSess
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for assessment_taken in self.get_assessments_taken_by_bank(bank_id):
-            id_list.append(assessment_taken.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('ASSESSMENT', local=True)
+        lookup_session = mgr.get_assessment_taken_lookup_session_for_bank(bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_bank_view()
+        return lookup_session._get_object_ids_in_view('assessment', 'AssessmentTaken', 'assessment.AssessmentTaken')
 
     @utilities.arguments_not_none
     def get_assessments_taken_by_bank(self, bank_id):
@@ -9132,7 +9228,7 @@ class BankHierarchySession(abc_assessment_sessions.BankHierarchySession, osid_se
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=bank_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=bank_id)
+        return self._hierarchy_session.is_ancestor(id_=bank_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_banks(self, bank_id):
@@ -9237,7 +9333,7 @@ class BankHierarchySession(abc_assessment_sessions.BankHierarchySession, osid_se
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=bank_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=bank_id)
+        return self._hierarchy_session.is_descendant(id_=bank_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_bank_node_ids(self, bank_id, ancestor_levels, descendant_levels, include_siblings):
@@ -263,24 +263,14 @@ class AssessmentPartLookupSession(abc_assessment_authoring_sessions.AssessmentPa
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('assessment_authoring',
                                          collection='AssessmentPart',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in assessment_part_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'assessment_authoring').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AssessmentPartList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(assessment_part_ids, 'assessment_authoring'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AssessmentPartList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_assessment_parts_by_genus_type(self, assessment_part_genus_type):
@@ -829,7 +819,7 @@ class AssessmentPartAdminSession(abc_assessment_authoring_sessions.AssessmentPar
             raise errors.Unsupported('assessment_part_form did not originate from this session')
         if not assessment_part_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(assessment_part_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(assessment_part_form._my_map))
 
         self._forms[assessment_part_form.get_id().get_identifier()] = CREATED
         result = objects.AssessmentPart(
@@ -934,7 +924,7 @@ class AssessmentPartAdminSession(abc_assessment_authoring_sessions.AssessmentPar
             raise errors.Unsupported('assessment_part_form did not originate from this session')
         if not assessment_part_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(assessment_part_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(assessment_part_form._my_map))
 
         self._forms[assessment_part_form.get_id().get_identifier()] = CREATED
         result = objects.AssessmentPart(
@@ -1246,10 +1236,10 @@ class AssessmentPartBankSession(abc_assessment_authoring_sessions.AssessmentPart
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for assessment_part in self.get_assessment_parts_by_bank(bank_id):
-            id_list.append(assessment_part.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('ASSESSMENT_AUTHORING', local=True)
+        lookup_session = mgr.get_assessment_part_lookup_session_for_bank(bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_bank_view()
+        return lookup_session._get_object_ids_in_view('assessment_authoring', 'AssessmentPart', 'assessment_authoring.AssessmentPart')
 
     @utilities.arguments_not_none
     def get_assessment_parts_by_bank(self, bank_id):
@@ -2120,24 +2110,14 @@ class SequenceRuleLookupSession(abc_assessment_authoring_sessions.SequenceRuleLo
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('assessment_authoring',
                                          collection='SequenceRule',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in sequence_rule_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'assessment_authoring').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.SequenceRuleList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(sequence_rule_ids, 'assessment_authoring'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.SequenceRuleList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_sequence_rules_by_genus_type(self, sequence_rule_genus_type):
@@ -2515,7 +2495,7 @@ class SequenceRuleAdminSession(abc_assessment_authoring_sessions.SequenceRuleAdm
             raise errors.Unsupported('sequence_rule_form did not originate from this session')
         if not sequence_rule_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(sequence_rule_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(sequence_rule_form._my_map))
 
         self._forms[sequence_rule_form.get_id().get_identifier()] = CREATED
         result = objects.SequenceRule(
@@ -232,24 +232,14 @@ class AgentLookupSession(abc_authentication_sessions.AgentLookupSession, osid_se
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('authentication',
                                          collection='Agent',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in agent_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'authentication').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AgentList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(agent_ids, 'authentication'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AgentList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_agents_by_genus_type(self, agent_genus_type):
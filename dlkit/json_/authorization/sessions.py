@@ -16,8 +16,10 @@ from bson.objectid import ObjectId
 from . import objects
 from . import queries
 from .. import utilities
+from ..hierarchy_caches import CATALOG_OBJECT_COLLECTIONS
 from ..id.objects import IdList
 from ..osid import sessions as osid_sessions
+from ..osid.sessions import MAX_IN_BATCH
 from ..osid.sessions import OsidSession
 from ..primitives import DateTime
 from ..primitives import Id
@@ -213,6 +215,117 @@ class AuthorizationSession(abc_authorization_sessions.AuthorizationSession, osid
             parent_id_list = [str(parent_id) for parent_id in parent_ids]
         return parent_id_list
 
+    def _get_parent_idstr_map(self, idstrs, hierarchy_id):
+        """Maps qualifiers, and all of their ancestors, to the id strings of their parents.
+
+        Unless caching is enabled, the JSON hierarchy is walked up a
+        level at a time, with one query per level for all the qualifiers.
+
+        """
+        hierarchy_session = self._get_hierarchy_session(hierarchy_id)
+        if (not self._caching_enabled() and
+                hasattr(hierarchy_session, '_get_adjacent_idstrs') and
+                hasattr(getattr(hierarchy_session, '_rls', None), '_view_filter')):
+            return hierarchy_session._get_adjacent_idstrs(list(idstrs), float('inf'), 'destinationId', 'sourceId')
+        parent_idstrs = {}
+        while idstrs:
+            for idstr in idstrs:
+                parent_idstrs[idstr] = self._get_parent_id_list(Id(idstr), hierarchy_id)
+            idstrs = set(parent_idstr
+                         for idstr in idstrs
+                         for parent_idstr in parent_idstrs[idstr]
+                         if parent_idstr not in parent_idstrs)
+        return parent_idstrs
+
+    def _get_ancestor_idstr_lists(self, idstrs, hierarchy_id):
+        """Returns, for each qualifier, the id strings of the qualifier and of all of its ancestors.
+
+        The ancestors are looked up live, one hierarchy level at a time for
+        all of the qualifiers, so that moving a qualifier in another
+        process takes effect on the next check.
+
+        """
+        parent_idstr_map = self._get_parent_idstr_map(sorted(set(idstrs)), hierarchy_id)
+        idstr_lists = []
+        for idstr in idstrs:
+            idstr_list = [idstr]
+            parent_idstrs = [idstr]
+            while parent_idstrs:
+                parent_idstrs = sorted(set(parent_idstr
+                                           for child_idstr in parent_idstrs
+                                           for parent_idstr in parent_idstr_map.get(child_idstr, [])
+                                           if parent_idstr not in idstr_list))
+                idstr_list += parent_idstrs
+            idstr_lists.append(idstr_list)
+        return idstr_lists
+
+    def _get_materialized_ancestor_idstr_map(self, idstrs, package_name, catalog_name):
+        """Maps qualifiers to the ``ancestor<Catalog>Ids`` materialized on their catalogs.
+
+        The arrays of all the qualifiers are read with one query on the
+        ids of their catalogs. Qualifiers that are not catalogs, or whose
+        catalogs have no array yet, are left out.
+
+        """
+        if not self._materializes_ancestry() or catalog_name not in CATALOG_OBJECT_COLLECTIONS:
+            return {}
+        ancestor_key = 'ancestor' + catalog_name + 'Ids'
+        object_idstrs = dict((Id(idstr).get_identifier(), idstr) for idstr in idstrs
+                             if ObjectId.is_valid(Id(idstr).get_identifier()))
+        if not object_idstrs:
+            return {}
+        collection = JSONClientValidated(package_name,
+                                         collection=catalog_name,
+                                         runtime=self._runtime)
+        return dict((object_idstrs[str(catalog_map['_id'])], catalog_map[ancestor_key])
+                    for catalog_map in collection.find(
+                        {'_id': {'$in': [ObjectId(identifier) for identifier in object_idstrs]}},
+                        projection={ancestor_key: True})
+                    if ancestor_key in catalog_map)
+
+    def _get_qualifier_idstr_lists(self, qualifier_ids):
+        """Returns, for each qualifier, the id strings of the qualifiers whose authorizations apply to it.
+
+        Those are the qualifier, its ancestors in its catalog hierarchy and
+        the 'ROOT' qualifier of its namespace. Aliases are resolved, and
+        ancestors looked up, for all the qualifiers of a catalog hierarchy
+        at once. With ``materializeCatalogAncestry@json`` set, the
+        ancestors are read from the qualifiers' catalogs, otherwise the
+        hierarchy is walked.
+
+        """
+        idstr_lists = [[str(qualifier_id)] for qualifier_id in qualifier_ids]
+        hierarchy_indexes = {}
+        for index, qualifier_id in enumerate(qualifier_ids):
+            try:
+                authority = qualifier_id.get_identifier_namespace().split('.')[0].upper()
+                identifier = qualifier_id.get_identifier_namespace().split('.')[1].upper()
+            except (IndexError, KeyError):
+                continue  # not a catalog qualifier, so only explicit authorizations apply
+            package_name = qualifier_id.get_identifier_namespace().split('.')[0]
+            hierarchy_indexes.setdefault((package_name, authority, identifier), []).append(index)
+        for (package_name, authority, identifier), indexes in hierarchy_indexes.items():
+            # handle aliased IDs
+            primary_ids = self._get_ids([qualifier_ids[index] for index in indexes], package_name)
+            hierarchy_id = Id(authority=authority,
+                              namespace='CATALOG',
+                              identifier=identifier)
+            primary_idstrs = [str(primary_id) for primary_id in primary_ids]
+            ancestor_idstr_map = self._get_materialized_ancestor_idstr_map(
+                primary_idstrs, package_name, qualifier_ids[indexes[0]].get_identifier_namespace().split('.')[1])
+            walked_idstrs = [idstr for idstr in primary_idstrs if idstr not in ancestor_idstr_map]
+            if walked_idstrs:
+                ancestor_idstr_map.update(zip(walked_idstrs,
+                                              self._get_ancestor_idstr_lists(walked_idstrs, hierarchy_id)))
+            ancestor_idstr_lists = [ancestor_idstr_map[idstr] for idstr in primary_idstrs]
+            for index, primary_id, ancestor_idstrs in zip(indexes, primary_ids, ancestor_idstr_lists):
+                root_qualifier_id = Id(
+                    authority=primary_id.get_authority(),
+                    namespace=primary_id.get_identifier_namespace(),
+                    identifier='ROOT')
+                idstr_lists[index] = [str(root_qualifier_id)] + ancestor_idstrs
+        return idstr_lists
+
     def get_vault_id(self):
         """Gets the ``Vault``  ``Id`` associated with this session.
 
@@ -296,64 +409,64 @@ class AuthorizationSession(abc_authorization_sessions.AuthorizationSession, osid
         ``false``.
 
         """
+        # An authorization on the qualifier, on any of its ancestors in
+        # its catalog hierarchy, or on the 'ROOT' qualifier applies, so
+        # they are all checked with one query
         collection = JSONClientValidated('authorization',
                                          collection='Authorization',
                                          runtime=self._runtime)
-
-        def is_parent_authorized(catalog_id):
-            """Recursively checks parents for implicit authorizations"""
-            parent_id_list = self._get_parent_id_list(catalog_id, hierarchy_id)
-            if parent_id_list:
-                try:
-                    collection.find_one(
-                        {'agentId': str(agent_id),
-                         'functionId': str(function_id),
-                         'qualifierId': {'$in': parent_id_list}})
-                except errors.NotFound:
-                    for parent_id in parent_id_list:
-                        if is_parent_authorized(Id(parent_id)):
-                            return True
-                    return False
-                else:
-                    return True
-            else:
-                return False
-
-        # Check first for an explicit or 'ROOT' level implicit authorization:
-        try:
-            authority = qualifier_id.get_identifier_namespace().split('.')[0].upper()
-            identifier = qualifier_id.get_identifier_namespace().split('.')[1].upper()
-        except KeyError:
-            idstr_list = [str(qualifier_id)]
-            authority = identifier = None
-        else:
-            # handle aliased IDs
-            package_name = qualifier_id.get_identifier_namespace().split('.')[0]
-            qualifier_id = self._get_id(qualifier_id, package_name)
-
-            root_qualifier_id = Id(
-                authority=qualifier_id.get_authority(),
-                namespace=qualifier_id.get_identifier_namespace(),
-                identifier='ROOT')
-            idstr_list = [str(root_qualifier_id), str(qualifier_id)]
+        idstr_list = self._get_qualifier_idstr_lists([qualifier_id])[0]
         try:
             collection.find_one(
                 {'agentId': str(agent_id),
                  'functionId': str(function_id),
-                 'qualifierId': {'$in': idstr_list}})
-
-        # Otherwise check for implicit authorization through inheritance:
+                 'qualifierId': {'$in': idstr_list}},
+                projection={'_id': True})
         except errors.NotFound:
-            if authority and identifier:
-                hierarchy_id = Id(authority=authority,
-                                  namespace='CATALOG',
-                                  identifier=identifier)
-                return is_parent_authorized(qualifier_id)
-            else:
-                return False
+            return False
         else:
             return True
 
+    @utilities.arguments_not_none
+    def are_authorized(self, agent_id, function_ids, qualifier_ids):
+        """Determines which of the given functions the given agent is authorized for on each of the given qualifiers.
+
+        This is not part of the OSID specification. It answers
+        ``is_authorized()`` for every pair of function and qualifier, with
+        one query for all of them.
+
+        arg:    agent_id (osid.id.Id): the ``Id`` of an ``Agent``
+        arg:    function_ids (osid.id.IdList): the ``Ids`` of
+                ``Functions``
+        arg:    qualifier_ids (osid.id.IdList): the ``Ids`` of
+                ``Qualifiers``
+        return: (list) - a list per function, in the order of
+                ``function_ids,`` of ``true`` or ``false`` per
+                qualifier, in the order of ``qualifier_ids``
+        raise:  NullArgument - ``agent_id`` , ``function_ids`` or
+                ``qualifier_ids`` is ``null``
+        raise:  OperationFailed - unable to complete request
+        raise:  PermissionDenied - authorization failure making request
+
+        """
+        function_idstrs = [str(function_id) for function_id in function_ids]
+        qualifier_idstr_lists = self._get_qualifier_idstr_lists(list(qualifier_ids))
+        applicable_idstrs = sorted(set(idstr for idstr_list in qualifier_idstr_lists for idstr in idstr_list))
+        collection = JSONClientValidated('authorization',
+                                         collection='Authorization',
+                                         runtime=self._runtime)
+        authorized = set()
+        for index in range(0, len(applicable_idstrs), MAX_IN_BATCH):
+            for authz_map in collection.find(
+                    {'agentId': str(agent_id),
+                     'functionId': {'$in': function_idstrs},
+                     'qualifierId': {'$in': applicable_idstrs[index:index + MAX_IN_BATCH]}},
+                    projection={'functionId': True, 'qualifierId': True}):
+                authorized.add((authz_map['functionId'], authz_map['qualifierId']))
+        return [[any((function_idstr, idstr) in authorized for idstr in idstr_list)
+                 for idstr_list in qualifier_idstr_lists]
+                for function_idstr in function_idstrs]
+
     @utilities.arguments_not_none
     def get_authorization_condition(self, function_id):
         """Gets the ``AuthorizationCondition`` for making conditional authorization checks.
@@ -634,24 +747,14 @@ class AuthorizationLookupSession(abc_authorization_sessions.AuthorizationLookupS
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('authorization',
                                          collection='Authorization',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in authorization_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'authorization').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AuthorizationList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(authorization_ids, 'authorization'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AuthorizationList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_authorizations_by_genus_type(self, authorization_genus_type):
@@ -1581,7 +1684,7 @@ class AuthorizationAdminSession(abc_authorization_sessions.AuthorizationAdminSes
             osid_map['endDate'] = authorization_form._my_map['endDate']
             collection.save(osid_map)
         except errors.NotFound:
-            insert_result = collection.insert_one(authorization_form._my_map)
+            insert_result = collection.insert_one(self._set_ancestor_catalog_ids(authorization_form._my_map))
 
             self._forms[authorization_form.get_id().get_identifier()] = CREATED
             osid_map = collection.find_one({'_id': insert_result.inserted_id})
@@ -3157,7 +3260,7 @@ class VaultHierarchySession(abc_authorization_sessions.VaultHierarchySession, os
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=vault_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=vault_id)
+        return self._hierarchy_session.is_ancestor(id_=vault_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_vaults(self, vault_id):
@@ -3263,7 +3366,7 @@ class VaultHierarchySession(abc_authorization_sessions.VaultHierarchySession, os
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=vault_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=vault_id)
+        return self._hierarchy_session.is_descendant(id_=vault_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_vault_node_ids(self, vault_id, ancestor_levels, descendant_levels, include_siblings):
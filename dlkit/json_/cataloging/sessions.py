@@ -1042,7 +1042,7 @@ class CatalogHierarchySession(abc_cataloging_sessions.CatalogHierarchySession, o
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=catalog_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=catalog_id)
+        return self._hierarchy_session.is_ancestor(id_=catalog_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_catalogs(self, catalog_id):
@@ -1150,7 +1150,7 @@ class CatalogHierarchySession(abc_cataloging_sessions.CatalogHierarchySession, o
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=catalog_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=catalog_id)
+        return self._hierarchy_session.is_descendant(id_=catalog_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_catalog_node_ids(self, catalog_id, ancestor_levels, descendant_levels, include_siblings):
@@ -0,0 +1,299 @@
+"""In-memory indexes for the non-MongoDB JSON backends"""
+import codecs
+import json
+import os
+
+from collections import OrderedDict
+from itertools import count
+from threading import RLock
+
+from bson import ObjectId
+
+
+# Top-level fields the sessions routinely query on, besides the
+# assigned<Catalog>Ids and ancestor<Catalog>Ids fields which are always indexed
+INDEXED_FIELDS = ['genusTypeId',
+                  'sourceId',
+                  'destinationId',
+                  'assessmentTakenId']
+
+
+def is_indexed_field(key):
+    """Tests if the given top-level document key gets an inverted index"""
+    return (key in INDEXED_FIELDS or
+            (key.startswith('assigned') and key.endswith('Ids')) or
+            (key.startswith('ancestor') and key.endswith('Ids')))
+
+
+def _get_index_values(value):
+    """Gets the hashable values to index for one field value"""
+    if isinstance(value, list):
+        return [v for v in value if isinstance(v, (str, type(u'')))]
+    elif isinstance(value, (str, type(u''))):
+        return [value]
+    return []
+
+
+def get_query_values(value):
+    """Gets the values a query term matches on, or None if it can't narrow"""
+    if isinstance(value, ObjectId):
+        return [str(value)]
+    elif isinstance(value, (str, type(u''))):
+        return [value]
+    elif isinstance(value, dict) and list(value.keys()) == ['$in']:
+        in_values = []
+        for in_value in value['$in']:
+            if isinstance(in_value, ObjectId):
+                in_values.append(str(in_value))
+            elif isinstance(in_value, (str, type(u''))):
+                in_values.append(in_value)
+            else:
+                # i.e. regular expressions
+                return None
+        return in_values
+    return None
+
+
+class CollectionIndex(object):
+    """Maps document ``_ids`` to their location, plus inverted field indexes.
+
+    Only top-level string (or list of string) values are indexed. A
+    candidate set returned by ``get_candidate_ids()`` is always a superset
+    of the matching documents, so callers still need to run the full
+    query against each candidate.
+
+    Locations are handed back in the order documents were first added,
+    like the natural order of a MongoDB collection.
+
+    """
+    def __init__(self):
+        self._lock = RLock()
+        self._locations = OrderedDict()
+        self._sequence = {}
+        self._counter = count()
+        self._fields = {}
+        self._doc_values = {}
+
+    def __len__(self):
+        return len(self._locations)
+
+    def __contains__(self, doc_id):
+        return str(doc_id) in self._locations
+
+    def add(self, doc, location):
+        """Adds (or replaces) a document in this index"""
+        doc_id = str(doc['_id'])
+        with self._lock:
+            self._remove_values(doc_id)
+            doc_values = {}
+            for key, value in doc.items():
+                if is_indexed_field(key):
+                    values = _get_index_values(value)
+                    if values:
+                        doc_values[key] = values
+                        postings = self._fields.setdefault(key, {})
+                        for index_value in values:
+                            postings.setdefault(index_value, set()).add(doc_id)
+            if doc_id not in self._sequence:
+                self._sequence[doc_id] = next(self._counter)
+            self._locations[doc_id] = location
+            self._doc_values[doc_id] = doc_values
+
+    def _remove_values(self, doc_id):
+        for key, values in self._doc_values.pop(doc_id, {}).items():
+            postings = self._fields[key]
+            for index_value in values:
+                postings[index_value].discard(doc_id)
+                if not postings[index_value]:
+                    del postings[index_value]
+
+    def remove(self, doc_id):
+        """Removes a document from this index, if present"""
+        doc_id = str(doc_id)
+        with self._lock:
+            if doc_id not in self._locations:
+                return
+            self._remove_values(doc_id)
+            del self._locations[doc_id]
+            del self._sequence[doc_id]
+
+    def clear(self):
+        with self._lock:
+            self._locations = OrderedDict()
+            self._sequence = {}
+            self._fields = {}
+            self._doc_values = {}
+
+    def set_location(self, doc_id, location):
+        """Moves an indexed document without touching its field values"""
+        with self._lock:
+            if str(doc_id) in self._locations:
+                self._locations[str(doc_id)] = location
+
+    def get_location(self, doc_id):
+        """Gets the location of a document, or None if not indexed"""
+        return self._locations.get(str(doc_id))
+
+    def get_ids(self, doc_ids=None):
+        """Gets the given (or all) indexed document ``_ids``, in natural order"""
+        with self._lock:
+            if doc_ids is None:
+                return list(self._locations.keys())
+            return sorted([doc_id for doc_id in doc_ids if doc_id in self._sequence],
+                          key=self._sequence.__getitem__)
+
+    def get_locations(self, doc_ids=None):
+        """Gets the locations of the given (or all) document ``_ids``, in natural order"""
+        with self._lock:
+            return [self._locations[doc_id] for doc_id in self.get_ids(doc_ids)]
+
+    def get_candidate_ids(self, query):
+        """Gets the ``_ids`` that may match a query.
+
+        Returns ``None`` if no term of the query can use the index, in which
+        case every document is a candidate.
+
+        """
+        candidates = None
+        with self._lock:
+            for key, value in query.items():
+                if key == '$and':
+                    for sub_query in value:
+                        sub_candidates = self.get_candidate_ids(sub_query)
+                        if sub_candidates is not None:
+                            if candidates is None:
+                                candidates = sub_candidates
+                            else:
+                                candidates = candidates & sub_candidates
+                    continue
+                if key != '_id' and key not in self._fields and not is_indexed_field(key):
+                    continue
+                values = get_query_values(value)
+                if values is None:
+                    continue
+                if key == '_id':
+                    term_candidates = set(v for v in values if v in self._locations)
+                else:
+                    postings = self._fields.get(key, {})
+                    term_candidates = set()
+                    for query_value in values:
+                        term_candidates.update(postings.get(query_value, ()))
+                if candidates is None:
+                    candidates = term_candidates
+                else:
+                    candidates = candidates & term_candidates
+        return candidates
+
+    def is_exact(self, query):
+        """Tests if ``get_candidate_ids()`` gives exactly the matching documents"""
+        for key, value in query.items():
+            if key == '$and':
+                if not all(self.is_exact(sub_query) for sub_query in value):
+                    return False
+            elif key != '_id' and not is_indexed_field(key):
+                return False
+            elif get_query_values(value) is None:
+                return False
+        return True
+
+
+def _get_mtime(path):
+    stat_result = os.stat(path)
+    try:
+        return stat_result.st_mtime_ns
+    except AttributeError:
+        # python 2
+        return stat_result.st_mtime
+
+
+class FilesystemCollectionIndex(CollectionIndex):
+    """A ``CollectionIndex`` over a one-file-per-document directory.
+
+    The index is loaded lazily on first use. Before each use the directory
+    mtime is checked; documents are written by renaming a temporary file
+    into place, so writes from other processes change the directory mtime,
+    and only files whose own mtime changed get parsed again. Writes made
+    through this process are recorded directly with ``record_write()``.
+    They leave the directory mtime unseen, since another writer may have
+    changed the directory too, so the next use re-stats the files but does
+    not parse the ones recorded here.
+
+    """
+    def __init__(self, directory):
+        CollectionIndex.__init__(self)
+        self._directory = directory
+        self._dir_mtime = None
+        self._file_mtimes = {}
+
+    @staticmethod
+    def _get_file_contents_as_json(file_path):
+        with codecs.open(file_path, 'rb', encoding='utf-8') as input_file:
+            return json.loads(input_file.read())
+
+    def clear(self):
+        with self._lock:
+            CollectionIndex.clear(self)
+            self._dir_mtime = None
+            self._file_mtimes = {}
+
+    def refresh(self):
+        """Brings the index up to date with the directory, if it changed"""
+        with self._lock:
+            try:
+                dir_mtime = _get_mtime(self._directory)
+            except OSError:
+                self.clear()
+                return
+            if dir_mtime == self._dir_mtime:
+                return
+            seen = set()
+            for file_name in os.listdir(self._directory):
+                if not file_name.endswith('.json') or file_name.startswith('.'):
+                    continue
+                doc_id = file_name[:-len('.json')]
+                file_path = os.path.join(self._directory, file_name)
+                seen.add(doc_id)
+                try:
+                    file_mtime = _get_mtime(file_path)
+                except OSError:
+                    # removed while scanning
+                    seen.discard(doc_id)
+                    continue
+                if self._file_mtimes.get(doc_id) != file_mtime:
+                    try:
+                        doc = self._get_file_contents_as_json(file_path)
+                    except (IOError, OSError, ValueError):
+                        seen.discard(doc_id)
+                        continue
+                    doc['_id'] = doc_id
+                    self.add(doc, file_path)
+                    self._file_mtimes[doc_id] = file_mtime
+            for doc_id in set(self._file_mtimes) - seen:
+                self.remove(doc_id)
+                del self._file_mtimes[doc_id]
+            self._dir_mtime = dir_mtime
+
+    def record_write(self, doc, file_path):
+        """Records a document this process just wrote to ``file_path``"""
+        with self._lock:
+            self.add(doc, file_path)
+            self._file_mtimes[str(doc['_id'])] = _get_mtime(file_path)
+
+    def record_delete(self, doc_id):
+        """Records a document this process just deleted"""
+        with self._lock:
+            self.remove(doc_id)
+            self._file_mtimes.pop(str(doc_id), None)
+
+
+COLLECTION_INDEXES = {}
+_COLLECTION_INDEXES_LOCK = RLock()
+
+
+def get_filesystem_index(directory):
+    """Gets the process-wide index for a filesystem collection directory"""
+    directory = os.path.abspath(directory)
+    with _COLLECTION_INDEXES_LOCK:
+        if directory not in COLLECTION_INDEXES:
+            COLLECTION_INDEXES[directory] = FilesystemCollectionIndex(directory)
+        return COLLECTION_INDEXES[directory]
@@ -222,24 +222,14 @@ class CommentLookupSession(abc_commenting_sessions.CommentLookupSession, osid_se
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('commenting',
                                          collection='Comment',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in comment_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'commenting').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.CommentList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(comment_ids, 'commenting'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.CommentList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_comments_by_genus_type(self, comment_genus_type):
@@ -1033,7 +1023,7 @@ class CommentAdminSession(abc_commenting_sessions.CommentAdminSession, osid_sess
             raise errors.Unsupported('comment_form did not originate from this session')
         if not comment_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(comment_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(comment_form._my_map))
 
         self._forms[comment_form.get_id().get_identifier()] = CREATED
         result = objects.Comment(
@@ -1315,10 +1305,10 @@ class CommentBookSession(abc_commenting_sessions.CommentBookSession, osid_sessio
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for comment in self.get_comments_by_book(book_id):
-            id_list.append(comment.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('COMMENTING', local=True)
+        lookup_session = mgr.get_comment_lookup_session_for_book(book_id, proxy=self._proxy)
+        lookup_session.use_isolated_book_view()
+        return lookup_session._get_object_ids_in_view('commenting', 'Comment', 'commenting.Comment')
 
     @utilities.arguments_not_none
     def get_comments_by_book(self, book_id):
@@ -2505,7 +2495,7 @@ class BookHierarchySession(abc_commenting_sessions.BookHierarchySession, osid_se
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=book_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=book_id)
+        return self._hierarchy_session.is_ancestor(id_=book_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_books(self, book_id):
@@ -2612,7 +2602,7 @@ class BookHierarchySession(abc_commenting_sessions.BookHierarchySession, osid_se
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=book_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=book_id)
+        return self._hierarchy_session.is_descendant(id_=book_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_book_node_ids(self, book_id, ancestor_levels, descendant_levels, include_siblings):
@@ -0,0 +1,353 @@
+"""Lazy cursors for the non-MongoDB JSON backends
+
+``DocumentCursor`` stands in for a pymongo ``Cursor`` in the filesystem
+and document store impls. Matching ``_ids`` are worked out from the
+collection index when there is one, and documents are only read (and
+matched) as they are iterated, so a sliced or limited cursor only reads
+the page it returns.
+
+"""
+import codecs
+import glob
+import json
+import os
+
+from pymongo import ASCENDING
+
+from .collection_indexes import get_query_values
+from .osid.osid_errors import IllegalState, InvalidArgument
+from .query_compiler import compile_query, resolve_path
+
+
+def get_id_values(query):
+    """Gets the ``_ids`` a query is restricted to, or None if it is not"""
+    id_values = None
+    for key, value in query.items():
+        if key == '$and':
+            for sub_query in value:
+                sub_values = get_id_values(sub_query)
+                if sub_values is not None:
+                    if id_values is None:
+                        id_values = sub_values
+                    else:
+                        id_values = [v for v in id_values if v in sub_values]
+        elif key == '_id':
+            values = get_query_values(value)
+            if values is not None:
+                if id_values is None:
+                    id_values = values
+                else:
+                    id_values = [v for v in id_values if v in values]
+    return id_values
+
+
+class DirectorySource(object):
+    """Documents kept as one ``<_id>.json`` file each, without an index"""
+    def __init__(self, directory):
+        self._directory = directory
+
+    def _get_path(self, doc_id):
+        return '{0}/{1}.json'.format(self._directory, doc_id)
+
+    def get_ids(self, query):
+        id_values = get_id_values(query)
+        if id_values is not None:
+            return [doc_id for doc_id in id_values if os.path.isfile(self._get_path(doc_id))]
+        return [os.path.basename(file_path)[:-len('.json')]
+                for file_path in glob.iglob(self._directory + '/*.json')]
+
+    def is_exact(self, query):
+        return not query
+
+    def load(self, doc_id):
+        try:
+            with codecs.open(self._get_path(doc_id), 'rb', encoding='utf-8') as input_file:
+                return json.loads(input_file.read())
+        except (IOError, OSError):
+            # deleted since the _ids were listed
+            return None
+
+
+class IndexedDirectorySource(DirectorySource):
+    """Documents kept as one ``<_id>.json`` file each, with a ``FilesystemCollectionIndex``"""
+    def __init__(self, directory, index):
+        DirectorySource.__init__(self, directory)
+        self._index = index
+
+    def get_ids(self, query):
+        self._index.refresh()
+        return self._index.get_ids(self._index.get_candidate_ids(query))
+
+    def is_exact(self, query):
+        return self._index.is_exact(query)
+
+
+class StoreSource(object):
+    """Documents kept in a ``DocumentStore``"""
+    def __init__(self, store):
+        self._store = store
+
+    def get_ids(self, query):
+        return self._store.get_ids(self._store.get_candidate_ids(query))
+
+    def is_exact(self, query):
+        return self._store.is_exact(query)
+
+    def load(self, doc_id):
+        return self._store.get(doc_id)
+
+
+def _get_projection_spec(projection):
+    """Normalizes a projection to (paths, include, include_id). A list means inclusion"""
+    if not projection:
+        return None
+    if isinstance(projection, (list, tuple)):
+        projection = dict((key, True) for key in projection)
+    include_id = bool(projection.get('_id', True))
+    fields = dict((key, bool(value)) for key, value in projection.items() if key != '_id')
+    if not fields:
+        # only _id was given
+        if include_id:
+            return [], True, True
+        return [('_id',)], False, False
+    if len(set(fields.values())) != 1:
+        raise InvalidArgument('projections cannot mix inclusion and exclusion')
+    include = list(fields.values())[0]
+    paths = [tuple(key.split('.')) for key in fields]
+    if not include and not include_id:
+        paths.append(('_id',))
+    return paths, include, include_id
+
+
+def _include_path(source, target, path):
+    if path[0] not in source:
+        return
+    value = source[path[0]]
+    if len(path) == 1:
+        target[path[0]] = value
+    elif isinstance(value, dict):
+        _include_path(value, target.setdefault(path[0], {}), path[1:])
+    elif isinstance(value, list):
+        elements = target.setdefault(path[0], [{} for element in value if isinstance(element, dict)])
+        for element, target_element in zip([e for e in value if isinstance(e, dict)], elements):
+            _include_path(element, target_element, path[1:])
+
+
+def _exclude_path(target, path):
+    if len(path) == 1:
+        if isinstance(target, dict):
+            target.pop(path[0], None)
+        return
+    value = target.get(path[0]) if isinstance(target, dict) else None
+    if isinstance(value, dict):
+        target[path[0]] = dict(value)
+        _exclude_path(target[path[0]], path[1:])
+    elif isinstance(value, list):
+        target[path[0]] = [dict(element) if isinstance(element, dict) else element
+                           for element in value]
+        for element in target[path[0]]:
+            _exclude_path(element, path[1:])
+
+
+def project_document(doc, projection):
+    """Applies a MongoDB-style projection (a dict, or a list of fields) to a document"""
+    spec = _get_projection_spec(projection)
+    if spec is None:
+        return doc
+    paths, include, include_id = spec
+    if include:
+        projected = {}
+        if include_id and '_id' in doc:
+            projected['_id'] = doc['_id']
+        for path in paths:
+            _include_path(doc, projected, path)
+        return projected
+    projected = dict(doc)
+    for path in paths:
+        _exclude_path(projected, path)
+    return projected
+
+
+def _get_sort_key(path):
+    def sort_key(doc):
+        values = resolve_path(doc, path)
+        if not values:
+            return (0, '')
+        value = values[0]
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return (1, value)
+        if isinstance(value, dict):
+            # stored datetimes, or embedded documents
+            return (2, sorted(value.items()))
+        return (3, str(value))
+    return sort_key
+
+
+class DocumentCursor(object):
+    """A pymongo ``Cursor`` look-alike over a document source.
+
+    Supports ``sort()``, ``skip()``, ``limit()``, slicing, ``count()`` and
+    projections.
+    Sorting on ``_id`` alone, and counting a query the index answers
+    exactly, only look at the ``_ids``. Any other sort reads all the
+    matching documents before the first one is returned.
+
+    """
+    def __init__(self, source, query=None, restore=None, projection=None):
+        self._source = source
+        self._query = query or {}
+        self._restore = restore
+        self._projection = projection
+        self._sort = []
+        self._skip = 0
+        self._limit = 0
+        self._started = False
+        self._iterator = None
+        self._ids = None
+        self._matched = None  # True once self._ids are all known to match
+
+    def _check_not_started(self):
+        if self._started:
+            raise IllegalState('cannot modify a cursor after it has been used')
+
+    def sort(self, key_or_list, direction=None):
+        self._check_not_started()
+        if isinstance(key_or_list, (list, tuple)):
+            self._sort = [(key, direction) for key, direction in key_or_list]
+        else:
+            self._sort = [(key_or_list, ASCENDING if direction is None else direction)]
+        self._ids = None
+        self._matched = None
+        return self
+
+    def skip(self, skip):
+        self._check_not_started()
+        if skip < 0:
+            raise InvalidArgument('skip must be >= 0')
+        self._skip = skip
+        return self
+
+    def limit(self, limit):
+        self._check_not_started()
+        self._limit = abs(limit)
+        return self
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.step is not None:
+                raise InvalidArgument('cursor slices do not support a step')
+            self._check_not_started()
+            start = index.start or 0
+            if start < 0 or (index.stop is not None and index.stop < 0):
+                raise InvalidArgument('cursor slices do not support negative indexes')
+            self._skip = start
+            if index.stop is not None:
+                # an empty slice still has to return nothing
+                self._limit = max(index.stop - start, 0) or -1
+            return self
+        if index < 0:
+            raise InvalidArgument('cursors do not support negative indexes')
+        for position, doc in enumerate(self._iter_all()):
+            if position == index:
+                return self._restore_doc(doc)
+        raise IndexError('no such item for cursor')
+
+    def _get_ids(self):
+        if self._ids is None:
+            self._ids = self._source.get_ids(self._query)
+            self._matched = self._source.is_exact(self._query)
+            if self._sort and [key for key, direction in self._sort] == ['_id']:
+                self._ids = sorted(self._ids, reverse=(self._sort[0][1] != ASCENDING))
+        return self._ids
+
+    def _get_matched_ids(self):
+        """Gets the matching ``_ids``, reading documents only if the index can't tell"""
+        ids = self._get_ids()
+        if not self._matched:
+            matches = compile_query(self._query)
+            self._ids = [doc_id for doc_id, doc in self._iter_loaded(ids, matches)]
+            self._matched = True
+        return self._ids
+
+    def _iter_loaded(self, ids, matches=None):
+        for doc_id in ids:
+            doc = self._source.load(doc_id)
+            if doc is not None and (matches is None or matches(doc)):
+                yield doc_id, doc
+
+    def _iter_all(self):
+        """Yields all the matching stored documents, in order, without skip or limit"""
+        ids = self._get_ids()
+        matches = None if self._matched else compile_query(self._query)
+        if self._sort and [key for key, direction in self._sort] != ['_id']:
+            docs = [doc for doc_id, doc in self._iter_loaded(ids, matches)]
+            for key, direction in reversed(self._sort):
+                docs.sort(key=_get_sort_key(tuple(key.split('.'))),
+                          reverse=(direction != ASCENDING))
+            for doc in docs:
+                yield doc
+        else:
+            for doc_id, doc in self._iter_loaded(ids, matches):
+                yield doc
+
+    def _iter_page(self):
+        if self._limit == -1:
+            return
+        if self._skip and (not self._sort or [key for key, direction in self._sort] == ['_id']):
+            # skip the _ids, not the documents, when that is safe
+            ids = self._get_matched_ids()
+            if len(ids) <= self._skip:
+                return
+            self._ids = ids[self._skip:]
+            skip = 0
+        else:
+            skip = self._skip
+        returned = 0
+        for position, doc in enumerate(self._iter_all()):
+            if position < skip:
+                continue
+            yield self._restore_doc(doc)
+            returned += 1
+            if self._limit and returned >= self._limit:
+                return
+
+    def _restore_doc(self, doc):
+        if self._projection is not None:
+            doc = project_document(doc, self._projection)
+        if self._restore is not None:
+            return self._restore(doc)
+        return doc
+
+    def __iter__(self):
+        return self
+
+    def next(self):
+        if self._iterator is None:
+            self._started = True
+            self._iterator = self._iter_page()
+        return next(self._iterator)
+
+    __next__ = next
+
+    def rewind(self):
+        """Rewinds this cursor to its unevaluated state"""
+        self._started = False
+        self._iterator = None
+        self._ids = None
+        self._matched = None
+        return self
+
+    def count(self, with_limit_and_skip=False):
+        """Counts the matching documents, like ``Cursor.count()``"""
+        if self._started:
+            # the _ids may have been narrowed to the page already
+            total = len(DocumentCursor(self._source, self._query)._get_matched_ids())
+        else:
+            total = len(self._get_matched_ids())
+        if with_limit_and_skip:
+            if self._limit == -1:
+                return 0
+            total = max(total - self._skip, 0)
+            if self._limit:
+                total = min(total, self._limit)
+        return total
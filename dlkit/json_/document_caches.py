@@ -0,0 +1,231 @@
+"""Read-through caching of documents looked up by ``_id``
+
+``JSONClientValidated.find_one()`` keeps the documents of the collections
+listed in ``cachedCollections@json`` in the process-wide
+``DOCUMENT_CACHE``, keyed by (namespace, ``_id``). Writes made through
+``JSONClientValidated`` invalidate the cached copies. Writes from other
+processes are only seen once an entry expires, unless
+``invalidateCacheFromOplog@json`` is set, in which case the changes
+the ``MongoListener`` reads from the MongoDB change stream invalidate
+them as well.
+
+Catalog collections (``CATALOG_COLLECTIONS``) are cached the same way
+in ``CATALOG_CACHE`` when ``catalogCacheTTL@json`` is set to a number of
+seconds, so that constructing a session for a warm catalog does not
+touch the database. It is off by default (``CATALOG_TTL``), since a
+catalog changed by another process would be seen late; combine it with
+``invalidateCacheFromOplog@json`` in multi-process deployments.
+Both caches also remember the ``_id``s that were not found, until that
+``_id`` is written or the entry expires. ``_create_orchestrated_cat()``
+records the foreign catalogs it could not find the same way, in the
+foreign catalog's collection.
+
+``ALIAS_CACHE`` maps alias ``Id`` strings to their primary ``Id``
+strings, or to None for ids that are not aliases, keyed by the namespace
+of the ``<pkg>Ids`` collection. ``OsidSession._alias_id()`` invalidates
+the aliases it moves, and entries written by other processes are picked
+up after ``ALIAS_TTL`` seconds.
+
+"""
+import copy
+import time
+
+from collections import OrderedDict
+from threading import RLock
+
+from bson import ObjectId
+
+
+MAX_CACHED_DOCUMENTS = 10000
+MAX_CACHED_ALIASES = 10000
+ALIAS_TTL = 60
+MAX_CACHED_CATALOGS = 1000
+CATALOG_TTL = 0
+
+# Stands in for a document that was looked up and not found
+MISSING_DOCUMENT_KEY = '$missing'
+
+# The (db, collection) of the catalogs sessions are constructed for
+CATALOG_COLLECTIONS = [('assessment', 'Bank'),
+                       ('assessment_authoring', 'Bank'),
+                       ('authentication', 'Agency'),
+                       ('authorization', 'Vault'),
+                       ('cataloging', 'Catalog'),
+                       ('commenting', 'Book'),
+                       ('grading', 'Gradebook'),
+                       ('hierarchy', 'Hierarchy'),
+                       ('learning', 'ObjectiveBank'),
+                       ('logging', 'Log'),
+                       ('relationship', 'Family'),
+                       ('repository', 'Repository'),
+                       ('resource', 'Bin')]
+
+
+def _get_empty_stats():
+    return dict(hits=0, misses=0, evictions=0, expirations=0, invalidations=0)
+
+
+def split_id_term(query):
+    """Splits a query into its ``_id`` value and the rest of its terms.
+
+    Returns ``(None, None)`` if the query is not restricted to one ``_id``.
+
+    """
+    if not isinstance(query, dict):
+        return None, None
+    if '_id' in query:
+        doc_id = query['_id']
+        other_terms = dict((key, value) for key, value in query.items() if key != '_id')
+    else:
+        id_terms = [sub_query for sub_query in query.get('$and', [])
+                    if isinstance(sub_query, dict) and list(sub_query.keys()) == ['_id']]
+        if not id_terms or any(id_term['_id'] != id_terms[0]['_id'] for id_term in id_terms):
+            return None, None
+        doc_id = id_terms[0]['_id']
+        other_terms = dict((key, value) for key, value in query.items() if key != '$and')
+        other_sub_queries = [sub_query for sub_query in query['$and'] if sub_query not in id_terms]
+        if other_sub_queries:
+            other_terms['$and'] = other_sub_queries
+    if isinstance(doc_id, (ObjectId, str, type(u''))):
+        return doc_id, other_terms
+    return None, None
+
+
+class DocumentCache(object):
+    """A bounded LRU cache of documents, with an optional time to live per entry.
+
+    Every invalidation bumps the generation of its namespace. A reader
+    gets the generation before going to the database and hands it to
+    ``put()``, which drops the document if a write came in meanwhile.
+
+    """
+    def __init__(self, max_size=MAX_CACHED_DOCUMENTS, timer=time.time):
+        self._lock = RLock()
+        self.max_size = max_size
+        self._timer = timer
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._stats = {}
+        self._listening = False
+
+    def _count(self, namespace, stat, amount=1):
+        if namespace not in self._stats:
+            self._stats[namespace] = _get_empty_stats()
+        self._stats[namespace][stat] += amount
+
+    def get_stats(self, namespace=None):
+        """Gets the counters for a namespace, or summed over all namespaces"""
+        with self._lock:
+            if namespace is not None:
+                return dict(self._stats.get(namespace, _get_empty_stats()))
+            totals = _get_empty_stats()
+            for namespace_stats in self._stats.values():
+                for stat, value in namespace_stats.items():
+                    totals[stat] += value
+            totals['size'] = len(self._entries)
+            return totals
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = {}
+
+    def clear(self):
+        """Drops every cached document"""
+        with self._lock:
+            for namespace in set(key[0] for key in self._entries):
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            self._entries = OrderedDict()
+
+    def get_generation(self, namespace):
+        return self._generations.get(namespace, 0)
+
+    def get(self, namespace, doc_id):
+        """Gets a copy of a cached document, or None"""
+        key = (namespace, doc_id)
+        with self._lock:
+            try:
+                doc, expires = self._entries[key]
+            except KeyError:
+                self._count(namespace, 'misses')
+                return None
+            if expires is not None and expires <= self._timer():
+                del self._entries[key]
+                self._count(namespace, 'expirations')
+                self._count(namespace, 'misses')
+                return None
+            self._entries[key] = self._entries.pop(key)  # most recently used
+            self._count(namespace, 'hits')
+        return copy.deepcopy(doc)
+
+    def put(self, namespace, doc_id, doc, ttl=None, generation=None):
+        """Caches a copy of a document, unless its namespace was written to
+        since ``generation``"""
+        doc = copy.deepcopy(doc)
+        with self._lock:
+            if generation is not None and generation != self.get_generation(namespace):
+                return
+            expires = None
+            if ttl is not None:
+                expires = self._timer() + ttl
+            self._entries.pop((namespace, doc_id), None)
+            self._entries[(namespace, doc_id)] = (doc, expires)
+            while len(self._entries) > self.max_size:
+                evicted_key = next(iter(self._entries))
+                del self._entries[evicted_key]
+                self._count(evicted_key[0], 'evictions')
+
+    def invalidate(self, namespace, doc_ids):
+        """Drops the cached copies of some documents"""
+        with self._lock:
+            self._generations[namespace] = self.get_generation(namespace) + 1
+            for doc_id in doc_ids:
+                if self._entries.pop((namespace, doc_id), None) is not None:
+                    self._count(namespace, 'invalidations')
+
+    def invalidate_namespace(self, namespace):
+        """Drops every cached document of a namespace"""
+        with self._lock:
+            self._generations[namespace] = self.get_generation(namespace) + 1
+            for key in [key for key in self._entries if key[0] == namespace]:
+                del self._entries[key]
+                self._count(namespace, 'invalidations')
+
+    def invalidate_database(self, db_name):
+        """Drops every cached document of a (prefixed) MongoDB database"""
+        with self._lock:
+            for namespace in set(key[0] for key in self._entries) | set(self._generations):
+                if namespace.startswith(db_name + '.'):
+                    self.invalidate_namespace(namespace)
+
+    def process_oplog_entry(self, entry):
+        """Invalidates the documents changed by a MongoDB oplog entry"""
+        namespace = entry.get('ns', '')
+        if entry.get('op') in ['i', 'u', 'd']:
+            doc_id = (entry.get('o2') or entry.get('o') or {}).get('_id')
+            if doc_id is None:
+                self.invalidate_namespace(namespace)
+            else:
+                self.invalidate(namespace, [doc_id])
+        elif entry.get('op') == 'c':
+            db_name = namespace.split('.')[0]
+            command = entry.get('o', {})
+            if 'dropDatabase' in command:
+                self.invalidate_database(db_name)
+            elif 'drop' in command:
+                self.invalidate_namespace('{0}.{1}'.format(db_name, command['drop']))
+
+    def listen_to_oplog(self, listener, runtime=None):
+        """Has a ``MongoListener`` invalidate this cache, starting it if needed"""
+        with self._lock:
+            if self._listening:
+                return
+            listener.oplog_callbacks.append(self.process_oplog_entry)
+            self._listening = True
+            if not listener.is_alive():
+                listener.initialize(runtime)
+                listener.start()
+
+
+DOCUMENT_CACHE = DocumentCache()
+CATALOG_CACHE = DocumentCache(max_size=MAX_CACHED_CATALOGS)
+ALIAS_CACHE = DocumentCache(max_size=MAX_CACHED_ALIASES)
@@ -0,0 +1,486 @@
+"""Document stores for the non-MongoDB JSON backends"""
+import atexit
+import codecs
+import glob
+import json
+import os
+import re
+
+from threading import RLock, Thread
+
+from .collection_indexes import CollectionIndex
+from .osid.osid_errors import OperationFailed
+
+
+class DocumentStore(object):
+    """Base class for stores that keep a collection of JSON documents.
+
+    Documents are handed in and out in their stored (json serializable)
+    form, with a string ``_id``. Query matching and conversion back to
+    datetimes and ``ObjectIds`` are left to ``JSONClientValidated``.
+
+    """
+    def __init__(self):
+        self._lock = RLock()
+        self._index = CollectionIndex()
+
+    def _load(self):
+        """Lazily loads the store. Implementations must be idempotent"""
+        pass
+
+    def get(self, doc_id):
+        """Gets a stored document by ``_id``, or None"""
+        raise NotImplementedError()
+
+    def put(self, doc):
+        """Inserts or replaces a document"""
+        self.put_many([doc])
+
+    def put_many(self, docs):
+        """Inserts or replaces several documents at once"""
+        raise NotImplementedError()
+
+    def delete(self, doc_id):
+        """Deletes a document. Returns False if it did not exist"""
+        return self.delete_many([doc_id]) == 1
+
+    def delete_many(self, doc_ids):
+        """Deletes several documents at once. Returns the number deleted"""
+        raise NotImplementedError()
+
+    def count(self):
+        self._load()
+        return len(self._index)
+
+    def get_ids(self, doc_ids=None):
+        """Gets the given (or all) stored ``_ids``, in insertion order"""
+        self._load()
+        return self._index.get_ids(doc_ids)
+
+    def get_candidate_ids(self, query):
+        """Gets the ``_ids`` that may match a query, or None for all of them"""
+        self._load()
+        return self._index.get_candidate_ids(query)
+
+    def is_exact(self, query):
+        """Tests if ``get_candidate_ids()`` gives exactly the matching ``_ids``"""
+        return self._index.is_exact(query)
+
+
+SEGMENT_NAME_TEMPLATE = 'segment-{0:08d}.jsonl'
+SEGMENT_NAME_RE = re.compile(r'^segment-(\d{8})\.jsonl$')
+
+
+class SegmentStore(DocumentStore):
+    """Keeps a collection as append-only JSON-lines segment files.
+
+    Every write appends one record per document to the active segment:
+    ``{"_id": ..., "doc": {...}}`` for a save, or ``{"_id": ...,
+    "deleted": true}`` for a delete, and is fsynced before returning. An
+    in-memory offset index maps each live ``_id`` to its (segment,
+    offset, length).
+
+    The ``MANIFEST`` file lists the live segments in replay order and is
+    only ever replaced atomically, so rotation and compaction either
+    happen completely or not at all. Segment files not listed in it are
+    left-overs of an interrupted compaction and are removed on load, and
+    a partially written record at the end of the active segment is
+    truncated.
+
+    A collection directory without a ``MANIFEST`` that holds
+    one-file-per-document ``.json`` files is imported on first load.
+    Only one process should write to a collection at a time.
+
+    """
+    MANIFEST = 'MANIFEST'
+    MAX_SEGMENT_BYTES = 16 * 1024 * 1024
+    COMPACTION_RATIO = 0.5
+
+    def __init__(self, directory, max_segment_bytes=None, compaction_ratio=None):
+        DocumentStore.__init__(self)
+        self._directory = directory
+        if max_segment_bytes is not None:
+            self.MAX_SEGMENT_BYTES = max_segment_bytes
+        if compaction_ratio is not None:
+            self.COMPACTION_RATIO = compaction_ratio
+        self._loaded = False
+        self._segments = []
+        self._segment_bytes = {}
+        self._live_bytes = {}
+        self._readers = {}
+        self._writer = None
+        self._compactor = None
+        self._compact_lock = RLock()
+
+    def _path(self, name):
+        return os.path.join(self._directory, name)
+
+    @staticmethod
+    def _fsync(file_obj):
+        file_obj.flush()
+        os.fsync(file_obj.fileno())
+
+    def _write_manifest(self, segments):
+        """Atomically replaces the manifest with the given segment names"""
+        tmp_path = self._path('.' + self.MANIFEST + '.tmp')
+        with open(tmp_path, 'w') as manifest_file:
+            manifest_file.write(json.dumps(segments))
+            self._fsync(manifest_file)
+        try:
+            os.replace(tmp_path, self._path(self.MANIFEST))
+        except AttributeError:
+            # python 2
+            if os.name == 'nt' and os.path.isfile(self._path(self.MANIFEST)):
+                os.remove(self._path(self.MANIFEST))
+            os.rename(tmp_path, self._path(self.MANIFEST))
+        self._segments = list(segments)
+
+    def _next_segment_name(self):
+        numbers = [0]
+        for file_name in os.listdir(self._directory):
+            match = SEGMENT_NAME_RE.match(file_name)
+            if match:
+                numbers.append(int(match.group(1)))
+        return SEGMENT_NAME_TEMPLATE.format(max(numbers) + 1)
+
+    def _load(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if not os.path.isdir(self._directory):
+                os.makedirs(self._directory)
+            manifest_path = self._path(self.MANIFEST)
+            if os.path.isfile(manifest_path):
+                with open(manifest_path, 'r') as manifest_file:
+                    self._segments = json.loads(manifest_file.read())
+                bootstrap = False
+            else:
+                self._segments = []
+                bootstrap = True
+            for file_name in os.listdir(self._directory):
+                if ((SEGMENT_NAME_RE.match(file_name) and file_name not in self._segments) or
+                        file_name == '.compacting.tmp'):
+                    os.remove(self._path(file_name))
+            if not self._segments:
+                name = self._next_segment_name()
+                open(self._path(name), 'ab').close()
+                self._write_manifest([name])
+            for name in self._segments:
+                self._replay(name, is_active=(name == self._segments[-1]))
+            self._loaded = True
+            if bootstrap:
+                self.import_json_files(self._directory)
+
+    def _replay(self, name, is_active=False):
+        """Rebuilds the index entries for the records in one segment"""
+        self._segment_bytes[name] = 0
+        self._live_bytes.setdefault(name, 0)
+        offset = 0
+        with open(self._path(name), 'rb') as segment_file:
+            for line in segment_file:
+                length = len(line)
+                try:
+                    if not line.endswith(b'\n'):
+                        raise ValueError('partial record')
+                    record = json.loads(line.decode('utf-8'))
+                except ValueError:
+                    if is_active:
+                        # the tail of an interrupted append
+                        break
+                    raise OperationFailed('corrupt record in ' + self._path(name))
+                self._apply(record, (name, offset, length))
+                offset += length
+        self._segment_bytes[name] = offset
+        if is_active and offset != os.path.getsize(self._path(name)):
+            with open(self._path(name), 'ab') as segment_file:
+                segment_file.truncate(offset)
+
+    def _apply(self, record, location):
+        """Points the index at a newly read or written record"""
+        doc_id = record['_id']
+        previous = self._index.get_location(doc_id)
+        if previous is not None:
+            self._live_bytes[previous[0]] -= previous[2]
+        if record.get('deleted'):
+            self._index.remove(doc_id)
+        else:
+            self._index.add(record['doc'], location)
+            self._live_bytes[location[0]] = self._live_bytes.get(location[0], 0) + location[2]
+
+    def _get_writer(self):
+        active = self._segments[-1]
+        if self._writer is None or self._writer[0] != active:
+            if self._writer is not None:
+                self._writer[1].close()
+            self._writer = (active, open(self._path(active), 'ab'))
+        return self._writer[1]
+
+    def _append(self, records):
+        """Appends records to the active segment, rotating when it is full"""
+        lines = [(json.dumps(record) + '\n').encode('utf-8') for record in records]
+        writer = self._get_writer()
+        active = self._segments[-1]
+        offset = self._segment_bytes[active]
+        writer.write(b''.join(lines))
+        self._fsync(writer)
+        for record, line in zip(records, lines):
+            self._apply(record, (active, offset, len(line)))
+            offset += len(line)
+        self._segment_bytes[active] = offset
+        if offset >= self.MAX_SEGMENT_BYTES:
+            self._rotate()
+        self._maybe_compact()
+
+    def _rotate(self):
+        """Seals the active segment and starts a new one"""
+        self._fsync(self._get_writer())
+        name = self._next_segment_name()
+        open(self._path(name), 'ab').close()
+        self._segment_bytes[name] = 0
+        self._live_bytes[name] = 0
+        self._write_manifest(self._segments + [name])
+
+    def _get_reader(self, name):
+        if name not in self._readers:
+            self._readers[name] = open(self._path(name), 'rb')
+        return self._readers[name]
+
+    def _read(self, location):
+        reader = self._get_reader(location[0])
+        reader.seek(location[1])
+        return json.loads(reader.read(location[2]).decode('utf-8'))
+
+    def get(self, doc_id):
+        self._load()
+        with self._lock:
+            location = self._index.get_location(doc_id)
+            if location is None:
+                return None
+            return self._read(location)['doc']
+
+    def put_many(self, docs):
+        self._load()
+        if not docs:
+            return
+        with self._lock:
+            self._append([{'_id': str(doc['_id']), 'doc': doc} for doc in docs])
+
+    def delete_many(self, doc_ids):
+        self._load()
+        with self._lock:
+            records = [{'_id': str(doc_id), 'deleted': True}
+                       for doc_id in doc_ids if str(doc_id) in self._index]
+            if records:
+                self._append(records)
+            return len(records)
+
+    def get_garbage_ratio(self):
+        """Gets the fraction of sealed segment bytes that are no longer live"""
+        self._load()
+        sealed = self._segments[:-1]
+        total = sum(self._segment_bytes[name] for name in sealed)
+        if total == 0:
+            return 0.0
+        return 1.0 - float(sum(self._live_bytes[name] for name in sealed)) / total
+
+    def _maybe_compact(self):
+        if (self.get_garbage_ratio() > self.COMPACTION_RATIO and
+                (self._compactor is None or not self._compactor.is_alive())):
+            self._compactor = Thread(target=self.compact)
+            self._compactor.daemon = True
+            self._compactor.start()
+
+    def compact(self):
+        """Rewrites the live records of all sealed segments into one segment.
+
+        The records are copied without holding the store lock, so reads
+        and writes go on meanwhile. The index and the manifest are then
+        swapped under the lock, for the records that were not rewritten
+        or deleted in the meantime.
+
+        """
+        self._load()
+        with self._compact_lock:
+            with self._lock:
+                sealed = self._segments[:-1]
+                if not sealed:
+                    return
+                locations = [(doc_id, self._index.get_location(doc_id)) for doc_id in self._index.get_ids()]
+                locations = [(doc_id, location) for doc_id, location in locations if location[0] in sealed]
+            tmp_path = self._path('.compacting.tmp')
+            copied = []
+            offset = 0
+            readers = {}
+            try:
+                with open(tmp_path, 'wb') as compacted:
+                    for doc_id, location in locations:
+                        if location[0] not in readers:
+                            readers[location[0]] = open(self._path(location[0]), 'rb')
+                        readers[location[0]].seek(location[1])
+                        compacted.write(readers[location[0]].read(location[2]))
+                        copied.append((doc_id, location, offset))
+                        offset += location[2]
+                    self._fsync(compacted)
+            finally:
+                for reader in readers.values():
+                    reader.close()
+            with self._lock:
+                name = self._next_segment_name()
+                os.rename(tmp_path, self._path(name))
+                self._write_manifest([name] + [segment for segment in self._segments if segment not in sealed])
+                live_bytes = 0
+                for doc_id, location, new_offset in copied:
+                    if self._index.get_location(doc_id) == location:
+                        self._index.set_location(doc_id, (name, new_offset, location[2]))
+                        live_bytes += location[2]
+                self._segment_bytes[name] = offset
+                self._live_bytes[name] = live_bytes
+                for old_name in sealed:
+                    if old_name in self._readers:
+                        self._readers.pop(old_name).close()
+                    del self._segment_bytes[old_name]
+                    del self._live_bytes[old_name]
+                    os.remove(self._path(old_name))
+
+    def import_json_files(self, directory):
+        """Imports a one-file-per-document directory into this store"""
+        docs = []
+        for file_path in glob.iglob(os.path.join(directory, '*.json')):
+            with codecs.open(file_path, 'rb', encoding='utf-8') as input_file:
+                doc = json.loads(input_file.read())
+            doc['_id'] = str(doc.get('_id', os.path.basename(file_path)[:-len('.json')]))
+            docs.append(doc)
+        self.put_many(docs)
+        return len(docs)
+
+    def close(self):
+        with self._lock:
+            if self._writer is not None:
+                self._fsync(self._writer[1])
+                self._writer[1].close()
+                self._writer = None
+            for reader in self._readers.values():
+                reader.close()
+            self._readers = {}
+            self._loaded = False
+            self._index.clear()
+
+
+class MemoryStore(DocumentStore):
+    """Keeps a collection in memory, for short-lived deployments and tests.
+
+    Documents are kept serialized, by ``_id``, so callers never share
+    state with the store, and the field indexes of ``CollectionIndex``
+    answer the ``_id`` and ``assigned<Catalog>Ids`` lookups.
+
+    With ``snapshot=True`` the collection is loaded from
+    ``<directory>/snapshot.jsonl`` if there is one, and written back to
+    it by ``snapshot()``, and at interpreter exit.
+
+    """
+    SNAPSHOT = 'snapshot.jsonl'
+
+    def __init__(self, directory=None, snapshot=False):
+        DocumentStore.__init__(self)
+        self._directory = directory
+        self._snapshot = snapshot and directory is not None
+        self._loaded = False
+        self._docs = {}
+
+    def _get_snapshot_path(self):
+        return os.path.join(self._directory, self.SNAPSHOT)
+
+    def _load(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            if self._snapshot and os.path.isfile(self._get_snapshot_path()):
+                with codecs.open(self._get_snapshot_path(), 'rb', encoding='utf-8') as snapshot_file:
+                    for line in snapshot_file:
+                        if line.strip():
+                            self._put(json.loads(line))
+            self._loaded = True
+
+    def _put(self, doc):
+        doc_id = str(doc['_id'])
+        self._docs[doc_id] = json.dumps(doc)
+        self._index.add(doc, doc_id)
+
+    def get(self, doc_id):
+        self._load()
+        serialized = self._docs.get(str(doc_id))
+        if serialized is None:
+            return None
+        return json.loads(serialized)
+
+    def put_many(self, docs):
+        self._load()
+        with self._lock:
+            for doc in docs:
+                self._put(doc)
+
+    def delete_many(self, doc_ids):
+        self._load()
+        deleted = 0
+        with self._lock:
+            for doc_id in doc_ids:
+                if self._docs.pop(str(doc_id), None) is not None:
+                    self._index.remove(doc_id)
+                    deleted += 1
+        return deleted
+
+    def snapshot(self):
+        """Writes the collection to its snapshot file, if snapshots are on"""
+        if not self._snapshot or not self._loaded:
+            return
+        with self._lock:
+            if not os.path.isdir(self._directory):
+                os.makedirs(self._directory)
+            tmp_path = os.path.join(self._directory, '.' + self.SNAPSHOT + '.tmp')
+            with codecs.open(tmp_path, 'wb', encoding='utf-8') as snapshot_file:
+                for doc_id in self._index.get_ids():
+                    snapshot_file.write(self._docs[doc_id] + '\n')
+            try:
+                os.replace(tmp_path, self._get_snapshot_path())
+            except AttributeError:
+                # python 2
+                if os.name == 'nt' and os.path.isfile(self._get_snapshot_path()):
+                    os.remove(self._get_snapshot_path())
+                os.rename(tmp_path, self._get_snapshot_path())
+
+    def close(self):
+        with self._lock:
+            self.snapshot()
+            self._docs = {}
+            self._loaded = False
+            self._index.clear()
+
+
+DOCUMENT_STORES = {}
+_DOCUMENT_STORES_LOCK = RLock()
+
+
+def get_document_store(engine, location, snapshot=False):
+    """Gets the process-wide document store for a collection location.
+
+    ``snapshot`` only applies to the ``memory`` engine, and only when its
+    store is first created.
+
+    """
+    location = os.path.abspath(location)
+    with _DOCUMENT_STORES_LOCK:
+        key = (engine, location)
+        if key not in DOCUMENT_STORES:
+            if engine == 'segment':
+                DOCUMENT_STORES[key] = SegmentStore(location)
+            elif engine == 'memory':
+                DOCUMENT_STORES[key] = MemoryStore(location, snapshot=snapshot)
+                if snapshot:
+                    atexit.register(DOCUMENT_STORES[key].snapshot)
+            else:
+                raise OperationFailed('unknown document store engine: ' + str(engine))
+        return DOCUMENT_STORES[key]
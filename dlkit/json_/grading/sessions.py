@@ -254,24 +254,14 @@ class GradeSystemLookupSession(abc_grading_sessions.GradeSystemLookupSession, os
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('grading',
                                          collection='GradeSystem',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in grade_system_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'grading').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.GradeSystemList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(grade_system_ids, 'grading'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.GradeSystemList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_grade_systems_by_genus_type(self, grade_system_genus_type):
@@ -736,7 +726,7 @@ class GradeSystemAdminSession(abc_grading_sessions.GradeSystemAdminSession, osid
             raise errors.Unsupported('grade_system_form did not originate from this session')
         if not grade_system_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(grade_system_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(grade_system_form._my_map))
 
         self._forms[grade_system_form.get_id().get_identifier()] = CREATED
         result = objects.GradeSystem(
@@ -1406,10 +1396,10 @@ class GradeSystemGradebookSession(abc_grading_sessions.GradeSystemGradebookSessi
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for grade_system in self.get_grade_systems_by_gradebook(gradebook_id):
-            id_list.append(grade_system.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('GRADING', local=True)
+        lookup_session = mgr.get_grade_system_lookup_session_for_gradebook(gradebook_id, proxy=self._proxy)
+        lookup_session.use_isolated_gradebook_view()
+        return lookup_session._get_object_ids_in_view('grading', 'GradeSystem', 'grading.GradeSystem')
 
     @utilities.arguments_not_none
     def get_grade_systems_by_gradebook(self, gradebook_id):
@@ -1860,24 +1850,14 @@ class GradeEntryLookupSession(abc_grading_sessions.GradeEntryLookupSession, osid
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('grading',
                                          collection='GradeEntry',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in grade_entry_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'grading').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.GradeEntryList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(grade_entry_ids, 'grading'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.GradeEntryList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_grade_entries_by_genus_type(self, grade_entry_genus_type):
@@ -2514,7 +2494,7 @@ class GradeEntryAdminSession(abc_grading_sessions.GradeEntryAdminSession, osid_s
             raise errors.Unsupported('grade_entry_form did not originate from this session')
         if not grade_entry_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(grade_entry_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(grade_entry_form._my_map))
 
         self._forms[grade_entry_form.get_id().get_identifier()] = CREATED
         result = objects.GradeEntry(
@@ -2947,24 +2927,14 @@ class GradebookColumnLookupSession(abc_grading_sessions.GradebookColumnLookupSes
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('grading',
                                          collection='GradebookColumn',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in gradebook_column_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'grading').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.GradebookColumnList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(gradebook_column_ids, 'grading'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.GradebookColumnList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_gradebook_columns_by_genus_type(self, gradebook_column_genus_type):
@@ -3481,7 +3451,7 @@ class GradebookColumnAdminSession(abc_grading_sessions.GradebookColumnAdminSessi
             raise errors.Unsupported('gradebook_column_form did not originate from this session')
         if not gradebook_column_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(gradebook_column_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(gradebook_column_form._my_map))
 
         self._forms[gradebook_column_form.get_id().get_identifier()] = CREATED
         result = objects.GradebookColumn(
@@ -3852,10 +3822,10 @@ class GradebookColumnGradebookSession(abc_grading_sessions.GradebookColumnGradeb
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for gradebook_column in self.get_gradebook_columns_by_gradebook(gradebook_id):
-            id_list.append(gradebook_column.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('GRADING', local=True)
+        lookup_session = mgr.get_gradebook_column_lookup_session_for_gradebook(gradebook_id, proxy=self._proxy)
+        lookup_session.use_isolated_gradebook_view()
+        return lookup_session._get_object_ids_in_view('grading', 'GradebookColumn', 'grading.GradebookColumn')
 
     @utilities.arguments_not_none
     def get_gradebook_columns_by_gradebook(self, gradebook_id):
@@ -5051,7 +5021,7 @@ class GradebookHierarchySession(abc_grading_sessions.GradebookHierarchySession,
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=gradebook_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=gradebook_id)
+        return self._hierarchy_session.is_ancestor(id_=gradebook_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_gradebooks(self, gradebook_id):
@@ -5157,7 +5127,7 @@ class GradebookHierarchySession(abc_grading_sessions.GradebookHierarchySession,
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=gradebook_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=gradebook_id)
+        return self._hierarchy_session.is_descendant(id_=gradebook_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_gradebook_node_ids(self, gradebook_id, ancestor_levels, descendant_levels, include_siblings):
@@ -15,8 +15,11 @@ from bson.objectid import ObjectId
 
 from . import objects
 from .. import utilities
+from ..hierarchy_caches import HIERARCHY_SNAPSHOTS
+from ..hierarchy_caches import HierarchySnapshot
 from ..id.objects import IdList
 from ..osid import sessions as osid_sessions
+from ..osid.sessions import MAX_IN_BATCH
 from ..osid.sessions import OsidSession
 from ..primitives import Id
 from ..primitives import Type
@@ -187,6 +190,9 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         *compliance: mandatory -- This method must be implemented.*
 
         """
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return IdList([Id(idstr) for idstr in snapshot.get_child_idstrs(str(self._phantom_root_id))])
         id_list = []
         for r in self._rls.get_relationships_by_genus_type_for_source(self._phantom_root_id, self._relationship_type):
             id_list.append(r.get_destination_id())
@@ -229,6 +235,9 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         ``false``.
 
         """
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return str(parent_id) in snapshot.get_parent_idstrs(str(id_))
         return bool(self._rls.get_relationships_by_genus_type_for_peers(
             parent_id,
             id_,
@@ -247,6 +256,10 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         *compliance: mandatory -- This method must be implemented.*
 
         """
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return IdList([Id(idstr) for idstr in snapshot.get_parent_idstrs(str(id_))
+                           if idstr != str(getattr(self, '_phantom_root_id', None))])
         id_list = []
         for r in self._rls.get_relationships_by_genus_type_for_destination(id_, self._relationship_type):
             ident = r.get_source_id()
@@ -271,7 +284,12 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         ``false``.
 
         """
-        raise errors.Unimplemented()
+        if str(ancestor_id) == str(getattr(self, '_phantom_root_id', None)):
+            return False
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return str(ancestor_id) in snapshot.get_ancestor_idstrs(str(id_))
+        return str(ancestor_id) in self._get_reachable_idstrs(str(id_), 'destinationId', 'sourceId')
 
     @utilities.arguments_not_none
     def has_children(self, id_):
@@ -308,6 +326,9 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         ``false``.
 
         """
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return str(child_id) in snapshot.get_child_idstrs(str(id_))
         return bool(self._rls.get_relationships_by_genus_type_for_peers(
             id_,
             child_id,
@@ -326,6 +347,9 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         *compliance: mandatory -- This method must be implemented.*
 
         """
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return IdList([Id(idstr) for idstr in snapshot.get_child_idstrs(str(id_))])
         id_list = []
         for r in self._rls.get_relationships_by_genus_type_for_source(id_, self._relationship_type):
             id_list.append(r.get_destination_id())
@@ -347,7 +371,10 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         *implementation notes*: If not found return ``false``.
 
         """
-        raise errors.Unimplemented()
+        snapshot = self._get_hierarchy_snapshot()
+        if snapshot is not None:
+            return str(descendant_id) in snapshot.get_descendant_idstrs(str(id_))
+        return str(descendant_id) in self._get_reachable_idstrs(str(id_), 'sourceId', 'destinationId')
 
     @utilities.arguments_not_none
     def get_nodes(self, id_, ancestor_levels=10, descendant_levels=10, include_siblings=False):
@@ -373,14 +400,145 @@ class HierarchyTraversalSession(abc_hierarchy_sessions.HierarchyTraversalSession
         """
         # This impl ignores include_siblings, assumes false
         include_siblings = bool(include_siblings)
+        if not hasattr(self._rls, '_view_filter'):
+            return self._get_nodes_by_node(id_, ancestor_levels, descendant_levels)
+        parent_idstrs = self._get_adjacent_idstrs(str(id_), ancestor_levels, 'destinationId', 'sourceId')
+        child_idstrs = self._get_adjacent_idstrs(str(id_), descendant_levels, 'sourceId', 'destinationId')
+        # Nodes reached from a parent other than the phantom root have parents
+        has_parents = dict((idstr, bool(idstrs)) for idstr, idstrs in parent_idstrs.items())
+        for idstr, idstrs in child_idstrs.items():
+            if idstr != str(getattr(self, '_phantom_root_id', None)):
+                has_parents.update((child_idstr, True) for child_idstr in idstrs)
+        unknown_idstrs = [idstr for idstr in child_idstrs if idstr not in has_parents]
+        if unknown_idstrs:
+            has_parents.update((idstr, bool(idstrs)) for idstr, idstrs in
+                               self._get_adjacent_idstrs(unknown_idstrs, 0, 'destinationId', 'sourceId').items())
+        # Nodes reached from a child have children
+        has_children = dict((idstr, bool(idstrs)) for idstr, idstrs in child_idstrs.items())
+        for idstrs in parent_idstrs.values():
+            has_children.update((parent_idstr, True) for parent_idstr in idstrs)
+
+        def make_node(idstr, ancestor_levels, descendant_levels):
+            parent_node_list = []
+            child_node_list = []
+            if ancestor_levels != 0:
+                for parent_idstr in parent_idstrs[idstr]:
+                    parent_node_list.append(make_node(parent_idstr, ancestor_levels - 1, 0))
+            if descendant_levels != 0:
+                for child_idstr in child_idstrs[idstr]:
+                    child_node_list.append(make_node(child_idstr, 0, descendant_levels - 1))
+            return objects.Node({'type': 'OsidNode',
+                                 'id': idstr,
+                                 'childNodes': child_node_list,
+                                 'parentNodes': parent_node_list,
+                                 'root': not has_parents[idstr],
+                                 'leaf': not has_children[idstr],
+                                 'sequestered': False})
+
+        return make_node(str(id_), ancestor_levels, descendant_levels)
+
+    def _get_adjacent_idstrs(self, idstrs, levels, match_field, adjacent_field):
+        """Maps nodes to the idstrs of their parents, or children, a level at a time.
+
+        Walks ``levels`` levels away from ``idstrs`` with one ``$in``
+        query per level on ``match_field``, plus one more level to learn
+        which of the farthest nodes have no parents (or children). As in
+        ``get_parents()``, the phantom root is not a parent. With a
+        hierarchy snapshot, the levels are read from it instead.
+
+        """
+        if not isinstance(idstrs, list):
+            idstrs = [idstrs]
+        snapshot = self._get_hierarchy_snapshot()
+        collection = JSONClientValidated('relationship',
+                                         collection='Relationship',
+                                         runtime=self._runtime)
+        phantom_root_idstr = str(getattr(self, '_phantom_root_id', None))
+        adjacent_idstrs = {}
+        level = 0
+        while idstrs and level <= levels:
+            for idstr in idstrs:
+                adjacent_idstrs[idstr] = []
+            if snapshot is not None:
+                for idstr in idstrs:
+                    if match_field == 'destinationId':
+                        adjacent_idstrs[idstr] = [parent_idstr for parent_idstr in snapshot.get_parent_idstrs(idstr)
+                                                  if parent_idstr != phantom_root_idstr]
+                    else:
+                        adjacent_idstrs[idstr] = snapshot.get_child_idstrs(idstr)
+            else:
+                for index in range(0, len(idstrs), MAX_IN_BATCH):
+                    query = dict({match_field: {'$in': idstrs[index:index + MAX_IN_BATCH]},
+                                  'genusTypeId': str(self._relationship_type)},
+                                 **self._rls._view_filter())
+                    for relationship_map in collection.find(
+                            query, projection={'sourceId': 1, 'destinationId': 1}).sort('_id', ASCENDING):
+                        if match_field == 'destinationId' and relationship_map['sourceId'] == phantom_root_idstr:
+                            continue
+                        adjacent_idstrs[relationship_map[match_field]].append(relationship_map[adjacent_field])
+            next_idstrs = []
+            for idstr in idstrs:
+                for adjacent_idstr in adjacent_idstrs[idstr]:
+                    if adjacent_idstr not in adjacent_idstrs and adjacent_idstr not in next_idstrs:
+                        next_idstrs.append(adjacent_idstr)
+            idstrs = next_idstrs
+            level += 1
+        return adjacent_idstrs
+
+    def _get_reachable_idstrs(self, idstr, match_field, adjacent_field):
+        """Gets the idstrs of all the ancestors, or descendants, of a node"""
+        if not hasattr(self._rls, '_view_filter'):
+            raise errors.Unimplemented()
+        adjacent_idstrs = self._get_adjacent_idstrs(idstr, float('inf'), match_field, adjacent_field)
+        return set(adjacent_idstr for idstrs in adjacent_idstrs.values() for adjacent_idstr in idstrs)
+
+    def _uses_hierarchy_snapshots(self):
+        """Tests if hierarchies are read into shared snapshots, per the
+        ``useHierarchySnapshots@json`` runtime parameter"""
+        if getattr(self, '_hierarchy_snapshots', None) is None:
+            self._hierarchy_snapshots = False
+            try:
+                config = utilities.get_configuration_snapshot(self._runtime)
+                self._hierarchy_snapshots = config.get_boolean_value('parameter:useHierarchySnapshots@json')
+            except (AttributeError, KeyError, errors.NotFound):
+                pass
+        return self._hierarchy_snapshots
+
+    def _get_hierarchy_snapshot_key(self):
+        """Gets the ``HIERARCHY_SNAPSHOTS`` key of this hierarchy"""
+        return '{0}:{1}'.format(self._get_descendant_cache_key(self._catalog_id.get_identifier()),
+                                str(self._relationship_type))
+
+    def _get_hierarchy_snapshot(self):
+        """Gets the shared snapshot of this hierarchy, reading it with one
+        query if needed, or None if this runtime does not use snapshots"""
+        if not self._uses_hierarchy_snapshots() or not hasattr(self._rls, '_view_filter'):
+            return None
+        snapshot_key = self._get_hierarchy_snapshot_key()
+        snapshot = HIERARCHY_SNAPSHOTS.get(snapshot_key)
+        if snapshot is None:
+            generation = HIERARCHY_SNAPSHOTS.get_generation(snapshot_key)
+            collection = JSONClientValidated('relationship',
+                                             collection='Relationship',
+                                             runtime=self._runtime)
+            query = dict({'genusTypeId': str(self._relationship_type)}, **self._rls._view_filter())
+            snapshot = HierarchySnapshot(
+                (relationship_map['sourceId'], relationship_map['destinationId'])
+                for relationship_map in collection.find(
+                    query, projection={'sourceId': 1, 'destinationId': 1}).sort('_id', ASCENDING))
+            snapshot = HIERARCHY_SNAPSHOTS.put(snapshot_key, snapshot, generation, ttl=self._get_hierarchy_cache_ttl())
+        return snapshot
+
+    def _get_nodes_by_node(self, id_, ancestor_levels, descendant_levels):
+        """Gets a portion of the hierarchy with the lookups of each node"""
         parent_node_list = []
         child_node_list = []
         if ancestor_levels != 0:
             for parent_id in self.get_parents(id_):
-                parent_node_list.append(self.get_nodes(parent_id, ancestor_levels - 1, 0))
+                parent_node_list.append(self._get_nodes_by_node(parent_id, ancestor_levels - 1, 0))
         if descendant_levels != 0:
             for child_id in self.get_children(id_):
-                child_node_list.append(self.get_nodes(child_id, 0, descendant_levels - 1))
+                child_node_list.append(self._get_nodes_by_node(child_id, 0, descendant_levels - 1))
         return objects.Node({'type': 'OsidNode',
                              'id': str(id_),
                              'childNodes': child_node_list,
@@ -550,6 +708,8 @@ class HierarchyDesignSession(abc_hierarchy_sessions.HierarchyDesignSession, osid
         rfc.set_description(self._relationship_type.get_display_name().get_text() + ' relationship for parent: ' + str(id_) + ' and child: ' + str(child_id))
         rfc.set_genus_type(self._relationship_type)
         self._ras.create_relationship(rfc)
+        HIERARCHY_SNAPSHOTS.add_edge(self._hts._get_hierarchy_snapshot_key(), str(id_), str(child_id))
+        self._clear_descendant_caches(id_, [child_id])
 
     @utilities.arguments_not_none
     def remove_root(self, id_):
@@ -567,6 +727,8 @@ class HierarchyDesignSession(abc_hierarchy_sessions.HierarchyDesignSession, osid
         if not bool(result.available()):
             raise errors.NotFound()
         self._ras.delete_relationship(result.get_next_relationship().get_id())
+        HIERARCHY_SNAPSHOTS.remove_edge(self._hts._get_hierarchy_snapshot_key(), str(self._phantom_root_id), str(id_))
+        self._clear_descendant_caches(self._phantom_root_id)
         self._adopt_orphans(id_)
 
     @utilities.arguments_not_none
@@ -587,6 +749,8 @@ class HierarchyDesignSession(abc_hierarchy_sessions.HierarchyDesignSession, osid
         if not bool(result.available()):
             raise errors.NotFound()
         self._ras.delete_relationship(result.get_next_relationship().get_id())
+        HIERARCHY_SNAPSHOTS.remove_edge(self._hts._get_hierarchy_snapshot_key(), str(id_), str(child_id))
+        self._clear_descendant_caches(id_, [child_id])
 
     @utilities.arguments_not_none
     def remove_children(self, id_):
@@ -604,8 +768,12 @@ class HierarchyDesignSession(abc_hierarchy_sessions.HierarchyDesignSession, osid
         results = self._rls.get_relationships_by_genus_type_for_source(id_, self._relationship_type)
         if results.available() == 0:
             raise errors.NotFound()
+        child_ids = []
         for r in results:
             self._ras.delete_relationship(r.get_id())
+            HIERARCHY_SNAPSHOTS.remove_edge(self._hts._get_hierarchy_snapshot_key(), str(id_), str(r.get_destination_id()))
+            child_ids.append(r.get_destination_id())
+        self._clear_descendant_caches(id_, child_ids)
 
     def _adopt_orphans(self, negligent_parent_id):
         """Clean up orphaned children"""
@@ -621,6 +789,31 @@ class HierarchyDesignSession(abc_hierarchy_sessions.HierarchyDesignSession, osid
         rfc.set_description(self._relationship_type.get_display_name().get_text() + ' relationship for implicit root and child: ' + str(id_))
         rfc.set_genus_type(self._relationship_type)
         self._ras.create_relationship(rfc)
+        HIERARCHY_SNAPSHOTS.add_edge(self._hts._get_hierarchy_snapshot_key(), str(self._phantom_root_id), str(id_))
+        self._clear_descendant_caches(self._phantom_root_id, [id_])
+
+    def _clear_descendant_caches(self, id_, child_ids=None):
+        """Drops the cached hierarchy walks a change under ``id_`` affects.
+
+        The ``child_ids`` moved in or out under ``id_`` get new ancestors,
+        so the materialized catalog ancestry of their subtrees is
+        brought up to date.
+
+        """
+        node_ids = [id_]
+        if self._get_caching_engine() is not None:
+            # the shared cache tier is keyed by catalog, so name the ancestors
+            parent_ids = [id_]
+            while parent_ids:
+                parent_ids = [relationship.get_source_id()
+                              for child_id in parent_ids
+                              for relationship in self._rls.get_relationships_by_genus_type_for_destination(
+                                  child_id, self._relationship_type)
+                              if str(relationship.get_source_id()) not in [str(node_id) for node_id in node_ids]]
+                node_ids += parent_ids
+        self._delete_descendent_cat_idstrs(self._catalog_id.get_identifier(), node_ids)
+        for child_id in child_ids or []:
+            self._submit_ancestry_rematerialization(child_id)
 
 
 class HierarchyLookupSession(abc_hierarchy_sessions.HierarchyLookupSession, osid_sessions.OsidSession):
@@ -0,0 +1,448 @@
+"""Caching of catalog hierarchy walks
+
+Federated catalog views filter on the ids of a catalog and all of its
+descendants. ``OsidSession._get_descendent_cat_idstrs()`` keeps those
+sets in the process-wide ``DESCENDANT_CACHE``, keyed by (hierarchy,
+catalog). Since every set includes the catalog it was computed for, a
+change under a node only affects the sets that contain that node, and
+``HierarchyDesignSession`` drops exactly those when it adds or removes a
+child or a root. Sets expire after ``hierarchyCacheTTL@json`` seconds
+(default ``DESCENDANT_TTL``, 0 turns the cache off), so changes made by
+other processes are seen by then. With ``invalidateCacheFromOplog@json``
+the ``MongoListener`` also hands every relationship change to
+``process_oplog_entry()``, which drops the hierarchies kept in the
+changed collection.
+
+With ``materializeCatalogAncestry@json`` set, objects also carry an
+``ancestor<Catalog>Ids`` array: the ids of their catalogs and of all of
+those catalogs' ancestors, read live from the hierarchy when they are
+written. Federated views then match on that one field instead of an
+``$in`` over every descendant catalog. Hierarchy changes hand the
+re-materialization of the moved subtree to the background
+``ANCESTRY_MATERIALIZER``, which logs and retries failed jobs, and keeps
+the ones that still fail in ``failed_jobs``. Objects written before the
+parameter was set have no array: run ``materialize_catalog_ancestry()``
+once when turning it on, and again to repair objects after failed jobs.
+Catalogs carry the same array, for themselves. ``HierarchyDesignSession``
+updates the catalogs of the moved subtree before returning, and
+``AuthorizationSession`` reads a qualifier's inherited authorizations
+from it, with one lookup whatever the depth of the qualifier.
+
+With ``useHierarchySnapshots@json`` set, ``HierarchyTraversalSession``
+reads a whole hierarchy into a ``HierarchySnapshot`` with one query, and
+shares it through ``HIERARCHY_SNAPSHOTS``. Parents and children are
+then looked up in the snapshot, and the ancestor and descendant sets of
+a node are computed once, so ``is_ancestor()`` and ``is_descendant()``
+are set membership tests. ``HierarchyDesignSession`` applies its
+changes to the shared snapshot, which drops only the affected closures.
+Like descendant sets, snapshots expire after ``hierarchyCacheTTL@json``
+seconds (0 reads the hierarchy again on every call), and are dropped by
+``process_oplog_entry()`` with ``invalidateCacheFromOplog@json``, so
+changes made by other processes are seen by then.
+
+"""
+import logging
+import time
+
+from collections import OrderedDict
+from threading import RLock, Thread
+
+from .document_caches import CATALOG_COLLECTIONS
+
+try:
+    from Queue import Queue
+except ImportError:
+    # python 3
+    from queue import Queue
+
+
+MAX_CACHED_NODES = 10000
+DESCENDANT_TTL = 30
+MAX_JOB_ATTEMPTS = 3
+
+LOG = logging.getLogger(__name__)
+
+# The (db, collection) of the objects assigned to each kind of catalog.
+# Family is left out: hierarchies are themselves made of relationships.
+CATALOG_OBJECT_COLLECTIONS = {
+    'Agency': [('authentication', 'Agent')],
+    'Bank': [('assessment', 'Item'),
+             ('assessment', 'Assessment'),
+             ('assessment', 'AssessmentOffered'),
+             ('assessment', 'AssessmentTaken'),
+             ('assessment_authoring', 'AssessmentPart'),
+             ('assessment_authoring', 'SequenceRule')],
+    'Bin': [('resource', 'Resource')],
+    'Book': [('commenting', 'Comment')],
+    'Gradebook': [('grading', 'GradeSystem'),
+                  ('grading', 'GradeEntry'),
+                  ('grading', 'GradebookColumn')],
+    'Log': [('logging', 'LogEntry')],
+    'ObjectiveBank': [('learning', 'Objective'),
+                      ('learning', 'Activity'),
+                      ('learning', 'Proficiency')],
+    'Repository': [('repository', 'Asset'),
+                   ('repository', 'Composition')],
+    'Vault': [('authorization', 'Authorization')],
+}
+
+
+def get_materialized_fields(db, collection):
+    """Gets the ``ancestor<Catalog>Ids`` fields kept on a collection's objects"""
+    return ['ancestor' + catalog_name + 'Ids'
+            for catalog_name, collections in CATALOG_OBJECT_COLLECTIONS.items()
+            if (db, collection) in collections]
+
+
+def get_changed_hierarchy_storage(entry):
+    """Gets the relationship collection, or the database, whose
+    hierarchies a MongoDB oplog entry changed, or None"""
+    namespace = entry.get('ns', '')
+    if entry.get('op') in ['i', 'u', 'd']:
+        if namespace.split('.', 1)[-1] == 'Relationship':
+            return namespace
+    elif entry.get('op') == 'c':
+        db_name = namespace.split('.')[0]
+        command = entry.get('o', {})
+        if 'dropDatabase' in command:
+            return db_name
+        elif 'drop' in command:
+            return '{0}.{1}'.format(db_name, command['drop'])
+    return None
+
+
+class DescendantCache(object):
+    """A bounded LRU cache of the inclusive descendant id sets of hierarchy
+    nodes, each kept for ``ttl`` seconds.
+
+    Every invalidation bumps the generation of its hierarchy. A reader
+    gets the generation before walking the hierarchy and hands it to
+    ``put()``, which drops the set if the hierarchy changed meanwhile.
+
+    """
+    def __init__(self, max_size=MAX_CACHED_NODES, ttl=DESCENDANT_TTL, timer=time.time):
+        self._lock = RLock()
+        self.max_size = max_size
+        self.ttl = ttl
+        self._timer = timer
+        self._entries = OrderedDict()
+        self._generations = {}
+        self._listening = False
+        self._stats = dict(hits=0, misses=0, evictions=0, expirations=0, invalidations=0)
+
+    def get_stats(self):
+        with self._lock:
+            stats = dict(self._stats)
+            stats['size'] = len(self._entries)
+            return stats
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats = dict(hits=0, misses=0, evictions=0, expirations=0, invalidations=0)
+
+    def get_generation(self, hierarchy_key):
+        return self._generations.get(hierarchy_key, 0)
+
+    def get(self, hierarchy_key, idstr):
+        """Gets the descendant idstrs of a node, including itself, or None"""
+        key = (hierarchy_key, idstr)
+        with self._lock:
+            try:
+                idstrs, expires = self._entries.pop(key)
+            except KeyError:
+                self._stats['misses'] += 1
+                return None
+            if expires <= self._timer():
+                self._stats['expirations'] += 1
+                self._stats['misses'] += 1
+                return None
+            self._entries[key] = (idstrs, expires)  # most recently used
+            self._stats['hits'] += 1
+        return list(idstrs)
+
+    def put(self, hierarchy_key, idstr, idstrs, generation=None, ttl=None):
+        """Caches the descendant idstrs of a node for ``ttl`` seconds (the
+        cache's default if None), unless its hierarchy changed since
+        ``generation``"""
+        if ttl is None:
+            ttl = self.ttl
+        with self._lock:
+            if not ttl or (generation is not None and generation != self.get_generation(hierarchy_key)):
+                return
+            self._entries.pop((hierarchy_key, idstr), None)
+            self._entries[(hierarchy_key, idstr)] = (frozenset(idstrs), self._timer() + ttl)
+            while len(self._entries) > self.max_size:
+                del self._entries[next(iter(self._entries))]
+                self._stats['evictions'] += 1
+
+    def invalidate_ancestors(self, hierarchy_key, idstr):
+        """Drops the cached sets that include a node, i.e. those of the
+        node and of its ancestors (or its descendants, for ancestor sets)"""
+        with self._lock:
+            self._generations[hierarchy_key] = self.get_generation(hierarchy_key) + 1
+            for key in [key for key, (idstrs, expires) in self._entries.items()
+                        if key[0] == hierarchy_key and idstr in idstrs]:
+                del self._entries[key]
+                self._stats['invalidations'] += 1
+
+    def invalidate_storage(self, location):
+        """Drops the cached sets of the hierarchies kept in a (prefixed)
+        MongoDB database or collection"""
+        with self._lock:
+            for hierarchy_key in set(key[0] for key in self._entries) | set(self._generations):
+                if hierarchy_key.startswith(location + '.') or hierarchy_key.startswith(location + ':'):
+                    self._generations[hierarchy_key] = self.get_generation(hierarchy_key) + 1
+            for key in [key for key in self._entries
+                        if key[0].startswith(location + '.') or key[0].startswith(location + ':')]:
+                del self._entries[key]
+                self._stats['invalidations'] += 1
+
+    def clear(self):
+        with self._lock:
+            for hierarchy_key in set(key[0] for key in self._entries):
+                self._generations[hierarchy_key] = self.get_generation(hierarchy_key) + 1
+            self._entries = OrderedDict()
+
+    def process_oplog_entry(self, entry):
+        """Drops the hierarchies kept in the collection, or database, a
+        MongoDB oplog entry changed"""
+        location = get_changed_hierarchy_storage(entry)
+        if location is not None:
+            self.invalidate_storage(location)
+
+    def listen_to_oplog(self, listener, runtime=None):
+        """Has a ``MongoListener`` invalidate this cache, starting it if needed"""
+        with self._lock:
+            if self._listening:
+                return
+            listener.oplog_callbacks.append(self.process_oplog_entry)
+            self._listening = True
+            if not listener.is_alive():
+                listener.initialize(runtime)
+                listener.start()
+
+
+class HierarchySnapshot(object):
+    """The parent and child idstrs of every node of a hierarchy, with
+    memoized ancestor and descendant sets"""
+    def __init__(self, edges=()):
+        self._lock = RLock()
+        self._parents = {}
+        self._children = {}
+        self._ancestors = {}
+        self._descendants = {}
+        for parent_idstr, child_idstr in edges:
+            self._parents.setdefault(child_idstr, []).append(parent_idstr)
+            self._children.setdefault(parent_idstr, []).append(child_idstr)
+
+    def get_parent_idstrs(self, idstr):
+        with self._lock:
+            return list(self._parents.get(idstr, []))
+
+    def get_child_idstrs(self, idstr):
+        with self._lock:
+            return list(self._children.get(idstr, []))
+
+    def _walk(self, idstr, adjacency):
+        """Gets the idstrs reachable from a node, not including itself"""
+        reached = set()
+        idstrs = [idstr]
+        while idstrs:
+            idstrs = [next_idstr for current_idstr in idstrs
+                      for next_idstr in adjacency.get(current_idstr, [])
+                      if next_idstr not in reached]
+            reached.update(idstrs)
+        reached.discard(idstr)
+        return reached
+
+    def get_ancestor_idstrs(self, idstr):
+        """Gets the ancestors of a node, not including itself"""
+        with self._lock:
+            if idstr not in self._ancestors:
+                self._ancestors[idstr] = frozenset(self._walk(idstr, self._parents))
+            return self._ancestors[idstr]
+
+    def get_descendant_idstrs(self, idstr):
+        """Gets the descendants of a node, not including itself"""
+        with self._lock:
+            if idstr not in self._descendants:
+                self._descendants[idstr] = frozenset(self._walk(idstr, self._children))
+            return self._descendants[idstr]
+
+    def _forget_closures(self, parent_idstr, child_idstr):
+        """Drops the closures an edge between two nodes changes"""
+        for idstr in self._walk(child_idstr, self._children) | set([child_idstr]):
+            self._ancestors.pop(idstr, None)
+        for idstr in self._walk(parent_idstr, self._parents) | set([parent_idstr]):
+            self._descendants.pop(idstr, None)
+
+    def add_edge(self, parent_idstr, child_idstr):
+        with self._lock:
+            self._forget_closures(parent_idstr, child_idstr)
+            self._parents.setdefault(child_idstr, []).append(parent_idstr)
+            self._children.setdefault(parent_idstr, []).append(child_idstr)
+
+    def remove_edge(self, parent_idstr, child_idstr):
+        with self._lock:
+            self._forget_closures(parent_idstr, child_idstr)
+            if parent_idstr in self._parents.get(child_idstr, []):
+                self._parents[child_idstr].remove(parent_idstr)
+            if child_idstr in self._children.get(parent_idstr, []):
+                self._children[parent_idstr].remove(child_idstr)
+
+
+class HierarchySnapshots(object):
+    """The process-wide snapshots of hierarchies, keyed like the
+    descendant cache plus the relationship type, each kept for ``ttl``
+    seconds"""
+    def __init__(self, ttl=DESCENDANT_TTL, timer=time.time):
+        self._lock = RLock()
+        self.ttl = ttl
+        self._timer = timer
+        self._snapshots = {}
+        self._generations = {}
+        self._listening = False
+
+    def get_generation(self, snapshot_key):
+        return self._generations.get(snapshot_key, 0)
+
+    def get(self, snapshot_key):
+        """Gets the shared snapshot of a hierarchy, or None"""
+        with self._lock:
+            try:
+                snapshot, expires = self._snapshots[snapshot_key]
+            except KeyError:
+                return None
+            if expires <= self._timer():
+                del self._snapshots[snapshot_key]
+                return None
+            return snapshot
+
+    def put(self, snapshot_key, snapshot, generation=None, ttl=None):
+        """Shares a snapshot for ``ttl`` seconds (the default if None),
+        unless its hierarchy changed since ``generation``. Returns the
+        shared snapshot, if there is one"""
+        if ttl is None:
+            ttl = self.ttl
+        with self._lock:
+            shared_snapshot = self.get(snapshot_key)
+            if shared_snapshot is not None:
+                return shared_snapshot
+            if not ttl or (generation is not None and generation != self.get_generation(snapshot_key)):
+                return snapshot
+            self._snapshots[snapshot_key] = (snapshot, self._timer() + ttl)
+            return snapshot
+
+    def add_edge(self, snapshot_key, parent_idstr, child_idstr):
+        with self._lock:
+            self._generations[snapshot_key] = self.get_generation(snapshot_key) + 1
+            if snapshot_key in self._snapshots:
+                self._snapshots[snapshot_key][0].add_edge(parent_idstr, child_idstr)
+
+    def remove_edge(self, snapshot_key, parent_idstr, child_idstr):
+        with self._lock:
+            self._generations[snapshot_key] = self.get_generation(snapshot_key) + 1
+            if snapshot_key in self._snapshots:
+                self._snapshots[snapshot_key][0].remove_edge(parent_idstr, child_idstr)
+
+    def invalidate_storage(self, location):
+        """Drops the snapshots of the hierarchies kept in a (prefixed)
+        MongoDB database or collection"""
+        with self._lock:
+            for snapshot_key in set(self._snapshots) | set(self._generations):
+                if snapshot_key.startswith(location + '.') or snapshot_key.startswith(location + ':'):
+                    self._generations[snapshot_key] = self.get_generation(snapshot_key) + 1
+                    self._snapshots.pop(snapshot_key, None)
+
+    def clear(self):
+        with self._lock:
+            for snapshot_key in self._snapshots:
+                self._generations[snapshot_key] = self.get_generation(snapshot_key) + 1
+            self._snapshots = {}
+
+    def process_oplog_entry(self, entry):
+        """Drops the snapshots kept in the collection, or database, a
+        MongoDB oplog entry changed"""
+        location = get_changed_hierarchy_storage(entry)
+        if location is not None:
+            self.invalidate_storage(location)
+
+    def listen_to_oplog(self, listener, runtime=None):
+        """Has a ``MongoListener`` invalidate these snapshots, starting it if needed"""
+        with self._lock:
+            if self._listening:
+                return
+            listener.oplog_callbacks.append(self.process_oplog_entry)
+            self._listening = True
+            if not listener.is_alive():
+                listener.initialize(runtime)
+                listener.start()
+
+
+class AncestryMaterializer(Thread):
+    """Runs ancestry re-materialization jobs, one at a time, in the background.
+
+    A job that raises is logged and queued again, up to
+    ``MAX_JOB_ATTEMPTS`` times, and then kept in ``failed_jobs``.
+
+    """
+    def __init__(self):
+        Thread.__init__(self)
+        self.daemon = True
+        self._jobs = Queue()
+        self._start_lock = RLock()
+        self.failed_jobs = []
+
+    def submit(self, job, attempt=1):
+        """Queues a callable, starting the thread if needed"""
+        with self._start_lock:
+            if not self.is_alive():
+                self.start()
+        self._jobs.put((job, attempt))
+
+    def join_pending(self):
+        """Waits until every queued job has run"""
+        self._jobs.join()
+
+    def run(self):
+        while True:
+            job, attempt = self._jobs.get()
+            try:
+                job()
+            except Exception:  # pylint: disable=broad-except
+                # a failing job must not stop the ones queued after it
+                if attempt < MAX_JOB_ATTEMPTS:
+                    LOG.warning('ancestry materialization job %r failed, queueing attempt %d',
+                                job, attempt + 1, exc_info=True)
+                    self._jobs.put((job, attempt + 1))
+                else:
+                    LOG.error('ancestry materialization job %r failed %d times, giving up; '
+                              'run materialize_catalog_ancestry() to repair',
+                              job, attempt, exc_info=True)
+                    self.failed_jobs.append(job)
+            finally:
+                self._jobs.task_done()
+
+
+def materialize_catalog_ancestry(runtime, proxy=None, catalog_names=None):
+    """Sets the ``ancestor<Catalog>Ids`` of every catalog and object kept
+    under a runtime.
+
+    Run it once when turning ``materializeCatalogAncestry@json`` on, so
+    objects written before have the array, and to repair objects after
+    failed ``ANCESTRY_MATERIALIZER`` jobs.
+
+    """
+    from .osid.sessions import OsidSession
+    session = OsidSession()
+    session._init_proxy_and_runtime(proxy, runtime)
+    for catalog_name in catalog_names or sorted(CATALOG_OBJECT_COLLECTIONS):
+        for db_name, collection in CATALOG_COLLECTIONS:
+            if collection == catalog_name:
+                session._materialize_catalog_ancestry(db_name, catalog_name)
+        session._materialize_ancestry(catalog_name, {})
+
+
+DESCENDANT_CACHE = DescendantCache()
+ANCESTRY_MATERIALIZER = AncestryMaterializer()
+HIERARCHY_SNAPSHOTS = HierarchySnapshots()
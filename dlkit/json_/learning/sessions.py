@@ -220,24 +220,14 @@ class ObjectiveLookupSession(abc_learning_sessions.ObjectiveLookupSession, osid_
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('learning',
                                          collection='Objective',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in objective_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'learning').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.ObjectiveList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(objective_ids, 'learning'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.ObjectiveList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_objectives_by_genus_type(self, objective_genus_type):
@@ -702,7 +692,7 @@ class ObjectiveAdminSession(abc_learning_sessions.ObjectiveAdminSession, osid_se
             raise errors.Unsupported('objective_form did not originate from this session')
         if not objective_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(objective_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(objective_form._my_map))
 
         self._forms[objective_form.get_id().get_identifier()] = CREATED
         result = objects.Objective(
@@ -1660,10 +1650,10 @@ class ObjectiveObjectiveBankSession(abc_learning_sessions.ObjectiveObjectiveBank
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for objective in self.get_objectives_by_objective_bank(objective_bank_id):
-            id_list.append(objective.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('LEARNING', local=True)
+        lookup_session = mgr.get_objective_lookup_session_for_objective_bank(objective_bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_objective_bank_view()
+        return lookup_session._get_object_ids_in_view('learning', 'Objective', 'learning.Objective')
 
     @utilities.arguments_not_none
     def get_objectives_by_objective_bank(self, objective_bank_id):
@@ -2621,24 +2611,14 @@ class ActivityLookupSession(abc_learning_sessions.ActivityLookupSession, osid_se
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('learning',
                                          collection='Activity',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in activity_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'learning').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.ActivityList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(activity_ids, 'learning'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.ActivityList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_activities_by_genus_type(self, activity_genus_type):
@@ -3213,7 +3193,7 @@ class ActivityAdminSession(abc_learning_sessions.ActivityAdminSession, osid_sess
             raise errors.Unsupported('activity_form did not originate from this session')
         if not activity_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(activity_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(activity_form._my_map))
 
         self._forms[activity_form.get_id().get_identifier()] = CREATED
         result = objects.Activity(
@@ -3498,10 +3478,10 @@ class ActivityObjectiveBankSession(abc_learning_sessions.ActivityObjectiveBankSe
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for activity in self.get_activities_by_objective_bank(objective_bank_id):
-            id_list.append(activity.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('LEARNING', local=True)
+        lookup_session = mgr.get_activity_lookup_session_for_objective_bank(objective_bank_id, proxy=self._proxy)
+        lookup_session.use_isolated_objective_bank_view()
+        return lookup_session._get_object_ids_in_view('learning', 'Activity', 'learning.Activity')
 
     @utilities.arguments_not_none
     def get_activities_by_objective_bank(self, objective_bank_id):
@@ -3984,24 +3964,14 @@ class ProficiencyLookupSession(abc_learning_sessions.ProficiencyLookupSession, o
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('learning',
                                          collection='Proficiency',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in proficiency_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'learning').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.ProficiencyList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(proficiency_ids, 'learning'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.ProficiencyList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_proficiencies_by_genus_type(self, proficiency_genus_type):
@@ -4863,7 +4833,7 @@ class ProficiencyAdminSession(abc_learning_sessions.ProficiencyAdminSession, osi
             raise errors.Unsupported('proficiency_form did not originate from this session')
         if not proficiency_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(proficiency_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(proficiency_form._my_map))
 
         self._forms[proficiency_form.get_id().get_identifier()] = CREATED
         result = objects.Proficiency(
@@ -6214,7 +6184,7 @@ class ObjectiveBankHierarchySession(abc_learning_sessions.ObjectiveBankHierarchy
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=objective_bank_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=objective_bank_id)
+        return self._hierarchy_session.is_ancestor(id_=objective_bank_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_objective_banks(self, objective_bank_id):
@@ -6325,7 +6295,7 @@ class ObjectiveBankHierarchySession(abc_learning_sessions.ObjectiveBankHierarchy
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=objective_bank_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=objective_bank_id)
+        return self._hierarchy_session.is_descendant(id_=objective_bank_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_objective_bank_node_ids(self, objective_bank_id, ancestor_levels, descendant_levels, include_siblings):
@@ -367,24 +367,14 @@ class LogEntryLookupSession(abc_logging_sessions.LogEntryLookupSession, osid_ses
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('logging',
                                          collection='LogEntry',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in log_entry_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'logging').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.LogEntryList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(log_entry_ids, 'logging'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.LogEntryList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_log_entries_by_genus_type(self, log_entry_genus_type):
@@ -980,7 +970,7 @@ class LogEntryAdminSession(abc_logging_sessions.LogEntryAdminSession, osid_sessi
             log_entry_form._my_map['timestamp'] = DateTime.utcnow()
         log_entry_form._my_map['agentId'] = str(self.get_effective_agent_id())
 
-        insert_result = collection.insert_one(log_entry_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(log_entry_form._my_map))
 
         self._forms[log_entry_form.get_id().get_identifier()] = CREATED
         result = objects.LogEntry(
@@ -2464,7 +2454,7 @@ class LogHierarchySession(abc_logging_sessions.LogHierarchySession, osid_session
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=log_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=log_id)
+        return self._hierarchy_session.is_ancestor(id_=log_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_logs(self, log_id):
@@ -2569,7 +2559,7 @@ class LogHierarchySession(abc_logging_sessions.LogHierarchySession, osid_session
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=log_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=log_id)
+        return self._hierarchy_session.is_descendant(id_=log_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_log_node_ids(self, log_id, ancestor_levels, descendant_levels, include_siblings):
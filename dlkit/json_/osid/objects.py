@@ -22,11 +22,13 @@ from pymongo.cursor import Cursor
 
 from . import default_mdata
 from .. import types
+from ..cursors import DocumentCursor
 from .. import utilities
 from ..osid import markers as osid_markers
 from ..primitives import DisplayText
 from ..primitives import Id
 from ..primitives import Type
+from ..utilities import BatchedObjectMaps
 from ..utilities import OsidListList, is_string, ListFiller
 from ..utilities import get_locale_with_proxy
 from ..utilities import is_string
@@ -2347,7 +2349,7 @@ class OsidList(abc_osid_objects.OsidList):
             iter_object = itertools.chain(*iter_object)
         elif isinstance(iter_object, dict) or isinstance(iter_object, list):
             self._count = len(iter_object)
-        elif isinstance(iter_object, (Cursor, ListFiller)):
+        elif isinstance(iter_object, (Cursor, DocumentCursor, ListFiller, BatchedObjectMaps)):
             self._count = iter_object.count(True)
         else:
             self._count = None
@@ -79,9 +79,8 @@ class OsidQuery(abc_osid_queries.OsidQuery, osid_markers.Suppliable):
         self._keyword_fields = ['displayName.text', 'description.text']
         try:
             # Try to get additional keyword fields from the runtime, if available:
-            config = runtime.get_configuration()
-            parameter_id = Id('parameter:keywordFields@json')
-            additional_keyword_fields = config.get_value_by_parameter(parameter_id).get_object_value()
+            config = utilities.get_configuration_snapshot(runtime)
+            additional_keyword_fields = config.get_object_value('parameter:keywordFields@json')
             self._keyword_fields += additional_keyword_fields[self._namespace]
         except (AttributeError, KeyError, errors.NotFound):
             pass
@@ -17,7 +17,6 @@ from .. import utilities
 from ..osid import rules as osid_rules
 from dlkit.abstract_osid.osid import errors
 from dlkit.abstract_osid.osid import searches as abc_osid_searches
-from dlkit.primordium.id.primitives import Id
 
 
 class OsidSearch(abc_osid_searches.OsidSearch, osid_rules.OsidCondition):
@@ -52,9 +51,8 @@ class OsidSearch(abc_osid_searches.OsidSearch, osid_rules.OsidCondition):
         self._keyword_fields = ['displayName.text', 'description.text']
         try:
             # Try to get additional keyword fields from the runtime, if available:
-            config = runtime.get_configuration()
-            parameter_id = Id('parameter:keywordFields@json')
-            additional_keyword_fields = config.get_value_by_parameter(parameter_id).get_object_value()
+            config = utilities.get_configuration_snapshot(runtime)
+            additional_keyword_fields = config.get_object_value('parameter:keywordFields@json')
             self._keyword_fields += additional_keyword_fields[self._namespace]
         except (AttributeError, KeyError, errors.NotFound):
             pass
@@ -12,24 +12,40 @@
 
 
 import datetime
+import functools
 import socket
+import weakref
 
 
 from bson.objectid import ObjectId
 from importlib import import_module
+from pymongo import DESCENDING
+from threading import RLock
 
 
 from .. import types
 from .. import utilities
+from ..document_caches import ALIAS_CACHE
+from ..document_caches import ALIAS_TTL
+from ..document_caches import CATALOG_COLLECTIONS
+from ..document_caches import MISSING_DOCUMENT_KEY
+from ..hierarchy_caches import ANCESTRY_MATERIALIZER
+from ..hierarchy_caches import CATALOG_OBJECT_COLLECTIONS
+from ..hierarchy_caches import DESCENDANT_CACHE
+from ..hierarchy_caches import DESCENDANT_TTL
 from ..cataloging.objects import Catalog
+from ..id.objects import IdList
 from ..locale.objects import Locale
 from ..primitives import Id
 from ..primitives import Type
+from ..utilities import BatchedObjectMaps
 from ..utilities import JSONClientValidated
 from ..utilities import PHANTOM_ROOT_IDENTIFIER
 from ..utilities import camel_to_under
+from ..utilities import convert_catalog_id_to_object_id_string
 from ..utilities import get_authenticated_agent_id_with_proxy
 from ..utilities import get_authenticated_agent_with_proxy
+from ..utilities import get_configuration_snapshot
 from ..utilities import get_effective_agent_id_with_proxy
 from ..utilities import get_effective_agent_with_proxy
 from ..utilities import get_locale_with_proxy
@@ -48,6 +64,11 @@ EFFECTIVE = 0
 ANY_EFFECTIVE = 1
 CREATED = True
 UPDATED = True
+MAX_IN_BATCH = 1000
+
+# The catalog lookup sessions of each runtime, by cataloging provider
+CATALOGING_LOOKUP_SESSIONS = weakref.WeakKeyDictionary()
+CATALOGING_LOCK = RLock()
 
 
 class OsidSession(abc_osid_sessions.OsidSession):
@@ -87,9 +108,8 @@ class OsidSession(abc_osid_sessions.OsidSession):
         self._runtime = runtime
         if runtime is not None:
             try:
-                authority_param_id = Id('parameter:authority@mongo')
-                self._authority = runtime.get_configuration().get_value_by_parameter(
-                    authority_param_id).get_string_value()
+                self._authority = get_configuration_snapshot(runtime).get_string_value(
+                    'parameter:authority@mongo')
             except (KeyError, errors.NotFound):
                 self._authority = 'ODL.MIT.EDU'
 
@@ -98,9 +118,8 @@ class OsidSession(abc_osid_sessions.OsidSession):
         self._init_proxy_and_runtime(proxy, runtime)
         osid_name = self._session_namespace.split('.')[0]
         try:
-            config = self._runtime.get_configuration()
-            parameter_id = Id('parameter:' + osid_name + 'CatalogingProviderImpl@mongo')
-            provider_impl = config.get_value_by_parameter(parameter_id).get_string_value()
+            config = get_configuration_snapshot(self._runtime)
+            provider_impl = config.get_string_value('parameter:' + osid_name + 'CatalogingProviderImpl@mongo')
             self._cataloging_manager = self._runtime.get_manager('CATALOGING', provider_impl)  # need to add version argument
         except (AttributeError, KeyError, errors.NotFound):
             pass
@@ -114,11 +133,10 @@ class OsidSession(abc_osid_sessions.OsidSession):
         if catalog_id is not None and catalog_id.get_identifier() != PHANTOM_ROOT_IDENTIFIER:
             self._catalog_identifier = catalog_id.get_identifier()
 
-            config = self._runtime.get_configuration()
-            parameter_id = Id('parameter:' + db_name + 'CatalogingProviderImpl@mongo')
+            config = get_configuration_snapshot(self._runtime)
 
             try:
-                provider_impl = config.get_value_by_parameter(parameter_id).get_string_value()
+                provider_impl = config.get_string_value('parameter:' + db_name + 'CatalogingProviderImpl@mongo')
             except (AttributeError, KeyError, errors.NotFound):
                 collection = JSONClientValidated(db_name,
                                                  collection=cat_name,
@@ -132,9 +150,7 @@ class OsidSession(abc_osid_sessions.OsidSession):
                         raise errors.NotFound('could not find catalog identifier ' + catalog_id.get_identifier() + cat_name)
             else:
                 uses_cataloging = True
-                cataloging_manager = self._runtime.get_manager('CATALOGING',
-                                                               provider_impl)  # need to add version argument
-                lookup_session = cataloging_manager.get_catalog_lookup_session()
+                lookup_session = self._get_cataloging_lookup_session(provider_impl)
                 # self._my_catalog_map = lookup_session.get_catalog(catalog_id)._my_map
                 # self._catalog = Catalog(osid_object_map=self._my_catalog_map, runtime=self._runtime,
                 #                         proxy=self._proxy)
@@ -150,6 +166,20 @@ class OsidSession(abc_osid_sessions.OsidSession):
         self._catalog_id = self._catalog.get_id()
         self._forms = dict()
 
+    def _get_cataloging_lookup_session(self, provider_impl):
+        """Gets the catalog lookup session of a cataloging provider, made
+        once per runtime"""
+        with CATALOGING_LOCK:
+            try:
+                lookup_sessions = CATALOGING_LOOKUP_SESSIONS.setdefault(self._runtime, {})
+            except TypeError:
+                lookup_sessions = {}  # the runtime cannot be weakly referenced
+            if provider_impl not in lookup_sessions:
+                cataloging_manager = self._runtime.get_manager('CATALOGING',
+                                                               provider_impl)  # need to add version argument
+                lookup_sessions[provider_impl] = cataloging_manager.get_catalog_lookup_session()
+            return lookup_sessions[provider_impl]
+
     def _get_phantom_root_catalog(self, cat_name, cat_class):
         """Get's the catalog id corresponding to the root of all implementation catalogs."""
         catalog_map = make_catalog_map(cat_name, identifier=PHANTOM_ROOT_IDENTIFIER)
@@ -161,12 +191,36 @@ class OsidSession(abc_osid_sessions.OsidSession):
                 foreign_catalog_id.authority == self._authority):
             raise errors.NotFound()  # This is not a foreign catalog
         foreign_service_name = foreign_catalog_id.get_identifier_namespace().split('.')[0]
+        # Foreign catalogs that were not found are remembered like missing
+        # documents of their own collection, so creating them invalidates that
+        foreign_collection_name = foreign_catalog_id.namespace.split('.')[1]
+        foreign_cache = None
+        if (foreign_service_name, foreign_collection_name) in CATALOG_COLLECTIONS:
+            foreign_collection = JSONClientValidated(foreign_service_name,
+                                                     collection=foreign_collection_name,
+                                                     runtime=self._runtime)
+            foreign_cache = foreign_collection._cache
+        if foreign_cache is not None:
+            foreign_identifier = foreign_catalog_id.get_identifier()
+            if ObjectId.is_valid(foreign_identifier):
+                foreign_identifier = ObjectId(foreign_identifier)
+            missing_key = foreign_collection._get_cache_key(foreign_identifier)
+            cached = foreign_cache.get(foreign_collection._cache_namespace, missing_key)
+            if cached is not None and MISSING_DOCUMENT_KEY in cached:
+                raise errors.NotFound()
+            generation = foreign_cache.get_generation(foreign_collection._cache_namespace)
         # foreign_cat_name = inflection.underscore(foreign_catalog_id.namespace.split('.')[1])
         # catalog_name = foreign_cat_name.lower()
         catalog_name = camel_to_under(foreign_catalog_id.namespace.split('.')[1])
         manager = self._get_provider_manager(foreign_service_name.upper())
         lookup_session = getattr(manager, 'get_{0}_lookup_session'.format(catalog_name))(proxy=self._proxy)
-        getattr(lookup_session, 'get_{0}'.format(catalog_name))(foreign_catalog_id)  # Raises NotFound
+        try:
+            getattr(lookup_session, 'get_{0}'.format(catalog_name))(foreign_catalog_id)
+        except errors.NotFound:
+            if foreign_cache is not None:
+                foreign_cache.put(foreign_collection._cache_namespace, missing_key, {MISSING_DOCUMENT_KEY: True},
+                                  ttl=foreign_collection._cache_ttl, generation=generation)
+            raise
         collection = JSONClientValidated(db_name,
                                          collection=cat_name,
                                          runtime=self._runtime)
@@ -198,15 +252,44 @@ class OsidSession(abc_osid_sessions.OsidSession):
         Only looks within the Id Alias namespace for the session package
 
         """
+        return self._get_ids([id_], pkg_name)[0]
+
+    def _get_ids(self, ids, pkg_name):
+        """
+        Returns the primary ids given a list of ids that may be aliases.
+
+        The ids are returned in the order given, with the ones that are
+        not in the alias table returned as is. Aliases are looked up in
+        the process-wide alias cache first, and the rest are resolved
+        with a single query, caching the ids that turn out not to be
+        aliases too.
+
+        """
+        ids = list(ids)
         collection = JSONClientValidated('id',
                                          collection=pkg_name + 'Ids',
                                          runtime=self._runtime)
-        try:
-            result = collection.find_one({'aliasIds': {'$in': [str(id_)]}})
-        except errors.NotFound:
-            return id_
-        else:
-            return Id(result['_id'])
+        namespace = collection._cache_namespace
+        primary_idstrs = {}
+        uncached_idstrs = []
+        for idstr in set(str(id_) for id_ in ids):
+            entry = ALIAS_CACHE.get(namespace, idstr)
+            if entry is None:
+                uncached_idstrs.append(idstr)
+            else:
+                primary_idstrs[idstr] = entry['_id']
+        if uncached_idstrs:
+            generation = ALIAS_CACHE.get_generation(namespace)
+            found = {}
+            for result in collection.find({'aliasIds': {'$in': uncached_idstrs}}):
+                for alias_idstr in result['aliasIds']:
+                    found[alias_idstr] = result['_id']
+            for idstr in uncached_idstrs:
+                primary_idstrs[idstr] = found.get(idstr)
+                ALIAS_CACHE.put(namespace, idstr, {'_id': primary_idstrs[idstr]},
+                                ttl=ALIAS_TTL, generation=generation)
+        return [id_ if primary_idstrs[str(id_)] is None else Id(primary_idstrs[str(id_)])
+                for id_ in ids]
 
     def _alias_id(self, primary_id, equivalent_id):
         """Adds the given equivalent_id as an alias for primary_id if possible"""
@@ -233,6 +316,7 @@ class OsidSession(abc_osid_sessions.OsidSession):
         else:
             id_map['aliasIds'].append(str(equivalent_id))
             collection.save(id_map)
+        ALIAS_CACHE.invalidate(collection._cache_namespace, [str(equivalent_id)])
 
     def _get_catalog_idstrs(self):
         """Returns the proper list of catalog idstrs based on catalog view"""
@@ -242,18 +326,22 @@ class OsidSession(abc_osid_sessions.OsidSession):
             return self._get_descendent_cat_idstrs(self._catalog_id)
 
     def _get_descendent_cat_idstrs(self, cat_id, hierarchy_session=None):
-        """Recursively returns a list of all descendent catalog ids, inclusive"""
+        """Recursively returns a list of all descendent catalog ids, inclusive
+
+        The lists are kept for ``hierarchyCacheTTL@json`` seconds in the
+        process-wide ``DESCENDANT_CACHE``, which the hierarchy design
+        sessions invalidate. If a caching engine is set up with
+        ``useCachingForQualifierIds@json``, that shared cache is used
+        instead, since it is the one the other processes invalidate.
+
+        """
         def get_descendent_ids(h_session):
             idstr_list = [str(cat_id)]
             if h_session is None:
-                pkg_name = cat_id.get_identifier_namespace().split('.')[0]
-                cat_name = cat_id.get_identifier_namespace().split('.')[1]
                 try:
                     mgr = self._get_provider_manager('HIERARCHY')
                     h_session = mgr.get_hierarchy_traversal_session_for_hierarchy(
-                        Id(authority=pkg_name.upper(),
-                           namespace='CATALOG',
-                           identifier=cat_name.upper()),
+                        catalog_hierarchy_id,
                         proxy=self._proxy)
                 except (errors.OperationFailed, errors.Unsupported):
                     return idstr_list  # there is no hierarchy
@@ -262,42 +350,18 @@ class OsidSession(abc_osid_sessions.OsidSession):
                     idstr_list += self._get_descendent_cat_idstrs(child_id, h_session)
             return list(set(idstr_list))
 
-        use_caching = False
-        try:
-            config = self._runtime.get_configuration()
-            parameter_id = Id('parameter:useCachingForQualifierIds@json')
-            if config.get_value_by_parameter(parameter_id).get_boolean_value():
-                use_caching = True
-            else:
-                pass
-        except (AttributeError, KeyError, errors.NotFound):
-            pass
-        if use_caching:
-            key = 'descendent-catalog-ids-{0}'.format(str(cat_id))
-
-            # If configured to use memcache as the caching engine, use it.
-            # Otherwise default to diskcache
-            caching_engine = 'diskcache'
-
-            try:
-                config = self._runtime.get_configuration()
-                parameter_id = Id('parameter:cachingEngine@json')
-                caching_engine = config.get_value_by_parameter(parameter_id).get_string_value()
-            except (AttributeError, KeyError, errors.NotFound):
-                pass
+        pkg_name = cat_id.get_identifier_namespace().split('.')[0]
+        cat_name = cat_id.get_identifier_namespace().split('.')[1]
+        catalog_hierarchy_id = Id(authority=pkg_name.upper(),
+                                  namespace='CATALOG',
+                                  identifier=cat_name.upper())
 
+        caching_engine = self._get_caching_engine()
+        if caching_engine is not None:
+            # the shared tier is what other processes invalidate, so read it directly
+            key = 'descendent-catalog-ids-{0}'.format(str(cat_id))
             if caching_engine == 'memcache':
-                import memcache
-                caching_host = '127.0.0.1:11211'
-                try:
-                    config = self._runtime.get_configuration()
-                    parameter_id = Id('parameter:cachingHostURI@json')
-                    caching_host = config.get_value_by_parameter(parameter_id).get_string_value()
-                except (AttributeError, KeyError, errors.NotFound):
-                    pass
-
-                mc = memcache.Client([caching_host], debug=0)
-
+                mc = self._get_memcache_client()
                 catalog_ids = mc.get(key)
                 if catalog_ids is None:
                     catalog_ids = get_descendent_ids(hierarchy_session)
@@ -315,10 +379,218 @@ class OsidSession(abc_osid_sessions.OsidSession):
                         cache.set(key, catalog_ids)
             else:
                 raise errors.NotFound('The {0} caching engine was not found.'.format(caching_engine))
-        else:
-            catalog_ids = get_descendent_ids(hierarchy_session)
+            return catalog_ids
+
+        ttl = self._get_hierarchy_cache_ttl()
+        if not ttl:
+            return get_descendent_ids(hierarchy_session)
+        hierarchy_key = self._get_descendant_cache_key(
+            convert_catalog_id_to_object_id_string(catalog_hierarchy_id))
+        catalog_ids = DESCENDANT_CACHE.get(hierarchy_key, str(cat_id))
+        if catalog_ids is not None:
+            return catalog_ids
+        generation = DESCENDANT_CACHE.get_generation(hierarchy_key)
+        catalog_ids = get_descendent_ids(hierarchy_session)
+        DESCENDANT_CACHE.put(hierarchy_key, str(cat_id), catalog_ids, generation=generation, ttl=ttl)
         return catalog_ids
 
+    def _get_hierarchy_cache_ttl(self):
+        """Gets how many seconds descendant catalog ids are kept in the
+        ``DESCENDANT_CACHE``, per the ``hierarchyCacheTTL@json`` runtime
+        parameter (0 to not cache them)"""
+        if getattr(self, '_hierarchy_cache_ttl', None) is None:
+            self._hierarchy_cache_ttl = DESCENDANT_TTL
+            try:
+                config = get_configuration_snapshot(self._runtime)
+                self._hierarchy_cache_ttl = config.get_integer_value('parameter:hierarchyCacheTTL@json')
+            except (AttributeError, KeyError, errors.NotFound):
+                pass
+        return self._hierarchy_cache_ttl
+
+    def _get_descendant_cache_key(self, hierarchy_identifier):
+        """Gets the ``DESCENDANT_CACHE`` key of a hierarchy, qualified by
+        where this runtime keeps its relationships"""
+        collection = JSONClientValidated('relationship',
+                                         collection='Relationship',
+                                         runtime=self._runtime)
+        return '{0}:{1}'.format(collection._cache_namespace, hierarchy_identifier)
+
+    def _get_caching_engine(self):
+        """Gets the configured shared caching engine, or None if not caching"""
+        try:
+            config = get_configuration_snapshot(self._runtime)
+            if not config.get_boolean_value('parameter:useCachingForQualifierIds@json'):
+                return None
+        except (AttributeError, KeyError, errors.NotFound):
+            return None
+
+        # If configured to use memcache as the caching engine, use it.
+        # Otherwise default to diskcache
+        caching_engine = 'diskcache'
+
+        try:
+            config = get_configuration_snapshot(self._runtime)
+            caching_engine = config.get_string_value('parameter:cachingEngine@json')
+        except (AttributeError, KeyError, errors.NotFound):
+            pass
+        return caching_engine
+
+    def _get_memcache_client(self):
+        import memcache
+        caching_host = '127.0.0.1:11211'
+        try:
+            config = get_configuration_snapshot(self._runtime)
+            caching_host = config.get_string_value('parameter:cachingHostURI@json')
+        except (AttributeError, KeyError, errors.NotFound):
+            pass
+
+        return memcache.Client([caching_host], debug=0)
+
+    def _delete_descendent_cat_idstrs(self, hierarchy_identifier, node_ids):
+        """Drops the cached descendent catalog ids that include the
+        given (changed) nodes, from both cache tiers"""
+        hierarchy_key = self._get_descendant_cache_key(hierarchy_identifier)
+        for node_id in node_ids:
+            DESCENDANT_CACHE.invalidate_ancestors(hierarchy_key, str(node_id))
+        caching_engine = self._get_caching_engine()
+        keys = ['descendent-catalog-ids-{0}'.format(str(node_id)) for node_id in node_ids]
+        if caching_engine == 'memcache':
+            self._get_memcache_client().delete_multi(keys)
+        elif caching_engine == 'diskcache':
+            import diskcache
+            with diskcache.Cache('/tmp/dlkit_cache') as cache:
+                for key in keys:
+                    cache.delete(key)
+
+    def _materializes_ancestry(self):
+        """Tests if objects keep an ``ancestor<Catalog>Ids`` array, per the
+        ``materializeCatalogAncestry@json`` runtime parameter"""
+        if getattr(self, '_materialized_ancestry', None) is None:
+            self._materialized_ancestry = False
+            try:
+                config = get_configuration_snapshot(self._runtime)
+                self._materialized_ancestry = config.get_boolean_value('parameter:materializeCatalogAncestry@json')
+            except (AttributeError, KeyError, errors.NotFound):
+                pass
+        return self._materialized_ancestry
+
+    def _get_ancestor_cat_idstrs(self, cat_id, ancestor_idstr_lists=None):
+        """Returns a list of all ancestor catalog ids, inclusive
+
+        The hierarchy is walked live, since the lists end up persisted
+        on objects. ``ancestor_idstr_lists`` can memoize them for the
+        span of one job.
+
+        """
+        if ancestor_idstr_lists is not None and str(cat_id) in ancestor_idstr_lists:
+            return ancestor_idstr_lists[str(cat_id)]
+        pkg_name = cat_id.get_identifier_namespace().split('.')[0]
+        cat_name = cat_id.get_identifier_namespace().split('.')[1]
+        catalog_hierarchy_id = Id(authority=pkg_name.upper(),
+                                  namespace='CATALOG',
+                                  identifier=cat_name.upper())
+        idstr_list = [str(cat_id)]
+        try:
+            mgr = self._get_provider_manager('HIERARCHY')
+            h_session = mgr.get_hierarchy_traversal_session_for_hierarchy(
+                catalog_hierarchy_id,
+                proxy=self._proxy)
+        except (errors.OperationFailed, errors.Unsupported):
+            pass  # there is no hierarchy
+        else:
+            node_ids = [cat_id]
+            while node_ids:
+                node_ids = [parent_id
+                            for node_id in node_ids
+                            for parent_id in h_session.get_parents(node_id)
+                            if str(parent_id) not in idstr_list]
+                idstr_list += list(set(str(node_id) for node_id in node_ids))
+        if ancestor_idstr_lists is not None:
+            ancestor_idstr_lists[str(cat_id)] = idstr_list
+        return idstr_list
+
+    def _get_ancestor_catalog_idstrs(self, cat_idstrs, ancestor_idstr_lists=None):
+        """Returns the ids of some catalogs and of all of their ancestors"""
+        idstr_list = set()
+        for cat_idstr in cat_idstrs:
+            idstr_list.update(self._get_ancestor_cat_idstrs(Id(cat_idstr), ancestor_idstr_lists))
+        return sorted(idstr_list)
+
+    def _set_ancestor_catalog_ids(self, obj_map):
+        """Sets the ``ancestor<Catalog>Ids`` of an object map about to be
+        written, if this runtime materializes catalog ancestry"""
+        if self._catalog_name in CATALOG_OBJECT_COLLECTIONS and self._materializes_ancestry():
+            obj_map['ancestor' + self._catalog_name + 'Ids'] = self._get_ancestor_catalog_idstrs(
+                obj_map.get('assigned' + self._catalog_name + 'Ids', []))
+        return obj_map
+
+    def _rematerialize_ancestry(self, cat_id):
+        """Brings the ``ancestor<Catalog>Ids`` of the objects in a catalog's
+        subtree up to date"""
+        cat_name = cat_id.get_identifier_namespace().split('.')[-1]
+        if cat_name not in CATALOG_OBJECT_COLLECTIONS:
+            return
+        self._materialize_ancestry(
+            cat_name, {'assigned' + cat_name + 'Ids': {'$in': self._get_descendent_cat_idstrs(cat_id)}})
+
+    def _materialize_ancestry(self, cat_name, query):
+        """Sets the ``ancestor<Catalog>Ids`` of the objects matching a query,
+        with one bulk update per batch of objects"""
+        catalog_key = 'assigned' + cat_name + 'Ids'
+        ancestor_key = 'ancestor' + cat_name + 'Ids'
+        ancestor_idstr_lists = {}
+        for db_name, obj_name in CATALOG_OBJECT_COLLECTIONS[cat_name]:
+            collection = JSONClientValidated(db_name,
+                                             collection=obj_name,
+                                             runtime=self._runtime)
+            updates = []
+            for obj_map in collection.find(query, projection={catalog_key: True}):
+                updates.append((obj_map['_id'],
+                                {ancestor_key: self._get_ancestor_catalog_idstrs(obj_map.get(catalog_key, []),
+                                                                                 ancestor_idstr_lists)}))
+                if len(updates) == MAX_IN_BATCH:
+                    collection.bulk_set(updates)
+                    updates = []
+            collection.bulk_set(updates)
+
+    def _materialize_catalog_ancestry(self, db_name, cat_name, cat_idstrs=None):
+        """Sets the ``ancestor<Catalog>Ids`` of catalogs, or of all the
+        catalogs in a collection, with one bulk update per batch.
+
+        ``AuthorizationSession`` reads a qualifier's ancestors from there.
+
+        """
+        if cat_name not in CATALOG_OBJECT_COLLECTIONS:
+            return
+        ancestor_key = 'ancestor' + cat_name + 'Ids'
+        collection = JSONClientValidated(db_name,
+                                         collection=cat_name,
+                                         runtime=self._runtime)
+        if cat_idstrs is None:
+            cat_idstrs = [str(Id(identifier=str(cat_map['_id']),
+                                 namespace=db_name + '.' + cat_name,
+                                 authority=self._authority))
+                          for cat_map in collection.find({}, projection={'_id': True})]
+        cat_idstrs = [cat_idstr for cat_idstr in cat_idstrs
+                      if ObjectId.is_valid(Id(cat_idstr).get_identifier())]
+        ancestor_idstr_lists = {}
+        for start in range(0, len(cat_idstrs), MAX_IN_BATCH):
+            collection.bulk_set([(ObjectId(Id(cat_idstr).get_identifier()),
+                                  {ancestor_key: self._get_ancestor_catalog_idstrs([cat_idstr], ancestor_idstr_lists)})
+                                 for cat_idstr in cat_idstrs[start:start + MAX_IN_BATCH]])
+
+    def _submit_ancestry_rematerialization(self, cat_id):
+        """Updates the ``ancestor<Catalog>Ids`` of the catalogs under a
+        catalog whose ancestors changed, and has the background
+        materializer update the objects in them"""
+        if self._materializes_ancestry():
+            namespace = cat_id.get_identifier_namespace().split('.')
+            if len(namespace) == 2:
+                # synchronously, since authorization checks depend on them
+                self._materialize_catalog_ancestry(namespace[0], namespace[1],
+                                                   self._get_descendent_cat_idstrs(cat_id))
+            ANCESTRY_MATERIALIZER.submit(functools.partial(self._rematerialize_ancestry, cat_id))
+
     def _is_phantom_root_federated(self):
         return (self._catalog_view == FEDERATED and
                 self._catalog_id.get_identifier() == '000000000000000000000000')
@@ -360,6 +632,9 @@ class OsidSession(abc_osid_sessions.OsidSession):
         """
         if self._is_phantom_root_federated():
             return {}
+        if (self._catalog_view == FEDERATED and self._catalog_name in CATALOG_OBJECT_COLLECTIONS and
+                self._materializes_ancestry()):
+            return {'ancestor' + self._catalog_name + 'Ids': str(self._catalog_id)}
         idstr_list = self._get_catalog_idstrs()
         return {'assigned' + self._catalog_name + 'Ids': {'$in': idstr_list}}
         # return {'assigned' + utilities.format_catalog(self._catalog_name) + 'Ids': {'$in': idstr_list}}
@@ -379,7 +654,68 @@ class OsidSession(abc_osid_sessions.OsidSession):
                 obj_map[catalog_key].append(str(cat_id))
         else:
             obj_map[catalog_key] = [str(cat_id)]
-        collection.save(obj_map)
+        collection.save(self._set_ancestor_catalog_ids(obj_map))
+
+    def _get_object_ids_in_view(self, pkg_name, obj_name, namespace):
+        """Gets the ``IdList`` of the objects in this session's catalog view.
+
+        Like the templated ``get_<objects>()`` lookup, but only the ``_ids``
+        are read from the collection.
+
+        """
+        try:
+            authority = get_configuration_snapshot(self._runtime).get_string_value(
+                'parameter:authority@json')
+        except (AttributeError, KeyError, errors.NotFound):
+            authority = 'ODL.MIT.EDU'
+        collection = JSONClientValidated(pkg_name,
+                                         collection=obj_name,
+                                         runtime=self._runtime)
+        result = collection.find(self._view_filter(),
+                                 projection={'_id': True}).sort('_id', DESCENDING)
+        return IdList([Id(identifier=str(obj_map['_id']),
+                          namespace=namespace,
+                          authority=authority) for obj_map in result])
+
+    @staticmethod
+    def _get_object_maps_in_order(collection, object_ids):
+        """Gets the stored maps for several object ids with one find, in the order given"""
+        object_maps = dict((str(object_map['_id']), object_map)
+                           for object_map in collection.find({'_id': {'$in': list(object_ids)}}))
+        return [object_maps[str(object_id)] for object_id in object_ids]
+
+    def _get_object_maps_by_ids(self, collection, object_ids):
+        """Gets the stored maps for a list of object ids, in the order given.
+
+        Duplicate ids get their map repeated. In plenary view an id that
+        is missing (or outside of the catalog view) raises ``NotFound``,
+        otherwise it is left out. Lists of more than ``MAX_IN_BATCH``
+        distinct ids are checked with id-only queries up front, and the
+        maps are then read one batch at a time as the list is iterated.
+
+        """
+        def query(ids):
+            return dict({'_id': {'$in': ids}}, **self._view_filter())
+        object_ids = list(object_ids)
+        unique_ids = list(set(object_ids))
+        object_maps = None
+        if len(unique_ids) <= MAX_IN_BATCH:
+            object_maps = dict((str(object_map['_id']), object_map)
+                               for object_map in collection.find(query(unique_ids)))
+            found_idstrs = set(object_maps)
+        else:
+            found_idstrs = set()
+            for start in range(0, len(unique_ids), MAX_IN_BATCH):
+                found_idstrs.update(str(object_map['_id']) for object_map in collection.find(
+                    query(unique_ids[start:start + MAX_IN_BATCH]), projection={'_id': True}))
+        if self._object_view == PLENARY:
+            for object_id in object_ids:
+                if str(object_id) not in found_idstrs:
+                    raise errors.NotFound(str(object_id) + ' not found')
+        object_ids = [object_id for object_id in object_ids if str(object_id) in found_idstrs]
+        if object_maps is not None:
+            return [object_maps[str(object_id)] for object_id in object_ids]
+        return BatchedObjectMaps(collection, query, object_ids, MAX_IN_BATCH)
 
     def _unassign_object_from_catalog(self, obj_id, cat_id):
         pkg_name = obj_id.get_identifier_namespace().split('.')[0]
@@ -395,7 +731,7 @@ class OsidSession(abc_osid_sessions.OsidSession):
             obj_map[catalog_key].remove(str(cat_id))
         except (KeyError, ValueError):
             raise errors.NotFound()
-        collection.save(obj_map)
+        collection.save(self._set_ancestor_catalog_ids(obj_map))
 
     def get_locale(self):
         """Gets the locale indicating the localization preferences in effect for this session.
@@ -0,0 +1,424 @@
+"""Compiles MongoDB-style queries into predicates for the non-MongoDB JSON backends
+
+Queries built by ``OsidQuery`` (``_query_terms``) and by the sessions are
+turned into a nested Python predicate once, instead of re-walking the
+query dict for every stored document. Compiled predicates are cached by
+query shape -- the keys and operators used, without the values -- so
+that queries that only differ in their values share one predicate.
+
+Supported are ``$and``, ``$or``, ``$nor``, ``$eq``, ``$ne``, ``$in``,
+``$nin``, ``$gt``, ``$gte``, ``$lt``, ``$lte``, ``$exists`` and
+``$regex`` (with ``$options``), on dotted paths of any depth. Like in
+MongoDB, arrays on the path are expanded and a term matches if any of
+the values found matches.
+
+Documents are matched in their stored form, so ``ObjectIds`` in the query
+are compared as strings, and ``datetime`` query values are compared with
+the stored datetime maps written by ``clean_up_datetime()``.
+
+"""
+import datetime
+import operator
+import re
+
+from collections import OrderedDict
+from itertools import count
+from threading import RLock
+
+from bson import ObjectId
+
+from .osid.osid_errors import OperationFailed
+
+
+REGEX_TYPE = type(re.compile(''))
+LOGICAL_OPERATORS = ['$and', '$or', '$nor']
+MAX_CACHED_SHAPES = 512
+
+try:
+    STRING_TYPES = (str, unicode)
+    NUMBER_TYPES = (int, long, float)
+except NameError:
+    # python 3
+    STRING_TYPES = (str,)
+    NUMBER_TYPES = (int, float)
+
+_DATETIME_KEYS = ['year', 'month', 'day', 'hour', 'minute', 'second', 'microsecond']
+
+
+def is_regex(value):
+    return isinstance(value, REGEX_TYPE)
+
+
+def _is_operator_dict(value):
+    return (isinstance(value, dict) and len(value) > 0 and
+            all(key.startswith('$') for key in value))
+
+
+def _coerce_operand(value):
+    """Converts a query value to the form documents are stored in"""
+    if isinstance(value, ObjectId):
+        return str(value)
+    if isinstance(value, list):
+        return [_coerce_operand(v) for v in value]
+    return value
+
+
+def _coerce_candidate(candidate, operand):
+    """Converts a stored datetime map back to a datetime, when compared to one"""
+    if (isinstance(operand, datetime.datetime) and isinstance(candidate, dict) and
+            'year' in candidate):
+        try:
+            return datetime.datetime(candidate['year'], candidate['month'], candidate['day'],
+                                     *[candidate.get(key) or 0 for key in _DATETIME_KEYS[3:]])
+        except (KeyError, TypeError, ValueError):
+            return candidate
+    return candidate
+
+
+def _strip_tzinfo(value):
+    if isinstance(value, datetime.datetime) and value.tzinfo is not None:
+        return value.replace(tzinfo=None)
+    return value
+
+
+def resolve_path(doc, path):
+    """Gets the values at a dotted path in a document, expanding arrays"""
+    values = [doc]
+    for part in path:
+        next_values = []
+        for value in values:
+            if isinstance(value, dict):
+                if part in value:
+                    next_values.append(value[part])
+            elif isinstance(value, list):
+                if part.isdigit() and int(part) < len(value):
+                    next_values.append(value[int(part)])
+                for element in value:
+                    if isinstance(element, dict) and part in element:
+                        next_values.append(element[part])
+        values = next_values
+    return values
+
+
+def _iter_candidates(values):
+    """Yields the resolved values, plus the elements of any arrays among them"""
+    for value in values:
+        if isinstance(value, list):
+            for element in value:
+                yield element
+        yield value
+
+
+def _equals(candidate, operand):
+    if is_regex(operand):
+        return isinstance(candidate, STRING_TYPES) and operand.search(candidate) is not None
+    candidate = _coerce_candidate(candidate, operand)
+    if isinstance(operand, datetime.datetime):
+        return _strip_tzinfo(candidate) == _strip_tzinfo(operand)
+    return candidate == operand
+
+
+def _comparable(candidate, operand):
+    if isinstance(operand, bool) or isinstance(candidate, bool):
+        return isinstance(operand, bool) and isinstance(candidate, bool)
+    if isinstance(operand, NUMBER_TYPES):
+        return isinstance(candidate, NUMBER_TYPES)
+    if isinstance(operand, STRING_TYPES):
+        return isinstance(candidate, STRING_TYPES)
+    return isinstance(candidate, type(operand))
+
+
+class ValueSet(object):
+    """The bound operand of ``$in`` and ``$nin``"""
+    def __init__(self, values):
+        if not isinstance(values, (list, tuple, set)):
+            raise OperationFailed('$in / $nin need an array, not ' + str(values))
+        self.hashable = set()
+        self.others = []
+        self.matches_missing = False
+        for value in _coerce_operand(list(values)):
+            if value is None:
+                self.matches_missing = True
+            if is_regex(value) or isinstance(value, (dict, list, datetime.datetime)):
+                self.others.append(value)
+            else:
+                try:
+                    self.hashable.add(value)
+                except TypeError:
+                    self.others.append(value)
+
+    def __contains__(self, candidate):
+        try:
+            if candidate in self.hashable:
+                return True
+        except TypeError:
+            pass
+        return any(_equals(candidate, other) for other in self.others)
+
+
+# operand converters, applied once when a query is bound to its compiled shape
+def _bind_value(value):
+    return _coerce_operand(value)
+
+
+def _bind_value_set(value):
+    return ValueSet(value)
+
+
+def _bind_exists(value):
+    return value not in [False, 'false', 0, None]
+
+
+def _bind_regex(value):
+    pattern, options = value
+    if is_regex(pattern):
+        return pattern
+    flags = 0
+    for option, flag in [('i', re.I), ('m', re.M), ('s', re.S), ('x', re.X)]:
+        if option in (options or ''):
+            flags |= flag
+    return re.compile(pattern, flags)
+
+
+# field operator compilers: each gets the split path and the parameter
+# index of its operand, and returns a predicate(doc, params)
+def _compile_eq(path, index):
+    def match_eq(doc, params):
+        operand = params[index]
+        values = resolve_path(doc, path)
+        if operand is None and not values:
+            return True
+        for candidate in _iter_candidates(values):
+            if _equals(candidate, operand):
+                return True
+        return False
+    return match_eq
+
+
+def _compile_ne(path, index):
+    match_eq = _compile_eq(path, index)
+
+    def match_ne(doc, params):
+        return not match_eq(doc, params)
+    return match_ne
+
+
+def _compile_in(path, index):
+    def match_in(doc, params):
+        value_set = params[index]
+        values = resolve_path(doc, path)
+        if not values:
+            return value_set.matches_missing
+        for candidate in _iter_candidates(values):
+            if candidate in value_set:
+                return True
+        return False
+    return match_in
+
+
+def _compile_nin(path, index):
+    match_in = _compile_in(path, index)
+
+    def match_nin(doc, params):
+        return not match_in(doc, params)
+    return match_nin
+
+
+def _get_comparison_compiler(compare):
+    def compile_comparison(path, index):
+        def match_comparison(doc, params):
+            operand = params[index]
+            for candidate in _iter_candidates(resolve_path(doc, path)):
+                candidate = _coerce_candidate(candidate, operand)
+                if not _comparable(candidate, operand):
+                    continue
+                try:
+                    if compare(_strip_tzinfo(candidate), _strip_tzinfo(operand)):
+                        return True
+                except TypeError:
+                    continue
+            return False
+        return match_comparison
+    return compile_comparison
+
+
+def _compile_exists(path, index):
+    def match_exists(doc, params):
+        return bool(resolve_path(doc, path)) == params[index]
+    return match_exists
+
+
+def _compile_regex(path, index):
+    def match_regex(doc, params):
+        regex = params[index]
+        for candidate in _iter_candidates(resolve_path(doc, path)):
+            if isinstance(candidate, STRING_TYPES) and regex.search(candidate) is not None:
+                return True
+        return False
+    return match_regex
+
+
+# operator: (predicate compiler, operand converter)
+FIELD_OPERATORS = {
+    '$eq': (_compile_eq, _bind_value),
+    '$ne': (_compile_ne, _bind_value),
+    '$in': (_compile_in, _bind_value_set),
+    '$nin': (_compile_nin, _bind_value_set),
+    '$gt': (_get_comparison_compiler(operator.gt), _bind_value),
+    '$gte': (_get_comparison_compiler(operator.ge), _bind_value),
+    '$lt': (_get_comparison_compiler(operator.lt), _bind_value),
+    '$lte': (_get_comparison_compiler(operator.le), _bind_value),
+    '$exists': (_compile_exists, _bind_exists),
+    '$regex': (_compile_regex, _bind_regex),
+}
+
+
+def get_query_shape(query, params=None):
+    """Splits a query into its hashable shape and its list of operand values.
+
+    The operands are appended to ``params`` in the order the compiled
+    predicate expects them.
+
+    """
+    if params is None:
+        params = []
+    if not isinstance(query, dict):
+        raise OperationFailed('query must be a dict, not ' + str(query))
+    shape = []
+    for key in sorted(query):
+        value = query[key]
+        if key in LOGICAL_OPERATORS:
+            if not isinstance(value, (list, tuple)):
+                raise OperationFailed(key + ' needs an array of queries')
+            shape.append((key, tuple(get_query_shape(sub_query, params)[0]
+                                     for sub_query in value)))
+        elif key.startswith('$'):
+            raise OperationFailed('unsupported query operator: ' + key)
+        elif _is_operator_dict(value):
+            operators = []
+            for op in sorted(value):
+                if op == '$options':
+                    if '$regex' not in value:
+                        raise OperationFailed('$options needs a $regex')
+                    continue
+                if op not in FIELD_OPERATORS:
+                    raise OperationFailed('unsupported query operator: ' + op)
+                if op == '$regex':
+                    params.append((value['$regex'], value.get('$options')))
+                else:
+                    params.append(value[op])
+                operators.append(op)
+            shape.append((key, tuple(operators)))
+        else:
+            params.append(value)
+            shape.append((key, ('$eq',)))
+    return tuple(shape), params
+
+
+def _compile_shape(shape, counter, binders):
+    tests = []
+    for key, spec in shape:
+        if key in LOGICAL_OPERATORS:
+            sub_tests = [_compile_shape(sub_shape, counter, binders) for sub_shape in spec]
+            tests.append(_compile_logical(key, sub_tests))
+        else:
+            path = tuple(key.split('.'))
+            for op in spec:
+                compile_operator, bind_operand = FIELD_OPERATORS[op]
+                binders.append(bind_operand)
+                tests.append(compile_operator(path, next(counter)))
+    if len(tests) == 1:
+        return tests[0]
+
+    def match_all(doc, params):
+        for test in tests:
+            if not test(doc, params):
+                return False
+        return True
+    return match_all
+
+
+def _compile_logical(key, sub_tests):
+    if key == '$and':
+        def match_and(doc, params):
+            return all(test(doc, params) for test in sub_tests)
+        return match_and
+    elif key == '$or':
+        def match_or(doc, params):
+            return any(test(doc, params) for test in sub_tests)
+        return match_or
+
+    def match_nor(doc, params):
+        return not any(test(doc, params) for test in sub_tests)
+    return match_nor
+
+
+class CompiledQuery(object):
+    """A query bound to the compiled predicate for its shape.
+
+    Instances are callable with a stored document and return whether
+    it matches.
+
+    """
+    def __init__(self, query, predicate, params):
+        self.query = query
+        self._predicate = predicate
+        self._params = params
+
+    def __call__(self, doc):
+        return self._predicate(doc, self._params)
+
+
+class QueryCompiler(object):
+    """Compiles queries, caching the compiled predicates by query shape"""
+    def __init__(self, max_shapes=MAX_CACHED_SHAPES):
+        self._lock = RLock()
+        self._max_shapes = max_shapes
+        self._predicates = OrderedDict()
+        self._stats = dict(hits=0, misses=0)
+
+    def get_stats(self):
+        return dict(self._stats)
+
+    def clear(self):
+        with self._lock:
+            self._predicates = OrderedDict()
+            self._stats = dict(hits=0, misses=0)
+
+    def _get_predicate(self, shape):
+        with self._lock:
+            if shape in self._predicates:
+                self._stats['hits'] += 1
+                self._predicates[shape] = self._predicates.pop(shape)  # most recently used
+                return self._predicates[shape]
+            self._stats['misses'] += 1
+            binders = []
+            predicate = (_compile_shape(shape, count(), binders), binders)
+            self._predicates[shape] = predicate
+            while len(self._predicates) > self._max_shapes:
+                self._predicates.popitem(last=False)
+            return predicate
+
+    def compile(self, query):
+        """Gets a ``CompiledQuery`` for a query dict, ``OsidQuery`` or None"""
+        if isinstance(query, CompiledQuery):
+            return query
+        try:
+            query = query._query_terms
+        except AttributeError:
+            pass
+        if query is None:
+            query = {}
+        shape, params = get_query_shape(query)
+        predicate, binders = self._get_predicate(shape)
+        return CompiledQuery(query,
+                             predicate,
+                             [bind(value) for bind, value in zip(binders, params)])
+
+
+QUERY_COMPILER = QueryCompiler()
+
+
+def compile_query(query):
+    """Compiles a query with the process-wide ``QUERY_COMPILER``"""
+    return QUERY_COMPILER.compile(query)
@@ -245,24 +245,14 @@ class RelationshipLookupSession(abc_relationship_sessions.RelationshipLookupSess
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('relationship',
                                          collection='Relationship',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in relationship_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'relationship').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.RelationshipList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(relationship_ids, 'relationship'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.RelationshipList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_relationships_by_genus_type(self, relationship_genus_type):
@@ -2192,7 +2182,7 @@ class FamilyHierarchySession(abc_relationship_sessions.FamilyHierarchySession, o
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=family_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=family_id)
+        return self._hierarchy_session.is_ancestor(id_=family_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_families(self, family_id):
@@ -2300,7 +2290,7 @@ class FamilyHierarchySession(abc_relationship_sessions.FamilyHierarchySession, o
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=family_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=family_id)
+        return self._hierarchy_session.is_descendant(id_=family_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_family_node_ids(self, family_id, ancestor_levels, descendant_levels, include_siblings):
@@ -24,6 +24,7 @@ from ..osid import sessions as osid_sessions
 from ..osid.sessions import OsidSession
 from ..primitives import Id
 from ..primitives import Type
+from ..query_compiler import is_regex
 from ..utilities import JSONClientValidated
 from ..utilities import PHANTOM_ROOT_IDENTIFIER
 from dlkit.abstract_osid.id.primitives import Id as ABCId
@@ -251,24 +252,14 @@ class AssetLookupSession(abc_repository_sessions.AssetLookupSession, osid_sessio
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('repository',
                                          collection='Asset',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in asset_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'repository').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.AssetList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(asset_ids, 'repository'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.AssetList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_assets_by_genus_type(self, asset_genus_type):
@@ -604,18 +595,17 @@ class AssetContentLookupSession(abc_repository_sessions.AssetContentLookupSessio
         collection = JSONClientValidated('repository',
                                          collection='Asset',
                                          runtime=self._runtime)
-        object_id_list = [ObjectId(self._get_id(i, 'repository').get_identifier()) for i in asset_content_ids]
+        object_id_list = [ObjectId(i.get_identifier()) for i in self._get_ids(asset_content_ids, 'repository')]
 
         results = collection.find(
             dict({'assetContents._id': {'$in': object_id_list}},
                  **self._view_filter()))
-        # if a match is not found, NotFound exception will be thrown by find_one, so
-        # the below should always work
-        asset_content_maps = [ac
-                              for asset in results
-                              for ac in asset['assetContents']
+        asset_content_maps = dict((str(ac['_id']), ac)
+                                  for asset in results
+                                  for ac in asset['assetContents'])
+        asset_content_maps = [asset_content_maps[str(object_id)]
                               for object_id in object_id_list
-                              if ac['_id'] == object_id]
+                              if str(object_id) in asset_content_maps]
         return objects.AssetContentList(asset_content_maps, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
@@ -917,7 +907,6 @@ class AssetQuerySession(abc_repository_sessions.AssetQuerySession, osid_sessions
         return queries.AssetContentQuery(runtime=self._runtime)
 
     def get_asset_contents_by_query(self, asset_content_query):
-        import re
         and_list = list()
         or_list = list()
         for term in asset_content_query._query_terms:
@@ -954,7 +943,7 @@ class AssetQuerySession(abc_repository_sessions.AssetQuerySession, osid_sessions
                                 search_value = asset_content_query._query_terms[term]
                                 if isinstance(search_value, dict):
                                     search_value = search_value['$in'][0]
-                                if isinstance(search_value, re._pattern_type):
+                                if is_regex(search_value):
                                     # then we need to do a regex comparison on the content value
                                     if search_value.match(value) is None:
                                         is_match = False
@@ -1348,7 +1337,7 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
             raise errors.Unsupported('asset_form did not originate from this session')
         if not asset_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(asset_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(asset_form._my_map))
 
         self._forms[asset_form.get_id().get_identifier()] = CREATED
         result = objects.Asset(
@@ -1358,6 +1347,56 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
 
         return result
 
+    @utilities.arguments_not_none
+    def create_assets(self, asset_forms):
+        """Creates several new ``Assets`` with one bulk write.
+
+        All the forms are checked before anything is written.
+
+        arg:    asset_forms (osid.repository.AssetForm[]): the forms for the
+                new ``Assets``
+        return: (osid.repository.AssetList) - the new ``Assets``, in the order
+                of ``asset_forms``
+        raise:  IllegalState - a ``asset_form`` was already used in a
+                create transaction
+        raise:  InvalidArgument - one or more of the form elements is
+                invalid
+        raise:  NullArgument - ``asset_forms`` is ``null``
+        raise:  OperationFailed - unable to complete request
+        raise:  PermissionDenied - authorization failure occurred
+        raise:  Unsupported - a ``asset_form`` did not originate from
+                ``get_asset_form_for_create()``
+        *compliance: optional -- This method is not in the OSID spec.*
+
+        """
+        collection = JSONClientValidated('repository',
+                                         collection='Asset',
+                                         runtime=self._runtime)
+        asset_forms = list(asset_forms)
+        form_ids = set()
+        for asset_form in asset_forms:
+            if not isinstance(asset_form, ABCAssetForm):
+                raise errors.InvalidArgument('argument type is not an AssetForm')
+            if asset_form.is_for_update():
+                raise errors.InvalidArgument('the AssetForm is for update only, not create')
+            form_id = asset_form.get_id().get_identifier()
+            try:
+                if self._forms[form_id] == CREATED or form_id in form_ids:
+                    raise errors.IllegalState('asset_form already used in a create transaction')
+            except KeyError:
+                raise errors.Unsupported('asset_form did not originate from this session')
+            if not asset_form.is_valid():
+                raise errors.InvalidArgument('one or more of the form elements is invalid')
+            form_ids.add(form_id)
+        insert_result = collection.insert_many([self._set_ancestor_catalog_ids(asset_form._my_map) for asset_form in asset_forms])
+
+        for form_id in form_ids:
+            self._forms[form_id] = CREATED
+        return objects.AssetList(
+            self._get_object_maps_in_order(collection, insert_result.inserted_ids),
+            runtime=self._runtime,
+            proxy=self._proxy)
+
     def can_update_assets(self):
         """Tests if this user can update ``Assets``.
 
@@ -1454,6 +1493,57 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
             runtime=self._runtime,
             proxy=self._proxy)
 
+    @utilities.arguments_not_none
+    def update_assets(self, asset_forms):
+        """Updates several existing ``Assets`` with one bulk write.
+
+        All the forms are checked before anything is written.
+
+        arg:    asset_forms (osid.repository.AssetForm[]): the forms
+                containing the elements to be updated
+        return: (osid.repository.AssetList) - the updated ``Assets``, in the
+                order of ``asset_forms``
+        raise:  IllegalState - a ``asset_form`` was already used in an
+                update transaction
+        raise:  InvalidArgument - one or more of the form elements is
+                invalid
+        raise:  NullArgument - ``asset_forms`` is ``null``
+        raise:  OperationFailed - unable to complete request
+        raise:  PermissionDenied - authorization failure occurred
+        raise:  Unsupported - a ``asset_form`` did not originate from
+                ``get_asset_form_for_update()``
+        *compliance: optional -- This method is not in the OSID spec.*
+
+        """
+        collection = JSONClientValidated('repository',
+                                         collection='Asset',
+                                         runtime=self._runtime)
+        asset_forms = list(asset_forms)
+        form_ids = set()
+        for asset_form in asset_forms:
+            if not isinstance(asset_form, ABCAssetForm):
+                raise errors.InvalidArgument('argument type is not an AssetForm')
+            if not asset_form.is_for_update():
+                raise errors.InvalidArgument('the AssetForm is for update only, not create')
+            form_id = asset_form.get_id().get_identifier()
+            try:
+                if self._forms[form_id] == UPDATED or form_id in form_ids:
+                    raise errors.IllegalState('asset_form already used in an update transaction')
+            except KeyError:
+                raise errors.Unsupported('asset_form did not originate from this session')
+            if not asset_form.is_valid():
+                raise errors.InvalidArgument('one or more of the form elements is invalid')
+            form_ids.add(form_id)
+        collection.bulk_save([asset_form._my_map for asset_form in asset_forms])
+
+        for form_id in form_ids:
+            self._forms[form_id] = UPDATED
+        # Note: like update_asset(), returns the objects even though the OSIDs don't require it
+        return objects.AssetList(
+            [asset_form._my_map for asset_form in asset_forms],
+            runtime=self._runtime,
+            proxy=self._proxy)
+
     def can_delete_assets(self):
         """Tests if this user can delete ``Assets``.
 
@@ -1906,7 +1996,7 @@ class AssetAdminSession(abc_repository_sessions.AssetAdminSession, osid_sessions
             asset_map['repositoryId'] = str(self._catalog_id)
         if 'assignedRepositoryIds' in asset_map:
             asset_map['assignedRepositoryIds'] = [str(self._catalog_id)]
-        insert_result = collection.insert_one(asset_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(asset_map))
         result = objects.Asset(
             osid_object_map=collection.find_one({'_id': insert_result.inserted_id}),
             runtime=self._runtime,
@@ -2321,10 +2411,10 @@ class AssetRepositorySession(abc_repository_sessions.AssetRepositorySession, osi
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for asset in self.get_assets_by_repository(repository_id):
-            id_list.append(asset.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('REPOSITORY', local=True)
+        lookup_session = mgr.get_asset_lookup_session_for_repository(repository_id, proxy=self._proxy)
+        lookup_session.use_isolated_repository_view()
+        return lookup_session._get_object_ids_in_view('repository', 'Asset', 'repository.Asset')
 
     @utilities.arguments_not_none
     def get_assets_by_repository(self, repository_id):
@@ -3263,24 +3353,14 @@ class CompositionLookupSession(abc_repository_sessions.CompositionLookupSession,
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('repository',
                                          collection='Composition',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in composition_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'repository').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.CompositionList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(composition_ids, 'repository'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.CompositionList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_compositions_by_genus_type(self, composition_genus_type):
@@ -3917,7 +3997,7 @@ class CompositionAdminSession(abc_repository_sessions.CompositionAdminSession, o
             raise errors.Unsupported('composiiton_form did not originate from this session')
         if not composiiton_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(composiiton_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(composiiton_form._my_map))
 
         self._forms[composiiton_form.get_id().get_identifier()] = CREATED
         result = objects.Composition(
@@ -4189,7 +4269,7 @@ class CompositionAdminSession(abc_repository_sessions.CompositionAdminSession, o
             composition_map['repositoryId'] = str(self._catalog_id)
         if 'assignedRepositoryIds' in composition_map:
             composition_map['assignedRepositoryIds'] = [str(self._catalog_id)]
-        insert_result = collection.insert_one(composition_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(composition_map))
         result = objects.Composition(
             osid_object_map=collection.find_one({'_id': insert_result.inserted_id}),
             runtime=self._runtime,
@@ -4284,10 +4364,10 @@ class CompositionRepositorySession(abc_repository_sessions.CompositionRepository
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for composition in self.get_compositions_by_repository(repository_id):
-            id_list.append(composition.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('REPOSITORY', local=True)
+        lookup_session = mgr.get_composition_lookup_session_for_repository(repository_id, proxy=self._proxy)
+        lookup_session.use_isolated_repository_view()
+        return lookup_session._get_object_ids_in_view('repository', 'Composition', 'repository.Composition')
 
     @utilities.arguments_not_none
     def get_compositions_by_repository(self, repository_id):
@@ -5575,7 +5655,7 @@ class RepositoryHierarchySession(abc_repository_sessions.RepositoryHierarchySess
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=repository_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=repository_id)
+        return self._hierarchy_session.is_ancestor(id_=repository_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_repositories(self, repository_id):
@@ -5681,7 +5761,7 @@ class RepositoryHierarchySession(abc_repository_sessions.RepositoryHierarchySess
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=repository_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=repository_id)
+        return self._hierarchy_session.is_descendant(id_=repository_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_repository_node_ids(self, repository_id, ancestor_levels, descendant_levels, include_siblings):
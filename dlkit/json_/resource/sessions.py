@@ -247,24 +247,14 @@ class ResourceLookupSession(abc_resource_sessions.ResourceLookupSession, osid_se
         """
         # Implemented from template for
         # osid.resource.ResourceLookupSession.get_resources_by_ids
-        # NOTE: This implementation currently ignores plenary view
         collection = JSONClientValidated('resource',
                                          collection='Resource',
                                          runtime=self._runtime)
         object_id_list = []
-        for i in resource_ids:
-            object_id_list.append(ObjectId(self._get_id(i, 'resource').get_identifier()))
-        result = collection.find(
-            dict({'_id': {'$in': object_id_list}},
-                 **self._view_filter()))
-        result = list(result)
-        sorted_result = []
-        for object_id in object_id_list:
-            for object_map in result:
-                if object_map['_id'] == object_id:
-                    sorted_result.append(object_map)
-                    break
-        return objects.ResourceList(sorted_result, runtime=self._runtime, proxy=self._proxy)
+        for i in self._get_ids(resource_ids, 'resource'):
+            object_id_list.append(ObjectId(i.get_identifier()))
+        result = self._get_object_maps_by_ids(collection, object_id_list)
+        return objects.ResourceList(result, runtime=self._runtime, proxy=self._proxy)
 
     @utilities.arguments_not_none
     def get_resources_by_genus_type(self, resource_genus_type):
@@ -849,7 +839,7 @@ class ResourceAdminSession(abc_resource_sessions.ResourceAdminSession, osid_sess
             raise errors.Unsupported('resource_form did not originate from this session')
         if not resource_form.is_valid():
             raise errors.InvalidArgument('one or more of the form elements is invalid')
-        insert_result = collection.insert_one(resource_form._my_map)
+        insert_result = collection.insert_one(self._set_ancestor_catalog_ids(resource_form._my_map))
 
         self._forms[resource_form.get_id().get_identifier()] = CREATED
         result = objects.Resource(
@@ -1384,10 +1374,10 @@ class ResourceBinSession(abc_resource_sessions.ResourceBinSession, osid_sessions
         """
         # Implemented from template for
         # osid.resource.ResourceBinSession.get_resource_ids_by_bin
-        id_list = []
-        for resource in self.get_resources_by_bin(bin_id):
-            id_list.append(resource.get_id())
-        return IdList(id_list)
+        mgr = self._get_provider_manager('RESOURCE', local=True)
+        lookup_session = mgr.get_resource_lookup_session_for_bin(bin_id, proxy=self._proxy)
+        lookup_session.use_isolated_bin_view()
+        return lookup_session._get_object_ids_in_view('resource', 'Resource', 'resource.Resource')
 
     @utilities.arguments_not_none
     def get_resources_by_bin(self, bin_id):
@@ -2986,7 +2976,7 @@ class BinHierarchySession(abc_resource_sessions.BinHierarchySession, osid_sessio
         # osid.resource.BinHierarchySession.is_ancestor_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_ancestor_of_catalog(id_=id_, catalog_id=bin_id)
-        return self._hierarchy_session.is_ancestor(id_=id_, ancestor_id=bin_id)
+        return self._hierarchy_session.is_ancestor(id_=bin_id, ancestor_id=id_)
 
     @utilities.arguments_not_none
     def has_child_bins(self, bin_id):
@@ -3091,7 +3081,7 @@ class BinHierarchySession(abc_resource_sessions.BinHierarchySession, osid_sessio
         # osid.resource.BinHierarchySession.is_descendant_of_bin
         if self._catalog_session is not None:
             return self._catalog_session.is_descendant_of_catalog(id_=id_, catalog_id=bin_id)
-        return self._hierarchy_session.is_descendant(id_=id_, descendant_id=bin_id)
+        return self._hierarchy_session.is_descendant(id_=bin_id, descendant_id=id_)
 
     @utilities.arguments_not_none
     def get_bin_node_ids(self, bin_id, ancestor_levels, descendant_levels, include_siblings):
@@ -10,9 +10,17 @@ import json
 import datetime
 import keyword
 
-from threading import Thread
+from collections import OrderedDict
+
+from threading import RLock, Thread
 from pymongo import MongoClient, ASCENDING, DESCENDING
 from pymongo.errors import OperationFailure as PyMongoOperationFailed
+try:
+    from pymongo import ReplaceOne, UpdateOne
+except ImportError:
+    # pymongo 2
+    ReplaceOne = None
+    UpdateOne = None
 from bson import ObjectId
 from bson.timestamp import Timestamp
 from bson.errors import InvalidId
@@ -25,6 +33,12 @@ from dlkit.primordium.type.primitives import Type
 from importlib import import_module
 
 from . import JSON_CLIENT
+from . import MONGO_LISTENER
+from .document_caches import ALIAS_CACHE, CATALOG_CACHE, CATALOG_COLLECTIONS, CATALOG_TTL, DOCUMENT_CACHE,\
+    MISSING_DOCUMENT_KEY, split_id_term
+from .hierarchy_caches import DESCENDANT_CACHE, HIERARCHY_SNAPSHOTS, get_materialized_fields
+from .cursors import DocumentCursor, DirectorySource, IndexedDirectorySource, StoreSource, project_document
+from .query_compiler import compile_query
 
 from . import types
 PHANTOM_ROOT_IDENTIFIER = '000000000000000000000000'
@@ -101,6 +115,33 @@ class ListFiller(object):
         return self._data
 
 
+class BatchedObjectMaps(object):
+    """Streams the stored maps for a list of object ids, in the order given.
+
+    The ids are read one ``$in`` query per ``batch_size`` ids, when
+    iteration reaches them, so only one batch of maps is held at a time.
+    ``query`` turns a list of ids into the query for that batch.
+
+    """
+    def __init__(self, collection, query, object_ids, batch_size):
+        self._collection = collection
+        self._query = query
+        self._object_ids = object_ids
+        self._batch_size = batch_size
+
+    def __iter__(self):
+        for start in range(0, len(self._object_ids), self._batch_size):
+            batch = self._object_ids[start:start + self._batch_size]
+            object_maps = dict((str(object_map['_id']), object_map)
+                               for object_map in self._collection.find(self._query(list(set(batch)))))
+            for object_id in batch:
+                if str(object_id) in object_maps:
+                    yield object_maps[str(object_id)]
+
+    def count(self, *args):
+        return len(self._object_ids)
+
+
 # These helper methods are for the Filesystem impl
 def clean_up_datetime(obj_map):
     """convert datetime objects to dictionaries for storage"""
@@ -236,105 +277,13 @@ def is_string(string_):
 
 
 def query_is_match(query, contents):
-    num_keys = len(list(query.keys()))
-    num_matches = 0
-    for key, value in query.items():
-        if key == '_id' and isinstance(value, ObjectId):
-            value = str(value)
-
-        if isinstance(value, dict) and list(value.keys())[0] in ['$in', '$nin']:
-            value_key = list(value.keys())[0]
-
-            mod_value = value[value_key]
-            matches_already_calculated = False
-            if isinstance(value[value_key], list) and len(value[value_key]) > 0:
-                if isinstance(value[value_key][0], ObjectId):
-                    mod_value = [str(v) for v in value[value_key]]
-                elif isinstance(value[value_key][0], re._pattern_type):
-                    # then we need to do a regex comparison on the content value
-                    regex = value[value_key][0]
-                    if '.' in key:
-                        # assume two levels deep?
-                        haystack = contents[key.split('.')[0]][key.split('.')[1]]
-                    else:
-                        haystack = contents[key]
-                    regex_key = list(value.keys())[0]
-                    if regex_key == '$in':
-                        if regex.search(haystack):
-                            num_matches += 1
-                    elif regex_key == '$nin':
-                        if regex.search(haystack) is None:
-                            num_matches += 1
-                    matches_already_calculated = True
-
-            if not matches_already_calculated:
-                if '.' in key:
-                    key_chain = key.split('.')
-                    # assume only two levels deep for most basic use cases...
-                    if key_chain[0] in contents:
-                        sub_content = contents[key_chain[0]]
-                        if isinstance(sub_content, list):
-                            if not isinstance(key_chain[1], int):
-                                for ele in sub_content:
-                                    test_case = ele
-                                    test_key = key_chain[1]
-
-                                    if any(v2 in test_case[test_key] for v2 in mod_value):
-                                        num_matches += 1
-                            else:
-                                test_case = sub_content[key_chain[1]]
-                                test_key = key_chain[2]
-
-                                if any(v2 in test_case[test_key] for v2 in mod_value):
-                                    num_matches += 1
-                        else:
-                            test_case = sub_content
-                            test_key = key_chain[1]
-
-                            if test_case is not None and any(v2 in test_case[test_key] for v2 in mod_value):
-                                num_matches += 1
-                else:
-                    if key in contents and any(v2 in contents[key] for v2 in mod_value):
-                        num_matches += 1
-            else:
-                if key in contents and any(v2 in contents[key] for v2 in mod_value):
-                    num_matches += 1
-        elif '.' in key:
-            key_chain = key.split('.')
-            # assume only two levels deep for most basic use cases...
-            if '_id' in key_chain:
-                value = str(value)
-            if key_chain[0] in contents:
-                sub_content = contents[key_chain[0]]
-                if isinstance(sub_content, list):
-                    if not isinstance(key_chain[1], int):
-                        for ele in sub_content:
-                            test_case = ele
-                            test_key = key_chain[1]
-
-                            if test_case[test_key] == value:
-                                num_matches += 1
-                    else:
-                        test_case = sub_content[key_chain[1]]
-                        test_key = key_chain[2]
+    """Tests if a stored document matches a MongoDB-style query.
 
-                        if test_case[test_key] == value:
-                            num_matches += 1
-                else:
-                    test_case = sub_content
-                    test_key = key_chain[1]
-
-                    if test_case is not None and test_case[test_key] == value:
-                        num_matches += 1
-        elif (key in contents and
-              isinstance(contents[key], list) and
-              is_string(value)):
-            if key in contents and value in contents[key]:
-                num_matches += 1
-        else:
-            if key in contents and contents[key] == value:
-                num_matches += 1
-    return num_keys == num_matches
+    To match many documents against one query, use ``compile_query()``
+    and call the result instead.
+
+    """
+    return compile_query(query)(contents)
 
 
 def splice_and_query(query):
@@ -348,17 +297,31 @@ def splice_and_query(query):
 # =======================================
 
 
+def get_configuration_snapshot(runtime):
+    """Gets the configuration snapshot of a runtime.
+
+    Runtimes without ``get_configuration_snapshot()`` fall back to the
+    snapshot kept by the ``Configuration`` of their value retrieval
+    session.
+
+    """
+    try:
+        return runtime.get_configuration_snapshot()
+    except AttributeError:
+        return runtime.get_configuration().get_configuration().get_snapshot()
+
+
 def set_json_client(runtime):
     # Default impl is MongoDB, but need to check if using Filesystem
     try:
-        use_filesystem_param_id = Id('parameter:useFilesystem@json')
-        use_filesystem = runtime.get_configuration().get_value_by_parameter(use_filesystem_param_id).get_boolean_value()
+        use_filesystem = get_configuration_snapshot(runtime).get_boolean_value(
+            'parameter:useFilesystem@json')
         if not use_filesystem:
             raise AttributeError()
     except (AttributeError, KeyError, NotFound):
         try:
-            mongo_host_param_id = Id('parameter:mongoHostURI@json')
-            mongo_host = runtime.get_configuration().get_value_by_parameter(mongo_host_param_id).get_string_value()
+            mongo_host = get_configuration_snapshot(runtime).get_string_value(
+                'parameter:mongoHostURI@json')
         except (AttributeError, KeyError, NotFound):
             JSON_CLIENT.set_json_client(MongoClient())
         else:
@@ -367,64 +330,374 @@ def set_json_client(runtime):
         JSON_CLIENT.set_json_client(True)
 
 
-class JSONClientValidated(object):
-    """automatically validates the insert_one, find_one, and delete_one methods"""
-    def __init__(self, db, collection=None, runtime=None):
-        if not JSON_CLIENT.is_json_client_set() and runtime is not None:
-            set_json_client(runtime)
+def _get_configuration_key(runtime):
+    """Gets the cache key of the configuration backing a runtime, or None"""
+    try:
+        return runtime.get_configuration_key()
+    except AttributeError:
+        return None
+
+
+class JSONClientHandle(object):
+    """Resolved storage settings for one (configuration, db, collection)"""
+    def __init__(self, json_impl, cursor=None, mc=None, json_client=None, index_count=0, index=None,
+                 store=None, cache=None, cache_namespace=None, cache_ttl=None, namespace=None):
+        self.json_impl = json_impl
+        self.cursor = cursor
+        self.mc = mc
+        self.json_client = json_client
+        self.index_count = index_count
+        self.index = index
+        self.store = store
+        self.cache = cache
+        self.cache_namespace = cache_namespace
+        self.cache_ttl = cache_ttl
+        self.namespace = namespace  # with the db prefix, as MongoDB reports it
+
+
+class JSONClientRegistry(object):
+    """Process-wide registry of resolved JSONClientValidated handles.
+
+    The runtime configuration for a given configuration key is read only
+    once, and Mongo indexes listed in ``indexes@json`` are only created
+    once per client connection, instead of on every
+    ``JSONClientValidated`` construction.
+
+    Runtimes that cannot report a configuration key are resolved on
+    every construction, as before. Databases or collections dropped
+    outside of dlkit should be reported with ``invalidate_database()``
+    or ``invalidate_collection()`` so their indexes get created again.
+
+    Once a MongoDB runtime sets ``invalidateCacheFromOplog@json``, the
+    caches handed to ``register_oplog_cache()``, ``DESCENDANT_CACHE`` and
+    ``HIERARCHY_SNAPSHOTS``, are invalidated by the ``MongoListener``.
 
-        self._json_impl = 'mongo'
+    """
+    # number of parameter lookups an uncached construction would do
+    FILESYSTEM_CONFIG_LOOKUPS = 4
+    MONGO_CONFIG_LOOKUPS = 3
+    MAX_CONFIGURATIONS = 256
+
+    def __init__(self):
+        self._lock = RLock()
+        self._configs = OrderedDict()
+        self._handles = {}
+        self._indexed_fields = {}
+        self._oplog_caches = [DESCENDANT_CACHE, HIERARCHY_SNAPSHOTS]
+        self._listening_to_oplog = False
+        self._stats = dict()
+        self.reset_stats()
+
+    def reset_stats(self):
+        """Resets all the counters to zero"""
+        self._stats = {
+            'handles_created': 0,
+            'handle_hits': 0,
+            'config_lookups_saved': 0,
+            'index_round_trips': 0,
+            'index_round_trips_saved': 0,
+        }
+
+    def get_stats(self):
+        """Returns a copy of the counters"""
+        return dict(self._stats)
+
+    def clear(self):
+        """Forgets all resolved configurations, handles and created indexes"""
+        with self._lock:
+            self._configs = OrderedDict()
+            self._handles = {}
+            self._indexed_fields = {}
+
+    def invalidate_collection(self, db_name, collection):
+        """Forgets the indexes created on a (prefixed) db collection"""
+        with self._lock:
+            for client_key in self._indexed_fields:
+                self._indexed_fields[client_key][1].difference_update(
+                    [k for k in self._indexed_fields[client_key][1]
+                     if k[0] == db_name and k[1] == collection])
+            self._drop_handles(db_name, collection)
+            DOCUMENT_CACHE.invalidate_namespace('{0}.{1}'.format(db_name, collection))
+            CATALOG_CACHE.invalidate_namespace('{0}.{1}'.format(db_name, collection))
+            ALIAS_CACHE.invalidate_namespace('{0}.{1}'.format(db_name, collection))
+            DESCENDANT_CACHE.invalidate_storage('{0}.{1}'.format(db_name, collection))
+            HIERARCHY_SNAPSHOTS.invalidate_storage('{0}.{1}'.format(db_name, collection))
+
+    def invalidate_database(self, db_name):
+        """Forgets the indexes created anywhere in a (prefixed) db"""
+        with self._lock:
+            for client_key in self._indexed_fields:
+                self._indexed_fields[client_key][1].difference_update(
+                    [k for k in self._indexed_fields[client_key][1] if k[0] == db_name])
+            self._drop_handles(db_name)
+            DOCUMENT_CACHE.invalidate_database(db_name)
+            CATALOG_CACHE.invalidate_database(db_name)
+            ALIAS_CACHE.invalidate_database(db_name)
+            DESCENDANT_CACHE.invalidate_storage(db_name)
+            HIERARCHY_SNAPSHOTS.invalidate_storage(db_name)
+
+    def _drop_handles(self, db_name, collection=None):
+        for handle_key in list(self._handles):
+            handle = self._handles[handle_key]
+            if handle.json_impl == 'mongo' and handle_key[2] is not None:
+                if handle.mc.database.name == db_name and collection in (None, handle_key[2]):
+                    del self._handles[handle_key]
+
+    def register_oplog_cache(self, cache):
+        """Has the ``MongoListener`` invalidate a cache, i.e. anything with a
+        ``listen_to_oplog(listener, runtime)`` method, once oplog
+        invalidation is configured"""
+        with self._lock:
+            if cache not in self._oplog_caches:
+                self._oplog_caches.append(cache)
+            if self._listening_to_oplog:
+                cache.listen_to_oplog(MONGO_LISTENER)
+
+    def _listen_to_oplog(self, runtime):
+        with self._lock:
+            self._listening_to_oplog = True
+            for cache in self._oplog_caches:
+                cache.listen_to_oplog(MONGO_LISTENER, runtime)
+
+    def _evict(self, config_key):
+        del self._configs[config_key]
+        for handle_key in [k for k in self._handles if k[0] == config_key]:
+            del self._handles[handle_key]
+
+    def _resolve_config(self, runtime):
+        settings = {
+            'use_filesystem': False,
+            'use_filesystem_indexes': False,
+            'filesystem_engine': 'files',
+            'memory_snapshot': False,
+            'data_store_path': None,
+            'db_prefix': '',
+            'indexes': {},
+            'cached_collections': {},
+            'invalidate_cache_from_oplog': False,
+            'catalog_cache_ttl': CATALOG_TTL,
+            'materialize_ancestry': False
+        }
         try:
-            use_filesystem_param_id = Id('parameter:useFilesystem@json')
-            use_filesystem = runtime.get_configuration().get_value_by_parameter(use_filesystem_param_id).get_boolean_value()
-            if not use_filesystem:
-                raise AttributeError()
+            settings['use_filesystem'] = get_configuration_snapshot(runtime).get_boolean_value(
+                'parameter:useFilesystem@json')
         except (AttributeError, KeyError, NotFound):
             pass
-        else:
-            self._json_impl = 'filesystem'
+        try:
+            settings['use_filesystem_indexes'] = get_configuration_snapshot(runtime).get_boolean_value(
+                'parameter:useFilesystemIndexes@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['filesystem_engine'] = get_configuration_snapshot(runtime).get_string_value(
+                'parameter:filesystemEngine@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['memory_snapshot'] = get_configuration_snapshot(runtime).get_boolean_value(
+                'parameter:memorySnapshot@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['data_store_path'] = get_configuration_snapshot(runtime).get_string_value(
+                'parameter:dataStorePath@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['db_prefix'] = get_configuration_snapshot(runtime).get_string_value(
+                'parameter:mongoDBNamePrefix@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['indexes'] = get_configuration_snapshot(runtime).get_object_value(
+                'parameter:indexes@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            cached_collections = get_configuration_snapshot(runtime).get_object_value(
+                'parameter:cachedCollections@json')
+            # a list of namespaces, or a map of namespaces to their ttl in seconds
+            if isinstance(cached_collections, dict):
+                settings['cached_collections'] = dict(cached_collections)
+            else:
+                settings['cached_collections'] = dict((namespace, None) for namespace in cached_collections)
+        except (AttributeError, KeyError, NotFound, TypeError):
+            pass
+        try:
+            settings['invalidate_cache_from_oplog'] = get_configuration_snapshot(runtime).get_boolean_value(
+                'parameter:invalidateCacheFromOplog@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['catalog_cache_ttl'] = get_configuration_snapshot(runtime).get_integer_value(
+                'parameter:catalogCacheTTL@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        try:
+            settings['materialize_ancestry'] = get_configuration_snapshot(runtime).get_boolean_value(
+                'parameter:materializeCatalogAncestry@json')
+        except (AttributeError, KeyError, NotFound):
+            pass
+        return settings
 
-        if self._impl('filesystem'):
-            host_path = PROJECT_PATH
-            try:
-                host_path_param_id = Id('parameter:dataStorePath@json')
-                if BOOTLOADER:
-                    host_path = '{0}/{1}'.format(host_path,
-                                                 runtime.get_configuration().get_value_by_parameter(host_path_param_id).get_string_value())
+    def _get_config(self, config_key, runtime):
+        """Returns the json settings for a runtime, resolving them once"""
+        if config_key is None:
+            return self._resolve_config(runtime)
+        try:
+            settings = self._configs[config_key]
+        except KeyError:
+            settings = self._resolve_config(runtime)
+            self._configs[config_key] = settings
+            if len(self._configs) > self.MAX_CONFIGURATIONS:
+                self._evict(next(iter(self._configs)))
+        return settings
+
+    def _create_indexes(self, json_client, mc, db_name, collection, fields):
+        """Creates each configured index once per client connection"""
+        client_key = id(json_client)
+        if (client_key not in self._indexed_fields or
+                self._indexed_fields[client_key][0] is not json_client):
+            # keep the client itself, so its id() is not reused
+            self._indexed_fields[client_key] = (json_client, set())
+        indexed_fields = self._indexed_fields[client_key][1]
+        for field in fields:
+            index_key = (db_name, collection, str(field))
+            if index_key in indexed_fields:
+                self._stats['index_round_trips_saved'] += 1
+            else:
+                mc.create_index(field)
+                indexed_fields.add(index_key)
+                self._stats['index_round_trips'] += 1
+
+    def get_handle(self, db, collection=None, runtime=None):
+        """Gets the resolved handle for a db / collection under a runtime"""
+        with self._lock:
+            if not JSON_CLIENT.is_json_client_set() and runtime is not None:
+                set_json_client(runtime)
+            config_key = _get_configuration_key(runtime)
+            handle_key = (config_key, db, collection)
+            handle = None
+            if config_key is not None:
+                handle = self._handles.get(handle_key)
+            if handle is not None:
+                if handle.json_impl != 'mongo':
+                    self._stats['handle_hits'] += 1
+                    self._stats['config_lookups_saved'] += self.FILESYSTEM_CONFIG_LOOKUPS
+                    if handle.json_impl == 'filesystem' and not os.path.isdir(handle.cursor):
+                        os.makedirs(handle.cursor)
+                    return handle
+                if handle.json_client is JSON_CLIENT.json_client:
+                    self._stats['handle_hits'] += 1
+                    self._stats['config_lookups_saved'] += self.MONGO_CONFIG_LOOKUPS
+                    self._stats['index_round_trips_saved'] += handle.index_count
+                    return handle
+                # the client has been replaced since, so resolve again
+
+            settings = self._get_config(config_key, runtime)
+            if settings['use_filesystem']:
+                host_path = PROJECT_PATH
+                if settings['data_store_path'] is not None:
+                    if BOOTLOADER:
+                        host_path = '{0}/{1}'.format(host_path, settings['data_store_path'])
+                    else:
+                        host_path = settings['data_store_path']
+                if collection is None:
+                    cursor = '{}/{}'.format(host_path, db)
+                else:
+                    cursor = '{}/{}/{}'.format(host_path, db, collection)
+
+                engine = settings['filesystem_engine']
+                if engine != 'memory' or collection is None:
+                    # memory stores only touch the disk for snapshots
+                    if not os.path.isdir(cursor):
+                        os.makedirs(cursor)
+                if engine in ['segment', 'memory'] and collection is not None:
+                    from .document_stores import get_document_store
+                    handle = JSONClientHandle(engine,
+                                              cursor=cursor,
+                                              store=get_document_store(engine,
+                                                                       cursor,
+                                                                       snapshot=settings['memory_snapshot']))
                 else:
-                    host_path = runtime.get_configuration().get_value_by_parameter(host_path_param_id).get_string_value()
-            except (AttributeError, KeyError, NotFound):
-                pass
-            if collection is None:
-                self._cursor = '{}/{}'.format(host_path, db)
+                    index = None
+                    if settings['use_filesystem_indexes'] and collection is not None:
+                        from .collection_indexes import get_filesystem_index
+                        index = get_filesystem_index(cursor)
+                    handle = JSONClientHandle('filesystem', cursor=cursor, index=index)
             else:
-                self._cursor = '{}/{}/{}'.format(host_path, db, collection)
+                # use MongoDB as default
+                json_client = JSON_CLIENT.json_client
+                db_name = settings['db_prefix'] + db
+                index_fields = []
+                if collection is None:
+                    mc = json_client[db_name]
+                else:
+                    mc = json_client[db_name][collection]
+                    # add the collection index, if available in the configs
+                    namespace = '{0}.{1}'.format(db, collection)
+                    try:
+                        if namespace in settings['indexes']:
+                            index_fields = list(settings['indexes'][namespace])
+                    except TypeError:
+                        pass
+                    if settings['materialize_ancestry']:
+                        index_fields += [field for field in get_materialized_fields(db, collection)
+                                         if field not in index_fields]
+                    self._create_indexes(json_client, mc, db_name, collection, index_fields)
+                handle = JSONClientHandle('mongo',
+                                          mc=mc,
+                                          json_client=json_client,
+                                          index_count=len(index_fields))
+            if collection is not None:
+                handle.namespace = '{0}{1}.{2}'.format(settings['db_prefix'], db, collection)
+                if handle.json_impl == 'mongo':
+                    handle.cache_namespace = handle.namespace
+                else:
+                    handle.cache_namespace = os.path.abspath(handle.cursor)
+            namespace = '{0}.{1}'.format(db, collection)
+            if collection is not None and namespace in settings['cached_collections']:
+                handle.cache = DOCUMENT_CACHE
+                handle.cache_ttl = settings['cached_collections'][namespace]
+            elif (db, collection) in CATALOG_COLLECTIONS and settings['catalog_cache_ttl']:
+                handle.cache = CATALOG_CACHE
+                handle.cache_ttl = settings['catalog_cache_ttl']
+            if (handle.cache is not None and handle.json_impl == 'mongo' and
+                    settings['invalidate_cache_from_oplog']):
+                handle.cache.listen_to_oplog(MONGO_LISTENER, runtime)
+            if handle.json_impl == 'mongo' and settings['invalidate_cache_from_oplog']:
+                self._listen_to_oplog(runtime)
+            if config_key is not None:
+                self._handles[handle_key] = handle
+                self._configs[config_key] = self._configs.pop(config_key)  # most recently used
+            self._stats['handles_created'] += 1
+            return handle
+
+
+JSON_CLIENT_REGISTRY = JSONClientRegistry()
+
+
+def register_oplog_cache(cache):
+    """Has the ``MongoListener`` invalidate a cache under runtimes that set
+    ``invalidateCacheFromOplog@json``"""
+    JSON_CLIENT_REGISTRY.register_oplog_cache(cache)
 
-            if not os.path.isdir(self._cursor):
-                os.makedirs(self._cursor)
-        else:
-            # use MongoDB as default
-            db_prefix = ''
-            try:
-                db_prefix_param_id = Id('parameter:mongoDBNamePrefix@json')
-                db_prefix = runtime.get_configuration().get_value_by_parameter(db_prefix_param_id).get_string_value()
-            except (AttributeError, KeyError, NotFound):
-                pass
 
-            if collection is None:
-                self._mc = JSON_CLIENT.json_client[db_prefix + db]
-            else:
-                self._mc = JSON_CLIENT.json_client[db_prefix + db][collection]
-                # add the collection index, if available in the configs
-                try:
-                    mongo_indexes_param_id = Id('parameter:indexes@json')
-                    mongo_indexes = runtime.get_configuration().get_value_by_parameter(mongo_indexes_param_id).get_object_value()
-                    namespace = '{0}.{1}'.format(db, collection)
-                    if namespace in mongo_indexes:
-                        for field in mongo_indexes[namespace]:
-                            self._mc.create_index(field)
-                except (AttributeError, KeyError, NotFound):
-                    pass
+class JSONClientValidated(object):
+    """automatically validates the insert_one, find_one, and delete_one methods"""
+    def __init__(self, db, collection=None, runtime=None):
+        handle = JSON_CLIENT_REGISTRY.get_handle(db, collection=collection, runtime=runtime)
+        self._json_impl = handle.json_impl
+        self._store = handle.store
+        self._cache = handle.cache
+        self._cache_namespace = handle.cache_namespace
+        self._cache_ttl = handle.cache_ttl
+        self._namespace = handle.namespace
+        if self._impl('mongo'):
+            self._mc = handle.mc
+        else:
+            self._cursor = handle.cursor
+            self._index = handle.index
 
     @staticmethod
     def _get_file_contents_as_json(file_path):
@@ -444,8 +717,95 @@ class JSONClientValidated(object):
 
     @staticmethod
     def _save_dict_as_json_file(file_path, dict):
-        with codecs.open(file_path, 'wb', encoding='utf-8') as output_file:
+        # write to a temporary file and rename it into place, so readers
+        # never see a partial document and the directory mtime changes
+        tmp_path = '{0}/.{1}.tmp'.format(os.path.dirname(file_path),
+                                         os.path.basename(file_path))
+        with codecs.open(tmp_path, 'wb', encoding='utf-8') as output_file:
             output_file.write(json.dumps(dict))
+        try:
+            os.replace(tmp_path, file_path)
+        except AttributeError:
+            # python 2
+            if os.name == 'nt' and os.path.isfile(file_path):
+                os.remove(file_path)
+            os.rename(tmp_path, file_path)
+
+    def _get_target_files(self, query=None):
+        """Gets the json files that may match the query, for the Filesystem impl"""
+        if self._index is None:
+            return glob.iglob(self._cursor + '/*.json')
+        self._index.refresh()
+        if query is None:
+            return self._index.get_locations()
+        candidate_ids = self._index.get_candidate_ids(query)
+        if candidate_ids is None:
+            return self._index.get_locations()
+        return self._index.get_locations(candidate_ids)
+
+    def _record_write(self, doc, write_target, op):
+        if self._index is not None:
+            self._index.record_write(doc, write_target)
+        self._record_changes(op, [doc['_id']])
+
+    @staticmethod
+    def _prepare_for_store(doc):
+        """Converts a document to its stored form, for the Filesystem impls"""
+        try:
+            doc['_id'] = str(doc['_id'])  # to convert the ObjectID to a string
+        except KeyError:
+            doc['_id'] = str(ObjectId())
+        doc = clean_up_datetime(doc)
+        return clean_up_embedded_object_ids(doc)
+
+    @staticmethod
+    def _restore_from_store(contents):
+        contents = convert_dict_to_datetime(contents)
+        return convert_ids_to_object_ids(contents)
+
+    def _iter_store_matches(self, query=None):
+        """Yields the stored documents that match a query, for the document store impls"""
+        if query is None:
+            doc_ids = self._store.get_ids()
+            matches = None
+        else:
+            candidate_ids = self._store.get_candidate_ids(query)
+            doc_ids = self._store.get_ids(candidate_ids)
+            matches = compile_query(query)
+        for doc_id in doc_ids:
+            contents = self._store.get(doc_id)
+            if contents is not None and (matches is None or matches(contents)):
+                yield contents
+
+    def _get_document_source(self):
+        """Gets the source for a DocumentCursor, for the Filesystem impls"""
+        if self._store is not None:
+            return StoreSource(self._store)
+        if self._index is not None:
+            return IndexedDirectorySource(self._cursor, self._index)
+        return DirectorySource(self._cursor)
+
+    def _store_find_one(self, query):
+        query = self._convert_to_dict(query)
+        for contents in self._iter_store_matches(query):
+            return self._restore_from_store(contents)
+        raise NotFound(str(query) + ' returned None. Path: ' + self._cursor)
+
+    def _store_delete_one(self, query):
+        query = self._convert_to_dict(query)
+        for contents in self._iter_store_matches(query):
+            self._store.delete(contents['_id'])
+            self._record_changes('d', [contents['_id']])
+            return 1
+        raise NotFound(str(query) + ' returned None.')
+
+    def _store_save(self, doc, op):
+        doc = self._prepare_for_store(doc)
+        self._store.put(doc)
+        self._record_changes(op, [doc['_id']])
+        inserted_obj = Filler()
+        inserted_obj.inserted_id = doc['_id']
+        return inserted_obj
 
     def _validate_write(self, result):
         if self._impl('filesystem'):
@@ -463,20 +823,31 @@ class JSONClientValidated(object):
                     raise OperationFailed('Nothing saved to database.')
 
     def count(self):
+        if self._store is not None:
+            return self._store.count()
         if self._impl('filesystem'):
-            return 0
+            return self.find().count()
         return self._mc.count()
 
     def delete_one(self, query):
+        if self._store is not None:
+            return self._store_delete_one(query)
         if self._impl('filesystem'):
             # does not support datetime queries
             results = 0
             query = self._convert_to_dict(query)
-            for target_file in glob.iglob(self._cursor + '/*.json'):
-                contents = self._get_file_contents_as_json(target_file)
+            matches = compile_query(query)
+            for target_file in self._get_target_files(query):
+                try:
+                    contents = self._get_file_contents_as_json(target_file)
+                except (IOError, OSError):
+                    continue
 
-                if query_is_match(query, contents):
+                if matches(contents):
                     os.remove(target_file)
+                    if self._index is not None:
+                        self._index.record_delete(contents['_id'])
+                    self._record_changes('d', [contents['_id']])
                     results += 1
                     break
 
@@ -485,6 +856,13 @@ class JSONClientValidated(object):
             return results
 
         # Mongo impl as default
+        doc_id, other_terms = split_id_term(self._convert_to_dict(query))
+        if doc_id is None and MONGO_LISTENER.local_changes is not None and \
+                self._namespace in MONGO_LISTENER.receivers:
+            # local notification receivers need the _id
+            deleted = self._mc.find_one(query, {'_id': True})
+            if deleted is not None:
+                doc_id = deleted['_id']
         try:
             result = self._mc.delete_one(query)
         except TypeError:
@@ -493,79 +871,116 @@ class JSONClientValidated(object):
                 returned_object = result
                 result = Filler()
                 result.deleted_count = returned_object['n']
+        if result is not None and result.deleted_count:
+            self._record_changes('d', None if doc_id is None else [doc_id])
         if result is None or result.deleted_count == 0:
             raise NotFound(str(query) + ' returned None.')
         return result
 
-    def find(self, query=None):
-        if self._impl('filesystem'):
-            # does not support datetime finding
-            results = []
-            if query is None:
-                for target_file in glob.iglob(self._cursor + '/*.json'):
-                    results.append(self._get_file_contents_as_json(target_file))
-            else:
+    def find(self, query=None, projection=None):
+        """Finds documents. ``projection`` is a MongoDB-style projection,
+        i.e. a list of field names or a ``{field: bool}`` dict"""
+        if not self._impl('mongo'):
+            # a lazy cursor, that matches against the stored documents
+            if query is not None:
                 query = self._convert_to_dict(query)
-                query = splice_and_query(query)
-                if '_id' in list(query.keys()) and not isinstance(query['_id'], dict):
-                    potential_file = '{0}/{1}.json'.format(self._cursor,
-                                                           query['_id'])
-                    if os.path.isfile(potential_file):
-                        del query['_id']
-                        contents = self._get_file_contents_as_json(potential_file)
-                        if query_is_match(query, contents):
-                            contents = convert_dict_to_datetime(contents)
-                            contents = convert_ids_to_object_ids(contents)
-                            results.append(contents)
-                elif '_id' in query:
-                    if '$in' in query['_id']:
-                        for query_id in query['_id']['$in']:
-                            potential_file = '{0}/{1}.json'.format(self._cursor,
-                                                                   query_id)
-                            if os.path.isfile(potential_file):
-                                contents = self._get_file_contents_as_json(potential_file)
-                                if query_is_match(query, contents):
-                                    contents = convert_dict_to_datetime(contents)
-                                    contents = convert_ids_to_object_ids(contents)
-                                    results.append(contents)
-                    else:
-                        # not match
-                        pass
-                else:
-                    for target_file in glob.iglob(self._cursor + '/*.json'):
-                        contents = self._get_file_contents_as_json(target_file)
-
-                        if query_is_match(query, contents):
-                            contents = convert_dict_to_datetime(contents)
-                            contents = convert_ids_to_object_ids(contents)
-                            results.append(contents)
-
-            results = ListFiller(results)
-            return results
+            return DocumentCursor(self._get_document_source(),
+                                  query,
+                                  restore=self._restore_from_store,
+                                  projection=projection)
 
         # Mongo impl as default
         if query is None:
-            return self._mc.find()
-        else:
+            query = {}
+        if projection is None:
             return self._mc.find(query)
+        else:
+            return self._mc.find(query, projection)
+
+    def _get_cache_key(self, doc_id):
+        if self._impl('mongo'):
+            # ObjectId('...') and '...' are different _ids in MongoDB
+            return doc_id
+        return str(doc_id)
+
+    def _record_changes(self, op, doc_ids=None):
+        """Drops written documents from the document cache, and replays
+        them to notification receivers when there is no change stream.
+
+        ``op`` is the oplog op code, i.e. ``'i'``, ``'u'`` or ``'d'``. No
+        ``doc_ids`` means any document may have changed.
+
+        """
+        if self._cache is not None:
+            if doc_ids is None:
+                self._cache.invalidate_namespace(self._cache_namespace)
+            else:
+                self._cache.invalidate(self._cache_namespace,
+                                       [self._get_cache_key(doc_id) for doc_id in doc_ids])
+        if doc_ids is not None:
+            MONGO_LISTENER.publish_local(self._namespace, op, doc_ids)
+
+    def _find_one_cached(self, query):
+        """Gets a document by ``_id`` through the document cache.
+
+        The whole document is cached, and any other terms of the query
+        are matched against it here.
+
+        """
+        doc_id, other_terms = split_id_term(query)
+        matches = None
+        try:
+            if other_terms:
+                matches = compile_query(other_terms)
+        except OperationFailed:
+            doc_id = None
+        if doc_id is None:
+            return self._find_one(query)
+        cache_key = self._get_cache_key(doc_id)
+        result = self._cache.get(self._cache_namespace, cache_key)
+        if result is None:
+            generation = self._cache.get_generation(self._cache_namespace)
+            try:
+                result = self._find_one({'_id': doc_id})
+            except NotFound:
+                self._cache.put(self._cache_namespace, cache_key, {MISSING_DOCUMENT_KEY: True},
+                                ttl=self._cache_ttl, generation=generation)
+                raise
+            self._cache.put(self._cache_namespace, cache_key, result,
+                            ttl=self._cache_ttl, generation=generation)
+        elif MISSING_DOCUMENT_KEY in result:
+            raise NotFound(str(query) + ' returned None.')
+        if matches is not None and not matches(clean_up_embedded_object_ids(clean_up_datetime(result))):
+            raise NotFound(str(query) + ' returned None.')
+        return result
+
+    def find_one(self, query, projection=None):
+        if self._cache is not None and projection is None:
+            return self._find_one_cached(self._convert_to_dict(query))
+        return self._find_one(query, projection)
 
-    def find_one(self, query):
+    def _find_one(self, query, projection=None):
+        if projection is not None and not self._impl('mongo'):
+            return project_document(self._find_one(query), projection)
+        if self._store is not None:
+            return self._store_find_one(query)
         if self._impl('filesystem'):
-            # does not support datetime finding
             results = None
             query = self._convert_to_dict(query)
-            query = splice_and_query(query)
-            if '_id' in list(query.keys()) or 'question._id' in query.keys():
-                if '_id' in list(query.keys()):
+            spliced_query = splice_and_query(query)
+            if '_id' in spliced_query or 'question._id' in spliced_query:
+                if '_id' in spliced_query:
                     id_key = '_id'
                 else:
                     id_key = 'question._id'
                 potential_file = '{0}/{1}.json'.format(self._cursor,
-                                                       query[id_key])
+                                                       spliced_query[id_key])
                 if os.path.isfile(potential_file):
-                    del query[id_key]
+                    # the file name already matches the id term
+                    matches = compile_query(dict((key, value) for key, value in spliced_query.items()
+                                                 if key != id_key))
                     contents = self._get_file_contents_as_json(potential_file)
-                    if query_is_match(query, contents):
+                    if matches(contents):
                         contents = convert_dict_to_datetime(contents)
                         contents = convert_ids_to_object_ids(contents)
                         results = contents
@@ -573,10 +988,11 @@ class JSONClientValidated(object):
                     raise NotFound(str(query) + ' returned None. Path: ' + self._cursor)
 
             if results is None:
-                for target_file in glob.iglob(self._cursor + '/*.json'):
+                matches = compile_query(query)
+                for target_file in self._get_target_files(query):
                     contents = self._get_file_contents_as_json(target_file)
 
-                    if query_is_match(query, contents):
+                    if matches(contents):
                         contents = convert_dict_to_datetime(contents)
                         contents = convert_ids_to_object_ids(contents)
                         results = contents
@@ -587,12 +1003,17 @@ class JSONClientValidated(object):
             return results
 
         # Mongo impl as default
-        result = self._mc.find_one(query)
+        if projection is None:
+            result = self._mc.find_one(query)
+        else:
+            result = self._mc.find_one(query, projection)
         if result is None:
             raise NotFound(str(query) + ' returned None.')
         return result
 
     def insert_one(self, doc):
+        if self._store is not None:
+            return self._store_save(doc, 'i')
         if self._impl('filesystem'):
             try:
                 doc['_id'] = str(doc['_id'])  # to convert the ObjectID to a string
@@ -607,6 +1028,7 @@ class JSONClientValidated(object):
             self._save_dict_as_json_file(write_target, doc)
 
             self._validate_write(write_target)
+            self._record_write(doc, write_target, 'i')
             inserted_obj = Filler()
             inserted_obj.inserted_id = doc['_id']
             return inserted_obj
@@ -622,17 +1044,155 @@ class JSONClientValidated(object):
                 result = Filler()
                 result.inserted_id = returned_object_id
         self._validate_write(result)
+        self._record_changes('i', [doc['_id']])
+        return result
+
+    def _save_files(self, docs, op):
+        """Writes stored-form documents as json files, for the Filesystem impl"""
+        for doc in docs:
+            write_target = '{}/{}.json'.format(self._cursor,
+                                               doc['_id'])
+            self._save_dict_as_json_file(write_target, doc)
+            self._validate_write(write_target)
+            self._record_write(doc, write_target, op)
+
+    def _put_many(self, docs, op):
+        """Writes several documents, for the Filesystem impls"""
+        docs = [self._prepare_for_store(doc) for doc in docs]
+        if self._store is not None:
+            self._store.put_many(docs)
+            self._record_changes(op, [doc['_id'] for doc in docs])
+        else:
+            self._save_files(docs, op)
+        inserted_obj = Filler()
+        inserted_obj.inserted_ids = [doc['_id'] for doc in docs]
+        return inserted_obj
+
+    def insert_many(self, docs):
+        """Inserts several documents in one call.
+
+        The returned result has the ``inserted_ids``, in the order of
+        ``docs``.
+
+        """
+        docs = list(docs)
+        if not self._impl('mongo'):
+            return self._put_many(docs, 'i')
+
+        # Mongo impl as default
+        if not docs:
+            inserted_obj = Filler()
+            inserted_obj.inserted_ids = []
+            return inserted_obj
+        try:
+            result = self._mc.insert_many(docs)
+        except (AttributeError, TypeError):
+            # pymongo 2.8.1
+            returned_object_ids = self._mc.insert(docs)
+            if returned_object_ids is None:
+                raise OperationFailed('Nothing saved to database.')
+            result = Filler()
+            result.inserted_ids = returned_object_ids
+        else:
+            if not result.acknowledged:
+                raise OperationFailed(str(result))
+        self._record_changes('i', result.inserted_ids)
         return result
 
+    def bulk_save(self, docs):
+        """Inserts or replaces several documents, by ``_id``, in one call"""
+        docs = list(docs)
+        if not self._impl('mongo'):
+            return self._put_many(docs, 'u')
+
+        # Mongo impl as default
+        if not docs:
+            return self.insert_many(docs)
+        for doc in docs:
+            if '_id' not in doc:
+                doc['_id'] = ObjectId()
+        if ReplaceOne is None:
+            # pymongo 2
+            for doc in docs:
+                self._validate_write(self._mc.save(doc))
+        else:
+            bulk_result = self._mc.bulk_write([ReplaceOne({'_id': doc['_id']}, doc, upsert=True)
+                                               for doc in docs])
+            if not bulk_result.acknowledged:
+                raise OperationFailed(str(bulk_result.bulk_api_result))
+        self._record_changes('u', [doc['_id'] for doc in docs])
+        result = Filler()
+        result.inserted_ids = [doc['_id'] for doc in docs]
+        return result
+
+    def bulk_set(self, updates):
+        """Sets some top-level fields of several documents in one call.
+
+        ``updates`` is a list of ``(_id, fields)`` pairs, ``fields``
+        being a dict of the new values.
+
+        """
+        updates = list(updates)
+        if not updates:
+            return
+        if not self._impl('mongo'):
+            fields_by_id = dict((str(doc_id), fields) for doc_id, fields in updates)
+            docs = list(self.find({'_id': {'$in': [doc_id for doc_id, fields in updates]}}))
+            for doc in docs:
+                doc.update(fields_by_id[str(doc['_id'])])
+            self._put_many(docs, 'u')
+            return
+
+        # Mongo impl as default
+        if UpdateOne is None:
+            # pymongo 2
+            for doc_id, fields in updates:
+                self._validate_write(self._mc.update({'_id': doc_id}, {'$set': fields}))
+        else:
+            bulk_result = self._mc.bulk_write([UpdateOne({'_id': doc_id}, {'$set': fields})
+                                               for doc_id, fields in updates])
+            if not bulk_result.acknowledged:
+                raise OperationFailed(str(bulk_result.bulk_api_result))
+        self._record_changes('u', [doc_id for doc_id, fields in updates])
+
+    def bulk_delete(self, doc_ids):
+        """Deletes several documents by ``_id``. Returns the number deleted"""
+        doc_ids = list(doc_ids)
+        if not doc_ids:
+            return 0
+        if self._store is not None:
+            results = self._store.delete_many(doc_ids)
+        elif self._impl('filesystem'):
+            results = 0
+            for doc_id in doc_ids:
+                try:
+                    os.remove('{0}/{1}.json'.format(self._cursor, doc_id))
+                except OSError:
+                    continue
+                if self._index is not None:
+                    self._index.record_delete(doc_id)
+                results += 1
+        else:
+            # Mongo impl as default
+            try:
+                results = self._mc.delete_many({'_id': {'$in': doc_ids}}).deleted_count
+            except (AttributeError, TypeError):
+                # pymongo 2
+                results = self._mc.remove({'_id': {'$in': doc_ids}})['n']
+        self._record_changes('d', doc_ids)
+        return results
+
     def raw(self):
         """ return the raw mongo client object...used for GridFS
         """
-        if self._impl('filesystem'):
+        if not self._impl('mongo'):
             return self._cursor
 
         return self._mc
 
     def save(self, doc):
+        if self._store is not None:
+            return self._store_save(doc, 'u')
         if self._impl('filesystem'):
             try:
                 doc['_id'] = str(doc['_id'])  # to convert the ObjectID to a string
@@ -647,6 +1207,7 @@ class JSONClientValidated(object):
 
             self._save_dict_as_json_file(write_target, doc)
             self._validate_write(write_target)
+            self._record_write(doc, write_target, 'u')
             inserted_obj = Filler()
             inserted_obj.inserted_id = doc['_id']
             return inserted_obj
@@ -659,6 +1220,7 @@ class JSONClientValidated(object):
             # pymongo 2
             result = self._mc.save(doc)
         self._validate_write(result)
+        self._record_changes('u', [doc['_id']])
         return result
 
 
@@ -725,13 +1287,13 @@ def get_provider_manager(osid, runtime=None, proxy=None, local=False):
     """
     if runtime is not None:
         if local:
-            parameter_id = Id('parameter:localImpl@json')
+            parameter = 'parameter:localImpl@json'
         else:
-            parameter_id = Id('parameter:' + osid.lower() + 'ProviderImpl@json')
+            parameter = 'parameter:' + osid.lower() + 'ProviderImpl@json'
         try:
             # Try to get the manager from the runtime, if available:
-            config = runtime.get_configuration()
-            impl_name = config.get_value_by_parameter(parameter_id).get_string_value()
+            config = get_configuration_snapshot(runtime)
+            impl_name = config.get_string_value(parameter)
             if proxy is None:
                 return runtime.get_manager(osid, impl_name)
             else:
@@ -810,9 +1372,8 @@ class OsidListList(list):
 def get_registry(entry, runtime):
     """Returns a record registry given an entry and runtime"""
     try:
-        records_location_param_id = Id('parameter:recordsRegistry@mongo')
-        registry = runtime.get_configuration().get_value_by_parameter(
-            records_location_param_id).get_string_value()
+        registry = get_configuration_snapshot(runtime).get_string_value(
+            'parameter:recordsRegistry@mongo')
         return import_module(registry).__dict__.get(entry, {})
     except (ImportError, AttributeError, KeyError, NotFound):
         return {}
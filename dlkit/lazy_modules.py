@@ -0,0 +1,83 @@
+"""Lazy resolution of package submodules and pass-through classes
+
+``install_lazy_module()`` swaps a module in ``sys.modules`` for a
+``LazyModule`` with the same globals, and a registry of the names it
+may resolve later: an OSID package's submodules, or the classes a
+pass-through module like ``dlkit.services.primitives`` re-exports. A
+registered name is imported on first attribute access, including
+``from <module> import <name>``, and is then set on the module, so
+later lookups are plain attribute reads.
+
+This is what a module-level ``__getattr__`` does on Python 3.7+, but
+it also works on 2.7 and 3.4+.
+
+"""
+import importlib
+import os
+import sys
+
+from types import ModuleType
+
+
+class LazyModule(ModuleType):
+    """A module that imports its registered names on first access"""
+
+    def __getattr__(self, name):
+        try:
+            path = self.__dict__['_lazy_registry'][name]
+        except KeyError:
+            raise AttributeError('module {0!r} has no attribute {1!r}'.format(self.__name__, name))
+        module_name, _, attribute = path.partition(':')
+        value = importlib.import_module(module_name)
+        if attribute:
+            value = getattr(value, attribute)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(self.__dict__['_lazy_registry']))
+
+
+def get_submodule_registry(module_name, path):
+    """Maps the names of a package's submodules to their import paths.
+
+    The package directories are listed rather than walked with
+    ``pkgutil``, which imports ``inspect``.
+
+    """
+    registry = {}
+    for directory in path:
+        for file_name in os.listdir(directory):
+            name, extension = os.path.splitext(file_name)
+            if name.startswith('_') or name.startswith('.'):
+                continue
+            if extension == '.py' or (not extension and
+                                      os.path.isfile(os.path.join(directory, file_name, '__init__.py'))):
+                registry[name] = module_name + '.' + name
+    return registry
+
+
+def install_lazy_package(module_name):
+    """Replaces a package in ``sys.modules`` with a ``LazyModule`` that
+    imports its submodules when they are first used"""
+    return install_lazy_module(module_name, get_submodule_registry(module_name, sys.modules[module_name].__path__),
+                               export=False)
+
+
+def install_lazy_module(module_name, registry, export=True):
+    """Replaces a module in ``sys.modules`` with a ``LazyModule`` that
+    resolves the ``registry`` names, each ``'module'`` or
+    ``'module:attribute'``, when they are first used.
+
+    With ``export``, the names are listed in ``__all__``, so that
+    ``from <module> import *`` still gets them.
+
+    """
+    module = sys.modules[module_name]
+    lazy_module = LazyModule(module_name, module.__doc__)
+    lazy_module.__dict__.update(module.__dict__)
+    lazy_module.__dict__['_lazy_registry'] = dict(registry)
+    if export:
+        lazy_module.__dict__['__all__'] = sorted(registry)
+    sys.modules[module_name] = lazy_module
+    return lazy_module
@@ -0,0 +1,4 @@
+"""OSID packages of dlkit.manager_impls, imported on first attribute access"""
+from dlkit import lazy_modules
+
+lazy_modules.install_lazy_package(__name__)
@@ -7,11 +7,19 @@ Can be used by implementations and consumer applications alike.
 
 from dlkit.abstract_osid.mapping import primitives as abc_mapping_primitives
 from dlkit.abstract_osid.osid.errors import NullArgument, InvalidArgument
-from dlkit.json_.utilities import is_string
 from ..osid.primitives import OsidPrimitive
 from ..type.primitives import Type
 
 
+def is_string(string_):
+    try:
+        # python 2
+        return isinstance(string_, basestring)
+    except NameError:
+        # python 3
+        return isinstance(string_, str)
+
+
 class RGBColorCoordinate(abc_mapping_primitives.Coordinate, OsidPrimitive):
     """
     A coordinate represents a position.
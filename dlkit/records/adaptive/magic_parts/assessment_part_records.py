@@ -180,7 +180,8 @@ class ScaffoldDownAssessmentPartRecord(ObjectInitRecord):
         collection = JSONClientValidated('assessment',
                                          collection='AssessmentSection',
                                          runtime=self.my_osid_object._runtime)
-        results = collection.find({"assessmentTakenId": {"$in": taken_ids}})
+        results = collection.find({"assessmentTakenId": {"$in": taken_ids}},
+                                  projection={'questions.itemId': True, '_id': False})
         for section in results:
             if 'questions' in section:
                 seen_items += [question['itemId'] for question in section['questions']]
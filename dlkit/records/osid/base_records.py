@@ -1795,9 +1795,9 @@ class FilesRecord(AssetUtils, ObjectInitRecord):
         acls = None
 
         try:
-            config = self.my_osid_object._runtime.get_configuration()
-            parameter_id = Id('parameter:bypassAuthorizationForFilesRecordAssetContentLookup@json')
-            bypass_asset_content_authorization = config.get_value_by_parameter(parameter_id).get_boolean_value()
+            config = utilities.get_configuration_snapshot(self.my_osid_object._runtime)
+            bypass_asset_content_authorization = config.get_boolean_value(
+                'parameter:bypassAuthorizationForFilesRecordAssetContentLookup@json')
         except (AttributeError, KeyError, NotFound):
             pass
 
@@ -5,6 +5,35 @@ from ..primitives import *
 from ..osid import markers as osid_markers
 import importlib
 from ..osid.objects import OsidList
+from collections import OrderedDict
+from itertools import count
+from threading import RLock
+
+
+MAX_TRACKED_MAPS = 1024
+
+_TRACKED_MAPS_LOCK = RLock()
+_TRACKED_MAPS = OrderedDict()
+_MAP_SERIALS = count(1)
+
+
+def _get_tracked_map(map_):
+    """Gets the ``[map, serial, version]`` entry of a configuration or
+    parameters map.
+
+    The entry keeps a reference to the map, so its ``id()`` cannot be
+    reused by another map while it is tracked. A map tracked again after
+    being evicted gets a new serial.
+
+    """
+    with _TRACKED_MAPS_LOCK:
+        entry = _TRACKED_MAPS.pop(id(map_), None)
+        if entry is None or entry[0] is not map_:
+            entry = [map_, next(_MAP_SERIALS), 0]
+        _TRACKED_MAPS[id(map_)] = entry  # most recently used
+        while len(_TRACKED_MAPS) > MAX_TRACKED_MAPS:
+            del _TRACKED_MAPS[next(iter(_TRACKED_MAPS))]
+        return entry
 
 
 class Parameter(abc_configuration_objects.Parameter, osid_objects.OsidRule):
@@ -675,6 +704,44 @@ class Configuration(abc_configuration_objects.Configuration, osid_objects.OsidCa
     def __init__(self, config_map):
         self._config_map = config_map
         self._identifier = config_map['id']
+        self._snapshot = None
+
+    def get_configuration_key(self):
+        """Gets a key identifying the contents of this configuration.
+
+        The key changes when the underlying configuration or parameters
+        map is replaced, when parameters are added to or removed from it,
+        and on ``mark_changed()``, so it can be used to key caches of
+        resolved parameter values.
+
+        """
+        map_entry = _get_tracked_map(self._config_map)
+        parameters = self._config_map.get('parameters')
+        if parameters is None:
+            return (self._identifier, map_entry[1], map_entry[2], None, 0)
+        return (self._identifier, map_entry[1], map_entry[2], _get_tracked_map(parameters)[1], len(parameters))
+
+    def mark_changed(self):
+        """Changes the configuration key after the map was edited in place,
+        e.g. a parameter value was replaced, so that the snapshot, nested
+        runtimes and handles resolved from the old values are not used"""
+        with _TRACKED_MAPS_LOCK:
+            _get_tracked_map(self._config_map)[2] += 1
+
+    def get_snapshot(self):
+        """Gets a ``ConfigurationSnapshot`` of the current parameter values.
+
+        A new snapshot replaces the old one when the configuration key
+        changes.
+
+        """
+        from .snapshots import ConfigurationSnapshot
+        key = self.get_configuration_key()
+        snapshot = getattr(self, '_snapshot', None)
+        if snapshot is None or snapshot.key != key:
+            snapshot = ConfigurationSnapshot(self._config_map, key=key)
+            self._snapshot = snapshot
+        return snapshot
 
     def is_registry(self):
         """Tests if this configuration is a parameter registry.
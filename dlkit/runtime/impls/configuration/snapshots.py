@@ -0,0 +1,105 @@
+"""Pre-parsed, read-only views of a configuration's parameter values
+
+``ValueRetrievalSession.get_value_by_parameter()`` walks the
+configuration map and builds new ``Value`` and ``Parameter`` objects on
+every call. A ``ConfigurationSnapshot`` resolves every parameter to its
+preferred value once, and answers lookups by parameter string, e.g.
+``'parameter:authority@json'``, from a dict.
+
+``Configuration.get_snapshot()`` keeps one snapshot per configuration
+and builds a new one when the configuration key changes, replacing the
+old one with a single assignment, so readers always see one whole
+snapshot or the other.
+
+"""
+from ..osid.osid_errors import IllegalState, NotFound, NullArgument
+from .objects import Parameter, Value
+
+
+def get_parameter_keys(parameter):
+    """Gets the keys a parameter string or ``Id`` may have in a configuration map
+
+    As in ``ValueRetrievalSession``, the ``identifier.namespace`` key is
+    preferred to the bare identifier, and the authority is not used.
+
+    """
+    if isinstance(parameter, str) or isinstance(parameter, type(u'')):
+        namespace, _, identifier = parameter.partition(':')
+        identifier = identifier.split('@')[0]
+    else:
+        namespace = parameter.get_identifier_namespace()
+        identifier = parameter.get_identifier()
+    return [identifier + '.' + namespace, identifier]
+
+
+class ConfigurationSnapshot(object):
+    """The preferred value of every parameter of a configuration, as of its creation"""
+
+    def __init__(self, config_map, key=None):
+        self.key = key
+        self._values = {}
+        for parameter_key, parameter_map in config_map.get('parameters', {}).items():
+            preferred_value_map = None
+            for value_map in parameter_map.get('values', []):
+                if preferred_value_map is None or preferred_value_map['priority'] < value_map['priority']:
+                    preferred_value_map = value_map
+            if preferred_value_map is not None:
+                self._values[parameter_key] = (parameter_map['syntax'],
+                                               preferred_value_map['value'],
+                                               Value(preferred_value_map, Parameter(parameter_map)))
+        self._resolved = {}
+
+    def _get_entry(self, parameter):
+        if parameter is None:
+            raise NullArgument()
+        is_string = isinstance(parameter, str) or isinstance(parameter, type(u''))
+        if is_string and parameter in self._resolved:
+            entry = self._resolved[parameter]
+        else:
+            entry = None
+            for parameter_key in get_parameter_keys(parameter):
+                if parameter_key in self._values:
+                    entry = self._values[parameter_key]
+                    break
+            if is_string:
+                self._resolved[parameter] = entry
+        if entry is None:
+            raise NotFound(str(parameter))
+        return entry
+
+    def _get_value(self, parameter, syntax):
+        entry = self._get_entry(parameter)
+        if entry[0] != syntax:
+            raise IllegalState()
+        return entry[1]
+
+    def has_parameter(self, parameter):
+        try:
+            self._get_entry(parameter)
+        except NotFound:
+            return False
+        return True
+
+    def get_value_by_parameter(self, parameter):
+        """Gets the preferred ``Value`` of a parameter string or ``Id``.
+
+        raise:  NotFound - no value for the parameter
+        raise:  NullArgument - ``parameter`` is ``None``
+
+        """
+        return self._get_entry(parameter)[2]
+
+    def get_boolean_value(self, parameter):
+        return self._get_value(parameter, 'BOOLEAN')
+
+    def get_integer_value(self, parameter):
+        return self._get_value(parameter, 'INTEGER')
+
+    def get_object_value(self, parameter):
+        return self._get_value(parameter, 'OBJECT')
+
+    def get_string_value(self, parameter):
+        return self._get_value(parameter, 'STRING')
+
+    def get_type_value(self, parameter):
+        return self._get_value(parameter, 'TYPE')
@@ -1,15 +1,55 @@
 """
 This module containg the OSID RuntimeManager class implementation for Django
+
+Managers are loaded in nested runtimes, one per implementation
+configuration in ``configs``. Those runtimes are shared process-wide,
+keyed by configuration key, so the provider managers each one caches
+are loaded once, and the manager classes of ``MANAGER_PATHS`` are
+imported on first use and then kept in ``_MANAGER_CLASSES``.
+``Runtime.invalidate_managers()`` drops them, e.g. after a test swaps an
+implementation's configuration.
+
 """
 import importlib
+from collections import OrderedDict
+from threading import RLock
+
 from .impls.osid.managers import OsidRuntimeManager
 from .impls.configuration.objects import Configuration
 from .impls.configuration.sessions import ValueRetrievalSession
-from .impls.primitives import Id
 from . import configs
 from .registry import MANAGER_PATHS
 NO_PROXY = 0
 PROXY = 1
+MAX_NESTED_RUNTIMES = 100
+
+_LOCK = RLock()
+_NESTED_RUNTIMES = OrderedDict()
+_MANAGER_CLASSES = {}
+
+
+def _get_manager_class(impl_key, osid, proxy_key):
+    """Gets the manager class registered in ``MANAGER_PATHS``, importing its module on first use"""
+    class_key = (impl_key, osid, proxy_key)
+    if class_key not in _MANAGER_CLASSES:
+        manager_path = MANAGER_PATHS[impl_key][osid][proxy_key]
+        module = importlib.import_module('.'.join(manager_path.split('.')[:-1]))
+        _MANAGER_CLASSES[class_key] = getattr(module, manager_path.split('.')[-1])
+    return _MANAGER_CLASSES[class_key]
+
+
+def _get_nested_runtime(implementation):
+    """Gets the shared runtime for an implementation configuration in ``configs``"""
+    configuration = Configuration(getattr(configs, implementation))
+    runtime_key = (implementation, configuration.get_configuration_key())
+    with _LOCK:
+        if runtime_key in _NESTED_RUNTIMES:
+            _NESTED_RUNTIMES[runtime_key] = _NESTED_RUNTIMES.pop(runtime_key)  # most recently used
+        else:
+            _NESTED_RUNTIMES[runtime_key] = Runtime(configuration)
+            while len(_NESTED_RUNTIMES) > MAX_NESTED_RUNTIMES:
+                del _NESTED_RUNTIMES[next(iter(_NESTED_RUNTIMES))]
+        return _NESTED_RUNTIMES[runtime_key]
 
 
 class Runtime(OsidRuntimeManager):
@@ -23,6 +63,13 @@ class Runtime(OsidRuntimeManager):
         self._proxy_managers = {}
 
     def get_service_manager(self, osid, implementation='SERVICE', proxy=None, version=[3, 0, 0]):
+        """Gets a new service manager.
+
+        Service managers keep the proxy and the views of their caller, so
+        a new one is made on every call. The provider managers behind it
+        come from the shared nested runtime, already loaded.
+
+        """
         if proxy is None:
             proxy_key = NO_PROXY
         else:
@@ -30,30 +77,55 @@ class Runtime(OsidRuntimeManager):
         return self._load_mgr(osid, implementation, version, proxy_key, proxy)
 
     def get_manager(self, osid, implementation, version=[3, 0, 0]):
-        if implementation + osid not in self._managers:
-            self._managers[implementation + osid] = self._load_mgr(osid, implementation, version, 0)
-        return self._managers[implementation + osid]
+        if (implementation, osid) not in self._managers:
+            self._managers[(implementation, osid)] = self._load_mgr(osid, implementation, version, NO_PROXY)
+        return self._managers[(implementation, osid)]
 
     def get_proxy_manager(self, osid, implementation, version=[3, 0, 0], proxy=None):
-        if implementation + osid not in self._proxy_managers:
-            self._proxy_managers[implementation + osid] = self._load_mgr(osid, implementation, version, 1)
-        return self._proxy_managers[implementation + osid]
+        if (implementation, osid) not in self._proxy_managers:
+            self._proxy_managers[(implementation, osid)] = self._load_mgr(osid, implementation, version, PROXY)
+        return self._proxy_managers[(implementation, osid)]
+
+    def invalidate_managers(self, osid=None, implementation=None):
+        """Drops the managers cached by this runtime and by the shared nested runtimes.
+
+        With ``osid`` and/or ``implementation``, only the matching
+        managers are dropped, and, without ``osid``, the nested runtime
+        of ``implementation``.
+
+        """
+        self._drop_managers(osid, implementation)
+        with _LOCK:
+            for runtime_key in list(_NESTED_RUNTIMES.keys()):
+                if osid is None and implementation in [None, runtime_key[0]]:
+                    del _NESTED_RUNTIMES[runtime_key]
+                else:
+                    _NESTED_RUNTIMES[runtime_key]._drop_managers(osid, implementation)
+
+    def _drop_managers(self, osid, implementation):
+        for managers in [self._managers, self._proxy_managers]:
+            for manager_key in list(managers.keys()):
+                if implementation in [None, manager_key[0]] and osid in [None, manager_key[1]]:
+                    del managers[manager_key]
 
     def get_configuration(self):
         return ValueRetrievalSession(self._configuration)
 
+    def get_configuration_snapshot(self):
+        return self._configuration.get_snapshot()
+
+    def get_configuration_key(self):
+        return self._configuration.get_configuration_key()
+
     def _load_mgr(self, osid, implementation, version, proxy_key, proxy=None):
-        new_configuration = Configuration(getattr(configs, implementation))
-        parameter_id = Id('parameter:implKey@dlkit_runtime')
-        impl_key = ValueRetrievalSession(new_configuration).get_value_by_parameter(parameter_id).get_string_value()
-        module_path = '.'.join(MANAGER_PATHS[impl_key][osid][proxy_key].split('.')[:-1])
-        class_name = MANAGER_PATHS[impl_key][osid][proxy_key].split('.')[-1]
-        module = importlib.import_module(module_path)
+        nested_runtime = _get_nested_runtime(implementation)
+        impl_key = nested_runtime.get_configuration_snapshot().get_string_value('parameter:implKey@dlkit_runtime')
+        manager_class = _get_manager_class(impl_key, osid, proxy_key)
         if proxy is None:
-            manager = getattr(module, class_name)()
+            manager = manager_class()
         else:
-            manager = getattr(module, class_name)(proxy=proxy)
-        manager.initialize(Runtime(new_configuration))
+            manager = manager_class(proxy=proxy)
+        manager.initialize(nested_runtime)
         return manager
 
     configuration = property(fget=get_configuration)
@@ -2588,6 +2588,10 @@ class Bank(abc_assessment_objects.Bank, osid.OsidSession, osid.OsidCatalog):
         # osid.resource.ResourceAdminSession.create_resource
         return self._get_provider_session('item_admin_session').create_item(*args, **kwargs)
 
+    def create_items(self, *args, **kwargs):
+        """Pass through to provider ItemAdminSession.create_items"""
+        return self._get_provider_session('item_admin_session').create_items(*args, **kwargs)
+
     def can_update_items(self):
         """Pass through to provider ItemAdminSession.can_update_items"""
         # Implemented from kitosid template for -
@@ -2622,6 +2626,10 @@ class Bank(abc_assessment_objects.Bank, osid.OsidSession, osid.OsidCatalog):
         # Note: The OSID spec does not require returning updated object
         return self._get_provider_session('item_admin_session').update_item(*args, **kwargs)
 
+    def update_items(self, *args, **kwargs):
+        """Pass through to provider ItemAdminSession.update_items"""
+        return self._get_provider_session('item_admin_session').update_items(*args, **kwargs)
+
     def save_item(self, item_form, *args, **kwargs):
         """Pass through to provider ItemAdminSession.update_item"""
         # Implemented from kitosid template for -
@@ -1,12 +1,19 @@
-"""Convenience primitives pass-through to dlkit.primordium"""
-# pylint: disable=unused-import
+"""Convenience primitives pass-through to dlkit.primordium
 
-from dlkit.primordium.id.primitives import Id
-from dlkit.primordium.type.primitives import Type
-from dlkit.primordium.locale.primitives import DisplayText
-from dlkit.primordium.installation.primitives import Version
-from dlkit.primordium.transport.objects import DataInputStream
-from dlkit.primordium.calendaring.primitives import DateTime, Duration
-from dlkit.primordium.mapping.color_primitives import RGBColorCoordinate
-from dlkit.primordium.mapping.spatial_units import RectangularSpatialUnit
-from dlkit.primordium.mapping.coordinate_primitives import BasicCoordinate
+Each class is imported from dlkit.primordium when it is first used.
+
+"""
+from dlkit import lazy_modules
+
+lazy_modules.install_lazy_module(__name__, {
+    'Id': 'dlkit.primordium.id.primitives:Id',
+    'Type': 'dlkit.primordium.type.primitives:Type',
+    'DisplayText': 'dlkit.primordium.locale.primitives:DisplayText',
+    'Version': 'dlkit.primordium.installation.primitives:Version',
+    'DataInputStream': 'dlkit.primordium.transport.objects:DataInputStream',
+    'DateTime': 'dlkit.primordium.calendaring.primitives:DateTime',
+    'Duration': 'dlkit.primordium.calendaring.primitives:Duration',
+    'RGBColorCoordinate': 'dlkit.primordium.mapping.color_primitives:RGBColorCoordinate',
+    'RectangularSpatialUnit': 'dlkit.primordium.mapping.spatial_units:RectangularSpatialUnit',
+    'BasicCoordinate': 'dlkit.primordium.mapping.coordinate_primitives:BasicCoordinate',
+})
@@ -1616,6 +1616,10 @@ class Repository(abc_repository_objects.Repository, osid.OsidSession, osid.OsidC
         # osid.resource.ResourceAdminSession.create_resource
         return self._get_provider_session('asset_admin_session').create_asset(*args, **kwargs)
 
+    def create_assets(self, *args, **kwargs):
+        """Pass through to provider AssetAdminSession.create_assets"""
+        return self._get_provider_session('asset_admin_session').create_assets(*args, **kwargs)
+
     def can_update_assets(self):
         """Pass through to provider AssetAdminSession.can_update_assets"""
         # Implemented from kitosid template for -
@@ -1650,6 +1654,10 @@ class Repository(abc_repository_objects.Repository, osid.OsidSession, osid.OsidC
         # Note: The OSID spec does not require returning updated object
         return self._get_provider_session('asset_admin_session').update_asset(*args, **kwargs)
 
+    def update_assets(self, *args, **kwargs):
+        """Pass through to provider AssetAdminSession.update_assets"""
+        return self._get_provider_session('asset_admin_session').update_assets(*args, **kwargs)
+
     def save_asset(self, asset_form, *args, **kwargs):
         """Pass through to provider AssetAdminSession.update_asset"""
         # Implemented from kitosid template for -
@@ -53,7 +53,7 @@ NEW_TYPE_2 = Type(**{'identifier': 'NEW 2', 'namespace': 'MINE 2', 'authority':
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -886,7 +886,7 @@ class TestAssessmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_results_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -1010,7 +1010,7 @@ class TestAssessmentResultsSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_lookup_session_class_fixture(request):
     # Implemented from init template for ResourceLookupSession
     request.cls.service_config = request.param
@@ -1220,7 +1220,7 @@ class TestItemLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_query_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -1317,7 +1317,7 @@ class TestItemQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_search_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -1405,7 +1405,7 @@ class TestItemSearchSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_admin_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -1506,6 +1506,32 @@ class TestItemAdminSession(object):
             with pytest.raises(errors.PermissionDenied):
                 self.catalog.create_item('foo')
 
+    def test_create_items(self):
+        """Tests create_items"""
+        from dlkit.abstract_osid.assessment.objects import ItemList
+        if not is_never_authz(self.service_config):
+            forms = []
+            for number in range(3):
+                form = self.catalog.get_item_form_for_create([])
+                form.display_name = 'bulk Item ' + str(number)
+                forms.append(form)
+            new_objects = self.catalog.create_items(forms)
+            assert isinstance(new_objects, ItemList)
+            assert [obj.display_name.text for obj in new_objects] == ['bulk Item 0', 'bulk Item 1', 'bulk Item 2']
+            with pytest.raises(errors.IllegalState):
+                self.catalog.create_items([forms[0]])
+            form = self.catalog.get_item_form_for_create([])
+            with pytest.raises(errors.IllegalState):
+                self.catalog.create_items([form, form])
+            with pytest.raises(errors.InvalidArgument):
+                self.catalog.create_items([form, 'I Will Break You!'])
+            assert self.catalog.create_items([form]).available() == 1
+            with pytest.raises(errors.NullArgument):
+                self.catalog.create_items(None)
+        else:
+            with pytest.raises(errors.PermissionDenied):
+                self.catalog.create_items(['foo'])
+
     def test_can_update_items(self):
         """Tests can_update_items"""
         # From test_templates/resource.py::ResourceAdminSession::can_update_resources_template
@@ -1554,6 +1580,25 @@ class TestItemAdminSession(object):
             with pytest.raises(errors.PermissionDenied):
                 self.catalog.update_item('foo')
 
+    def test_update_items(self):
+        """Tests update_items"""
+        if not is_never_authz(self.service_config):
+            form = self.catalog.get_item_form_for_update(self.osid_object.ident)
+            form.display_name = 'new name'
+            updated_objects = self.catalog.update_items([form])
+            assert updated_objects.available() == 1
+            assert updated_objects.next().display_name.text == 'new name'
+            assert self.catalog.get_item(self.osid_object.ident).display_name.text == 'new name'
+            with pytest.raises(errors.IllegalState):
+                self.catalog.update_items([form])
+            with pytest.raises(errors.InvalidArgument):
+                self.catalog.update_items([self.form])
+            with pytest.raises(errors.NullArgument):
+                self.catalog.update_items(None)
+        else:
+            with pytest.raises(errors.PermissionDenied):
+                self.catalog.update_items(['foo'])
+
     def test_can_delete_items(self):
         """Tests can_delete_items"""
         # From test_templates/resource.py::ResourceAdminSession::can_delete_resources_template
@@ -1790,7 +1835,7 @@ class NotificationReceiver(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_notification_session_class_fixture(request):
     # Implemented from init template for ResourceNotificationSession
     request.cls.service_config = request.param
@@ -1954,7 +1999,7 @@ class TestItemNotificationSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_bank_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.item_list = list()
@@ -2094,7 +2139,7 @@ class TestItemBankSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def item_bank_assignment_session_class_fixture(request):
     # From test_templates/resource.py::ResourceBinAssignmentSession::init_template
     request.cls.service_config = request.param
@@ -2233,7 +2278,7 @@ class TestItemBankAssignmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_lookup_session_class_fixture(request):
     # Implemented from init template for ResourceLookupSession
     request.cls.service_config = request.param
@@ -2407,7 +2452,7 @@ class FakeQuery:
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_query_session_class_fixture(request):
     # From test_templates/resource.py::ResourceQuerySession::init_template
     request.cls.service_config = request.param
@@ -2504,7 +2549,7 @@ class TestAssessmentQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_admin_session_class_fixture(request):
     # From test_templates/resource.py::ResourceAdminSession::init_template
     request.cls.service_config = request.param
@@ -2708,7 +2753,7 @@ class TestAssessmentAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_bank_session_class_fixture(request):
     # From test_templates/resource.py::ResourceBinSession::init_template
     request.cls.service_config = request.param
@@ -2848,7 +2893,7 @@ class TestAssessmentBankSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_bank_assignment_session_class_fixture(request):
     # From test_templates/resource.py::ResourceBinAssignmentSession::init_template
     request.cls.service_config = request.param
@@ -2987,7 +3032,7 @@ class TestAssessmentBankAssignmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_basic_authoring_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_offered_list = list()
@@ -3136,7 +3181,7 @@ class TestAssessmentBasicAuthoringSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_offered_lookup_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -3419,7 +3464,7 @@ class TestAssessmentOfferedLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_offered_query_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_offered_list = list()
@@ -3520,7 +3565,7 @@ class TestAssessmentOfferedQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_offered_admin_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_offered_list = list()
@@ -3716,7 +3761,7 @@ class TestAssessmentOfferedAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_offered_bank_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_offered_list = list()
@@ -3861,7 +3906,7 @@ class TestAssessmentOfferedBankSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_offered_bank_assignment_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_offered_list = list()
@@ -4005,7 +4050,7 @@ class TestAssessmentOfferedBankAssignmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_taken_lookup_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -4390,7 +4435,7 @@ class TestAssessmentTakenLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_taken_query_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_taken_list = list()
@@ -4498,7 +4543,7 @@ class TestAssessmentTakenQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_taken_admin_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -4690,7 +4735,7 @@ class TestAssessmentTakenAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_taken_bank_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_taken_list = list()
@@ -4841,7 +4886,7 @@ class TestAssessmentTakenBankSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def assessment_taken_bank_assignment_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.assessment_taken_list = list()
@@ -4991,7 +5036,7 @@ class TestAssessmentTakenBankAssignmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def bank_lookup_session_class_fixture(request):
     # From test_templates/resource.py::BinLookupSession::init_template
     request.cls.service_config = request.param
@@ -5122,7 +5167,7 @@ class TestBankLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def bank_query_session_class_fixture(request):
     # From test_templates/resource.py::BinQuerySession::init_template
     request.cls.service_config = request.param
@@ -5184,7 +5229,7 @@ class TestBankQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def bank_admin_session_class_fixture(request):
     # From test_templates/resource.py::BinAdminSession::init_template
     request.cls.service_config = request.param
@@ -5333,7 +5378,7 @@ class TestBankAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def bank_hierarchy_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchySession::init_template
     request.cls.service_config = request.param
@@ -5483,26 +5528,13 @@ class TestBankHierarchySession(object):
         """Tests is_ancestor_of_bank"""
         # From test_templates/resource.py::BinHierarchySession::is_ancestor_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_ancestor_of_bank,
-                          self.catalogs['Root'].ident,
-                          self.catalogs['Child 1'].ident)
+            assert isinstance(self.svc_mgr.is_ancestor_of_bank(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_ancestor_of_bank(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
+            assert self.svc_mgr.is_ancestor_of_bank(self.catalogs['Root'].ident, self.catalogs['Grandchild 1'].ident)
+            assert not self.svc_mgr.is_ancestor_of_bank(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_ancestor_of_bank(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_ancestor_of_bank(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_bank(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_bank(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Grandchild 1'].ident))
-        # self.assertFalse(self.svc_mgr.is_ancestor_of_bank(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
 
     def test_has_child_banks(self):
         """Tests has_child_banks"""
@@ -5557,26 +5589,13 @@ class TestBankHierarchySession(object):
         """Tests is_descendant_of_bank"""
         # From test_templates/resource.py::BinHierarchySession::is_descendant_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_descendant_of_bank,
-                          self.catalogs['Child 1'].ident,
-                          self.catalogs['Root'].ident)
+            assert isinstance(self.svc_mgr.is_descendant_of_bank(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_descendant_of_bank(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
+            assert self.svc_mgr.is_descendant_of_bank(self.catalogs['Grandchild 1'].ident, self.catalogs['Root'].ident)
+            assert not self.svc_mgr.is_descendant_of_bank(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_descendant_of_bank(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_descendant_of_bank(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_bank(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_bank(
-        #     self.catalogs['Grandchild 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertFalse(self.svc_mgr.is_descendant_of_bank(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
 
     def test_get_bank_node_ids(self):
         """Tests get_bank_node_ids"""
@@ -5614,7 +5633,7 @@ class TestBankHierarchySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def bank_hierarchy_design_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchyDesignSession::init_template
     request.cls.service_config = request.param
@@ -53,7 +53,7 @@ NEW_TYPE_2 = Type(**{'identifier': 'NEW 2', 'namespace': 'MINE', 'authority': 'Y
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def authorization_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.authz_mgr = Runtime().get_manager(
@@ -378,7 +378,7 @@ class TestAuthorizationSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def authorization_lookup_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.svc_mgr = Runtime().get_service_manager(
@@ -786,7 +786,7 @@ class FakeQuery:
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def authorization_query_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.authorization_list = list()
@@ -901,7 +901,7 @@ class TestAuthorizationQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def authorization_admin_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.authorization_list = list()
@@ -1428,7 +1428,7 @@ class TestAuthorizationVaultAssignmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def vault_lookup_session_class_fixture(request):
     # From test_templates/resource.py::BinLookupSession::init_template
     request.cls.service_config = request.param
@@ -1559,7 +1559,7 @@ class TestVaultLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def vault_query_session_class_fixture(request):
     # From test_templates/resource.py::BinQuerySession::init_template
     request.cls.service_config = request.param
@@ -1621,7 +1621,7 @@ class TestVaultQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def vault_admin_session_class_fixture(request):
     # From test_templates/resource.py::BinAdminSession::init_template
     request.cls.service_config = request.param
@@ -1770,7 +1770,7 @@ class TestVaultAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def vault_hierarchy_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchySession::init_template
     request.cls.service_config = request.param
@@ -1920,26 +1920,13 @@ class TestVaultHierarchySession(object):
         """Tests is_ancestor_of_vault"""
         # From test_templates/resource.py::BinHierarchySession::is_ancestor_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_ancestor_of_vault,
-                          self.catalogs['Root'].ident,
-                          self.catalogs['Child 1'].ident)
+            assert isinstance(self.svc_mgr.is_ancestor_of_vault(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_ancestor_of_vault(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
+            assert self.svc_mgr.is_ancestor_of_vault(self.catalogs['Root'].ident, self.catalogs['Grandchild 1'].ident)
+            assert not self.svc_mgr.is_ancestor_of_vault(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_ancestor_of_vault(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_ancestor_of_vault(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_vault(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_vault(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Grandchild 1'].ident))
-        # self.assertFalse(self.svc_mgr.is_ancestor_of_vault(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
 
     def test_has_child_vaults(self):
         """Tests has_child_vaults"""
@@ -1994,26 +1981,13 @@ class TestVaultHierarchySession(object):
         """Tests is_descendant_of_vault"""
         # From test_templates/resource.py::BinHierarchySession::is_descendant_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_descendant_of_vault,
-                          self.catalogs['Child 1'].ident,
-                          self.catalogs['Root'].ident)
+            assert isinstance(self.svc_mgr.is_descendant_of_vault(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_descendant_of_vault(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
+            assert self.svc_mgr.is_descendant_of_vault(self.catalogs['Grandchild 1'].ident, self.catalogs['Root'].ident)
+            assert not self.svc_mgr.is_descendant_of_vault(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_descendant_of_vault(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_descendant_of_vault(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_vault(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_vault(
-        #     self.catalogs['Grandchild 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertFalse(self.svc_mgr.is_descendant_of_vault(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
 
     def test_get_vault_node_ids(self):
         """Tests get_vault_node_ids"""
@@ -2051,7 +2025,7 @@ class TestVaultHierarchySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def vault_hierarchy_design_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchyDesignSession::init_template
     request.cls.service_config = request.param
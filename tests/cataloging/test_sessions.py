@@ -34,7 +34,7 @@ ALIAS_ID = Id(**{'identifier': 'ALIAS', 'namespace': 'ALIAS', 'authority': 'ALIA
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def catalog_lookup_session_class_fixture(request):
     # From test_templates/resource.py::BinLookupSession::init_template
     request.cls.service_config = request.param
@@ -165,7 +165,7 @@ class TestCatalogLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def catalog_query_session_class_fixture(request):
     # From test_templates/resource.py::BinQuerySession::init_template
     request.cls.service_config = request.param
@@ -227,7 +227,7 @@ class TestCatalogQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def catalog_admin_session_class_fixture(request):
     # From test_templates/resource.py::BinAdminSession::init_template
     request.cls.service_config = request.param
@@ -375,7 +375,7 @@ class TestCatalogAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def catalog_hierarchy_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchySession::init_template
     request.cls.service_config = request.param
@@ -525,26 +525,13 @@ class TestCatalogHierarchySession(object):
         """Tests is_ancestor_of_catalog"""
         # From test_templates/resource.py::BinHierarchySession::is_ancestor_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_ancestor_of_catalog,
-                          self.catalogs['Root'].ident,
-                          self.catalogs['Child 1'].ident)
+            assert isinstance(self.svc_mgr.is_ancestor_of_catalog(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_ancestor_of_catalog(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
+            assert self.svc_mgr.is_ancestor_of_catalog(self.catalogs['Root'].ident, self.catalogs['Grandchild 1'].ident)
+            assert not self.svc_mgr.is_ancestor_of_catalog(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_ancestor_of_catalog(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_ancestor_of_catalog(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_catalog(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_catalog(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Grandchild 1'].ident))
-        # self.assertFalse(self.svc_mgr.is_ancestor_of_catalog(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
 
     def test_has_child_catalogs(self):
         """Tests has_child_catalogs"""
@@ -599,26 +586,13 @@ class TestCatalogHierarchySession(object):
         """Tests is_descendant_of_catalog"""
         # From test_templates/resource.py::BinHierarchySession::is_descendant_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_descendant_of_catalog,
-                          self.catalogs['Child 1'].ident,
-                          self.catalogs['Root'].ident)
+            assert isinstance(self.svc_mgr.is_descendant_of_catalog(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_descendant_of_catalog(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
+            assert self.svc_mgr.is_descendant_of_catalog(self.catalogs['Grandchild 1'].ident, self.catalogs['Root'].ident)
+            assert not self.svc_mgr.is_descendant_of_catalog(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_descendant_of_catalog(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_descendant_of_catalog(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_catalog(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_catalog(
-        #     self.catalogs['Grandchild 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertFalse(self.svc_mgr.is_descendant_of_catalog(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
 
     def test_get_catalog_node_ids(self):
         """Tests get_catalog_node_ids"""
@@ -656,7 +630,7 @@ class TestCatalogHierarchySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def catalog_hierarchy_design_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchyDesignSession::init_template
     request.cls.service_config = request.param
@@ -38,7 +38,7 @@ NEW_TYPE_2 = Type(**{'identifier': 'NEW 2', 'namespace': 'MINE', 'authority': 'Y
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def comment_lookup_session_class_fixture(request):
     # From test_templates/commenting.py::CommentLookupSession::init_template
     request.cls.service_config = request.param
@@ -432,7 +432,7 @@ class FakeQuery:
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def comment_query_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.comment_list = list()
@@ -527,7 +527,7 @@ class TestCommentQuerySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def comment_admin_session_class_fixture(request):
     request.cls.service_config = request.param
     request.cls.comment_list = list()
@@ -715,7 +715,7 @@ class TestCommentAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def comment_book_session_class_fixture(request):
     # From test_templates/resource.py::ResourceBinSession::init_template
     request.cls.service_config = request.param
@@ -855,7 +855,7 @@ class TestCommentBookSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def comment_book_assignment_session_class_fixture(request):
     # From test_templates/resource.py::ResourceBinAssignmentSession::init_template
     request.cls.service_config = request.param
@@ -994,7 +994,7 @@ class TestCommentBookAssignmentSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def book_lookup_session_class_fixture(request):
     # From test_templates/resource.py::BinLookupSession::init_template
     request.cls.service_config = request.param
@@ -1125,7 +1125,7 @@ class TestBookLookupSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def book_admin_session_class_fixture(request):
     # From test_templates/resource.py::BinAdminSession::init_template
     request.cls.service_config = request.param
@@ -1274,7 +1274,7 @@ class TestBookAdminSession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def book_hierarchy_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchySession::init_template
     request.cls.service_config = request.param
@@ -1424,26 +1424,13 @@ class TestBookHierarchySession(object):
         """Tests is_ancestor_of_book"""
         # From test_templates/resource.py::BinHierarchySession::is_ancestor_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_ancestor_of_book,
-                          self.catalogs['Root'].ident,
-                          self.catalogs['Child 1'].ident)
+            assert isinstance(self.svc_mgr.is_ancestor_of_book(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_ancestor_of_book(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
+            assert self.svc_mgr.is_ancestor_of_book(self.catalogs['Root'].ident, self.catalogs['Grandchild 1'].ident)
+            assert not self.svc_mgr.is_ancestor_of_book(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_ancestor_of_book(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_ancestor_of_book(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_book(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
-        # self.assertTrue(self.svc_mgr.is_ancestor_of_book(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Grandchild 1'].ident))
-        # self.assertFalse(self.svc_mgr.is_ancestor_of_book(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
 
     def test_has_child_books(self):
         """Tests has_child_books"""
@@ -1498,26 +1485,13 @@ class TestBookHierarchySession(object):
         """Tests is_descendant_of_book"""
         # From test_templates/resource.py::BinHierarchySession::is_descendant_of_bin_template
         if not is_never_authz(self.service_config):
-            pytest.raises(errors.Unimplemented,
-                          self.svc_mgr.is_descendant_of_book,
-                          self.catalogs['Child 1'].ident,
-                          self.catalogs['Root'].ident)
+            assert isinstance(self.svc_mgr.is_descendant_of_book(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident), bool)
+            assert self.svc_mgr.is_descendant_of_book(self.catalogs['Child 1'].ident, self.catalogs['Root'].ident)
+            assert self.svc_mgr.is_descendant_of_book(self.catalogs['Grandchild 1'].ident, self.catalogs['Root'].ident)
+            assert not self.svc_mgr.is_descendant_of_book(self.catalogs['Root'].ident, self.catalogs['Child 1'].ident)
         else:
             with pytest.raises(errors.PermissionDenied):
                 self.svc_mgr.is_descendant_of_book(self.fake_id, self.fake_id)
-        # self.assertTrue(isinstance(self.svc_mgr.is_descendant_of_book(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident),
-        #     bool))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_book(
-        #     self.catalogs['Child 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertTrue(self.svc_mgr.is_descendant_of_book(
-        #     self.catalogs['Grandchild 1'].ident,
-        #     self.catalogs['Root'].ident))
-        # self.assertFalse(self.svc_mgr.is_descendant_of_book(
-        #     self.catalogs['Root'].ident,
-        #     self.catalogs['Child 1'].ident))
 
     def test_get_book_node_ids(self):
         """Tests get_book_node_ids"""
@@ -1555,7 +1529,7 @@ class TestBookHierarchySession(object):
 
 
 @pytest.fixture(scope="class",
-                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_MEMCACHE'])
+                params=['TEST_SERVICE', 'TEST_SERVICE_ALWAYS_AUTHZ', 'TEST_SERVICE_NEVER_AUTHZ', 'TEST_SERVICE_CATALOGING', 'TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY', 'TEST_SERVICE_MEMCACHE'])
 def book_hierarchy_design_session_class_fixture(request):
     # From test_templates/resource.py::BinHierarchyDesignSession::init_template
     request.cls.service_config = request.param
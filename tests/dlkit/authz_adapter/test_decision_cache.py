@@ -0,0 +1,109 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from dlkit.authz_adapter.assessment.sessions import BankHierarchyDesignSession
+from dlkit.authz_adapter.decision_cache import AUTHZ_DECISION_CACHE, DecisionCache
+from dlkit.primordium.id.primitives import Id
+
+
+BANK_ID = Id('assessment.Bank%3A000000000000000000000001%40ODL.MIT.EDU')
+CHILD_ID = Id('assessment.Bank%3A000000000000000000000002%40ODL.MIT.EDU')
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class CountingAuthorizationSession(object):
+    """Allows everything, and counts the questions it is asked"""
+    def __init__(self):
+        self.checks = []
+
+    def get_vault_id(self):
+        return Id('authorization.Vault%3A000000000000000000000001%40ODL.MIT.EDU')
+
+    def is_authorized(self, agent_id, function_id, qualifier_id):
+        self.checks.append((str(agent_id), str(function_id), str(qualifier_id)))
+        return True
+
+
+class BankHierarchyDesignProviderSession(object):
+    def add_child_bank(self, bank_id, child_id):
+        pass
+
+
+class TestDecisionCache(unittest.TestCase):
+    """Tests the bounded LRU / TTL decision cache"""
+
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.cache = DecisionCache(max_size=2, ttl=10, timer=self.timer)
+
+    def test_decisions_expire_and_are_evicted(self):
+        self.cache.put('a', True)
+        self.cache.put('b', False)
+        self.assertTrue(self.cache.get('a'))
+        self.cache.put('c', True)  # evicts b, the least recently used
+        self.assertIsNone(self.cache.get('b'))
+        self.assertTrue(self.cache.get('c'))
+        self.timer.now += 10
+        self.assertIsNone(self.cache.get('a'))
+        stats = self.cache.get_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions'], stats['expirations']), (2, 2, 1, 1))
+        self.assertEqual(stats['hit_rate'], 0.5)
+
+    def test_invalidation_drops_decisions_being_computed(self):
+        generation = self.cache.get_generation()
+        self.cache.invalidate()
+        self.cache.put('a', True, generation=generation)
+        self.assertIsNone(self.cache.get('a'))
+        self.cache.put('a', True)
+        self.cache.process_oplog_entry({'op': 'i', 'ns': 'authorization.Authorization', 'o': {'_id': 'x'}})
+        self.assertIsNone(self.cache.get('a'))
+
+    def test_listener_invalidates(self):
+        listener = FakeListener()
+        self.cache.listen_to_oplog(listener)
+        self.cache.listen_to_oplog(listener)
+        self.assertEqual(len(listener.oplog_callbacks), 1)
+        self.cache.put('a', True)
+        listener.oplog_callbacks[0]({'op': 'u', 'ns': 'test_authorization.Vault', 'o2': {'_id': 'x'}})
+        self.assertIsNone(self.cache.get('a'))
+
+
+class FakeListener(object):
+    def __init__(self):
+        self.oplog_callbacks = []
+
+    def is_alive(self):
+        return True
+
+
+class TestSharedDecisions(unittest.TestCase):
+    """Tests that the authz adapter sessions share their decisions"""
+
+    def setUp(self):
+        AUTHZ_DECISION_CACHE.invalidate()
+        self.authz_session = CountingAuthorizationSession()
+
+    def tearDown(self):
+        AUTHZ_DECISION_CACHE.invalidate()
+
+    def _get_session(self):
+        return BankHierarchyDesignSession(BankHierarchyDesignProviderSession(), self.authz_session)
+
+    def test_sessions_share_decisions(self):
+        self.assertTrue(self._get_session().can_modify_bank_hierarchy())
+        self.assertTrue(self._get_session().can_modify_bank_hierarchy())
+        self.assertEqual(len(self.authz_session.checks), 1)
+
+    def test_hierarchy_changes_invalidate_decisions(self):
+        session = self._get_session()
+        session.add_child_bank(BANK_ID, CHILD_ID)
+        session.can_modify_bank_hierarchy()
+        self.assertEqual(len(self.authz_session.checks), 2)
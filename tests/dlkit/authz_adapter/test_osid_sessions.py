@@ -0,0 +1,127 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from dlkit.authz_adapter.decision_cache import AUTHZ_DECISION_CACHE
+from dlkit.authz_adapter.osid.sessions import OsidSession
+
+from .test_decision_cache import CountingAuthorizationSession
+
+
+# root has children a and b, a has a1, and b has b1 and b2
+CHILD_IDSTRS = {'root': ['a', 'b'], 'a': ['a1'], 'b': ['b1', 'b2']}
+
+
+class SelectiveAuthorizationSession(CountingAuthorizationSession):
+    """Only authorizes the qualifiers given, and counts the questions it is asked"""
+    def __init__(self, authorized_idstrs):
+        super(SelectiveAuthorizationSession, self).__init__()
+        self.authorized_idstrs = authorized_idstrs
+
+    def is_authorized(self, agent_id, function_id, qualifier_id):
+        super(SelectiveAuthorizationSession, self).is_authorized(agent_id, function_id, qualifier_id)
+        return str(qualifier_id) in self.authorized_idstrs
+
+
+class BulkAuthorizationSession(SelectiveAuthorizationSession):
+    def __init__(self, authorized_idstrs):
+        super(BulkAuthorizationSession, self).__init__(authorized_idstrs)
+        self.bulk_checks = []
+
+    def are_authorized(self, agent_id, function_ids, qualifier_ids):
+        self.bulk_checks.append([str(qualifier_id) for qualifier_id in qualifier_ids])
+        return [[str(qualifier_id) in self.authorized_idstrs for qualifier_id in qualifier_ids]
+                for _ in function_ids]
+
+
+class TestCatalogsByAuthorization(unittest.TestCase):
+    """Tests splitting catalogs by whether a function is authorized for them"""
+
+    def setUp(self):
+        AUTHZ_DECISION_CACHE.invalidate()
+
+    def tearDown(self):
+        AUTHZ_DECISION_CACHE.invalidate()
+
+    def _get_session(self, authz_session):
+        session = OsidSession(None, authz_session)
+        session._id_namespace = 'assessment.Bank'
+        return session
+
+    def _get_idstrs_by_authz(self, authz_session):
+        return self._get_session(authz_session)._get_catalog_idstrs_by_authz(
+            'lookup', 'root', lambda idstr: CHILD_IDSTRS.get(idstr, []))
+
+    def test_levels_are_checked_together(self):
+        authz_session = BulkAuthorizationSession(['b'])
+        self.assertEqual(self._get_idstrs_by_authz(authz_session), (['b', 'b1', 'b2'], ['root', 'a', 'a1']))
+        self.assertEqual(authz_session.bulk_checks, [['root'], ['a', 'b'], ['a1']])
+        self.assertEqual(authz_session.checks, [])
+
+    def test_sessions_without_bulk_checks(self):
+        authz_session = SelectiveAuthorizationSession(['b'])
+        self.assertEqual(self._get_idstrs_by_authz(authz_session), (['b', 'b1', 'b2'], ['root', 'a', 'a1']))
+        self.assertEqual([check[2] for check in authz_session.checks], ['root', 'a', 'b', 'a1'])
+
+    def test_cached_decisions_are_not_checked_again(self):
+        authz_session = BulkAuthorizationSession(['b'])
+        self._get_idstrs_by_authz(authz_session)
+        self._get_idstrs_by_authz(authz_session)
+        self.assertEqual(len(authz_session.bulk_checks), 3)
+
+    def test_queries_match_authorized_catalogs(self):
+        session = self._get_session(BulkAuthorizationSession([]))
+        matches = []
+
+        def match_catalog_id(catalog_id, match):
+            matches.append((str(catalog_id), match))
+        self.assertEqual(session._match_authz_catalog_ids(match_catalog_id, ['b', 'b1'], ['root', 'a']), 2)
+        self.assertEqual(matches, [('b', True), ('b1', True)])
+        del matches[:]
+        self.assertEqual(session._match_authz_catalog_ids(match_catalog_id, [], ['root', 'a']), 0)
+        self.assertEqual(matches, [('root', False), ('a', False)])
+
+
+class FakeAuthorization(object):
+    def __init__(self, qualifier_idstr):
+        self.qualifier_idstr = qualifier_idstr
+
+    def get_qualifier_id(self):
+        return self.qualifier_idstr
+
+
+class CountingOverrideLookupSession(object):
+    """Holds overriding authorizations for some qualifiers, and counts the lookups"""
+    def __init__(self, qualifier_idstrs):
+        self.qualifier_idstrs = qualifier_idstrs
+        self.lookups = 0
+
+    def get_authorizations_for_agent_and_function(self, agent_id, function_id):
+        self.lookups += 1
+        return [FakeAuthorization(qualifier_idstr) for qualifier_idstr in self.qualifier_idstrs]
+
+
+class TestOverrideQualifiers(unittest.TestCase):
+    """Tests that overriding authorizations are shared and invalidated like decisions"""
+
+    def setUp(self):
+        AUTHZ_DECISION_CACHE.invalidate()
+        self.override_session = CountingOverrideLookupSession(['a1'])
+
+    def tearDown(self):
+        AUTHZ_DECISION_CACHE.invalidate()
+
+    def _get_override_qualifier_idstrs(self):
+        session = OsidSession(None, CountingAuthorizationSession(), override_lookup_session=self.override_session)
+        session._id_namespace = 'assessment.Bank'
+        return session._get_override_qualifier_idstrs('lookup')
+
+    def test_overrides_are_shared_until_invalidated(self):
+        self.assertEqual(self._get_override_qualifier_idstrs(), frozenset(['a1']))
+        self.assertEqual(self._get_override_qualifier_idstrs(), frozenset(['a1']))
+        self.assertEqual(self.override_session.lookups, 1)
+        self.override_session.qualifier_idstrs = []
+        AUTHZ_DECISION_CACHE.invalidate()
+        self.assertEqual(self._get_override_qualifier_idstrs(), frozenset())
+        self.assertEqual(self._get_override_qualifier_idstrs(), frozenset())
+        self.assertEqual(self.override_session.lookups, 2)
@@ -0,0 +1,61 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from dlkit.json_.assessment import sessions
+from dlkit.primordium.type.primitives import Type
+from dlkit.records import registry
+
+from .test_utilities import get_assessment_manager
+
+
+SEQUENCE_ASSESSMENT = Type(**registry.ASSESSMENT_RECORD_TYPES["simple-child-sequencing"])
+
+
+class TestSectionIdentityMap(unittest.TestCase):
+    """Tests loading each section once per AssessmentSession call"""
+
+    def setUp(self):
+        mgr = get_assessment_manager()
+        self.bank = mgr.create_bank(mgr.get_bank_form_for_create([]))
+        self.addCleanup(mgr.delete_bank, self.bank.ident)
+        item = self.bank.create_item(self.bank.get_item_form_for_create([]))
+        self.addCleanup(self.bank.delete_item, item.ident)
+        assessment = self.bank.create_assessment(self.bank.get_assessment_form_for_create([SEQUENCE_ASSESSMENT]))
+        self.addCleanup(self.bank.delete_assessment, assessment.ident)
+        self.bank.create_question(self.bank.get_question_form_for_create(item.ident, []))
+        self.bank.add_item(assessment.ident, item.ident)
+        offered = self.bank.create_assessment_offered(
+            self.bank.get_assessment_offered_form_for_create(assessment.ident, []))
+        self.addCleanup(self.bank.delete_assessment_offered, offered.ident)
+        taken = self.bank.create_assessment_taken(self.bank.get_assessment_taken_form_for_create(offered.ident, []))
+        self.addCleanup(self.bank.delete_assessment_taken, taken.ident)
+        self.section_id = self.bank.get_first_assessment_section(taken.ident).ident
+        self.question_id = self.bank.get_first_question(self.section_id).ident
+        self.session = self.bank._get_provider_session('assessment_session')
+        self.loads = []
+        get_section_util = sessions.get_section_util
+
+        def counting_get_section_util(section_id, *args, **kwargs):
+            self.loads.append(str(section_id))
+            return get_section_util(section_id, *args, **kwargs)
+        sessions.get_section_util = counting_get_section_util
+        self.addCleanup(setattr, sessions, 'get_section_util', get_section_util)
+
+    def test_submit_response_loads_the_section_once(self):
+        form = self.bank.get_response_form(self.section_id, self.question_id)
+        del self.loads[:]
+        self.bank.submit_response(self.section_id, self.question_id, form)
+        self.assertEqual(self.loads, [str(self.section_id)])
+        self.assertTrue(self.bank.is_question_answered(self.section_id, self.question_id))
+
+    def test_explicit_units_of_work(self):
+        with self.session._section_identity_map():
+            section = self.session.get_assessment_section(self.section_id)
+            self.session.skip_item(self.section_id, self.question_id)
+            self.assertIs(self.session.get_assessment_section(self.section_id), section)
+            self.session._refresh_section(self.section_id)
+            self.assertIsNot(self.session.get_assessment_section(self.section_id), section)
+        self.assertEqual(len(self.loads), 2)
+        self.session.get_assessment_section(self.section_id)
+        self.assertEqual(len(self.loads), 3)
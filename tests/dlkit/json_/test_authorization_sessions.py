@@ -0,0 +1,155 @@
+from __future__ import unicode_literals
+
+from bson import ObjectId
+
+from dlkit.json_.assessment.managers import AssessmentManager
+from dlkit.json_.authorization.managers import AuthorizationManager
+from dlkit.json_.hierarchy_caches import ANCESTRY_MATERIALIZER, materialize_catalog_ancestry
+from dlkit.json_.utilities import JSONClientValidated
+from dlkit.primordium.id.primitives import Id
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+from .test_hierarchy_traversal import HierarchyTestCase
+
+
+AGENT_ID = Id('agent:test_user@ODL.MIT.EDU')
+LOOKUP_BANK_FUNCTION_ID = Id('assessment.Bank%3Alookup%40ODL.MIT.EDU')
+
+
+class TestIsAuthorized(HierarchyTestCase):
+    """Tests authorizations inherited down the bank hierarchy"""
+
+    def setUp(self):
+        super(TestIsAuthorized, self).setUp()
+        authz_mgr = AuthorizationManager()
+        authz_mgr.initialize(self.runtime)
+        vault_admin_session = authz_mgr.get_vault_admin_session()
+        vault = vault_admin_session.create_vault(vault_admin_session.get_vault_form_for_create([]))
+        self.authz_admin_session = authz_mgr.get_authorization_admin_session_for_vault(vault.ident)
+        self.authz_admin_session.create_authorization(self.authz_admin_session.get_authorization_form_for_create_for_agent(
+            AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.child_ids[0], []))
+        self.session = authz_mgr.get_authorization_session_for_vault(vault.ident)
+        self.finds = []
+        find_one = JSONClientValidated.find_one
+
+        def counting_find_one(collection, *args, **kwargs):
+            self.finds.append(args)
+            return find_one(collection, *args, **kwargs)
+        JSONClientValidated.find_one = counting_find_one
+        self.addCleanup(setattr, JSONClientValidated, 'find_one', find_one)
+
+    def test_authorizations_apply_to_descendants(self):
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.child_ids[0]))
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.root_id))
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1]))
+
+    def test_warm_checks_take_one_query(self):
+        self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1])
+        del self.finds[:]
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1]))
+        self.assertEqual(len([args for args in self.finds if 'agentId' in args[0]]), 1)
+
+    def test_moving_a_qualifier_changes_its_authorizations(self):
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1]))
+        self.design_session.remove_child_bank(self.child_ids[0], self.grandchild_ids[0])
+        self.design_session.add_child_bank(self.child_ids[0], self.grandchild_ids[-1])
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1]))
+
+    def test_are_authorized_matches_is_authorized(self):
+        function_ids = [LOOKUP_BANK_FUNCTION_ID, Id('assessment.Bank%3Asearch%40ODL.MIT.EDU')]
+        qualifier_ids = [self.root_id, self.child_ids[0], self.grandchild_ids[0], self.grandchild_ids[-1]]
+        authz_finds = []
+        find = JSONClientValidated.find
+
+        def counting_find(collection, *args, **kwargs):
+            if 'agentId' in args[0]:
+                authz_finds.append(args)
+            return find(collection, *args, **kwargs)
+        JSONClientValidated.find = counting_find
+        self.addCleanup(setattr, JSONClientValidated, 'find', find)
+        self.assertEqual(self.session.are_authorized(AGENT_ID, function_ids, qualifier_ids),
+                         [[False, True, True, False], [False, False, False, False]])
+        self.assertEqual(len(authz_finds), 1)
+        self.assertEqual(self.session.are_authorized(AGENT_ID, function_ids, qualifier_ids),
+                         [[self.session.is_authorized(AGENT_ID, function_id, qualifier_id)
+                           for qualifier_id in qualifier_ids]
+                          for function_id in function_ids])
+
+    def test_qualifiers_without_a_package_only_match_explicitly(self):
+        qualifier_id = Id(identifier='qualifier', namespace='nodot', authority='ODL.MIT.EDU')
+        qualifier_ids = [qualifier_id, self.grandchild_ids[0]]
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, qualifier_id))
+        self.assertEqual(self.session.are_authorized(AGENT_ID, [LOOKUP_BANK_FUNCTION_ID], qualifier_ids),
+                         [[False, True]])
+        self.authz_admin_session.create_authorization(self.authz_admin_session.get_authorization_form_for_create_for_agent(
+            AGENT_ID, LOOKUP_BANK_FUNCTION_ID, qualifier_id, []))
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, qualifier_id))
+        self.assertEqual(self.session.are_authorized(AGENT_ID, [LOOKUP_BANK_FUNCTION_ID], qualifier_ids),
+                         [[True, True]])
+
+    def test_hierarchy_changes_made_elsewhere_are_seen(self):
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+        # as another process would, move the grandchild without the design session
+        collection = JSONClientValidated('relationship', collection='Relationship', runtime=self.runtime)
+        relationship = collection.find_one({'destinationId': str(self.grandchild_ids[0])})
+        relationship['sourceId'] = str(self.child_ids[1])
+        collection.save(relationship)
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+
+
+class TestIsAuthorizedWithMaterializedAncestry(TestIsAuthorized):
+    """Tests authorizations inherited through the ancestry materialized on banks"""
+
+    parameters = {
+        'materializeCatalogAncestry': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+    }
+
+    def tearDown(self):
+        ANCESTRY_MATERIALIZER.join_pending()
+        super(TestIsAuthorizedWithMaterializedAncestry, self).tearDown()
+
+    def test_deny_takes_two_queries(self):
+        # root -> child -> grandchild: the bank's ancestry, then the authorizations
+        self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1])
+        queries = []
+        find = JSONClientValidated.find
+
+        def counting_find(collection, *args, **kwargs):
+            queries.append(args)
+            return find(collection, *args, **kwargs)
+        JSONClientValidated.find = counting_find
+        self.addCleanup(setattr, JSONClientValidated, 'find', find)
+        del self.finds[:]
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[-1]))
+        self.assertEqual(len(queries) + len(self.finds), 2)
+
+    def test_hierarchy_changes_made_elsewhere_are_seen(self):
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+        # as another process would, move the grandchild with a runtime of its own
+        mgr = AssessmentManager()
+        mgr.initialize(Runtime(Configuration({
+            'id': 'test_is_authorized_elsewhere_' + self.directory,
+            'parameters': dict({
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }, **self.parameters)
+        })))
+        design_session = mgr.get_bank_hierarchy_design_session()
+        design_session.remove_child_bank(self.child_ids[0], self.grandchild_ids[0])
+        design_session.add_child_bank(self.child_ids[1], self.grandchild_ids[0])
+        self.assertFalse(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+
+    def test_banks_without_ancestry_are_walked(self):
+        collection = JSONClientValidated('assessment', collection='Bank', runtime=self.runtime)
+        bank_map = collection.find_one({'_id': ObjectId(self.grandchild_ids[0].get_identifier())})
+        del bank_map['ancestorBankIds']
+        collection.save(bank_map)
+        self.assertTrue(self.session.is_authorized(AGENT_ID, LOOKUP_BANK_FUNCTION_ID, self.grandchild_ids[0]))
+        materialize_catalog_ancestry(self.runtime, catalog_names=['Bank'])
+        self.assertEqual(
+            sorted(collection.find_one({'_id': ObjectId(self.grandchild_ids[0].get_identifier())})['ancestorBankIds']),
+            sorted(str(bank_id) for bank_id in [self.root_id, self.other_root_id, self.child_ids[0], self.grandchild_ids[0]]))
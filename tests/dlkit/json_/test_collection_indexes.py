@@ -0,0 +1,91 @@
+from __future__ import unicode_literals
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from bson import ObjectId
+
+from dlkit.json_.collection_indexes import CollectionIndex, FilesystemCollectionIndex, \
+    get_filesystem_index
+from dlkit.json_.utilities import JSONClientValidated
+
+
+class TestCollectionIndex(unittest.TestCase):
+    """Tests for the inverted field indexes"""
+
+    def setUp(self):
+        self.index = CollectionIndex()
+        self.index.add({'_id': 'a', 'assignedBankIds': ['bank1', 'bank2'], 'genusTypeId': 'g1'}, 'loc_a')
+        self.index.add({'_id': 'b', 'assignedBankIds': ['bank2'], 'genusTypeId': 'g2'}, 'loc_b')
+        self.index.add({'_id': 'c', 'assignedBankIds': ['bank3'], 'displayName': 'foo'}, 'loc_c')
+
+    def test_candidates_for_list_field(self):
+        self.assertEqual(self.index.get_candidate_ids({'assignedBankIds': {'$in': ['bank2']}}),
+                         set(['a', 'b']))
+
+    def test_candidates_intersect_terms(self):
+        query = {'$and': [{'assignedBankIds': {'$in': ['bank1', 'bank2']}},
+                          {'genusTypeId': 'g2'}]}
+        self.assertEqual(self.index.get_candidate_ids(query), set(['b']))
+
+    def test_unindexed_query_returns_none(self):
+        self.assertIsNone(self.index.get_candidate_ids({'displayName': 'foo'}))
+
+    def test_id_candidates(self):
+        self.assertEqual(self.index.get_candidate_ids({'_id': {'$in': ['a', 'z']}}), set(['a']))
+
+    def test_remove_updates_postings(self):
+        self.index.remove('a')
+        self.assertEqual(self.index.get_candidate_ids({'assignedBankIds': 'bank2'}), set(['b']))
+        self.assertEqual(len(self.index), 2)
+
+
+class TestFilesystemCollectionIndex(unittest.TestCase):
+    """Tests that the directory index stays current"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.index = FilesystemCollectionIndex(self.directory)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _write(self, doc):
+        JSONClientValidated._save_dict_as_json_file(
+            os.path.join(self.directory, doc['_id'] + '.json'), doc)
+
+    def test_picks_up_external_writes(self):
+        self._write({'_id': 'a', 'genusTypeId': 'g1'})
+        self.index.refresh()
+        self.assertEqual(self.index.get_candidate_ids({'genusTypeId': 'g1'}), set(['a']))
+        time.sleep(0.01)
+        self._write({'_id': 'a', 'genusTypeId': 'g2'})
+        self._write({'_id': 'b', 'genusTypeId': 'g1'})
+        self.index.refresh()
+        self.assertEqual(self.index.get_candidate_ids({'genusTypeId': 'g1'}), set(['b']))
+        os.remove(os.path.join(self.directory, 'b.json'))
+        self.index.refresh()
+        self.assertEqual(self.index.get_candidate_ids({'genusTypeId': 'g1'}), set())
+
+    def test_own_writes_do_not_hide_external_ones(self):
+        self._write({'_id': 'a', 'genusTypeId': 'g1'})
+        self.index.refresh()
+        time.sleep(0.01)
+        os.remove(os.path.join(self.directory, 'a.json'))
+        doc = {'_id': 'b', 'genusTypeId': 'g1'}
+        self._write(doc)
+        self.index.record_write(doc, os.path.join(self.directory, 'b.json'))
+        self.index.refresh()
+        self.assertEqual(self.index.get_candidate_ids({'genusTypeId': 'g1'}), set(['b']))
+
+    def test_index_is_shared_per_directory(self):
+        self.assertTrue(get_filesystem_index(self.directory) is get_filesystem_index(self.directory + '/'))
+
+    def test_object_id_queries(self):
+        doc_id = str(ObjectId())
+        self._write({'_id': doc_id})
+        self.index.refresh()
+        self.assertEqual(self.index.get_candidate_ids({'_id': ObjectId(doc_id)}), set([doc_id]))
@@ -0,0 +1,101 @@
+import shutil
+import tempfile
+import unittest
+
+from pymongo import ASCENDING, DESCENDING
+
+from dlkit.json_.collection_indexes import FilesystemCollectionIndex
+from dlkit.json_.cursors import DirectorySource, DocumentCursor, IndexedDirectorySource, project_document
+from dlkit.json_.osid.osid_errors import IllegalState, InvalidArgument
+from dlkit.json_.utilities import JSONClientValidated
+
+
+class CountingSource(IndexedDirectorySource):
+    def __init__(self, directory, index):
+        IndexedDirectorySource.__init__(self, directory, index)
+        self.loads = 0
+
+    def load(self, doc_id):
+        self.loads += 1
+        return IndexedDirectorySource.load(self, doc_id)
+
+
+class TestDocumentCursor(unittest.TestCase):
+    """Tests the lazy cursor over filesystem collections"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        for number in range(10):
+            doc_id = '5a000000000000000000000{0}'.format(number)
+            JSONClientValidated._save_dict_as_json_file('{0}/{1}.json'.format(self.directory, doc_id),
+                                                        {'_id': doc_id,
+                                                         'genusTypeId': 'even' if number % 2 == 0 else 'odd',
+                                                         'number': number,
+                                                         'rank': 10 - number})
+        self.source = CountingSource(self.directory, FilesystemCollectionIndex(self.directory))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_sort_on_id_with_slice_only_reads_the_page(self):
+        cursor = DocumentCursor(self.source).sort('_id', DESCENDING)[2:5]
+        self.assertEqual(cursor.count(True), 3)
+        self.assertEqual(cursor.count(), 10)
+        self.assertEqual([doc['number'] for doc in cursor], [7, 6, 5])
+        self.assertEqual(self.source.loads, 3)
+
+    def test_exact_index_count_does_not_read_documents(self):
+        cursor = DocumentCursor(self.source, {'genusTypeId': 'odd'})
+        self.assertEqual(cursor.count(), 5)
+        self.assertEqual(self.source.loads, 0)
+
+    def test_query_that_needs_matching(self):
+        cursor = DocumentCursor(self.source, {'genusTypeId': 'even', 'number': {'$gte': 4}})
+        cursor = cursor.sort('_id', ASCENDING).skip(1).limit(1)
+        self.assertEqual(cursor.count(True), 1)
+        self.assertEqual([doc['number'] for doc in cursor], [6])
+
+    def test_sort_on_other_keys(self):
+        cursor = DocumentCursor(DirectorySource(self.directory)).sort([('genusTypeId', ASCENDING),
+                                                                       ('rank', ASCENDING)])
+        self.assertEqual([doc['number'] for doc in cursor], [8, 6, 4, 2, 0, 9, 7, 5, 3, 1])
+
+    def test_restore_and_index_access(self):
+        cursor = DocumentCursor(self.source, restore=lambda doc: doc['number'])
+        self.assertEqual(cursor.sort('number', DESCENDING)[0], 9)
+
+    def test_cannot_modify_after_iterating(self):
+        cursor = DocumentCursor(self.source)
+        next(cursor)
+        with self.assertRaises(IllegalState):
+            cursor.limit(1)
+        self.assertEqual(len(list(cursor.rewind().limit(4))), 4)
+
+
+class TestProjectDocument(unittest.TestCase):
+    """Tests MongoDB-style projections of stored documents"""
+
+    def setUp(self):
+        self.doc = {'_id': '1',
+                    'displayName': {'text': 'foo', 'languageTypeId': 'eng'},
+                    'questions': [{'itemId': 'a', 'responses': [1]},
+                                  {'itemId': 'b', 'responses': [2]}]}
+
+    def test_inclusion(self):
+        self.assertEqual(project_document(self.doc, {'displayName.text': True}),
+                         {'_id': '1', 'displayName': {'text': 'foo'}})
+        self.assertEqual(project_document(self.doc, {'questions.itemId': 1, '_id': 0}),
+                         {'questions': [{'itemId': 'a'}, {'itemId': 'b'}]})
+        self.assertEqual(project_document(self.doc, ['_id']), {'_id': '1'})
+
+    def test_exclusion(self):
+        projected = project_document(self.doc, {'questions.responses': False, '_id': False})
+        self.assertEqual(projected,
+                         {'displayName': {'text': 'foo', 'languageTypeId': 'eng'},
+                          'questions': [{'itemId': 'a'}, {'itemId': 'b'}]})
+        # the stored document is left alone
+        self.assertEqual(self.doc['questions'][0]['responses'], [1])
+
+    def test_mixed_projection_raises(self):
+        with self.assertRaises(InvalidArgument):
+            project_document(self.doc, {'displayName': True, 'questions': False})
@@ -0,0 +1,313 @@
+from __future__ import unicode_literals
+
+import shutil
+import tempfile
+import unittest
+
+from bson import ObjectId
+
+from dlkit.json_.assessment.managers import AssessmentManager
+from dlkit.json_.cataloging.managers import CatalogingManager
+from dlkit.json_.document_caches import ALIAS_CACHE, CATALOG_CACHE, DOCUMENT_CACHE, DocumentCache, split_id_term
+from dlkit.json_.osid.sessions import OsidSession
+from dlkit.json_.primitives import Id
+from dlkit.json_.utilities import JSONClientValidated, make_catalog_map
+from dlkit.runtime.errors import NotFound
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+
+class FakeTimer(object):
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDocumentCache(unittest.TestCase):
+    """Tests the bounded LRU / TTL document cache"""
+
+    def setUp(self):
+        self.timer = FakeTimer()
+        self.cache = DocumentCache(max_size=2, timer=self.timer)
+
+    def test_get_returns_a_copy(self):
+        self.cache.put('db.coll', 'a', {'_id': 'a', 'list': [1]})
+        doc = self.cache.get('db.coll', 'a')
+        doc['list'].append(2)
+        self.assertEqual(self.cache.get('db.coll', 'a'), {'_id': 'a', 'list': [1]})
+        self.assertEqual(self.cache.get_stats('db.coll')['hits'], 2)
+        self.assertIsNone(self.cache.get('db.coll', 'b'))
+        self.assertEqual(self.cache.get_stats()['misses'], 1)
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.put('db.coll', 'a', {'_id': 'a'})
+        self.cache.put('db.coll', 'b', {'_id': 'b'})
+        self.cache.get('db.coll', 'a')
+        self.cache.put('db.coll', 'c', {'_id': 'c'})
+        self.assertIsNone(self.cache.get('db.coll', 'b'))
+        self.assertIsNotNone(self.cache.get('db.coll', 'a'))
+        self.assertEqual(self.cache.get_stats()['evictions'], 1)
+
+    def test_entries_expire(self):
+        self.cache.put('db.coll', 'a', {'_id': 'a'}, ttl=10)
+        self.timer.now += 5
+        self.assertIsNotNone(self.cache.get('db.coll', 'a'))
+        self.timer.now += 5
+        self.assertIsNone(self.cache.get('db.coll', 'a'))
+        self.assertEqual(self.cache.get_stats()['expirations'], 1)
+
+    def test_put_after_a_write_is_dropped(self):
+        generation = self.cache.get_generation('db.coll')
+        self.cache.invalidate('db.coll', ['a'])
+        self.cache.put('db.coll', 'a', {'_id': 'a'}, generation=generation)
+        self.assertIsNone(self.cache.get('db.coll', 'a'))
+
+    def test_oplog_entries_invalidate(self):
+        doc_id = ObjectId()
+        self.cache.put('db.coll', doc_id, {'_id': doc_id})
+        self.cache.process_oplog_entry({'op': 'u', 'ns': 'db.coll', 'o2': {'_id': doc_id},
+                                        'o': {'$set': {'foo': 'bar'}}})
+        self.assertIsNone(self.cache.get('db.coll', doc_id))
+        self.cache.put('db.coll', doc_id, {'_id': doc_id})
+        self.cache.process_oplog_entry({'op': 'c', 'ns': 'db.$cmd', 'o': {'drop': 'coll'}})
+        self.assertIsNone(self.cache.get('db.coll', doc_id))
+
+    def test_split_id_term(self):
+        doc_id = ObjectId()
+        self.assertEqual(split_id_term({'_id': doc_id}), (doc_id, {}))
+        self.assertEqual(split_id_term({'$and': [{'_id': doc_id}, {'foo': 'bar'}]}),
+                         (doc_id, {'$and': [{'foo': 'bar'}]}))
+        self.assertEqual(split_id_term({'_id': {'$in': [doc_id]}}), (None, None))
+        self.assertEqual(split_id_term({'foo': 'bar'}), (None, None))
+
+
+class TestCachedJSONClient(unittest.TestCase):
+    """Tests find_one() by _id through the document cache"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        runtime = Runtime(Configuration({
+            'id': 'test_document_cache_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+                'cachedCollections': {'syntax': 'OBJECT', 'values': [{'value': ['testing.Cached'],
+                                                                      'priority': 1}]},
+            }
+        }))
+        self.client = JSONClientValidated('testing', collection='Cached', runtime=runtime)
+        self.uncached_client = JSONClientValidated('testing', collection='Uncached', runtime=runtime)
+        self.doc_id = ObjectId()
+        self.client.insert_one({'_id': self.doc_id, 'assignedBankIds': ['bank1'], 'foo': 'bar'})
+        self.namespace = self.client._cache_namespace
+        DOCUMENT_CACHE.reset_stats()
+
+    def tearDown(self):
+        DOCUMENT_CACHE.invalidate_namespace(self.namespace)
+        shutil.rmtree(self.directory)
+
+    def test_find_one_by_id_is_cached(self):
+        self.assertIsNone(self.uncached_client._cache)
+        self.assertEqual(self.client.find_one({'_id': self.doc_id})['foo'], 'bar')
+        self.assertEqual(self.client.find_one({'_id': self.doc_id})['foo'], 'bar')
+        stats = DOCUMENT_CACHE.get_stats(self.namespace)
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+
+    def test_other_terms_are_matched(self):
+        self.client.find_one({'_id': self.doc_id})
+        result = self.client.find_one({'$and': [{'_id': self.doc_id},
+                                                {'assignedBankIds': {'$in': ['bank1']}}]})
+        self.assertEqual(result['foo'], 'bar')
+        with self.assertRaises(NotFound):
+            self.client.find_one({'_id': self.doc_id, 'assignedBankIds': {'$in': ['bank2']}})
+        self.assertEqual(DOCUMENT_CACHE.get_stats(self.namespace)['hits'], 2)
+
+    def test_writes_invalidate(self):
+        doc = self.client.find_one({'_id': self.doc_id})
+        doc['foo'] = 'baz'
+        self.client.save(doc)
+        self.assertEqual(self.client.find_one({'_id': self.doc_id})['foo'], 'baz')
+        self.client.delete_one({'_id': self.doc_id})
+        with self.assertRaises(NotFound):
+            self.client.find_one({'_id': self.doc_id})
+
+
+class TestAliasResolution(unittest.TestCase):
+    """Tests resolving alias ids through the alias cache"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.session = OsidSession()
+        self.session._runtime = Runtime(Configuration({
+            'id': 'test_alias_cache_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }
+        }))
+        self.primary_id = Id(identifier=str(ObjectId()), namespace='testing.Thing', authority='TEST')
+        JSONClientValidated('testing', collection='Thing', runtime=self.session._runtime).insert_one(
+            {'_id': ObjectId(self.primary_id.get_identifier())})
+        self.namespace = JSONClientValidated('id', collection='testingIds',
+                                             runtime=self.session._runtime)._cache_namespace
+        ALIAS_CACHE.reset_stats()
+
+    def tearDown(self):
+        ALIAS_CACHE.invalidate_namespace(self.namespace)
+        shutil.rmtree(self.directory)
+
+    def test_ids_are_resolved_in_order(self):
+        alias_id = Id('testing.Thing%3Aalias%40TEST')
+        other_id = Id('testing.Thing%3Aother%40TEST')
+        self.session._alias_id(self.primary_id, alias_id)
+        self.assertEqual(self.session._get_ids([other_id, alias_id, other_id], 'testing'),
+                         [other_id, self.primary_id, other_id])
+        self.assertEqual(ALIAS_CACHE.get_stats(self.namespace)['misses'], 2)
+        self.assertEqual(self.session._get_id(other_id, 'testing'), other_id)
+        self.assertEqual(self.session._get_id(alias_id, 'testing'), self.primary_id)
+        self.assertEqual(ALIAS_CACHE.get_stats(self.namespace)['hits'], 2)
+
+    def test_alias_id_invalidates(self):
+        alias_id = Id('testing.Thing%3Aalias%40TEST')
+        self.assertEqual(self.session._get_id(alias_id, 'testing'), alias_id)
+        self.session._alias_id(self.primary_id, alias_id)
+        self.assertEqual(self.session._get_id(alias_id, 'testing'), self.primary_id)
+
+
+class TestCatalogCache(unittest.TestCase):
+    """Tests constructing sessions for catalogs through the catalog cache"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.runtime = Runtime(Configuration({
+            'id': 'test_catalog_cache_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+                'catalogCacheTTL': {'syntax': 'INTEGER', 'values': [{'value': 60, 'priority': 1}]},
+            }
+        }))
+        self.mgr = AssessmentManager()
+        self.mgr.initialize(self.runtime)
+        admin_session = self.mgr.get_bank_admin_session()
+        self.bank = admin_session.create_bank(admin_session.get_bank_form_for_create([]))
+        self.namespace = JSONClientValidated('assessment', collection='Bank', runtime=self.runtime)._cache_namespace
+        CATALOG_CACHE.reset_stats()
+
+    def tearDown(self):
+        CATALOG_CACHE.invalidate_namespace(self.namespace)
+        shutil.rmtree(self.directory)
+
+    def test_warm_catalog_is_not_read_again(self):
+        # create_bank() read the new bank back, which warmed the cache
+        self.mgr.get_item_lookup_session_for_bank(self.bank.ident)
+        self.mgr.get_item_lookup_session_for_bank(self.bank.ident)
+        self.assertEqual(CATALOG_CACHE.get_stats(self.namespace)['misses'], 0)
+        self.assertEqual(CATALOG_CACHE.get_stats(self.namespace)['hits'], 2)
+
+    def test_catalogs_are_not_cached_by_default(self):
+        runtime = Runtime(Configuration({
+            'id': 'test_catalog_cache_default_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }
+        }))
+        self.assertIsNone(JSONClientValidated('assessment', collection='Bank', runtime=runtime)._cache)
+
+    def test_missing_catalog_is_remembered_until_written(self):
+        bank_id = Id(identifier=str(ObjectId()), namespace='assessment.Bank', authority='ODL.MIT.EDU')
+        collection = JSONClientValidated('assessment', collection='Bank', runtime=self.runtime)
+        for _ in range(2):
+            with self.assertRaises(NotFound):
+                collection.find_one({'_id': ObjectId(bank_id.identifier)})
+        self.assertEqual(CATALOG_CACHE.get_stats(self.namespace)['hits'], 1)
+        collection.insert_one({'_id': ObjectId(bank_id.identifier)})
+        self.assertEqual(collection.find_one({'_id': ObjectId(bank_id.identifier)}),
+                         {'_id': ObjectId(bank_id.identifier)})
+
+    def test_missing_foreign_catalog_is_remembered_until_created(self):
+        bin_id = Id(identifier=str(ObjectId()), namespace='resource.Bin', authority='ODL.MIT.EDU')
+        session = OsidSession()
+        session._init_proxy_and_runtime(None, self.runtime)
+        provider_managers = []
+        get_provider_manager = OsidSession._get_provider_manager
+
+        def counting_get_provider_manager(session, *args, **kwargs):
+            provider_managers.append(args)
+            return get_provider_manager(session, *args, **kwargs)
+        OsidSession._get_provider_manager = counting_get_provider_manager
+        self.addCleanup(setattr, OsidSession, '_get_provider_manager', get_provider_manager)
+        for _ in range(2):
+            with self.assertRaises(NotFound):
+                session._create_orchestrated_cat(bin_id, 'assessment', 'Bank')
+        self.assertEqual(len(provider_managers), 1)
+        JSONClientValidated('resource', collection='Bin', runtime=self.runtime).insert_one(
+            make_catalog_map('Bin', identifier=ObjectId(bin_id.identifier)))
+        self.assertEqual(str(session._create_orchestrated_cat(bin_id, 'assessment', 'Bank')['_id']),
+                         bin_id.identifier)
+
+
+class CatalogingRuntime(Runtime):
+    """A runtime whose cataloging provider is the JSON one, on this runtime"""
+
+    def _load_mgr(self, osid, implementation, version, proxy_key, proxy=None):
+        manager = CatalogingManager()
+        manager.initialize(self)
+        return manager
+
+
+class TestCatalogCacheWithCataloging(unittest.TestCase):
+    """Tests constructing sessions for catalogs looked up through a cataloging provider"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.runtime = CatalogingRuntime(Configuration({
+            'id': 'test_catalog_cache_cataloging_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+                'catalogCacheTTL': {'syntax': 'INTEGER', 'values': [{'value': 60, 'priority': 1}]},
+                'assessmentCatalogingProviderImpl': {'syntax': 'STRING',
+                                                     'values': [{'value': 'TEST_CATALOGING', 'priority': 1}]},
+            }
+        }))
+        self.mgr = AssessmentManager()
+        self.mgr.initialize(self.runtime)
+        admin_session = self.mgr.get_bank_admin_session()
+        self.bank = admin_session.create_bank(admin_session.get_bank_form_for_create([]))
+
+    def tearDown(self):
+        CATALOG_CACHE.clear()
+        shutil.rmtree(self.directory)
+
+    def test_warm_session_takes_no_queries(self):
+        self.mgr.get_item_lookup_session_for_bank(self.bank.ident)
+        queries = []
+        find, find_one = JSONClientValidated.find, JSONClientValidated._find_one
+
+        def counting_find(collection, *args, **kwargs):
+            queries.append(args)
+            return find(collection, *args, **kwargs)
+
+        def counting_find_one(collection, *args, **kwargs):
+            queries.append(args)
+            return find_one(collection, *args, **kwargs)
+        JSONClientValidated.find, JSONClientValidated._find_one = counting_find, counting_find_one
+        self.addCleanup(setattr, JSONClientValidated, 'find', find)
+        self.addCleanup(setattr, JSONClientValidated, '_find_one', find_one)
+        managers = []
+        get_manager = CatalogingRuntime.get_manager
+
+        def counting_get_manager(runtime, *args, **kwargs):
+            managers.append(args)
+            return get_manager(runtime, *args, **kwargs)
+        CatalogingRuntime.get_manager = counting_get_manager
+        self.addCleanup(setattr, CatalogingRuntime, 'get_manager', get_manager)
+        session = self.mgr.get_item_lookup_session_for_bank(self.bank.ident)
+        self.assertEqual(str(session.get_bank_id()), str(self.bank.ident))
+        self.assertEqual(queries, [])
+        self.assertEqual(managers, [])
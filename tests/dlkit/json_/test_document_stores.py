@@ -0,0 +1,227 @@
+from __future__ import unicode_literals
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from threading import Thread
+
+from dlkit.json_.document_stores import MemoryStore, SegmentStore
+from dlkit.json_.utilities import JSONClientValidated
+from dlkit.runtime.errors import NotFound
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+
+class TestSegmentStore(unittest.TestCase):
+    """Tests for the append-only segment file store"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.store = SegmentStore(self.directory)
+
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+
+    def _reopen(self, **kwargs):
+        self.store.close()
+        self.store = SegmentStore(self.directory, **kwargs)
+
+    def test_can_put_get_and_delete(self):
+        self.store.put({'_id': 'a', 'foo': 'bar'})
+        self.store.put({'_id': 'a', 'foo': 'baz'})
+        self.assertEqual(self.store.get('a'), {'_id': 'a', 'foo': 'baz'})
+        self.assertTrue(self.store.delete('a'))
+        self.assertIsNone(self.store.get('a'))
+        self.assertFalse(self.store.delete('a'))
+
+    def test_records_are_replayed_on_load(self):
+        self.store.put_many([{'_id': 'a', 'genusTypeId': 'g1'}, {'_id': 'b', 'genusTypeId': 'g2'}])
+        self.store.delete('b')
+        self._reopen()
+        self.assertEqual(self.store.get_ids(), ['a'])
+        self.assertEqual(self.store.get_candidate_ids({'genusTypeId': 'g1'}), set(['a']))
+
+    def test_partial_record_is_truncated(self):
+        self.store.put({'_id': 'a'})
+        self.store.close()
+        with open(os.path.join(self.directory, 'segment-00000001.jsonl'), 'ab') as segment_file:
+            segment_file.write(b'{"_id": "b", "do')
+        self._reopen()
+        self.assertEqual(self.store.get_ids(), ['a'])
+        self.store.put({'_id': 'c'})
+        self._reopen()
+        self.assertEqual(self.store.get_ids(), ['a', 'c'])
+
+    def test_rotation_and_compaction(self):
+        self._reopen(max_segment_bytes=64, compaction_ratio=2.0)
+        for i in range(10):
+            self.store.put({'_id': 'a', 'count': i})
+        self.store.put({'_id': 'b'})
+        self.assertTrue(self.store.get_garbage_ratio() > 0.5)
+        self.store.compact()
+        self.assertEqual(self.store.get_garbage_ratio(), 0.0)
+        with open(os.path.join(self.directory, 'MANIFEST')) as manifest_file:
+            segments = json.loads(manifest_file.read())
+        self.assertEqual(sorted(segments), sorted(f for f in os.listdir(self.directory) if f.endswith('.jsonl')))
+        self._reopen()
+        self.assertEqual(self.store.get('a'), {'_id': 'a', 'count': 9})
+        self.assertEqual(self.store.count(), 2)
+
+    def test_writes_go_on_during_compaction(self):
+        self._reopen(max_segment_bytes=64, compaction_ratio=2.0)
+        for doc_id in ['a', 'b', 'c']:
+            for i in range(3):
+                self.store.put({'_id': doc_id, 'count': i})
+        fsync = self.store._fsync
+        writers = []
+
+        def write():
+            self.store.put({'_id': 'a', 'count': 10})
+            self.store.delete('b')
+
+        def write_while_copying(file_obj):
+            if file_obj.name.endswith('.compacting.tmp'):
+                writers.append(Thread(target=write))
+                writers[-1].start()
+                writers[-1].join(5)
+            fsync(file_obj)
+        self.store._fsync = write_while_copying
+        self.store.compact()
+        self.assertFalse(writers[0].is_alive())
+        self._reopen()
+        self.assertEqual(self.store.get('a'), {'_id': 'a', 'count': 10})
+        self.assertIsNone(self.store.get('b'))
+        self.assertEqual(self.store.get('c'), {'_id': 'c', 'count': 2})
+
+    def test_unlisted_segments_are_removed(self):
+        self.store.put({'_id': 'a'})
+        self.store.close()
+        with open(os.path.join(self.directory, 'segment-00000009.jsonl'), 'wb') as orphan:
+            orphan.write(b'{"_id": "b", "doc": {"_id": "b"}}\n')
+        self._reopen()
+        self.assertEqual(self.store.get_ids(), ['a'])
+        self.assertFalse(os.path.isfile(os.path.join(self.directory, 'segment-00000009.jsonl')))
+
+    def test_imports_json_files(self):
+        self.store.close()
+        shutil.rmtree(self.directory)
+        os.makedirs(self.directory)
+        for doc_id in ['a', 'b']:
+            JSONClientValidated._save_dict_as_json_file(os.path.join(self.directory, doc_id + '.json'),
+                                                        {'_id': doc_id})
+        self._reopen()
+        self.assertEqual(sorted(self.store.get_ids()), ['a', 'b'])
+
+
+class TestMemoryStore(unittest.TestCase):
+    """Tests for the in-memory store"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_documents_are_copied(self):
+        store = MemoryStore()
+        doc = {'_id': 'a', 'assignedBankIds': ['bank1']}
+        store.put(doc)
+        doc['assignedBankIds'].append('bank2')
+        store.get('a')['assignedBankIds'].append('bank3')
+        self.assertEqual(store.get('a'), {'_id': 'a', 'assignedBankIds': ['bank1']})
+        self.assertEqual(store.get_candidate_ids({'assignedBankIds': {'$in': ['bank1']}}), set(['a']))
+        self.assertEqual(store.delete_many(['a', 'b']), 1)
+        self.assertEqual(store.count(), 0)
+        self.assertFalse(os.listdir(self.directory))
+
+    def test_snapshot(self):
+        store = MemoryStore(self.directory, snapshot=True)
+        store.put_many([{'_id': 'a', 'foo': 1}, {'_id': 'b', 'foo': 2}])
+        store.close()
+        store = MemoryStore(self.directory, snapshot=True)
+        self.assertEqual(store.get_ids(), ['a', 'b'])
+        self.assertEqual(store.get('b'), {'_id': 'b', 'foo': 2})
+
+
+class TestSegmentJSONClient(unittest.TestCase):
+    """Tests JSONClientValidated on top of the segment engine"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        runtime = Runtime(Configuration({
+            'id': 'test_segment_engine_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'filesystemEngine': {'syntax': 'STRING', 'values': [{'value': 'segment', 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }
+        }))
+        self.client = JSONClientValidated('testing', collection='segments', runtime=runtime)
+
+    def tearDown(self):
+        self.client._store.close()
+        shutil.rmtree(self.directory)
+
+    def test_can_save_and_find(self):
+        self.assertTrue(self.client._impl('segment'))
+        self.client.insert_one({'_id': '123', 'assignedBankIds': ['bank1'], 'foo': 'bar'})
+        self.assertEqual(self.client.count(), 1)
+        self.assertEqual(self.client.find_one({'_id': '123'})['foo'], 'bar')
+        result = self.client.find({'assignedBankIds': {'$in': ['bank1']}})
+        self.assertEqual(result.count(), 1)
+        self.client.delete_one({'foo': 'bar'})
+        with self.assertRaises(NotFound):
+            self.client.find_one({'foo': 'bar'})
+
+    def test_bulk_writes(self):
+        result = self.client.insert_many([{'_id': 'a', 'foo': 1}, {'foo': 2}])
+        self.assertEqual(len(result.inserted_ids), 2)
+        self.assertEqual(result.inserted_ids[0], 'a')
+        self.client.bulk_save([{'_id': 'a', 'foo': 3}])
+        self.assertEqual(self.client.find_one({'_id': 'a'})['foo'], 3)
+        self.assertEqual(self.client.bulk_delete(result.inserted_ids + ['missing']), 2)
+        self.assertEqual(self.client.count(), 0)
+
+    def test_projection(self):
+        self.client.insert_one({'_id': '123', 'foo': 'bar', 'baz': {'qux': 1, 'quux': 2}})
+        self.assertEqual(self.client.find_one({'_id': '123'}, projection={'baz.qux': True}),
+                         {'_id': '123', 'baz': {'qux': 1}})
+        self.assertEqual(list(self.client.find(projection={'foo': False, '_id': False})),
+                         [{'baz': {'qux': 1, 'quux': 2}}])
+
+
+class TestMemoryJSONClient(unittest.TestCase):
+    """Tests JSONClientValidated on top of the memory engine"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        runtime = Runtime(Configuration({
+            'id': 'test_memory_engine_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'filesystemEngine': {'syntax': 'STRING', 'values': [{'value': 'memory', 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }
+        }))
+        self.client = JSONClientValidated('testing', collection='memory', runtime=runtime)
+
+    def tearDown(self):
+        self.client._store.close()
+        shutil.rmtree(self.directory)
+
+    def test_cursor_semantics(self):
+        self.assertTrue(self.client._impl('memory'))
+        self.client.insert_many([{'_id': str(number), 'number': number,
+                                  'assignedBankIds': ['bank{0}'.format(number % 2)]}
+                                 for number in range(6)])
+        result = self.client.find({'assignedBankIds': {'$in': ['bank0']}}).sort('number', -1)[1:3]
+        self.assertEqual([doc['number'] for doc in result], [2, 0])
+        self.assertEqual(self.client.find({'number': {'$gte': 3}}).count(), 3)
+        self.client.delete_one({'number': 5})
+        with self.assertRaises(NotFound):
+            self.client.find_one({'_id': '5'})
+        self.assertFalse(os.listdir(self.directory))
@@ -0,0 +1,157 @@
+from __future__ import unicode_literals
+
+import shutil
+import tempfile
+import unittest
+
+from dlkit.json_.assessment.managers import AssessmentManager
+from dlkit.json_.hierarchy_caches import ANCESTRY_MATERIALIZER, AncestryMaterializer, DescendantCache, \
+    materialize_catalog_ancestry
+from dlkit.json_.utilities import JSONClientValidated
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+
+class TestDescendantCache(unittest.TestCase):
+    """Tests the LRU of descendant id sets and its invalidation"""
+
+    def setUp(self):
+        self.cache = DescendantCache(max_size=3)
+        # root -> child -> grandchild, and an unrelated sibling
+        self.cache.put('db.Relationship:h1', 'root', ['root', 'child', 'grandchild'])
+        self.cache.put('db.Relationship:h1', 'child', ['child', 'grandchild'])
+        self.cache.put('db.Relationship:h1', 'sibling', ['sibling'])
+
+    def test_get(self):
+        self.assertEqual(sorted(self.cache.get('db.Relationship:h1', 'child')), ['child', 'grandchild'])
+        self.assertIsNone(self.cache.get('db.Relationship:h2', 'child'))
+        self.assertEqual(self.cache.get_stats()['hits'], 1)
+        self.assertEqual(self.cache.get_stats()['misses'], 1)
+
+    def test_only_sets_including_the_node_are_invalidated(self):
+        self.cache.invalidate_ancestors('db.Relationship:h1', 'child')
+        self.assertIsNone(self.cache.get('db.Relationship:h1', 'root'))
+        self.assertIsNone(self.cache.get('db.Relationship:h1', 'child'))
+        self.assertEqual(self.cache.get('db.Relationship:h1', 'sibling'), ['sibling'])
+
+    def test_put_after_a_change_is_dropped(self):
+        generation = self.cache.get_generation('db.Relationship:h1')
+        self.cache.invalidate_ancestors('db.Relationship:h1', 'grandchild')
+        self.cache.put('db.Relationship:h1', 'root', ['root'], generation=generation)
+        self.assertIsNone(self.cache.get('db.Relationship:h1', 'root'))
+
+    def test_least_recently_used_is_evicted(self):
+        self.cache.get('db.Relationship:h1', 'root')
+        self.cache.put('db.Relationship:h1', 'other', ['other'])
+        self.assertIsNone(self.cache.get('db.Relationship:h1', 'child'))
+        self.assertIsNotNone(self.cache.get('db.Relationship:h1', 'root'))
+
+    def test_dropped_database_invalidates(self):
+        self.cache.invalidate_storage('db')
+        self.assertIsNone(self.cache.get('db.Relationship:h1', 'sibling'))
+
+    def test_sets_expire(self):
+        now = [0]
+        cache = DescendantCache(ttl=10, timer=lambda: now[0])
+        cache.put('db.Relationship:h1', 'root', ['root'])
+        cache.put('db.Relationship:h1', 'child', ['child'], ttl=20)
+        now[0] = 15
+        self.assertIsNone(cache.get('db.Relationship:h1', 'root'))
+        self.assertEqual(cache.get('db.Relationship:h1', 'child'), ['child'])
+        self.assertEqual(cache.get_stats()['expirations'], 1)
+
+    def test_relationship_changes_in_the_oplog_invalidate(self):
+        self.cache.process_oplog_entry({'op': 'u', 'ns': 'db.Item', 'o2': {'_id': 'x'}})
+        self.assertIsNotNone(self.cache.get('db.Relationship:h1', 'sibling'))
+        self.cache.process_oplog_entry({'op': 'i', 'ns': 'db.Relationship', 'o': {'_id': 'x'}})
+        self.assertIsNone(self.cache.get('db.Relationship:h1', 'sibling'))
+
+
+class TestMaterializedAncestry(unittest.TestCase):
+    """Tests federated views over materialized ancestor<Catalog>Ids"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.runtime = Runtime(Configuration({
+            'id': 'test_materialized_ancestry_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+                'materializeCatalogAncestry': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+            }
+        }))
+        self.mgr = AssessmentManager()
+        self.mgr.initialize(self.runtime)
+        self.root, self.child, self.grandchild = [self._create_bank(name) for name in ['root', 'child', 'grandchild']]
+        self.design_session = self.mgr.get_bank_hierarchy_design_session()
+        self.design_session.add_root_bank(self.root.ident)
+        self.design_session.add_child_bank(self.root.ident, self.child.ident)
+        admin_session = self.mgr.get_item_admin_session_for_bank(self.grandchild.ident)
+        admin_session.create_item(admin_session.get_item_form_for_create([]))
+        self.lookup_session = self.mgr.get_item_lookup_session_for_bank(self.root.ident)
+        self.lookup_session.use_federated_bank_view()
+
+    def tearDown(self):
+        ANCESTRY_MATERIALIZER.join_pending()
+        shutil.rmtree(self.directory)
+
+    def _create_bank(self, name):
+        admin_session = self.mgr.get_bank_admin_session()
+        form = admin_session.get_bank_form_for_create([])
+        form.display_name = name
+        return admin_session.create_bank(form)
+
+    def _get_ancestor_idstrs(self):
+        collection = JSONClientValidated('assessment', collection='Item', runtime=self.runtime)
+        return collection.find_one({})['ancestorBankIds']
+
+    def test_view_filter_is_one_match(self):
+        self.assertEqual(self.lookup_session._view_filter(), {'ancestorBankIds': str(self.root.ident)})
+        self.assertEqual(self._get_ancestor_idstrs(), [str(self.grandchild.ident)])
+        self.assertEqual(self.lookup_session.get_items().available(), 0)
+
+    def test_hierarchy_changes_are_materialized(self):
+        self.design_session.add_child_bank(self.child.ident, self.grandchild.ident)
+        ANCESTRY_MATERIALIZER.join_pending()
+        self.assertEqual(sorted(self._get_ancestor_idstrs()),
+                         sorted(str(bank.ident) for bank in [self.root, self.child, self.grandchild]))
+        self.assertEqual(self.lookup_session.get_items().available(), 1)
+        self.design_session.remove_child_bank(self.child.ident, self.grandchild.ident)
+        ANCESTRY_MATERIALIZER.join_pending()
+        self.assertEqual(self.lookup_session.get_items().available(), 0)
+
+    def test_existing_objects_are_backfilled(self):
+        self.design_session.add_child_bank(self.child.ident, self.grandchild.ident)
+        ANCESTRY_MATERIALIZER.join_pending()
+        collection = JSONClientValidated('assessment', collection='Item', runtime=self.runtime)
+        item_map = collection.find_one({})
+        del item_map['ancestorBankIds']
+        collection.save(item_map)
+        materialize_catalog_ancestry(self.runtime, catalog_names=['Bank'])
+        self.assertEqual(sorted(self._get_ancestor_idstrs()),
+                         sorted(str(bank.ident) for bank in [self.root, self.child, self.grandchild]))
+
+
+class TestAncestryMaterializer(unittest.TestCase):
+    """Tests that failed jobs are retried, then kept"""
+
+    def test_failed_jobs_are_retried(self):
+        attempts = []
+
+        def flaky_job():
+            attempts.append(None)
+            if len(attempts) < 2:
+                raise RuntimeError()
+        materializer = AncestryMaterializer()
+        materializer.submit(flaky_job)
+        materializer.join_pending()
+        self.assertEqual(len(attempts), 2)
+        self.assertEqual(materializer.failed_jobs, [])
+
+    def test_jobs_that_keep_failing_are_kept(self):
+        def failing_job():
+            raise RuntimeError()
+        materializer = AncestryMaterializer()
+        materializer.submit(failing_job)
+        materializer.join_pending()
+        self.assertEqual(materializer.failed_jobs, [failing_job])
@@ -0,0 +1,176 @@
+from __future__ import unicode_literals
+
+import shutil
+import tempfile
+import unittest
+
+from dlkit.json_.assessment.managers import AssessmentManager
+from dlkit.json_.hierarchy_caches import HIERARCHY_SNAPSHOTS, HierarchySnapshot, HierarchySnapshots
+from dlkit.json_.utilities import JSONClientValidated
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+
+def dump_node(node):
+    return (str(node.ident), node._my_map['root'], node._my_map['leaf'],
+            [dump_node(child) for child in node.get_children()],
+            [dump_node(parent) for parent in node.get_parents()])
+
+
+class HierarchyTestCase(unittest.TestCase):
+    """Builds two root banks, four children of the first, three
+    grandchildren under each child, and the first child under both roots"""
+
+    parameters = {}
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        parameters = {
+            'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+            'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+        }
+        parameters.update(self.parameters)
+        self.runtime = Runtime(Configuration({
+            'id': 'test_hierarchy_traversal_' + self.directory,
+            'parameters': parameters
+        }))
+        self.mgr = AssessmentManager()
+        self.mgr.initialize(self.runtime)
+        self.admin_session = self.mgr.get_bank_admin_session()
+        self.design_session = self.mgr.get_bank_hierarchy_design_session()
+        self.root_id, self.other_root_id = self._create_bank(), self._create_bank()
+        self.design_session.add_root_bank(self.root_id)
+        self.design_session.add_root_bank(self.other_root_id)
+        self.child_ids = [self._create_bank() for _ in range(4)]
+        self.grandchild_ids = []
+        for child_id in self.child_ids:
+            self.design_session.add_child_bank(self.root_id, child_id)
+            for _ in range(3):
+                self.grandchild_ids.append(self._create_bank())
+                self.design_session.add_child_bank(child_id, self.grandchild_ids[-1])
+        self.design_session.add_child_bank(self.other_root_id, self.child_ids[0])
+        self.traversal_session = self.mgr.get_bank_hierarchy_session()._hierarchy_session
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _create_bank(self):
+        return self.admin_session.create_bank(self.admin_session.get_bank_form_for_create([])).ident
+
+
+class CountingTestCase(HierarchyTestCase):
+    """Counts the finds made on JSONClientValidated collections"""
+
+    def setUp(self):
+        super(CountingTestCase, self).setUp()
+        self.finds = []
+        find = JSONClientValidated.find
+
+        def counting_find(collection, *args, **kwargs):
+            self.finds.append(args)
+            return find(collection, *args, **kwargs)
+        JSONClientValidated.find = counting_find
+        self.addCleanup(setattr, JSONClientValidated, 'find', find)
+
+
+class TestLevelBatchedTraversal(CountingTestCase):
+    """Tests get_nodes() against the node by node traversal"""
+
+    def test_nodes_match_node_by_node_traversal(self):
+        for args in [(self.root_id, 10, 10),
+                     (self.child_ids[0], 10, 10),
+                     (self.grandchild_ids[0], 2, 0),
+                     (self.child_ids[1], 0, 1),
+                     (self.traversal_session._phantom_root_id, 0, 3)]:
+            self.assertEqual(dump_node(self.traversal_session.get_nodes(*args)),
+                             dump_node(self.traversal_session._get_nodes_by_node(*args)))
+
+    def test_queries_depend_on_depth(self):
+        self.traversal_session.get_nodes(self.root_id, 10, 10)
+        # no parents, then children, grandchildren and their (no) children
+        self.assertEqual(len(self.finds), 4)
+
+    def test_ancestors_and_descendants(self):
+        self.assertTrue(self.traversal_session.is_ancestor(self.grandchild_ids[0], self.other_root_id))
+        self.assertTrue(self.traversal_session.is_descendant(self.root_id, self.grandchild_ids[-1]))
+        self.assertFalse(self.traversal_session.is_ancestor(self.grandchild_ids[-1], self.other_root_id))
+        self.assertFalse(self.traversal_session.is_descendant(self.child_ids[1], self.child_ids[2]))
+        self.assertFalse(self.traversal_session.is_ancestor(self.root_id, self.traversal_session._phantom_root_id))
+
+
+class TestHierarchySnapshot(unittest.TestCase):
+    """Tests the closures of a snapshot as its edges change"""
+
+    def test_closures_follow_edge_changes(self):
+        snapshot = HierarchySnapshot([('a', 'b'), ('b', 'c'), ('x', 'y')])
+        self.assertEqual(snapshot.get_ancestor_idstrs('c'), frozenset(['a', 'b']))
+        self.assertEqual(snapshot.get_descendant_idstrs('x'), frozenset(['y']))
+        snapshot.add_edge('c', 'x')
+        self.assertEqual(snapshot.get_ancestor_idstrs('y'), frozenset(['a', 'b', 'c', 'x']))
+        self.assertEqual(snapshot.get_descendant_idstrs('a'), frozenset(['b', 'c', 'x', 'y']))
+        snapshot.remove_edge('a', 'b')
+        self.assertEqual(snapshot.get_ancestor_idstrs('y'), frozenset(['b', 'c', 'x']))
+        self.assertEqual(snapshot.get_descendant_idstrs('a'), frozenset())
+        self.assertEqual(snapshot.get_child_idstrs('c'), ['x'])
+
+
+class TestHierarchySnapshots(unittest.TestCase):
+    """Tests the expiry and invalidation of shared snapshots"""
+
+    def setUp(self):
+        self.now = [0]
+        self.snapshots = HierarchySnapshots(ttl=10, timer=lambda: self.now[0])
+        self.snapshot = self.snapshots.put('db.Relationship:h1:t', HierarchySnapshot([('a', 'b')]))
+
+    def test_snapshots_expire(self):
+        self.snapshots.put('db.Relationship:h2:t', HierarchySnapshot(), ttl=20)
+        self.now[0] = 15
+        self.assertIsNone(self.snapshots.get('db.Relationship:h1:t'))
+        self.assertIsNotNone(self.snapshots.get('db.Relationship:h2:t'))
+
+    def test_snapshots_are_not_shared_without_a_ttl(self):
+        snapshot = HierarchySnapshot()
+        self.assertIs(self.snapshots.put('db.Relationship:h2:t', snapshot, ttl=0), snapshot)
+        self.assertIsNone(self.snapshots.get('db.Relationship:h2:t'))
+
+    def test_relationship_changes_in_the_oplog_invalidate(self):
+        self.snapshots.process_oplog_entry({'op': 'u', 'ns': 'db.Item', 'o2': {'_id': 'x'}})
+        self.assertIs(self.snapshots.get('db.Relationship:h1:t'), self.snapshot)
+        self.snapshots.process_oplog_entry({'op': 'd', 'ns': 'db.Relationship', 'o': {'_id': 'x'}})
+        self.assertIsNone(self.snapshots.get('db.Relationship:h1:t'))
+
+
+class TestSnapshotTraversal(CountingTestCase):
+    """Tests traversing with useHierarchySnapshots@json set"""
+    parameters = {'useHierarchySnapshots': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]}}
+
+    def tearDown(self):
+        HIERARCHY_SNAPSHOTS.clear()
+        super(TestSnapshotTraversal, self).tearDown()
+
+    def test_traversal_reads_one_snapshot(self):
+        session = self.traversal_session
+        self.assertTrue(session.is_ancestor(self.grandchild_ids[0], self.other_root_id))
+        del self.finds[:]
+        self.assertTrue(session.is_descendant(self.root_id, self.grandchild_ids[-1]))
+        self.assertFalse(session.is_ancestor(self.grandchild_ids[-1], self.other_root_id))
+        self.assertEqual(set(str(idstr) for idstr in session.get_roots()),
+                         set([str(self.root_id), str(self.other_root_id)]))
+        self.assertEqual([str(parent_id) for parent_id in session.get_parents(self.child_ids[1])], [str(self.root_id)])
+        self.assertTrue(session.is_child(self.child_ids[1], self.grandchild_ids[3]))
+        session.get_nodes(self.root_id, 10, 10)
+        self.assertEqual(self.finds, [])
+
+    def test_nodes_match_node_by_node_traversal(self):
+        for args in [(self.root_id, 10, 10), (self.grandchild_ids[0], 2, 0)]:
+            self.assertEqual(dump_node(self.traversal_session.get_nodes(*args)),
+                             dump_node(self.traversal_session._get_nodes_by_node(*args)))
+
+    def test_design_changes_update_the_snapshot(self):
+        self.assertFalse(self.traversal_session.is_ancestor(self.grandchild_ids[-1], self.other_root_id))
+        self.design_session.add_child_bank(self.other_root_id, self.child_ids[-1])
+        self.design_session.remove_child_bank(self.root_id, self.child_ids[0])
+        del self.finds[:]
+        self.assertTrue(self.traversal_session.is_ancestor(self.grandchild_ids[-1], self.other_root_id))
+        self.assertFalse(self.traversal_session.is_descendant(self.root_id, self.grandchild_ids[0]))
+        self.assertEqual(self.finds, [])
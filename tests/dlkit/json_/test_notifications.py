@@ -0,0 +1,166 @@
+from __future__ import unicode_literals
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from dlkit.json_ import DeliveryPool, LocalChangeFeed, MongoListener
+from dlkit.json_ import utilities
+from dlkit.json_.utilities import JSONClientValidated
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+
+class Receiver(object):
+    def __init__(self):
+        self.notifications = []
+        self.received = threading.Event()
+
+    def new_things(self, notification_id, object_ids):
+        self.notifications.append(('new', notification_id, [str(object_id) for object_id in object_ids]))
+        self.received.set()
+
+    def deleted_things(self, notification_id, object_ids):
+        self.notifications.append(('deleted', notification_id, [str(object_id) for object_id in object_ids]))
+        self.received.set()
+
+
+def get_params(reliable=False):
+    return {'authority': 'TEST', 'obj_name_plural': 'things',
+            'i': True, 'u': False, 'd': True, 'reliable': reliable}
+
+
+def wait_for(condition, timeout=5):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestDeliveryPool(unittest.TestCase):
+    """Tests the per-receiver mailboxes of the delivery pool"""
+
+    def test_slow_receiver_does_not_stall_others(self):
+        pool = DeliveryPool(max_workers=2)
+        release = threading.Event()
+        delivered = []
+        pool.submit('slow', release.wait)
+        for number in range(5):
+            pool.submit('fast', lambda number=number: delivered.append(number))
+        self.assertTrue(wait_for(lambda: len(delivered) == 5))
+        self.assertEqual(delivered, [0, 1, 2, 3, 4])
+        release.set()
+
+    def test_failing_delivery_does_not_stop_the_worker(self):
+        pool = DeliveryPool(max_workers=1)
+        delivered = []
+        pool.submit('receiver', lambda: 1 / 0)
+        pool.submit('receiver', lambda: delivered.append(True))
+        self.assertTrue(wait_for(lambda: delivered))
+
+
+class TestMongoListener(unittest.TestCase):
+    """Tests the local change feed, delivery and retries of the listener"""
+
+    def setUp(self):
+        self.listener = MongoListener(wait_seconds=0.05, max_attempts=3)
+        self.listener.local_changes = LocalChangeFeed()
+        self.receiver = Receiver()
+
+    def tearDown(self):
+        self.listener.stop()
+
+    def test_local_changes_are_delivered(self):
+        self.listener.receivers['db.Thing'] = {self.receiver: get_params()}
+        self.listener.publish_local('db.Thing', 'i', ['a', 'b'])
+        self.listener.publish_local('db.Other', 'i', ['c'])
+        self.listener.start()
+        self.assertTrue(wait_for(lambda: len(self.receiver.notifications) == 2))
+        self.assertEqual([n[2] for n in self.receiver.notifications],
+                         [['db.Thing:a@TEST'], ['db.Thing:b@TEST']])
+
+    def test_reliable_notifications_are_retried_until_acknowledged(self):
+        self.listener.receivers['db.Thing'] = {self.receiver: get_params(reliable=True)}
+        self.listener.start()
+        self.listener.publish_local('db.Thing', 'd', ['a'])
+        self.assertTrue(wait_for(lambda: len(self.receiver.notifications) == 2))
+        notification_id = self.receiver.notifications[0][1]
+        self.assertEqual(self.receiver.notifications[1][1], notification_id)
+        self.listener.acknowledge(notification_id)
+        time.sleep(0.2)
+        self.assertEqual(len(self.receiver.notifications), 2)
+        self.assertEqual(self.listener.notifications, {})
+
+    def test_busy_change_stream_still_retries(self):
+        listener = MongoListener(retry_seconds=0)
+        retries = []
+
+        def retry():
+            retries.append(None)
+            listener.stop()
+        listener._retry = retry
+
+        class BusyStream(object):
+            resume_token = None
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *args):
+                pass
+
+            def try_next(self):
+                return {'operationType': 'insert', 'ns': {'db': 'db', 'coll': 'Thing'},
+                        'documentKey': {'_id': 'a'}, 'fullDocument': {'_id': 'a'}}
+        listener._watch = BusyStream
+        listener._run_change_stream()
+        self.assertEqual(len(retries), 1)
+
+    def test_change_stream_events_are_converted(self):
+        entry = MongoListener._get_oplog_entry({'operationType': 'replace',
+                                                'ns': {'db': 'db', 'coll': 'Thing'},
+                                                'documentKey': {'_id': 'a'},
+                                                'fullDocument': {'_id': 'a', 'foo': 'bar'}})
+        self.assertEqual(entry['op'], 'u')
+        self.assertEqual(entry['ns'], 'db.Thing')
+        self.assertEqual(entry['o2'], {'_id': 'a'})
+        entry = MongoListener._get_oplog_entry({'operationType': 'drop',
+                                                'ns': {'db': 'db', 'coll': 'Thing'}})
+        self.assertEqual(entry, {'op': 'c', 'ns': 'db.$cmd', 'o': {'drop': 'Thing'}})
+
+
+class TestLocalReplay(unittest.TestCase):
+    """Tests that JSONClientValidated writes are replayed to local receivers"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        runtime = Runtime(Configuration({
+            'id': 'test_local_replay_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }
+        }))
+        self.client = JSONClientValidated('testing', collection='Thing', runtime=runtime)
+        self.listener = MongoListener()
+        self.listener.local_changes = LocalChangeFeed()
+        self.global_listener = utilities.MONGO_LISTENER
+        utilities.MONGO_LISTENER = self.listener
+
+    def tearDown(self):
+        utilities.MONGO_LISTENER = self.global_listener
+        self.listener.stop()
+        shutil.rmtree(self.directory)
+
+    def test_writes_are_replayed(self):
+        receiver = Receiver()
+        self.listener.receivers['testing.Thing'] = {receiver: get_params()}
+        self.listener.start()
+        doc_id = self.client.insert_one({'foo': 'bar'}).inserted_id
+        self.client.delete_one({'foo': 'bar'})
+        self.assertTrue(wait_for(lambda: len(receiver.notifications) == 2))
+        self.assertEqual([(n[0], n[2]) for n in receiver.notifications],
+                         [('new', ['testing.Thing:{0}@TEST'.format(doc_id)]),
+                          ('deleted', ['testing.Thing:{0}@TEST'.format(doc_id)])])
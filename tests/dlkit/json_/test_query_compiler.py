@@ -0,0 +1,69 @@
+import datetime
+import re
+import unittest
+
+from bson import ObjectId
+
+from dlkit.json_.osid.osid_errors import OperationFailed
+from dlkit.json_.query_compiler import QueryCompiler, compile_query
+from dlkit.json_.utilities import clean_up_datetime
+
+
+class TestQueryCompiler(unittest.TestCase):
+    """Tests the compiled predicates against stored documents"""
+
+    def setUp(self):
+        self.doc = clean_up_datetime({
+            '_id': '5a0000000000000000000001',
+            'genusTypeId': 'genus',
+            'assignedBankIds': ['bank1', 'bank2'],
+            'displayName': {'text': 'Hello World'},
+            'score': 7.5,
+            'startDate': datetime.datetime(2018, 1, 2, 3, 4, 5),
+            'question': {'choices': [{'id': 'c1', 'texts': [{'text': 'a'}]},
+                                     {'id': 'c2', 'texts': [{'text': 'b'}]}]}
+        })
+
+    def test_in_and_nin(self):
+        self.assertTrue(compile_query({'assignedBankIds': {'$in': ['bank2', 'bank3']}})(self.doc))
+        self.assertFalse(compile_query({'assignedBankIds': {'$nin': ['bank2']}})(self.doc))
+        self.assertTrue(compile_query({'missing': {'$nin': ['bank2']}})(self.doc))
+        self.assertTrue(compile_query({'_id': {'$in': [ObjectId('5a0000000000000000000001')]}})(self.doc))
+
+    def test_in_does_not_match_substrings(self):
+        self.assertFalse(compile_query({'genusTypeId': {'$in': ['gen']}})(self.doc))
+
+    def test_regular_expressions(self):
+        self.assertTrue(compile_query({'displayName.text': {'$in': [re.compile('.*World.*')]}})(self.doc))
+        self.assertFalse(compile_query({'displayName.text': {'$nin': [re.compile('world', re.I)]}})(self.doc))
+        self.assertTrue(compile_query({'displayName.text': {'$regex': '^hello', '$options': 'i'}})(self.doc))
+
+    def test_deep_paths_expand_arrays(self):
+        self.assertTrue(compile_query({'question.choices.texts.text': 'b'})(self.doc))
+        self.assertTrue(compile_query({'question.choices.1.id': 'c2'})(self.doc))
+        self.assertFalse(compile_query({'question.choices.0.id': 'c2'})(self.doc))
+
+    def test_ranges(self):
+        self.assertTrue(compile_query({'score': {'$gte': 7.5, '$lte': 10}})(self.doc))
+        self.assertFalse(compile_query({'score': {'$gt': 7.5}})(self.doc))
+        self.assertFalse(compile_query({'genusTypeId': {'$gt': 1}})(self.doc))
+        self.assertTrue(compile_query({'startDate': {'$lt': datetime.datetime(2018, 1, 3)}})(self.doc))
+        self.assertFalse(compile_query({'startDate': {'$gte': datetime.datetime(2018, 1, 3)}})(self.doc))
+
+    def test_logical_operators_and_exists(self):
+        query = {'$or': [{'genusTypeId': 'other'},
+                         {'$and': [{'score': {'$gte': 5}}, {'score': {'$lt': 8}}]}]}
+        self.assertTrue(compile_query(query)(self.doc))
+        self.assertFalse(compile_query({'$nor': [{'genusTypeId': 'genus'}]})(self.doc))
+        self.assertTrue(compile_query({'_id': {'$exists': 'true'}})(self.doc))
+        self.assertFalse(compile_query({'_id': {'$exists': 'false'}})(self.doc))
+
+    def test_unsupported_operator_raises(self):
+        with self.assertRaises(OperationFailed):
+            compile_query({'score': {'$where': 'true'}})
+
+    def test_predicates_are_cached_by_shape(self):
+        compiler = QueryCompiler()
+        self.assertTrue(compiler.compile({'genusTypeId': {'$in': ['genus']}})(self.doc))
+        self.assertFalse(compiler.compile({'genusTypeId': {'$in': ['other', 'values']}})(self.doc))
+        self.assertEqual(compiler.get_stats(), {'hits': 1, 'misses': 1})
@@ -5,10 +5,24 @@ import glob
 import json
 import os
 import shutil
+import tempfile
 import unittest
 
-from dlkit.json_.utilities import MyIterator,\
-    query_is_match, JSONClientValidated
+try:
+    # python 2
+    from mock import MagicMock
+except ImportError:
+    # python 3
+    from unittest.mock import MagicMock
+
+from bson import ObjectId
+
+from dlkit.json_ import JSON_CLIENT, MONGO_LISTENER
+from dlkit.json_.osid import sessions as osid_sessions
+from dlkit.json_.utilities import MyIterator, BatchedObjectMaps,\
+    query_is_match, JSONClientValidated, JSONClientRegistry, JSON_CLIENT_REGISTRY
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
 from dlkit.runtime import RUNTIME, PROXY_SESSION
 from dlkit.runtime.errors import NotFound
 from dlkit.runtime.primitives import Id
@@ -145,3 +159,172 @@ class TestJSONClientValidated(unittest.TestCase):
 
         with self.assertRaises(NotFound):
             self.client.find_one({'foo': 'bim'})
+
+
+class TestJSONClientRegistry(unittest.TestCase):
+    """Check that client handles are resolved once and then reused"""
+
+    @staticmethod
+    def _get_mongo_runtime(indexes):
+        return Runtime(Configuration({
+            'id': 'test_json_client_registry',
+            'parameters': {
+                'mongoDBNamePrefix': {
+                    'syntax': 'STRING',
+                    'values': [{'value': 'test_dlkit_', 'priority': 1}]
+                },
+                'indexes': {
+                    'syntax': 'OBJECT',
+                    'values': [{'value': indexes, 'priority': 1}]
+                },
+            }
+        }))
+
+    @classmethod
+    def setUpClass(cls):
+        cls.mgr = get_assessment_manager()
+        cls.runtime = cls.mgr._provider_manager._runtime
+
+    def setUp(self):
+        JSON_CLIENT_REGISTRY.clear()
+        JSON_CLIENT_REGISTRY.reset_stats()
+        self._original_client = JSON_CLIENT.json_client
+
+    def tearDown(self):
+        JSON_CLIENT.set_json_client(self._original_client)
+        JSON_CLIENT_REGISTRY.clear()
+
+    def test_handle_is_created_once_per_collection(self):
+        first = JSONClientValidated('testing', collection='json_client', runtime=self.runtime)
+        second = JSONClientValidated('testing', collection='json_client', runtime=self.runtime)
+        self.assertEqual(first.raw(), second.raw())
+        self.assertTrue(first._impl('filesystem'))
+        stats = JSON_CLIENT_REGISTRY.get_stats()
+        self.assertEqual(stats['handles_created'], 1)
+        self.assertEqual(stats['handle_hits'], 1)
+        self.assertEqual(stats['config_lookups_saved'], JSON_CLIENT_REGISTRY.FILESYSTEM_CONFIG_LOOKUPS)
+
+    def test_clear_forgets_handles(self):
+        JSONClientValidated('testing', collection='json_client', runtime=self.runtime)
+        JSON_CLIENT_REGISTRY.clear()
+        JSONClientValidated('testing', collection='json_client', runtime=self.runtime)
+        self.assertEqual(JSON_CLIENT_REGISTRY.get_stats()['handles_created'], 2)
+
+    def test_mongo_indexes_are_created_once(self):
+        mock_client = MagicMock()
+        JSON_CLIENT.set_json_client(mock_client)
+        runtime = self._get_mongo_runtime({'testing.json_client': ['foo', 'bar']})
+        for _ in range(3):
+            client = JSONClientValidated('testing', collection='json_client', runtime=runtime)
+            self.assertTrue(client._impl('mongo'))
+        mock_collection = mock_client['test_dlkit_testing']['json_client']
+        self.assertEqual(mock_collection.create_index.call_count, 2)
+        stats = JSON_CLIENT_REGISTRY.get_stats()
+        self.assertEqual(stats['index_round_trips'], 2)
+        self.assertEqual(stats['index_round_trips_saved'], 4)
+        self.assertEqual(stats['config_lookups_saved'], 2 * JSON_CLIENT_REGISTRY.MONGO_CONFIG_LOOKUPS)
+
+    def test_replaced_client_is_resolved_again(self):
+        runtime = self._get_mongo_runtime({'testing.json_client': ['foo']})
+        first_client = MagicMock()
+        JSON_CLIENT.set_json_client(first_client)
+        JSONClientValidated('testing', collection='json_client', runtime=runtime)
+        second_client = MagicMock()
+        JSON_CLIENT.set_json_client(second_client)
+        client = JSONClientValidated('testing', collection='json_client', runtime=runtime)
+        self.assertEqual(client.raw(), second_client['test_dlkit_testing']['json_client'])
+        self.assertEqual(second_client['test_dlkit_testing']['json_client'].create_index.call_count, 1)
+        self.assertEqual(JSON_CLIENT_REGISTRY.get_stats()['handles_created'], 2)
+
+    def test_dropped_database_gets_indexes_again(self):
+        mock_client = MagicMock()
+        mock_client['test_dlkit_testing']['json_client'].database.name = 'test_dlkit_testing'
+        JSON_CLIENT.set_json_client(mock_client)
+        runtime = self._get_mongo_runtime({'testing.json_client': ['foo']})
+        JSONClientValidated('testing', collection='json_client', runtime=runtime)
+        JSON_CLIENT_REGISTRY.invalidate_database('test_dlkit_testing')
+        JSONClientValidated('testing', collection='json_client', runtime=runtime)
+        self.assertEqual(mock_client['test_dlkit_testing']['json_client'].create_index.call_count, 2)
+
+    def test_oplog_caches_listen_once_invalidation_is_configured(self):
+        JSON_CLIENT.set_json_client(MagicMock())
+        runtime = Runtime(Configuration({
+            'id': 'test_json_client_registry_oplog',
+            'parameters': {
+                'invalidateCacheFromOplog': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+            }
+        }))
+        registry = JSONClientRegistry()
+        registry._oplog_caches = []
+        early_cache, late_cache = MagicMock(), MagicMock()
+        registry.register_oplog_cache(early_cache)
+        registry.get_handle('testing', collection='json_client', runtime=self.runtime)
+        self.assertFalse(early_cache.listen_to_oplog.called)
+        registry.get_handle('testing', collection='json_client', runtime=runtime)
+        early_cache.listen_to_oplog.assert_called_once_with(MONGO_LISTENER, runtime)
+        registry.register_oplog_cache(late_cache)
+        late_cache.listen_to_oplog.assert_called_once_with(MONGO_LISTENER)
+
+    def test_runtime_without_configuration_key_is_not_cached(self):
+        runtime = MagicMock(spec=['get_configuration'])
+        runtime.get_configuration.return_value = self.runtime.get_configuration()
+        JSONClientValidated('testing', collection='json_client', runtime=runtime)
+        JSONClientValidated('testing', collection='json_client', runtime=runtime)
+        stats = JSON_CLIENT_REGISTRY.get_stats()
+        self.assertEqual(stats['handles_created'], 2)
+        self.assertEqual(stats['handle_hits'], 0)
+
+
+class UnfilteredSession(osid_sessions.OsidSession):
+    def _view_filter(self):
+        return {}
+
+
+class TestGetObjectMapsByIds(unittest.TestCase):
+    """Tests the ordering and batching of get_*_by_ids lookups"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        runtime = Runtime(Configuration({
+            'id': 'test_maps_by_ids_' + self.directory,
+            'parameters': {
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'dataStorePath': {'syntax': 'STRING', 'values': [{'value': self.directory, 'priority': 1}]},
+            }
+        }))
+        self.client = JSONClientValidated('testing', collection='Thing', runtime=runtime)
+        self.object_ids = [ObjectId() for number in range(5)]
+        for number, object_id in enumerate(self.object_ids):
+            self.client.insert_one({'_id': object_id, 'number': number})
+        self.session = UnfilteredSession()
+        self.max_in_batch = osid_sessions.MAX_IN_BATCH
+
+    def tearDown(self):
+        osid_sessions.MAX_IN_BATCH = self.max_in_batch
+        shutil.rmtree(self.directory)
+
+    def _get_numbers(self, object_ids):
+        return [object_map['number'] for object_map in
+                self.session._get_object_maps_by_ids(self.client, object_ids)]
+
+    def test_order_and_duplicates_are_kept(self):
+        object_ids = [self.object_ids[3], self.object_ids[0], self.object_ids[3]]
+        self.assertEqual(self._get_numbers(object_ids), [3, 0, 3])
+
+    def test_large_lists_are_streamed_in_batches(self):
+        osid_sessions.MAX_IN_BATCH = 2
+        object_ids = list(reversed(self.object_ids)) + [self.object_ids[1]]
+        result = self.session._get_object_maps_by_ids(self.client, object_ids)
+        self.assertTrue(isinstance(result, BatchedObjectMaps))
+        self.assertEqual(result.count(), 6)
+        self.assertEqual([object_map['number'] for object_map in result], [4, 3, 2, 1, 0, 1])
+
+    def test_missing_ids(self):
+        object_ids = [self.object_ids[1], ObjectId()]
+        self.assertEqual(self._get_numbers(object_ids), [1])
+        self.session._use_plenary_object_view()
+        with self.assertRaises(NotFound):
+            self._get_numbers(object_ids)
+        osid_sessions.MAX_IN_BATCH = 1
+        with self.assertRaises(NotFound):
+            self._get_numbers(object_ids)
@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from dlkit.abstract_osid.osid import errors
+from dlkit.primordium.id.primitives import Id
+from dlkit.runtime.impls.configuration.objects import Configuration
+from dlkit.runtime.managers import Runtime
+
+
+class TestConfigurationSnapshot(unittest.TestCase):
+    """Tests reading parameter values from a runtime's configuration snapshot"""
+
+    def setUp(self):
+        self.config_map = {
+            'id': 'test_configuration_snapshot',
+            'parameters': {
+                'authority': {'syntax': 'STRING',
+                              'values': [{'value': 'LOW', 'priority': 1}, {'value': 'HIGH', 'priority': 2}]},
+                'useFilesystem.parameter': {'syntax': 'BOOLEAN', 'values': [{'value': True, 'priority': 1}]},
+                'useFilesystem': {'syntax': 'BOOLEAN', 'values': [{'value': False, 'priority': 1}]},
+                'empty': {'syntax': 'STRING', 'values': []},
+            }
+        }
+        self.runtime = Runtime(Configuration(self.config_map))
+
+    def test_values_match_the_value_retrieval_session(self):
+        snapshot = self.runtime.get_configuration_snapshot()
+        for parameter, syntax in [('parameter:authority@json', 'string'),
+                                  ('parameter:useFilesystem@json', 'boolean')]:
+            value = self.runtime.get_configuration().get_value_by_parameter(Id(parameter))
+            self.assertEqual(getattr(snapshot, 'get_{0}_value'.format(syntax))(parameter),
+                             getattr(value, 'get_{0}_value'.format(syntax))())
+        self.assertEqual(snapshot.get_value_by_parameter(Id('parameter:authority@json')).get_string_value(), 'HIGH')
+
+    def test_missing_and_mistyped_values(self):
+        snapshot = self.runtime.get_configuration_snapshot()
+        for parameter in ['parameter:missing@json', 'parameter:empty@json']:
+            with self.assertRaises(errors.NotFound):
+                snapshot.get_string_value(parameter)
+            self.assertFalse(snapshot.has_parameter(parameter))
+        with self.assertRaises(errors.IllegalState):
+            snapshot.get_boolean_value('parameter:authority@json')
+
+    def test_snapshot_is_replaced_when_parameters_change(self):
+        snapshot = self.runtime.get_configuration_snapshot()
+        self.assertIs(self.runtime.get_configuration_snapshot(), snapshot)
+        self.config_map['parameters']['keywordFields'] = {'syntax': 'OBJECT',
+                                                          'values': [{'value': {}, 'priority': 1}]}
+        new_snapshot = self.runtime.get_configuration_snapshot()
+        self.assertIsNot(new_snapshot, snapshot)
+        self.assertEqual(new_snapshot.get_object_value('parameter:keywordFields@json'), {})
+        with self.assertRaises(errors.NotFound):
+            snapshot.get_object_value('parameter:keywordFields@json')
+
+    def test_snapshot_is_replaced_when_marked_changed(self):
+        snapshot = self.runtime.get_configuration_snapshot()
+        self.config_map['parameters']['useFilesystem']['values'][0]['value'] = True
+        self.assertIs(self.runtime.get_configuration_snapshot(), snapshot)
+        self.runtime._configuration.mark_changed()
+        self.assertTrue(self.runtime.get_configuration_snapshot().get_boolean_value('parameter:useFilesystem@json'))
+
+    def test_equal_maps_have_different_keys(self):
+        other_map = dict(self.config_map, parameters=dict(self.config_map['parameters']))
+        self.assertNotEqual(Configuration(other_map).get_configuration_key(),
+                            self.runtime.get_configuration_key())
+        self.assertEqual(Configuration(self.config_map).get_configuration_key(),
+                         self.runtime.get_configuration_key())
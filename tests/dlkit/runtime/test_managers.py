@@ -0,0 +1,40 @@
+from __future__ import unicode_literals
+
+import unittest
+
+from dlkit.runtime import configs
+from dlkit.runtime.managers import Runtime
+
+
+class TestManagerCache(unittest.TestCase):
+    """Tests sharing the provider managers behind service managers"""
+
+    def setUp(self):
+        self.runtime = Runtime()
+        self.runtime.invalidate_managers(implementation='TEST_SERVICE_FILESYSTEM')
+
+    def tearDown(self):
+        self.runtime.invalidate_managers(implementation='TEST_SERVICE_FILESYSTEM')
+
+    def _get_service_manager(self, runtime=None):
+        return (runtime or self.runtime).get_service_manager('ASSESSMENT', implementation='TEST_SERVICE_FILESYSTEM')
+
+    def test_provider_managers_are_shared(self):
+        manager = self._get_service_manager()
+        other_manager = self._get_service_manager(Runtime())
+        self.assertIsNot(manager, other_manager)
+        self.assertIs(manager._provider_manager, other_manager._provider_manager)
+
+    def test_invalidated_managers_are_loaded_again(self):
+        manager = self._get_service_manager()
+        self.runtime.invalidate_managers(osid='ASSESSMENT')
+        self.assertIsNot(self._get_service_manager()._provider_manager, manager._provider_manager)
+
+    def test_replaced_configuration_gets_a_new_runtime(self):
+        manager = self._get_service_manager()
+        original_configuration = configs.TEST_SERVICE_FILESYSTEM
+        configs.TEST_SERVICE_FILESYSTEM = dict(original_configuration)
+        try:
+            self.assertIsNot(self._get_service_manager()._provider_manager, manager._provider_manager)
+        finally:
+            configs.TEST_SERVICE_FILESYSTEM = original_configuration
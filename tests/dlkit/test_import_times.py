@@ -0,0 +1,128 @@
+"""Startup cost of the dlkit.services OSID packages
+
+Each package is imported in a fresh interpreter, and the modules it
+loads are checked. Run this module to print the import time and traced
+memory of every package, and with ``--save-baseline`` to record them in
+``import_times_baseline.json``::
+
+    python -m tests.dlkit.test_import_times [--save-baseline]
+
+Those figures depend on the host and the interpreter, so they are only
+compared with the baseline when ``DLKIT_CHECK_IMPORT_BASELINE`` is set,
+on the machine and Python the baseline was recorded with.
+
+"""
+from __future__ import print_function, unicode_literals
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+OSID_PACKAGES = ['assessment', 'assessment_authoring', 'authentication', 'authorization', 'cataloging',
+                 'commenting', 'grading', 'hierarchy', 'id', 'learning', 'locale', 'logging_', 'proxy',
+                 'relationship', 'repository', 'resource', 'type']
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'import_times_baseline.json')
+
+# Import times are noisy, so a package fails when it takes more than
+# TIME_FACTOR times its baseline, and TIME_SLACK_MS more. Traced memory
+# barely moves between runs.
+TIME_FACTOR = 3
+TIME_SLACK_MS = 25
+MEMORY_FACTOR = 1.25
+RUNS = 3
+
+MEASURE_IMPORT = """
+import json, sys, time, tracemalloc
+tracemalloc.start()
+start = time.time()
+import {0}
+{1}
+seconds = time.time() - start
+print(json.dumps({{'seconds': seconds,
+                  'bytes': tracemalloc.get_traced_memory()[0],
+                  'modules': sorted(sys.modules)}}))
+"""
+
+
+def measure_import(module_name, names=()):
+    """Imports a module, and then some ``names`` from it, in a new
+    interpreter, and gets its import time, allocated memory and the
+    modules it imported"""
+    from_import = ''
+    if names:
+        from_import = 'from {0} import {1}'.format(module_name, ', '.join(names))
+    output = subprocess.check_output([sys.executable, '-c', MEASURE_IMPORT.format(module_name, from_import)])
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+def measure_package(package, runs=RUNS):
+    """Gets the fastest import time, in ms, and the least memory, in KiB,
+    of a services package over a few runs"""
+    measurements = [measure_import('dlkit.services.' + package) for _ in range(runs)]
+    return {'ms': min(measurement['seconds'] for measurement in measurements) * 1000,
+            'kib': min(measurement['bytes'] for measurement in measurements) / 1024.0}
+
+
+def load_baseline():
+    with open(BASELINE_PATH) as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(measurements):
+    with open(BASELINE_PATH, 'w') as baseline_file:
+        json.dump(dict((package, {'ms': round(measurement['ms'], 1), 'kib': round(measurement['kib'])})
+                       for package, measurement in measurements.items()),
+                  baseline_file, indent=2, sort_keys=True)
+        baseline_file.write('\n')
+
+
+@unittest.skipIf(sys.version_info < (3, 4), 'needs tracemalloc')
+class TestServicesImports(unittest.TestCase):
+    """Tests that importing services does not load providers or other OSIDs"""
+
+    def test_package_imports_no_osids(self):
+        modules = measure_import('dlkit.services')['modules']
+        self.assertEqual([module for module in modules if module.startswith('dlkit.')],
+                         ['dlkit.lazy_modules', 'dlkit.services'])
+
+    def test_services_import_no_providers(self):
+        for osid in OSID_PACKAGES:
+            modules = measure_import('dlkit.services.' + osid)['modules']
+            self.assertFalse([module for module in modules
+                              if module.startswith('dlkit.json_') or module.startswith('pymongo')], osid)
+
+    def test_primitives_are_imported_when_used(self):
+        modules = measure_import('dlkit.services.primitives')['modules']
+        self.assertNotIn('dlkit.primordium.id.primitives', modules)
+        modules = measure_import('dlkit.services.primitives', ['Id'])['modules']
+        self.assertIn('dlkit.primordium.id.primitives', modules)
+        self.assertNotIn('dlkit.primordium.calendaring.primitives', modules)
+
+
+@unittest.skipIf(sys.version_info < (3, 4), 'needs tracemalloc')
+@unittest.skipUnless(os.environ.get('DLKIT_CHECK_IMPORT_BASELINE'), 'set DLKIT_CHECK_IMPORT_BASELINE to compare')
+class TestServicesImportBaseline(unittest.TestCase):
+    """Tests the import time and memory of each package against the baseline"""
+
+    def test_packages_are_within_baseline(self):
+        baseline = load_baseline()
+        for package in OSID_PACKAGES:
+            measurement = measure_package(package)
+            self.assertLessEqual(measurement['ms'], baseline[package]['ms'] * TIME_FACTOR + TIME_SLACK_MS,
+                                 '{0} took {1:.1f} ms'.format(package, measurement['ms']))
+            self.assertLessEqual(measurement['kib'], baseline[package]['kib'] * MEMORY_FACTOR,
+                                 '{0} allocated {1:.0f} KiB'.format(package, measurement['kib']))
+
+
+if __name__ == '__main__':
+    measurements = {}
+    print('{0:<24}{1:>12}{2:>14}'.format('package', 'import ms', 'memory KiB'))
+    for package in OSID_PACKAGES:
+        measurements[package] = measure_package(package)
+        print('{0:<24}{1:>12.1f}{2:>14.0f}'.format(package, measurements[package]['ms'],
+                                                   measurements[package]['kib']))
+    if '--save-baseline' in sys.argv:
+        save_baseline(measurements)
@@ -7,6 +7,7 @@ import unittest
 
 from pymongo import MongoClient
 
+from dlkit.json_.utilities import JSON_CLIENT_REGISTRY
 from dlkit.runtime import RUNTIME, PROXY_SESSION
 from dlkit.runtime.primordium import Id, DataInputStream, Type
 from dlkit.runtime.proxy_example import SimpleRequest
@@ -49,6 +50,7 @@ class DLKitTestCase(unittest.TestCase):
     @staticmethod
     def _delete_database(db_name):
         MongoClient().drop_database(db_name)
+        JSON_CLIENT_REGISTRY.invalidate_database(db_name)
 
     # def _pre_setup(self):
         # MockTestCase.setUp(self)
@@ -11,4 +11,4 @@ def uses_cataloging(config):
 
 
 def uses_filesystem_only(config):
-    return config == 'TEST_SERVICE_FILESYSTEM'
+    return config in ['TEST_SERVICE_FILESYSTEM', 'TEST_SERVICE_FILESYSTEM_INDEXES', 'TEST_SERVICE_MEMORY']